@@ -0,0 +1,6 @@
+"""
+Offline micro-benchmarks for hot paths in polymarket_apis.
+
+Run any module directly, e.g. ``python -m benchmarks.bench_market_decode``.
+None of the benchmarks touch the network.
+"""
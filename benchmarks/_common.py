@@ -0,0 +1,171 @@
+"""Synthetic websocket frames and timing helpers shared by the benchmarks."""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+CONDITION_ID = "0x" + "ab" * 32
+HASH = "0x" + "cd" * 20
+
+
+def token_ids(count: int, *, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [str(rng.getrandbits(252)) for _ in range(count)]
+
+
+def book_payload(
+    token_id: str,
+    *,
+    depth: int = 50,
+    tick: float = 0.01,
+    mid: float = 0.5,
+    timestamp_ms: int = 1_700_000_000_000,
+) -> dict[str, object]:
+    bids = [
+        {"price": f"{round(mid - tick * (depth - index), 4)}", "size": f"{10 + index}"}
+        for index in range(depth)
+        if mid - tick * (depth - index) > 0
+    ]
+    asks = [
+        {"price": f"{round(mid + tick * (depth - index), 4)}", "size": f"{10 + index}"}
+        for index in range(depth)
+        if mid + tick * (depth - index) < 1
+    ]
+    return {
+        "event_type": "book",
+        "market": CONDITION_ID,
+        "asset_id": token_id,
+        "timestamp": str(timestamp_ms),
+        "hash": HASH,
+        "bids": bids,
+        "asks": asks,
+        "tick_size": f"{tick:g}",
+        "last_trade_price": f"{mid}",
+    }
+
+
+def price_change_payload(
+    token_id: str,
+    *,
+    price: float,
+    size: float,
+    side: str,
+    best_bid: float = 0.49,
+    best_ask: float = 0.51,
+    timestamp_ms: int = 1_700_000_000_000,
+) -> dict[str, object]:
+    return {
+        "event_type": "price_change",
+        "market": CONDITION_ID,
+        "timestamp": str(timestamp_ms),
+        "price_changes": [
+            {
+                "asset_id": token_id,
+                "price": f"{price:g}",
+                "size": f"{size:g}",
+                "side": side,
+                "hash": HASH,
+                "best_bid": f"{best_bid:g}",
+                "best_ask": f"{best_ask:g}",
+            }
+        ],
+    }
+
+
+def last_trade_price_payload(
+    token_id: str,
+    *,
+    price: float,
+    size: float = 5.0,
+    side: str = "BUY",
+    timestamp_ms: int = 1_700_000_000_000,
+) -> dict[str, object]:
+    return {
+        "event_type": "last_trade_price",
+        "market": CONDITION_ID,
+        "asset_id": token_id,
+        "price": f"{price:g}",
+        "size": f"{size:g}",
+        "side": side,
+        "fee_rate_bps": "0",
+        "timestamp": str(timestamp_ms),
+    }
+
+
+def delta_burst(
+    token_id: str,
+    *,
+    count: int,
+    tick: float = 0.01,
+    mid: float = 0.5,
+    spread_ticks: int = 40,
+    seed: int = 11,
+) -> list[dict[str, object]]:
+    """Random price changes around ``mid``, including occasional crossing quotes."""
+    rng = random.Random(seed)
+    payloads: list[dict[str, object]] = []
+    for _ in range(count):
+        side = rng.choice(("BUY", "SELL"))
+        offset = rng.randint(-3, spread_ticks) * tick
+        price = mid - offset if side == "BUY" else mid + offset
+        price = min(max(round(price, 4), tick), 1 - tick)
+        size = 0.0 if rng.random() < 0.3 else float(rng.randint(1, 500))
+        payloads.append(
+            price_change_payload(token_id, price=price, size=size, side=side)
+        )
+    return payloads
+
+
+def encode(payloads: Iterable[object]) -> list[str]:
+    return [json.dumps(payload, separators=(",", ":")) for payload in payloads]
+
+
+@dataclass(frozen=True, slots=True)
+class Timing:
+    label: str
+    operations: int
+    seconds: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.operations / self.seconds if self.seconds else float("inf")
+
+    @property
+    def microseconds_per_op(self) -> float:
+        return self.seconds / self.operations * 1e6 if self.operations else 0.0
+
+
+def measure(
+    label: str,
+    operations: int,
+    func: Callable[[], object],
+    *,
+    repeat: int = 3,
+) -> Timing:
+    """Run ``func`` ``repeat`` times and keep the fastest wall-clock run."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return Timing(label=label, operations=operations, seconds=best)
+
+
+def report(title: str, timings: Iterable[Timing], *, unit: str = "ops") -> None:
+    rows = list(timings)
+    print(title)
+    width = max(len(row.label) for row in rows)
+    for row in rows:
+        print(
+            f"  {row.label:<{width}}  {row.ops_per_second:>14,.0f} {unit}/s"
+            f"  {row.microseconds_per_op:>10.2f} us/{unit.rstrip('s')}"
+        )
+    if len(rows) >= 2:
+        baseline, *others = rows
+        for row in others:
+            speedup = row.ops_per_second / baseline.ops_per_second
+            print(f"  {row.label} vs {baseline.label}: {speedup:.2f}x")
@@ -0,0 +1,288 @@
+"""
+Local stand-in for the Polymarket websocket endpoints.
+
+The server runs in a child process so that generating traffic does not compete
+with the client under test for the GIL. It speaks just enough of each protocol
+for ``AsyncPolymarketWebsocketsClient``: it answers ``PING`` with ``PONG``,
+sends the initial ``book`` snapshots for a market subscription and acknowledges
+real-time data price subscriptions. Data frames follow a fixed schedule of
+``rate`` frames per second for ``duration`` seconds, optionally released in
+bursts, shared by every connection, so frames due while the client is
+reconnecting are never sent.
+
+Every data frame carries its sequence number in ``timestamp`` (``BASE_MS +
+seq``; snapshots and acks use ``BASE_MS - 1``) and the server records the
+``time.monotonic_ns()`` at which it handed the frame to the socket, which is
+what the benchmark measures latency against.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Literal
+
+from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from ._common import (
+    CONDITION_ID,
+    book_payload,
+    delta_burst,
+    encode,
+    last_trade_price_payload,
+    token_ids,
+)
+
+type Channel = Literal["market", "user", "real_time_data"]
+
+BASE_MS = 1_700_000_000_000
+_STAMP = str(BASE_MS)
+_SEND_CHUNK = 64
+# How long the server waits for a backlogged sender after the schedule ends.
+_FINISH_GRACE_SECONDS = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class TrafficConfig:
+    channel: Channel = "market"
+    rate: int = 10_000
+    duration: float = 2.0
+    tokens: int = 20
+    depth: int = 20
+    book_ratio: float = 0.02
+    trade_ratio: float = 0.05
+    # Frames fall due in groups of ``burst`` rather than evenly.
+    burst: int = 1
+
+    @property
+    def total_frames(self) -> int:
+        return int(self.rate * self.duration)
+
+
+@dataclass(frozen=True, slots=True)
+class ServerStats:
+    sent_ns: array[int]
+    connections: int
+
+    @property
+    def sent(self) -> int:
+        return sum(1 for sent_ns in self.sent_ns if sent_ns)
+
+
+def sequence_from_timestamp_ms(timestamp_ms: int) -> int | None:
+    seq = timestamp_ms - BASE_MS
+    return seq if seq >= 0 else None
+
+
+def _market_templates(config: TrafficConfig) -> Callable[[int], str]:
+    ids = token_ids(config.tokens)
+    books = encode(book_payload(token_id, depth=config.depth) for token_id in ids)
+    deltas = [
+        encode(delta_burst(token_id, count=16, spread_ticks=config.depth, seed=index))
+        for index, token_id in enumerate(ids)
+    ]
+    trades = encode(last_trade_price_payload(token_id, price=0.5) for token_id in ids)
+    book_every = round(1 / config.book_ratio) if config.book_ratio else 0
+    trade_every = round(1 / config.trade_ratio) if config.trade_ratio else 0
+
+    def frame(seq: int) -> str:
+        token = seq % len(ids)
+        if book_every and seq % book_every == 0:
+            template = books[token]
+        elif trade_every and seq % trade_every == 1:
+            template = trades[token]
+        else:
+            template = deltas[token][seq // len(ids) % 16]
+        return template.replace(_STAMP, str(BASE_MS + seq))
+
+    return frame
+
+
+def _user_template() -> str:
+    return json.dumps(
+        {
+            "event_type": "order",
+            "type": "UPDATE",
+            "id": "0x" + "12" * 32,
+            "asset_id": token_ids(1)[0],
+            "market": CONDITION_ID,
+            "owner": "00000000-0000-0000-0000-000000000000",
+            "maker_address": "0x" + "34" * 20,
+            "price": "0.5",
+            "side": "BUY",
+            "size_matched": "5",
+            "original_size": "10",
+            "outcome": "Yes",
+            "order_type": "GTC",
+            "created_at": "1699999999",
+            "expiration": "0",
+            "associated_trades": None,
+            "timestamp": _STAMP,
+            "status": "LIVE",
+        },
+        separators=(",", ":"),
+    )
+
+
+def _real_time_data_template() -> str:
+    return json.dumps(
+        {
+            "topic": "crypto_prices",
+            "type": "update",
+            "timestamp": BASE_MS,
+            "connection_id": "bench",
+            "payload": {
+                "symbol": "btcusdt",
+                "timestamp": BASE_MS,
+                "value": 65_000.5,
+                "full_accuracy_value": "65000.50000000",
+            },
+        },
+        separators=(",", ":"),
+    )
+
+
+def frame_factory(config: TrafficConfig) -> Callable[[int], str]:
+    """Return ``seq -> frame text`` for the configured channel."""
+    if config.channel == "market":
+        return _market_templates(config)
+    template = (
+        _user_template() if config.channel == "user" else _real_time_data_template()
+    )
+    return lambda seq: template.replace(_STAMP, str(BASE_MS + seq))
+
+
+class _Schedule:
+    def __init__(self, config: TrafficConfig) -> None:
+        self.config = config
+        self.frame = frame_factory(config)
+        self.sent_ns = array("q", bytes(8 * config.total_frames))
+        self.next_seq = 0
+        self.connections = 0
+        self.streaming = 0
+        self.started: float | None = None
+        self.first_connection = asyncio.Event()
+        self.finished = asyncio.Event()
+
+    def due(self) -> int:
+        if self.started is None:
+            return 0
+        elapsed = time.monotonic() - self.started
+        due = int(elapsed * self.config.rate)
+        if elapsed < self.config.duration:
+            due -= due % self.config.burst
+        return min(self.config.total_frames, due)
+
+
+async def _answer_control_frames(
+    websocket: ServerConnection, schedule: _Schedule
+) -> None:
+    async for message in websocket:
+        if message == "PING":
+            await websocket.send("PONG")
+        elif schedule.config.channel == "real_time_data" and isinstance(message, str):
+            await _acknowledge_subscription(websocket, message)
+
+
+async def _acknowledge_subscription(websocket: ServerConnection, message: str) -> None:
+    request = json.loads(message)
+    if request.get("action") != "subscribe":
+        return
+    for subscription in request.get("subscriptions", []):
+        ack = {
+            "topic": subscription["topic"],
+            "type": "subscribe",
+            "timestamp": BASE_MS - 1,
+            "payload": {"symbol": "btcusdt", "data": []},
+        }
+        await websocket.send(json.dumps(ack, separators=(",", ":")))
+
+
+async def _send_initial_books(websocket: ServerConnection, message: str) -> None:
+    request = json.loads(message)
+    books = [
+        book_payload(token_id, timestamp_ms=BASE_MS - 1)
+        for token_id in request.get("assets_ids", [])
+    ]
+    await websocket.send(json.dumps(books, separators=(",", ":")))
+
+
+async def _stream(websocket: ServerConnection, schedule: _Schedule) -> None:
+    total = schedule.config.total_frames
+    # Frames that fell due while nobody was connected are skipped, not replayed.
+    schedule.next_seq = max(schedule.next_seq, schedule.due())
+    schedule.streaming += 1
+    try:
+        while schedule.next_seq < total:
+            due = schedule.due()
+            if schedule.next_seq >= due:
+                await asyncio.sleep(0.0005)
+                continue
+            for seq in range(
+                schedule.next_seq, min(due, schedule.next_seq + _SEND_CHUNK)
+            ):
+                schedule.next_seq = seq + 1
+                await websocket.send(schedule.frame(seq))
+                schedule.sent_ns[seq] = time.monotonic_ns()
+        schedule.finished.set()
+    finally:
+        schedule.streaming -= 1
+
+
+async def _handle(websocket: ServerConnection, schedule: _Schedule) -> None:
+    schedule.connections += 1
+    subscription = await websocket.recv()
+    if schedule.config.channel == "market" and isinstance(subscription, str):
+        await _send_initial_books(websocket, subscription)
+    control = asyncio.create_task(_answer_control_frames(websocket, schedule))
+    if schedule.config.channel == "real_time_data" and isinstance(subscription, str):
+        await _acknowledge_subscription(websocket, subscription)
+    if schedule.started is None:
+        schedule.started = time.monotonic()
+        schedule.first_connection.set()
+    try:
+        await _stream(websocket, schedule)
+        await websocket.wait_closed()
+    except ConnectionClosed:
+        pass
+    finally:
+        control.cancel()
+        with contextlib.suppress(asyncio.CancelledError, ConnectionClosed):
+            await control
+
+
+async def _serve(config: TrafficConfig, pipe: Connection) -> None:
+    schedule = _Schedule(config)
+
+    async def handler(websocket: ServerConnection) -> None:
+        await _handle(websocket, schedule)
+
+    async with serve(handler, "127.0.0.1", 0, max_size=None) as server:
+        pipe.send(server.sockets[0].getsockname()[1])
+        await schedule.first_connection.wait()
+        await asyncio.sleep(config.duration)
+        if schedule.streaming:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    schedule.finished.wait(), timeout=_FINISH_GRACE_SECONDS
+                )
+        pipe.send("done")
+        await asyncio.to_thread(pipe.recv)
+    pipe.send(ServerStats(sent_ns=schedule.sent_ns, connections=schedule.connections))
+
+
+def run_server(config: TrafficConfig, pipe: Connection) -> None:
+    """
+    Child process entry point.
+
+    Sends the listening port, then ``"done"`` once the schedule is over, waits
+    for the parent to say it has drained, and finally sends ``ServerStats``.
+    """
+    asyncio.run(_serve(config, pipe))
@@ -0,0 +1,95 @@
+"""
+Bulk order book snapshots over a simulated round trip.
+
+A mock transport answers ``POST /books`` after ``--latency-ms`` (plus a small
+per-token cost), standing in for the CLOB over the network. "chunked loop" is
+the hand-chunked sequential ``get_order_books`` calls the bulk methods replace;
+"bulk" and "async bulk" are ``get_order_books_bulk`` on the sync and async
+clients.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from polymarket_apis.clients.clob_client import (
+    AsyncPolymarketReadOnlyClobClient,
+    PolymarketReadOnlyClobClient,
+)
+
+from ._common import book_payload, measure, report, token_ids
+
+
+def _books(request: httpx.Request) -> list[dict[str, object]]:
+    return [
+        book_payload(item["token_id"], depth=5) for item in json.loads(request.content)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=10_000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--per-token-us", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    latency: float = args.latency_ms / 1e3
+    per_token: float = args.per_token_us / 1e6
+
+    def delay(request: httpx.Request) -> float:
+        return latency + len(json.loads(request.content)) * per_token
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(delay(request))
+        return httpx.Response(200, json=_books(request))
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay(request))
+        return httpx.Response(200, json=_books(request))
+
+    client = PolymarketReadOnlyClobClient()
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    async_client = AsyncPolymarketReadOnlyClobClient()
+    async_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(async_handler)
+    )
+
+    def chunked_loop() -> None:
+        for start in range(0, len(ids), args.chunk_size):
+            client.get_order_books(ids[start : start + args.chunk_size])
+
+    def bulk() -> None:
+        client.get_order_books_bulk(
+            ids, chunk_size=args.chunk_size, max_concurrency=args.concurrency
+        )
+
+    def async_bulk() -> None:
+        asyncio.run(
+            async_client.get_order_books_bulk(
+                ids, chunk_size=args.chunk_size, max_concurrency=args.concurrency
+            )
+        )
+
+    report(
+        f"{len(ids):,} order books, chunks of {args.chunk_size}, "
+        f"{args.latency_ms:g} ms round trip",
+        [
+            measure("chunked loop", len(ids), chunked_loop, repeat=args.repeat),
+            measure("bulk", len(ids), bulk, repeat=args.repeat),
+            measure("async bulk", len(ids), async_bulk, repeat=args.repeat),
+        ],
+        unit="books",
+    )
+
+
+if __name__ == "__main__":
+    main()
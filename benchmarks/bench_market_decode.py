@@ -0,0 +1,111 @@
+"""
+Market-channel ingest: decode-twice vs decode-once.
+
+Before: ``LocalOrderBookStore.apply_message_text`` decodes the frame, then the
+``_WebsocketMessage`` envelope decodes the same text again for
+``parse_market_event``. After: the payload decoded for the order book is handed
+to the envelope and reused.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from polymarket_apis.clients.websockets_client import (
+    LocalOrderBookStore,
+    _WebsocketMessage,
+    parse_market_event,
+)
+
+from ._common import (
+    book_payload,
+    delta_burst,
+    encode,
+    measure,
+    report,
+    token_ids,
+)
+
+
+def _frames(
+    tokens: int, deltas_per_token: int, depth: int
+) -> tuple[list[str], list[str]]:
+    ids = token_ids(tokens)
+    snapshots = encode(book_payload(token_id, depth=depth) for token_id in ids)
+    deltas: list[str] = []
+    for index, token_id in enumerate(ids):
+        deltas.extend(encode(delta_burst(token_id, count=deltas_per_token, seed=index)))
+    return snapshots, deltas
+
+
+def _decode_twice(snapshots: list[str], deltas: list[str], *, parse: bool) -> None:
+    store = LocalOrderBookStore()
+    for text in (*snapshots, *deltas):
+        store.apply_message_text(text)
+        message = _WebsocketMessage(channel="market", text=text)
+        if parse:
+            parse_market_event(message)
+
+
+def _decode_once(snapshots: list[str], deltas: list[str], *, parse: bool) -> None:
+    store = LocalOrderBookStore()
+    for text in (*snapshots, *deltas):
+        payload = json.loads(text)
+        store.apply_payload(payload)
+        message = _WebsocketMessage(channel="market", text=text, json_data=payload)
+        if parse:
+            parse_market_event(message)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--deltas-per-token", type=int, default=400)
+    parser.add_argument("--depth", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    snapshots, deltas = _frames(args.tokens, args.deltas_per_token, args.depth)
+    frames = len(snapshots) + len(deltas)
+
+    report(
+        f"envelope + local book only ({frames:,} frames)",
+        [
+            measure(
+                "decode twice",
+                frames,
+                lambda: _decode_twice(snapshots, deltas, parse=False),
+                repeat=args.repeat,
+            ),
+            measure(
+                "decode once",
+                frames,
+                lambda: _decode_once(snapshots, deltas, parse=False),
+                repeat=args.repeat,
+            ),
+        ],
+        unit="frames",
+    )
+    report(
+        f"envelope + local book + parse_market_event ({frames:,} frames)",
+        [
+            measure(
+                "decode twice",
+                frames,
+                lambda: _decode_twice(snapshots, deltas, parse=True),
+                repeat=args.repeat,
+            ),
+            measure(
+                "decode once",
+                frames,
+                lambda: _decode_once(snapshots, deltas, parse=True),
+                repeat=args.repeat,
+            ),
+        ],
+        unit="frames",
+    )
+
+
+if __name__ == "__main__":
+    main()
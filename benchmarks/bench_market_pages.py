@@ -0,0 +1,132 @@
+"""
+Paging through ``/markets`` with and without next-page prefetch.
+
+A mock transport answers each page after ``--latency-ms``, and the consumer
+spends ``--work-ms`` on every page. "cursor loop" calls ``get_markets`` page
+after page, so the two waits add up. ``iter_markets`` has the next page in
+flight while the current one is processed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from polymarket_apis.clients.clob_client import (
+    AsyncPolymarketReadOnlyClobClient,
+    PolymarketReadOnlyClobClient,
+)
+from polymarket_apis.utilities.constants import END_CURSOR
+
+from ._common import measure, report
+
+
+def _market(index: int) -> dict[str, object]:
+    return {
+        "tokens": [
+            {"token_id": str(index), "outcome": "Yes", "price": 0.5, "winner": False}
+        ],
+        "condition_id": "0x" + f"{index % 256:02x}" * 32,
+        "question_id": "0x" + "aa" * 32,
+        "question": f"Market {index}?",
+        "description": "",
+        "market_slug": f"market-{index}",
+        "end_date_iso": None,
+        "seconds_delay": 0,
+        "enable_order_book": True,
+        "accepting_orders": True,
+        "accepting_order_timestamp": None,
+        "minimum_order_size": 5,
+        "minimum_tick_size": 0.01,
+        "active": True,
+        "closed": False,
+        "archived": False,
+        "neg_risk": False,
+        "neg_risk_market_id": "",
+        "neg_risk_request_id": "",
+        "fpmm": "",
+        "notifications_enabled": False,
+        "is_50_50_outcome": False,
+        "icon": "",
+        "image": "",
+        "rewards": None,
+        "tags": None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--work-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    latency: float = args.latency_ms / 1e3
+    work: float = args.work_ms / 1e3
+    pages = {
+        str(page): {
+            "data": [
+                _market(page * args.page_size + index)
+                for index in range(args.page_size)
+            ],
+            "next_cursor": str(page + 1) if page + 1 < args.pages else END_CURSOR,
+            "limit": args.page_size,
+            "count": args.page_size,
+        }
+        for page in range(args.pages)
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(200, json=pages[request.url.params["next_cursor"]])
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, json=pages[request.url.params["next_cursor"]])
+
+    client = PolymarketReadOnlyClobClient()
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    async_client = AsyncPolymarketReadOnlyClobClient()
+    async_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(async_handler)
+    )
+
+    def cursor_loop() -> None:
+        cursor = "0"
+        while cursor != END_CURSOR:
+            page = client.get_markets(cursor)
+            time.sleep(work)
+            cursor = page.next_cursor
+
+    def prefetching() -> None:
+        for _ in client.iter_market_pages("0"):
+            time.sleep(work)
+
+    async def async_pages() -> None:
+        async for _ in async_client.iter_market_pages("0"):
+            await asyncio.sleep(work)
+
+    report(
+        f"{args.pages} pages of {args.page_size} markets, "
+        f"{args.latency_ms:g} ms round trip, {args.work_ms:g} ms work per page",
+        [
+            measure("cursor loop", args.pages, cursor_loop, repeat=args.repeat),
+            measure("iter_market_pages", args.pages, prefetching, repeat=args.repeat),
+            measure(
+                "async iter_market_pages",
+                args.pages,
+                lambda: asyncio.run(async_pages()),
+                repeat=args.repeat,
+            ),
+        ],
+        unit="pages",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Market events: pydantic models vs ``message_mode="struct"`` and ``"lazy"``.
+
+All paths start from the same pre-decoded payloads, so the numbers cover only
+building the event: ``parse_market_event`` validates into the pydantic models,
+``parse_market_struct_event`` builds the ``NamedTuple`` structs and
+``parse_market_lazy_event`` wraps the payload in a ``LazyEvent`` without
+validating it (the cost of an event that is discarded unread). Reported per
+path: CPU time per event, and bytes allocated while building each event and
+still held by it afterwards (from ``tracemalloc``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+
+from polymarket_apis.clients.websockets_client import (
+    _WebsocketMessage,
+    parse_market_event,
+    parse_market_lazy_event,
+    parse_market_struct_event,
+)
+
+from ._common import (
+    book_payload,
+    delta_burst,
+    encode,
+    last_trade_price_payload,
+    measure,
+    report,
+    token_ids,
+)
+
+type Parser = Callable[[_WebsocketMessage], object]
+
+
+def _messages(texts: list[str]) -> list[_WebsocketMessage]:
+    return [
+        _WebsocketMessage(channel="market", text=text, json_data=json.loads(text))
+        for text in texts
+    ]
+
+
+def _parse_all(parser: Parser, messages: list[_WebsocketMessage]) -> list[object]:
+    return [parser(message) for message in messages]
+
+
+def _memory(parser: Parser, messages: list[_WebsocketMessage]) -> tuple[float, float]:
+    """Return (peak bytes allocated, bytes retained) per event."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        events = _parse_all(parser, messages)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del events
+    return (peak - baseline) / len(messages), (retained - baseline) / len(messages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--deltas-per-token", type=int, default=400)
+    parser.add_argument("--depth", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    workloads = {
+        "price_change": encode(
+            payload
+            for index, token_id in enumerate(ids)
+            for payload in delta_burst(
+                token_id, count=args.deltas_per_token, seed=index
+            )
+        ),
+        "last_trade_price": encode(
+            last_trade_price_payload(token_id, price=0.5)
+            for token_id in ids
+            for _ in range(args.deltas_per_token)
+        ),
+        f"book (depth {args.depth})": encode(
+            book_payload(token_id, depth=args.depth) for token_id in ids
+        ),
+    }
+    paths: dict[str, Parser] = {
+        "pydantic": parse_market_event,
+        "struct": parse_market_struct_event,
+        "lazy": parse_market_lazy_event,
+    }
+
+    for name, texts in workloads.items():
+        messages = _messages(texts)
+        report(
+            f"{name}: {len(messages):,} events",
+            [
+                measure(
+                    label,
+                    len(messages),
+                    lambda path=path, messages=messages: _parse_all(path, messages),  # type: ignore[misc]
+                    repeat=args.repeat,
+                )
+                for label, path in paths.items()
+            ],
+            unit="events",
+        )
+        for label, path in paths.items():
+            peak, retained = _memory(path, messages)
+            print(
+                f"  {label:<8} {peak:>10,.0f} B/event allocated"
+                f" {retained:>10,.0f} B/event retained"
+            )
+
+
+if __name__ == "__main__":
+    main()
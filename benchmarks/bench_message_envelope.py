@@ -0,0 +1,92 @@
+"""
+Cost of the per-frame ``_WebsocketMessage`` envelope on the ingest path.
+
+Every received frame gets an envelope, usually with a payload that was
+already decoded for the local order book. "eager" reads ``received_at``,
+``message_size`` and ``trace_id`` right after building the envelope, which is
+the work the envelope used to do for every frame (a wall-clock ``datetime``, a
+UTF-8 copy of the frame to measure it, a trace id lookup). "lazy" only builds
+it, which is what happens now unless a log line or the drop-oldest policy reads
+those fields. "reader" passes the ``received_at`` the reader loop already has,
+as the connection does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from polymarket_apis.clients.websockets_client import _WebsocketMessage
+
+from ._common import book_payload, delta_burst, encode, measure, report, token_ids
+
+type Frames = list[tuple[str, object]]
+
+
+def _eager(frames: Frames) -> None:
+    for text, payload in frames:
+        message = _WebsocketMessage(channel="market", text=text, json_data=payload)
+        _ = (message.received_at, message.message_size, message.trace_id)
+
+
+def _lazy(frames: Frames) -> None:
+    for text, payload in frames:
+        _WebsocketMessage(channel="market", text=text, json_data=payload)
+
+
+def _reader(frames: Frames) -> None:
+    for text, payload in frames:
+        received_at = datetime.now(UTC)
+        _WebsocketMessage(
+            channel="market", text=text, json_data=payload, received_at=received_at
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--deltas-per-token", type=int, default=400)
+    parser.add_argument("--depth", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    workloads = {
+        "price_change": encode(
+            payload
+            for index, token_id in enumerate(ids)
+            for payload in delta_burst(
+                token_id, count=args.deltas_per_token, seed=index
+            )
+        ),
+        f"book (depth {args.depth})": encode(
+            book_payload(token_id, depth=args.depth) for token_id in ids
+        )
+        * (args.deltas_per_token // 10),
+    }
+    paths: dict[str, Callable[[Frames], None]] = {
+        "eager": _eager,
+        "lazy": _lazy,
+        "reader": _reader,
+    }
+    for name, texts in workloads.items():
+        frames = [(text, json.loads(text)) for text in texts]
+        report(
+            f"{name}: {len(frames):,} frames",
+            [
+                measure(
+                    label,
+                    len(frames),
+                    lambda path=path, frames=frames: path(frames),  # type: ignore[misc]
+                    repeat=args.repeat,
+                )
+                for label, path in paths.items()
+            ],
+            unit="frames",
+        )
+
+
+if __name__ == "__main__":
+    main()
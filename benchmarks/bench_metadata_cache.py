@@ -0,0 +1,82 @@
+"""
+Time from a fresh client to signed orders, with and without a metadata cache.
+
+Each run builds a new ``PolymarketClobClient``, as a restarted process would,
+and signs one order on each of ``--tokens`` tokens. A mock transport answers
+the tick size and neg risk lookups after ``--latency-ms``. "cold" has no
+cache; "warm" opens a ``SqliteMetadataCache`` that an earlier run filled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import cast
+
+import httpx
+
+from polymarket_apis.clients.clob_client import PolymarketClobClient
+from polymarket_apis.clients.clob_metadata_cache import SqliteMetadataCache
+from polymarket_apis.types.clob_types import ApiCreds, OrderArgs
+from polymarket_apis.types.common import EthAddress
+
+from ._common import measure, report, token_ids
+
+PRIVATE_KEY = "0x" + "11" * 32
+ADDRESS = cast("EthAddress", "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A")
+CREDS = ApiCreds(key="key", secret="c2VjcmV0", passphrase="passphrase")  # noqa: S106
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    latency: float = args.latency_ms / 1e3
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        if request.url.path == "/tick-size":
+            return httpx.Response(200, json={"minimum_tick_size": 0.01})
+        return httpx.Response(200, json={"neg_risk": False})
+
+    def sign_orders(cache: SqliteMetadataCache | None) -> None:
+        client = PolymarketClobClient(
+            PRIVATE_KEY, ADDRESS, CREDS, signature_type=0, metadata_cache=cache
+        )
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        with client:
+            for token_id in ids:
+                client.create_order(
+                    OrderArgs(token_id=token_id, price=0.5, size=10, side="BUY")
+                )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "metadata.sqlite"
+        with SqliteMetadataCache(path) as cache:
+            sign_orders(cache)
+
+        def warm() -> None:
+            with SqliteMetadataCache(path) as cache:
+                sign_orders(cache)
+
+        report(
+            f"first order on {len(ids)} tokens from a new client, "
+            f"{args.latency_ms:g} ms round trip",
+            [
+                measure(
+                    "cold", len(ids), lambda: sign_orders(None), repeat=args.repeat
+                ),
+                measure("warm", len(ids), warm, repeat=args.repeat),
+            ],
+            unit="orders",
+        )
+
+
+if __name__ == "__main__":
+    main()
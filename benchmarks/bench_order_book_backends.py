@@ -0,0 +1,191 @@
+"""
+Order book backends at scale: ``backend="sorted"`` vs ``backend="tick"``.
+
+Loads a snapshot for every token, reports the memory the store holds
+(``tracemalloc``), then replays a round-robin delta stream across all tokens.
+Most tokens sit on the 0.01 grid; every tenth uses 0.001 to exercise larger
+tick arrays.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from functools import partial
+from typing import Any
+
+from polymarket_apis.clients.websockets_client import (
+    LocalOrderBookBackend,
+    LocalOrderBookStore,
+)
+from polymarket_apis.utilities._order_book_ladder import (
+    PriceLadder,
+    SortedPriceLadder,
+    TickPriceLadder,
+)
+
+from ._common import Timing, book_payload, delta_burst, measure, report, token_ids
+
+
+def _payloads(
+    tokens: int, depth: int, deltas_per_token: int
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    snapshots: list[dict[str, Any]] = []
+    bursts: list[list[dict[str, Any]]] = []
+    for index, token_id in enumerate(token_ids(tokens)):
+        tick = 0.001 if index % 10 == 0 else 0.01
+        # Keep the book inside (0, 1) whatever the grid.
+        levels = min(depth, int(0.45 / tick))
+        snapshots.append(book_payload(token_id, depth=levels, tick=tick))
+        bursts.append(
+            delta_burst(
+                token_id,
+                count=deltas_per_token,
+                tick=tick,
+                spread_ticks=levels,
+                seed=index,
+            )
+        )
+    deltas = [burst[step] for step in range(deltas_per_token) for burst in bursts]
+    return json.loads(json.dumps(snapshots)), json.loads(json.dumps(deltas))
+
+
+def _loaded_store(
+    backend: LocalOrderBookBackend, snapshots: list[dict[str, Any]]
+) -> tuple[LocalOrderBookStore, int]:
+    gc.collect()
+    tracemalloc.start()
+    store = LocalOrderBookStore(backend=backend)
+    for payload in snapshots:
+        store.apply_payload(payload)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, size
+
+
+def _replay(
+    backend: LocalOrderBookBackend,
+    snapshots: list[dict[str, Any]],
+    deltas: list[dict[str, Any]],
+) -> None:
+    store = LocalOrderBookStore(backend=backend)
+    for payload in snapshots:
+        store.apply_payload(payload)
+    for payload in deltas:
+        store.apply_payload(payload)
+
+
+def _ladder_ops(deltas: list[dict[str, Any]]) -> list[tuple[str, str, float, float]]:
+    return [
+        (
+            change["asset_id"],
+            change["side"],
+            float(change["price"]),
+            float(change["size"]),
+        )
+        for payload in deltas
+        for change in payload["price_changes"]
+    ]
+
+
+def _ladders(
+    backend: LocalOrderBookBackend, store: LocalOrderBookStore
+) -> dict[str, tuple[PriceLadder, PriceLadder]]:
+    books: dict[str, tuple[PriceLadder, PriceLadder]] = {}
+    for token_id in store.token_ids:
+        bids, asks = store.bids(token_id), store.asks(token_id)
+        if backend == "tick":
+            tick_size = store.tick_size(token_id)
+            books[token_id] = (
+                TickPriceLadder("BUY", bids, tick_size=tick_size),
+                TickPriceLadder("SELL", asks, tick_size=tick_size),
+            )
+        else:
+            books[token_id] = (
+                SortedPriceLadder("BUY", bids),
+                SortedPriceLadder("SELL", asks),
+            )
+    return books
+
+
+def _apply_ops(
+    books: dict[str, tuple[PriceLadder, PriceLadder]],
+    ops: list[tuple[str, str, float, float]],
+) -> None:
+    """Apply deltas straight to the ladders, without payload validation or locking."""
+    for token_id, side, price, size in ops:
+        bids, asks = books[token_id]
+        levels, opposite = (bids, asks) if side == "BUY" else (asks, bids)
+        if size > 0:
+            opposite.remove_better_than(price)
+        levels.set(price, size)
+        levels.top(2)
+
+
+def _measure_ladders(
+    backend: LocalOrderBookBackend,
+    store: LocalOrderBookStore,
+    ops: list[tuple[str, str, float, float]],
+    repeat: int,
+) -> Timing:
+    # Ladders are mutated by a run, so rebuild them outside the timed region.
+    runs = [
+        measure(
+            backend,
+            len(ops),
+            partial(_apply_ops, _ladders(backend, store), ops),
+            repeat=1,
+        )
+        for _ in range(repeat)
+    ]
+    return min(runs, key=lambda timing: timing.seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=5_000)
+    parser.add_argument("--depth", type=int, default=30)
+    parser.add_argument("--deltas-per-token", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    snapshots, deltas = _payloads(args.tokens, args.depth, args.deltas_per_token)
+    backends: tuple[LocalOrderBookBackend, ...] = ("sorted", "tick")
+
+    print(f"memory after {args.tokens:,} snapshots ({args.depth} levels per side)")
+    stores: dict[LocalOrderBookBackend, LocalOrderBookStore] = {}
+    for backend in backends:
+        stores[backend], size = _loaded_store(backend, snapshots)
+        print(
+            f"  {backend:<6}  {size / 2**20:8.1f} MiB  {size / args.tokens:8.0f} B/token"
+        )
+
+    report(
+        f"snapshots + {len(deltas):,} deltas across {args.tokens:,} tokens",
+        [
+            measure(
+                backend,
+                len(deltas),
+                partial(_replay, backend, snapshots, deltas),
+                repeat=args.repeat,
+            )
+            for backend in backends
+        ],
+        unit="deltas",
+    )
+
+    ops = _ladder_ops(deltas)
+    report(
+        f"ladder operations only ({len(ops):,} deltas)",
+        [
+            _measure_ladders(backend, stores[backend], ops, args.repeat)
+            for backend in backends
+        ],
+        unit="deltas",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+One writer, many readers: locked reads vs optimistic (sequence-checked) reads.
+
+A writer thread applies a delta stream while reader threads poll ``snapshot()``
+across every token. The baseline subclass reproduces the previous behaviour of
+holding the store lock for the whole read, which makes the writer wait behind
+every dict copy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from typing import Any
+
+from polymarket_apis.clients.websockets_client import (
+    LocalOrderBookSnapshot,
+    LocalOrderBookStore,
+)
+
+from ._common import book_payload, delta_burst, token_ids
+
+
+class _LockedReadStore(LocalOrderBookStore):
+    def snapshot(self, token_id: str) -> LocalOrderBookSnapshot:
+        with self._lock:
+            return self._build_snapshot(token_id)
+
+
+def _run(
+    store: LocalOrderBookStore,
+    ids: list[str],
+    deltas: list[dict[str, Any]],
+    readers: int,
+) -> tuple[float, int]:
+    done = threading.Event()
+    reads = [0] * readers
+
+    def read(slot: int) -> None:
+        count = 0
+        while not done.is_set():
+            for token_id in ids:
+                store.snapshot(token_id)
+            count += len(ids)
+        reads[slot] = count
+
+    threads = [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    for payload in deltas:
+        store.apply_payload(payload)
+    elapsed = time.perf_counter() - started
+    done.set()
+    for thread in threads:
+        thread.join()
+    return elapsed, sum(reads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--deltas-per-token", type=int, default=100)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    snapshots = json.loads(
+        json.dumps(
+            [book_payload(token_id, depth=args.depth, tick=0.001) for token_id in ids]
+        )
+    )
+    bursts = [
+        delta_burst(
+            token_id,
+            count=args.deltas_per_token,
+            tick=0.001,
+            spread_ticks=args.depth,
+            seed=index,
+        )
+        for index, token_id in enumerate(ids)
+    ]
+    deltas = json.loads(
+        json.dumps(
+            [burst[step] for step in range(args.deltas_per_token) for burst in bursts]
+        )
+    )
+
+    print(
+        f"writer applies {len(deltas):,} deltas; readers poll snapshot() over {args.tokens} tokens"
+    )
+    for readers in (0, 1, 4):
+        for label, factory in (
+            ("locked reads", _LockedReadStore),
+            ("optimistic reads", LocalOrderBookStore),
+        ):
+            store = factory()
+            for payload in snapshots:
+                store.apply_payload(payload)
+            elapsed, reads = _run(store, ids, deltas, readers)
+            print(
+                f"  readers={readers}  {label:<16}  writer {len(deltas) / elapsed:>10,.0f} deltas/s"
+                f"  readers {reads / elapsed:>10,.0f} snapshots/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
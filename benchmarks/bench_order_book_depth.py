@@ -0,0 +1,116 @@
+"""
+Reading the top N levels: ``snapshot()`` + sort vs the cached ``top_bids``/``top_asks``.
+
+Also reports delta throughput at different ``depth`` settings, since the top-N
+window is only rebuilt when a change lands inside it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from functools import partial
+from typing import Any
+
+from polymarket_apis.clients.websockets_client import LocalOrderBookStore
+
+from ._common import book_payload, delta_burst, measure, report, token_ids
+
+
+def _store(depth: int, snapshots: list[dict[str, Any]]) -> LocalOrderBookStore:
+    store = LocalOrderBookStore(depth=depth)
+    for payload in snapshots:
+        store.apply_payload(payload)
+    return store
+
+
+def _read_via_snapshot(store: LocalOrderBookStore, ids: list[str], depth: int) -> None:
+    for token_id in ids:
+        snapshot = store.snapshot(token_id)
+        snapshot.sorted_bids()[:depth]
+        snapshot.sorted_asks()[:depth]
+
+
+def _read_cached(store: LocalOrderBookStore, ids: list[str]) -> None:
+    for token_id in ids:
+        store.top_bids(token_id)
+        store.top_asks(token_id)
+
+
+def _apply(
+    depth: int, snapshots: list[dict[str, Any]], deltas: list[dict[str, Any]]
+) -> None:
+    store = _store(depth, snapshots)
+    for payload in deltas:
+        store.apply_payload(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--book-depth", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--deltas-per-token", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    tick = 0.001
+    snapshots = json.loads(
+        json.dumps(
+            [
+                book_payload(token_id, depth=args.book_depth, tick=tick)
+                for token_id in ids
+            ]
+        )
+    )
+    deltas: list[dict[str, Any]] = []
+    for index, token_id in enumerate(ids):
+        deltas.extend(
+            delta_burst(
+                token_id,
+                count=args.deltas_per_token,
+                tick=tick,
+                spread_ticks=args.book_depth,
+                seed=index,
+            )
+        )
+    deltas = json.loads(json.dumps(deltas))
+
+    store = _store(args.depth, snapshots)
+    report(
+        f"read top {args.depth} levels per side ({args.tokens:,} tokens, "
+        f"{args.book_depth} levels per side)",
+        [
+            measure(
+                "snapshot + sort",
+                len(ids),
+                partial(_read_via_snapshot, store, ids, args.depth),
+                repeat=args.repeat,
+            ),
+            measure(
+                "top_bids/top_asks",
+                len(ids),
+                partial(_read_cached, store, ids),
+                repeat=args.repeat,
+            ),
+        ],
+        unit="reads",
+    )
+    report(
+        f"apply {len(deltas):,} deltas",
+        [
+            measure(
+                f"depth={depth}",
+                len(deltas),
+                partial(_apply, depth, snapshots, deltas),
+                repeat=args.repeat,
+            )
+            for depth in (2, args.depth)
+        ],
+        unit="deltas",
+    )
+
+
+if __name__ == "__main__":
+    main()
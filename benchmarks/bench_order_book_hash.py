@@ -0,0 +1,177 @@
+"""
+Cost of verifying local books against the server ``hash``.
+
+The baseline is the obvious inline check: after every delta, build an
+``OrderBookSummary`` from the store and run ``generate_orderbook_summary_hash``.
+The candidates use ``hash_check_interval``, which only copies the sampled book
+while applying and leaves the sha1 to ``verify_hashes``. Hashes in the replayed
+stream are real, so every check is expected to match.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from functools import partial
+from typing import Any
+
+from polymarket_apis.clients.websockets_client import LocalOrderBookStore
+from polymarket_apis.types.clob_types import OrderBookSummary
+from polymarket_apis.utilities.order_builder.helpers import (
+    generate_orderbook_summary_hash,
+)
+
+from ._common import book_payload, delta_burst, measure, report, token_ids
+
+
+def _summary_hash(store: LocalOrderBookStore, token_id: str, timestamp: object) -> str:
+    snapshot = store.snapshot(token_id)
+    summary = OrderBookSummary.model_validate(
+        {
+            "market": "0x" + "ab" * 32,
+            "asset_id": token_id,
+            "timestamp": timestamp,
+            "hash": "",
+            "bids": [
+                {"price": price, "size": size}
+                for price, size in sorted(snapshot.bids.items())
+            ],
+            "asks": [
+                {"price": price, "size": size}
+                for price, size in sorted(snapshot.asks.items(), reverse=True)
+            ],
+            "tick_size": f"{snapshot.tick_size:g}" if snapshot.tick_size else None,
+            "last_trade_price": snapshot.last_trade_price,
+        }
+    )
+    return generate_orderbook_summary_hash(summary)
+
+
+def _payloads(
+    tokens: int, depth: int, deltas_per_token: int
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    ids = token_ids(tokens)
+    snapshots: list[dict[str, Any]] = json.loads(
+        json.dumps([book_payload(token_id, depth=depth) for token_id in ids])
+    )
+    bursts = [
+        delta_burst(token_id, count=deltas_per_token, spread_ticks=depth, seed=index)
+        for index, token_id in enumerate(ids)
+    ]
+    deltas: list[dict[str, Any]] = json.loads(
+        json.dumps(
+            [burst[step] for step in range(deltas_per_token) for burst in bursts]
+        )
+    )
+    # Stamp each frame with the hash of the book it produces.
+    reference = LocalOrderBookStore()
+    for payload in snapshots:
+        reference.apply_payload(payload)
+        payload["hash"] = _summary_hash(
+            reference, payload["asset_id"], payload["timestamp"]
+        )
+    for payload in deltas:
+        reference.apply_payload(payload)
+        for change in payload["price_changes"]:
+            change["hash"] = _summary_hash(
+                reference, change["asset_id"], payload["timestamp"]
+            )
+    return snapshots, deltas
+
+
+def _loaded_store(
+    snapshots: list[dict[str, Any]], **options: Any
+) -> LocalOrderBookStore:
+    store = LocalOrderBookStore(**options)
+    for payload in snapshots:
+        store.apply_payload(payload)
+    store.verify_hashes()
+    return store
+
+
+def _inline(snapshots: list[dict[str, Any]], deltas: list[dict[str, Any]]) -> None:
+    store = _loaded_store(snapshots)
+    for payload in deltas:
+        store.apply_payload(payload)
+        for change in payload["price_changes"]:
+            token_id = change["asset_id"]
+            if _summary_hash(store, token_id, payload["timestamp"]) != change["hash"]:
+                store.invalidate("hash_mismatch", [token_id])
+
+
+def _sampled(
+    snapshots: list[dict[str, Any]],
+    deltas: list[dict[str, Any]],
+    interval: int,
+    *,
+    verify: bool,
+) -> None:
+    store = _loaded_store(
+        snapshots,
+        hash_check_interval=interval,
+        max_pending_hash_checks=len(deltas) + len(snapshots),
+    )
+    for payload in deltas:
+        store.apply_payload(payload)
+    if verify and store.verify_hashes():
+        msg = "unexpected hash mismatch"
+        raise AssertionError(msg)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=30)
+    parser.add_argument("--deltas-per-token", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    snapshots, deltas = _payloads(args.tokens, args.depth, args.deltas_per_token)
+    intervals = (1, 10, 100)
+
+    report(
+        f"critical path: applying {len(deltas):,} deltas",
+        [
+            measure(
+                "no checking",
+                len(deltas),
+                partial(_sampled, snapshots, deltas, 0, verify=False),
+                repeat=args.repeat,
+            ),
+            *(
+                measure(
+                    f"sample 1/{interval}",
+                    len(deltas),
+                    partial(_sampled, snapshots, deltas, interval, verify=False),
+                    repeat=args.repeat,
+                )
+                for interval in intervals
+            ),
+        ],
+        unit="deltas",
+    )
+    report(
+        "total cost including verification",
+        [
+            measure(
+                "inline pydantic hash",
+                len(deltas),
+                partial(_inline, snapshots, deltas),
+                repeat=args.repeat,
+            ),
+            *(
+                measure(
+                    f"sample 1/{interval} + verify",
+                    len(deltas),
+                    partial(_sampled, snapshots, deltas, interval, verify=True),
+                    repeat=args.repeat,
+                )
+                for interval in intervals
+            ),
+        ],
+        unit="deltas",
+    )
+
+
+if __name__ == "__main__":
+    main()
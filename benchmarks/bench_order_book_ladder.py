@@ -0,0 +1,163 @@
+"""
+Deep-book delta bursts: plain ``dict`` sides vs ``SortedPriceLadder`` sides.
+
+The baseline reproduces the previous ``LocalOrderBookStore`` algorithm: each
+side is a ``dict[float, float]``, crossing removal scans every level, and the
+top two levels are recomputed with ``nlargest``/``nsmallest`` after each
+change. The candidate is the store itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from heapq import nlargest, nsmallest
+from typing import Any
+
+from polymarket_apis.clients.websockets_client import LocalOrderBookStore
+
+from ._common import book_payload, delta_burst, measure, report, token_ids
+
+
+class _DictBook:
+    """The pre-ladder algorithm, kept verbatim for comparison."""
+
+    def __init__(self) -> None:
+        self.bids: dict[str, dict[float, float]] = {}
+        self.asks: dict[str, dict[float, float]] = {}
+        self.best_bid: dict[str, float] = {}
+        self.best_ask: dict[str, float] = {}
+        self.top: dict[str, tuple[object, object]] = {}
+
+    def apply(self, payload: dict[str, Any]) -> None:
+        if payload["event_type"] == "book":
+            token_id = payload["asset_id"]
+            self.bids[token_id] = {
+                float(level["price"]): float(level["size"]) for level in payload["bids"]
+            }
+            self.asks[token_id] = {
+                float(level["price"]): float(level["size"]) for level in payload["asks"]
+            }
+            self._refresh(token_id)
+            return
+        for item in payload["price_changes"]:
+            token_id = item["asset_id"]
+            price = float(item["price"])
+            size = float(item["size"])
+            side = item["side"]
+            if size > 0:
+                if side == "BUY":
+                    best_ask = self.best_ask.get(token_id)
+                    if best_ask is not None and price > best_ask:
+                        asks = self.asks.setdefault(token_id, {})
+                        for ask_price in list(asks):
+                            if best_ask <= ask_price < price:
+                                asks.pop(ask_price, None)
+                else:
+                    best_bid = self.best_bid.get(token_id)
+                    if best_bid is not None and price < best_bid:
+                        bids = self.bids.setdefault(token_id, {})
+                        for bid_price in list(bids):
+                            if price < bid_price <= best_bid:
+                                bids.pop(bid_price, None)
+            levels = (
+                self.bids.setdefault(token_id, {})
+                if side == "BUY"
+                else self.asks.setdefault(token_id, {})
+            )
+            if size == 0:
+                levels.pop(price, None)
+            else:
+                levels[price] = size
+            self._refresh(token_id)
+
+    def _refresh(self, token_id: str) -> None:
+        top_bids = tuple(nlargest(2, self.bids.get(token_id, {}).items()))
+        top_asks = tuple(nsmallest(2, self.asks.get(token_id, {}).items()))
+        self.top[token_id] = (top_bids, top_asks)
+        if top_bids:
+            self.best_bid[token_id] = top_bids[0][0]
+        else:
+            self.best_bid.pop(token_id, None)
+        if top_asks:
+            self.best_ask[token_id] = top_asks[0][0]
+        else:
+            self.best_ask.pop(token_id, None)
+
+
+def _payloads(
+    tokens: int, depth: int, deltas_per_token: int, tick: float
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    ids = token_ids(tokens)
+    snapshots = [book_payload(token_id, depth=depth, tick=tick) for token_id in ids]
+    deltas: list[dict[str, Any]] = []
+    for index, token_id in enumerate(ids):
+        deltas.extend(
+            delta_burst(
+                token_id,
+                count=deltas_per_token,
+                tick=tick,
+                spread_ticks=depth,
+                seed=index,
+            )
+        )
+    # Round-trip through JSON so both sides see the same string-typed fields.
+    return (
+        json.loads(json.dumps(snapshots)),
+        json.loads(json.dumps(deltas)),
+    )
+
+
+def _run_dict(snapshots: list[dict[str, Any]], deltas: list[dict[str, Any]]) -> None:
+    book = _DictBook()
+    for payload in snapshots:
+        book.apply(payload)
+    for payload in deltas:
+        book.apply(payload)
+
+
+def _run_ladder(snapshots: list[dict[str, Any]], deltas: list[dict[str, Any]]) -> None:
+    store = LocalOrderBookStore()
+    for payload in snapshots:
+        store.apply_payload(payload)
+    for payload in deltas:
+        store.apply_payload(payload)
+
+
+def _compare(
+    tokens: int, depth: int, deltas_per_token: int, tick: float, repeat: int
+) -> None:
+    snapshots, deltas = _payloads(tokens, depth, deltas_per_token, tick)
+    report(
+        f"depth {depth} per side, tick {tick:g} ({len(deltas):,} deltas)",
+        [
+            measure(
+                "dict + nlargest",
+                len(deltas),
+                lambda: _run_dict(snapshots, deltas),
+                repeat=repeat,
+            ),
+            measure(
+                "sorted ladder",
+                len(deltas),
+                lambda: _run_ladder(snapshots, deltas),
+                repeat=repeat,
+            ),
+        ],
+        unit="deltas",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--deltas-per-token", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for depth, tick in ((40, 0.01), (400, 0.001), (2_000, 0.0001)):
+        _compare(args.tokens, depth, args.deltas_per_token, tick, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
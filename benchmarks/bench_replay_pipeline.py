@@ -0,0 +1,98 @@
+"""
+Whole ingest pipeline from a recording, without the network.
+
+Synthesizes a market session, records it with ``FrameRecorder`` and replays it
+with ``replay_frames`` as fast as possible, separating the cost of the local
+book, the pydantic parser and both together.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from polymarket_apis.clients.websockets_client import LocalOrderBookStore
+from polymarket_apis.clients.websockets_recording import (
+    FrameRecord,
+    FrameRecorder,
+    read_frames,
+    replay_frames,
+)
+
+from ._common import Timing, book_payload, delta_burst, encode, report, token_ids
+
+
+def _session(tokens: int, depth: int, deltas_per_token: int) -> list[str]:
+    ids = token_ids(tokens)
+    snapshots = [book_payload(token_id, depth=depth) for token_id in ids]
+    bursts = [
+        delta_burst(token_id, count=deltas_per_token, spread_ticks=depth, seed=index)
+        for index, token_id in enumerate(ids)
+    ]
+    deltas = [burst[step] for step in range(deltas_per_token) for burst in bursts]
+    return encode([*snapshots, *deltas])
+
+
+def _replay(
+    label: str,
+    records: list[FrameRecord],
+    *,
+    store: bool,
+    parse: bool,
+    repeat: int,
+) -> Timing:
+    best = float("inf")
+    for _ in range(repeat):
+        events: list[object] = []
+        stats = asyncio.run(
+            replay_frames(
+                records,
+                process_event=events.append if parse else None,
+                local_order_books=LocalOrderBookStore() if store else None,
+            )
+        )
+        best = min(best, stats.seconds)
+    return Timing(label=label, operations=len(records), seconds=best)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=30)
+    parser.add_argument("--deltas-per-token", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    frames = _session(args.tokens, args.depth, args.deltas_per_token)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "session.jsonl.gz"
+        started = time.perf_counter()
+        with FrameRecorder(path) as recorder:
+            for text in frames:
+                recorder.record("market", text)
+            handed_off = time.perf_counter() - started
+        written = time.perf_counter() - started
+        size = path.stat().st_size
+        records = list(read_frames(path))
+
+    print(f"recorded {len(frames):,} frames, {size / 2**20:.1f} MiB compressed")
+    print(f"  record() hand-off   {len(frames) / handed_off:>12,.0f} frames/s")
+    print(f"  written and closed  {len(frames) / written:>12,.0f} frames/s")
+    report(
+        f"replay {len(records):,} frames as fast as possible",
+        [
+            _replay("store only", records, store=True, parse=False, repeat=args.repeat),
+            _replay("parse only", records, store=False, parse=True, repeat=args.repeat),
+            _replay(
+                "store + parse", records, store=True, parse=True, repeat=args.repeat
+            ),
+        ],
+        unit="frames",
+    )
+
+
+if __name__ == "__main__":
+    main()
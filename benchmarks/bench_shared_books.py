@@ -0,0 +1,115 @@
+"""
+Shared-memory order books: publisher overhead and reader access cost.
+
+Applies the same delta stream to a ``LocalOrderBookStore`` with and without a
+``SharedOrderBookPublisher`` attached, then times ``SharedOrderBookReader``
+``best_bid`` and ``snapshot`` next to the in-process store accessors they
+replace in a consumer process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from polymarket_apis.clients.websockets_client import LocalOrderBookStore
+from polymarket_apis.clients.websockets_shared_books import (
+    SharedOrderBookPublisher,
+    SharedOrderBookReader,
+)
+
+from ._common import book_payload, delta_burst, measure, report, token_ids
+
+
+def _apply(store: LocalOrderBookStore, payloads: list[object]) -> None:
+    for payload in payloads:
+        store.apply_payload(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--deltas-per-token", type=int, default=400)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = token_ids(args.tokens)
+    books = [
+        json.loads(json.dumps(book_payload(token_id, depth=40))) for token_id in ids
+    ]
+    deltas: list[object] = [
+        payload
+        for index, token_id in enumerate(ids)
+        for payload in delta_burst(token_id, count=args.deltas_per_token, seed=index)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "books"
+        plain = LocalOrderBookStore(depth=args.depth)
+        published = LocalOrderBookStore(depth=args.depth)
+        _apply(plain, books)
+        _apply(published, books)
+        with (
+            SharedOrderBookPublisher(path, published),
+            SharedOrderBookReader(path) as reader,
+        ):
+            report(
+                f"apply {len(deltas):,} deltas (depth {args.depth})",
+                [
+                    measure(
+                        "store",
+                        len(deltas),
+                        lambda: _apply(plain, deltas),
+                        repeat=args.repeat,
+                    ),
+                    measure(
+                        "store + publisher",
+                        len(deltas),
+                        lambda: _apply(published, deltas),
+                        repeat=args.repeat,
+                    ),
+                ],
+                unit="deltas",
+            )
+            reads = len(ids) * 100
+            report(
+                f"{reads:,} reads",
+                [
+                    measure(
+                        "store.best_bid",
+                        reads,
+                        lambda: [
+                            published.best_bid(t) for t in ids for _ in range(100)
+                        ],
+                        repeat=args.repeat,
+                    ),
+                    measure(
+                        "reader.best_bid",
+                        reads,
+                        lambda: [reader.best_bid(t) for t in ids for _ in range(100)],
+                        repeat=args.repeat,
+                    ),
+                    measure(
+                        "store.snapshot",
+                        reads,
+                        lambda: [
+                            published.snapshot(t) for t in ids for _ in range(100)
+                        ],
+                        repeat=args.repeat,
+                    ),
+                    measure(
+                        "reader.snapshot",
+                        reads,
+                        lambda: [reader.snapshot(t) for t in ids for _ in range(100)],
+                        repeat=args.repeat,
+                    ),
+                ],
+                unit="reads",
+            )
+
+
+if __name__ == "__main__":
+    main()
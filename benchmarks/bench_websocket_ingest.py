@@ -0,0 +1,351 @@
+"""
+End-to-end websocket ingest against a local stand-in server.
+
+For every channel, ``message_mode`` and queue overflow policy, a child process
+serves synthetic traffic on localhost at a fixed rate (see ``_ws_server``) and
+``AsyncPolymarketWebsocketsClient`` consumes it with a callback that stamps
+each event. Reported per case:
+
+- sustained frames/s actually delivered to the callback;
+- p50/p99 latency from the server handing a frame to the socket to the
+  callback seeing it, i.e. receive-to-callback plus one loopback hop;
+- dropped frames (sent but never delivered, e.g. evicted by ``drop_oldest`` or
+  lost in a reconnect, or merged into a later frame by ``conflate``, which only
+  runs on the market channel) and unsent frames (due while the client was
+  away).
+
+``--callback-cost-us`` and ``--queue-maxsize`` push the client into overflow so
+that the policies actually diverge. ``--batch-max-size`` switches to batch
+callbacks; the callback cost is then paid once per batch.
+
+Each case also samples event loop lag: a task that sleeps 1 ms in a loop and
+records how late it wakes up. ``--burst`` releases the schedule in groups of
+frames (with ``--book-ratio 1`` and a large ``--depth``, bursts of snapshots)
+and ``--parse-executors inline,thread,process`` compares validating events on
+the loop against ``WebsocketCallbackConfig(parse_executor=...)`` backed by a
+thread or process pool of ``--parse-workers``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal, cast, get_args
+
+from polymarket_apis.clients.websockets_client import (
+    AsyncPolymarketWebsocketsClient,
+    MessageMode,
+    MessageQueueOverflowPolicy,
+    WebsocketCallbackConfig,
+    WebsocketQueueConfig,
+    WebsocketReconnectConfig,
+)
+from polymarket_apis.types.clob_types import ApiCreds
+
+from ._common import token_ids
+from ._ws_server import (
+    Channel,
+    ServerStats,
+    TrafficConfig,
+    run_server,
+    sequence_from_timestamp_ms,
+)
+
+type ParseExecutorKind = Literal["inline", "thread", "process"]
+
+CHANNELS: tuple[Channel, ...] = ("market", "user", "real_time_data")
+_DRAIN_POLL_SECONDS = 0.25
+_LAG_PROBE_NS = 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class CaseResult:
+    message_mode: str
+    overflow_policy: str
+    parse_executor: str
+    offered: int
+    sent: int
+    delivered: int
+    seconds: float
+    latencies_ns: list[int]
+    loop_lags_ns: list[int]
+    connections: int
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.delivered / self.seconds if self.seconds else 0.0
+
+    def latency_us(self, quantile: float) -> float:
+        return _quantile(self.latencies_ns, quantile) / 1e3
+
+    def loop_lag_ms(self, quantile: float) -> float:
+        return _quantile(self.loop_lags_ns, quantile) / 1e6
+
+
+def _quantile(sorted_ns: list[int], quantile: float) -> float:
+    if not sorted_ns:
+        return float("nan")
+    return sorted_ns[min(len(sorted_ns) - 1, int(quantile * len(sorted_ns)))]
+
+
+def _sequence(event: object) -> int | None:
+    """Recover the schedule position the server stamped into ``timestamp``."""
+    if isinstance(event, str):
+        payload = json.loads(event)
+        timestamp = payload.get("timestamp") if isinstance(payload, dict) else None
+    else:
+        timestamp = getattr(event, "timestamp", None)
+    if isinstance(timestamp, datetime):
+        return sequence_from_timestamp_ms(round(timestamp.timestamp() * 1000))
+    if isinstance(timestamp, (int, str)):
+        return sequence_from_timestamp_ms(int(timestamp))
+    return None
+
+
+@contextmanager
+def _parse_executor(kind: ParseExecutorKind, workers: int) -> Iterator[Executor | None]:
+    if kind == "inline":
+        yield None
+        return
+    executor: Executor
+    if kind == "thread":
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        # Start the workers now rather than on the first burst.
+        list(executor.map(abs, range(workers * 4)))
+    try:
+        yield executor
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+async def _sample_loop_lag(lags: list[int]) -> None:
+    while True:
+        started = time.monotonic_ns()
+        await asyncio.sleep(_LAG_PROBE_NS / 1e9)
+        lags.append(time.monotonic_ns() - started - _LAG_PROBE_NS)
+
+
+async def _consume(
+    config: TrafficConfig,
+    port: int,
+    pipe: Any,
+    *,
+    message_mode: MessageMode,
+    overflow_policy: MessageQueueOverflowPolicy,
+    queue_maxsize: int,
+    callback_cost_ns: int,
+    batch_max_size: int | None,
+    parse_executor: Executor | None,
+) -> tuple[list[tuple[int, object]], list[int]]:
+    received: list[tuple[int, object]] = []
+    loop_lags: list[int] = []
+
+    def on_event(event: object) -> None:
+        now = time.monotonic_ns()
+        if batch_max_size is None:
+            received.append((now, event))
+        else:
+            received.extend((now, item) for item in cast("list[object]", event))
+        if callback_cost_ns:
+            deadline = now + callback_cost_ns
+            while time.monotonic_ns() < deadline:
+                pass
+
+    queue = (
+        WebsocketQueueConfig(
+            maxsize=queue_maxsize, user_overflow_policy=overflow_policy
+        )
+        if config.channel == "user"
+        else WebsocketQueueConfig(
+            maxsize=queue_maxsize, overflow_policy=overflow_policy
+        )
+    )
+    client = AsyncPolymarketWebsocketsClient(
+        callbacks=WebsocketCallbackConfig(
+            batch_max_size=batch_max_size, parse_executor=parse_executor
+        ),
+        queue=queue,
+        reconnect=WebsocketReconnectConfig(initial_delay=0.05, max_delay=0.2),
+    )
+    url = f"ws://127.0.0.1:{port}"
+    client.url_market = client.url_user = client.url_real_time_data = url
+    if config.channel == "market":
+        await client.open_market_connection(
+            token_ids(config.tokens), process_event=on_event, message_mode=message_mode
+        )
+    elif config.channel == "user":
+        creds = ApiCreds(key="bench", secret="bench", passphrase="bench")  # noqa: S106
+        await client.open_user_connection(
+            creds, process_event=on_event, message_mode=message_mode
+        )
+    else:
+        await client.open_real_time_data_connection(
+            [{"topic": "crypto_prices", "type": "update"}],
+            process_event=on_event,
+            message_mode=message_mode,
+        )
+    sampler = asyncio.create_task(_sample_loop_lag(loop_lags))
+    try:
+        await asyncio.to_thread(pipe.recv)
+        delivered = -1
+        while delivered != len(received):
+            delivered = len(received)
+            await asyncio.sleep(_DRAIN_POLL_SECONDS)
+    finally:
+        sampler.cancel()
+        await client.close()
+    return received, loop_lags
+
+
+def run_case(
+    config: TrafficConfig,
+    *,
+    message_mode: MessageMode,
+    overflow_policy: MessageQueueOverflowPolicy,
+    queue_maxsize: int,
+    callback_cost_us: float,
+    batch_max_size: int | None = None,
+    parse_executor: ParseExecutorKind = "inline",
+    parse_workers: int = 4,
+) -> CaseResult:
+    context = multiprocessing.get_context("spawn")
+    pipe, child_pipe = context.Pipe()
+    server = context.Process(target=run_server, args=(config, child_pipe), daemon=True)
+    server.start()
+    try:
+        with _parse_executor(parse_executor, parse_workers) as executor:
+            port = pipe.recv()
+            received, loop_lags = asyncio.run(
+                _consume(
+                    config,
+                    port,
+                    pipe,
+                    message_mode=message_mode,
+                    overflow_policy=overflow_policy,
+                    queue_maxsize=queue_maxsize,
+                    callback_cost_ns=int(callback_cost_us * 1e3),
+                    batch_max_size=batch_max_size,
+                    parse_executor=executor,
+                )
+            )
+        pipe.send("stop")
+        stats: ServerStats = pipe.recv()
+    finally:
+        server.join(timeout=5)
+        if server.is_alive():
+            server.kill()
+
+    latencies: list[int] = []
+    first_ns = last_ns = 0
+    for received_ns, event in received:
+        seq = _sequence(event)
+        if seq is None or seq >= len(stats.sent_ns) or not stats.sent_ns[seq]:
+            continue
+        latencies.append(received_ns - stats.sent_ns[seq])
+        first_ns = first_ns or received_ns
+        last_ns = received_ns
+    latencies.sort()
+    loop_lags.sort()
+    return CaseResult(
+        message_mode=message_mode,
+        overflow_policy=overflow_policy,
+        parse_executor=parse_executor,
+        offered=config.total_frames,
+        sent=stats.sent,
+        delivered=len(latencies),
+        seconds=(last_ns - first_ns) / 1e9,
+        latencies_ns=latencies,
+        loop_lags_ns=loop_lags,
+        connections=stats.connections,
+    )
+
+
+def print_results(config: TrafficConfig, results: list[CaseResult]) -> None:
+    print(
+        f"{config.channel}: {config.rate:,} frames/s offered for {config.duration:g} s"
+        f" in bursts of {config.burst}"
+    )
+    print(
+        f"  {'mode':<8} {'policy':<12} {'parse':<8} {'frames/s':>10}"
+        f" {'p50 us':>9} {'p99 us':>9} {'lag p99 ms':>10} {'lag max ms':>10}"
+        f" {'dropped':>8} {'unsent':>8} {'conns':>6}"
+    )
+    for result in results:
+        print(
+            f"  {result.message_mode:<8} {result.overflow_policy:<12}"
+            f" {result.parse_executor:<8} {result.frames_per_second:>10,.0f}"
+            f" {result.latency_us(0.5):>9,.0f} {result.latency_us(0.99):>9,.0f}"
+            f" {result.loop_lag_ms(0.99):>10,.2f} {result.loop_lag_ms(1.0):>10,.2f}"
+            f" {result.sent - result.delivered:>8,} {result.offered - result.sent:>8,}"
+            f" {result.connections:>6}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--channels", default=",".join(CHANNELS))
+    parser.add_argument("--rate", type=int, default=10_000)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--book-ratio", type=float, default=0.02)
+    parser.add_argument("--trade-ratio", type=float, default=0.05)
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--queue-maxsize", type=int, default=1_000)
+    parser.add_argument("--callback-cost-us", type=float, default=0.0)
+    parser.add_argument("--batch-max-size", type=int, default=None)
+    parser.add_argument("--parse-executors", default="inline")
+    parser.add_argument("--parse-workers", type=int, default=4)
+    parser.add_argument("--modes", default=",".join(get_args(MessageMode)))
+    parser.add_argument(
+        "--policies", default=",".join(get_args(MessageQueueOverflowPolicy))
+    )
+    args = parser.parse_args()
+    # One warning per dropped frame would otherwise dominate the measurement.
+    logging.getLogger("polymarket_apis").setLevel(logging.CRITICAL)
+
+    for channel in args.channels.split(","):
+        config = TrafficConfig(
+            channel=channel,
+            rate=args.rate,
+            duration=args.duration,
+            tokens=args.tokens,
+            depth=args.depth,
+            book_ratio=args.book_ratio,
+            trade_ratio=args.trade_ratio,
+            burst=args.burst,
+        )
+        results = [
+            run_case(
+                config,
+                message_mode=message_mode,
+                overflow_policy=overflow_policy,
+                queue_maxsize=args.queue_maxsize,
+                callback_cost_us=args.callback_cost_us,
+                batch_max_size=args.batch_max_size,
+                parse_executor=parse_executor,
+                parse_workers=args.parse_workers,
+            )
+            for message_mode in args.modes.split(",")
+            for overflow_policy in args.policies.split(",")
+            for parse_executor in args.parse_executors.split(",")
+            if overflow_policy != "conflate" or channel == "market"
+        ]
+        print_results(config, results)
+
+
+if __name__ == "__main__":
+    main()
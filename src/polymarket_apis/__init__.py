@@ -21,10 +21,13 @@ __email__ = "razvan@gheorghe.me"
 
 if TYPE_CHECKING:
     from .clients import (
+        AsyncPolymarketClobClient,
         AsyncPolymarketGraphQLClient,
+        AsyncPolymarketReadOnlyClobClient,
         AsyncPolymarketWebsocketsClient,
         LocalOrderBookSnapshot,
         LocalOrderBookStore,
+        OrderBookResyncConfig,
         PolymarketClobClient,
         PolymarketDataClient,
         PolymarketGammaClient,
@@ -48,7 +51,9 @@ if TYPE_CHECKING:
 
 __all__ = [
     "ApiCreds",
+    "AsyncPolymarketClobClient",
     "AsyncPolymarketGraphQLClient",
+    "AsyncPolymarketReadOnlyClobClient",
     "AsyncPolymarketWebsocketsClient",
     "FeeSchedule",
     "LocalOrderBookSnapshot",
@@ -56,6 +61,7 @@ __all__ = [
     "MarketIDs",
     "MarketOrderArgs",
     "OrderArgs",
+    "OrderBookResyncConfig",
     "OrderType",
     "PolymarketClobClient",
     "PolymarketDataClient",
@@ -75,6 +81,8 @@ __all__ = [
 
 _EXPORT_MAP = {
     "ApiCreds": ".types.clob_types",
+    "AsyncPolymarketClobClient": ".clients",
+    "AsyncPolymarketReadOnlyClobClient": ".clients",
     "AsyncPolymarketWebsocketsClient": ".clients",
     "AsyncPolymarketGraphQLClient": ".clients",
     "FeeSchedule": ".types",
@@ -83,6 +91,7 @@ _EXPORT_MAP = {
     "MarketOrderArgs": ".types.clob_types",
     "MarketIDs": ".types.clob_types",
     "OrderArgs": ".types.clob_types",
+    "OrderBookResyncConfig": ".clients",
     "OrderType": ".types.clob_types",
     "PolymarketClobClient": ".clients",
     "PolymarketDataClient": ".clients",
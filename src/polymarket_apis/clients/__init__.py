@@ -11,7 +11,19 @@ from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .clob_client import PolymarketClobClient, PolymarketReadOnlyClobClient
+    from ..utilities._latency_histogram import LatencyHistogram
+    from .clob_client import (
+        AsyncPolymarketClobClient,
+        AsyncPolymarketReadOnlyClobClient,
+        PolymarketClobClient,
+        PolymarketReadOnlyClobClient,
+    )
+    from .clob_metadata_cache import (
+        CacheStats,
+        LruTtlCache,
+        MetadataCacheConfig,
+        SqliteMetadataCache,
+    )
     from .data_client import PolymarketDataClient
     from .gamma_client import PolymarketGammaClient
     from .graphql_client import (
@@ -21,33 +33,71 @@ if TYPE_CHECKING:
     from .web3_client import PolymarketGaslessWeb3Client, PolymarketWeb3Client
     from .websockets_client import (
         AsyncChannelConnection,
+        AsyncMarketConnection,
         AsyncPolymarketWebsocketsClient,
         AsyncRealTimeDataConnection,
+        AsyncShardedMarketConnection,
         ConnectionHealth,
+        ConnectionLatency,
+        EventBookAggregate,
         LocalOrderBookSnapshot,
         LocalOrderBookStore,
+        MergedOrderBook,
         MessageMode,
+        OrderBookResyncConfig,
         PolymarketWebsocketsClient,
+        ShardedConnectionHealth,
         SyncChannelConnection,
+        SyncMarketConnection,
         SyncRealTimeDataConnection,
+        SyncShardedMarketConnection,
         WebsocketCallbackConfig,
         WebsocketQueueConfig,
         WebsocketReconnectConfig,
         parse_market_event,
+        parse_market_lazy_event,
+        parse_market_struct_event,
         parse_real_time_data_event,
         parse_sports_event,
         parse_user_event,
+        parse_user_lazy_event,
+    )
+    from .websockets_recording import (
+        FrameRecord,
+        FrameRecorder,
+        ReplayStats,
+        read_frames,
+        replay_frames,
+    )
+    from .websockets_shared_books import (
+        SharedOrderBookPublisher,
+        SharedOrderBookReader,
+        SharedOrderBookSnapshot,
     )
 
 __all__ = [
     "AsyncChannelConnection",
+    "AsyncMarketConnection",
+    "AsyncPolymarketClobClient",
     "AsyncPolymarketGraphQLClient",
+    "AsyncPolymarketReadOnlyClobClient",
     "AsyncPolymarketWebsocketsClient",
     "AsyncRealTimeDataConnection",
+    "AsyncShardedMarketConnection",
+    "CacheStats",
     "ConnectionHealth",
+    "ConnectionLatency",
+    "EventBookAggregate",
+    "FrameRecord",
+    "FrameRecorder",
+    "LatencyHistogram",
     "LocalOrderBookSnapshot",
     "LocalOrderBookStore",
+    "LruTtlCache",
+    "MergedOrderBook",
     "MessageMode",
+    "MetadataCacheConfig",
+    "OrderBookResyncConfig",
     "PolymarketClobClient",
     "PolymarketDataClient",
     "PolymarketGammaClient",
@@ -56,26 +106,53 @@ __all__ = [
     "PolymarketReadOnlyClobClient",
     "PolymarketWeb3Client",
     "PolymarketWebsocketsClient",
+    "ReplayStats",
+    "ShardedConnectionHealth",
+    "SharedOrderBookPublisher",
+    "SharedOrderBookReader",
+    "SharedOrderBookSnapshot",
+    "SqliteMetadataCache",
     "SyncChannelConnection",
+    "SyncMarketConnection",
     "SyncRealTimeDataConnection",
+    "SyncShardedMarketConnection",
     "WebsocketCallbackConfig",
     "WebsocketQueueConfig",
     "WebsocketReconnectConfig",
     "parse_market_event",
+    "parse_market_lazy_event",
+    "parse_market_struct_event",
     "parse_real_time_data_event",
     "parse_sports_event",
     "parse_user_event",
+    "parse_user_lazy_event",
+    "read_frames",
+    "replay_frames",
 ]
 
 _EXPORT_MAP = {
     "AsyncChannelConnection": ".websockets_client",
+    "AsyncMarketConnection": ".websockets_client",
+    "AsyncPolymarketClobClient": ".clob_client",
+    "AsyncPolymarketReadOnlyClobClient": ".clob_client",
     "AsyncPolymarketWebsocketsClient": ".websockets_client",
     "AsyncPolymarketGraphQLClient": ".graphql_client",
     "AsyncRealTimeDataConnection": ".websockets_client",
+    "AsyncShardedMarketConnection": ".websockets_client",
+    "CacheStats": ".clob_metadata_cache",
     "ConnectionHealth": ".websockets_client",
+    "ConnectionLatency": ".websockets_client",
+    "EventBookAggregate": ".websockets_client",
+    "FrameRecord": ".websockets_recording",
+    "FrameRecorder": ".websockets_recording",
+    "LatencyHistogram": "..utilities._latency_histogram",
     "LocalOrderBookStore": ".websockets_client",
     "LocalOrderBookSnapshot": ".websockets_client",
+    "LruTtlCache": ".clob_metadata_cache",
+    "MergedOrderBook": ".websockets_client",
     "MessageMode": ".websockets_client",
+    "MetadataCacheConfig": ".clob_metadata_cache",
+    "OrderBookResyncConfig": ".websockets_client",
     "PolymarketClobClient": ".clob_client",
     "PolymarketDataClient": ".data_client",
     "PolymarketGammaClient": ".gamma_client",
@@ -84,15 +161,28 @@ _EXPORT_MAP = {
     "PolymarketReadOnlyClobClient": ".clob_client",
     "PolymarketWeb3Client": ".web3_client",
     "PolymarketWebsocketsClient": ".websockets_client",
+    "ReplayStats": ".websockets_recording",
+    "ShardedConnectionHealth": ".websockets_client",
+    "SharedOrderBookPublisher": ".websockets_shared_books",
+    "SharedOrderBookReader": ".websockets_shared_books",
+    "SharedOrderBookSnapshot": ".websockets_shared_books",
+    "SqliteMetadataCache": ".clob_metadata_cache",
     "SyncChannelConnection": ".websockets_client",
+    "SyncMarketConnection": ".websockets_client",
     "SyncRealTimeDataConnection": ".websockets_client",
+    "SyncShardedMarketConnection": ".websockets_client",
     "WebsocketCallbackConfig": ".websockets_client",
     "WebsocketQueueConfig": ".websockets_client",
     "WebsocketReconnectConfig": ".websockets_client",
     "parse_real_time_data_event": ".websockets_client",
     "parse_market_event": ".websockets_client",
+    "parse_market_lazy_event": ".websockets_client",
+    "parse_market_struct_event": ".websockets_client",
     "parse_sports_event": ".websockets_client",
     "parse_user_event": ".websockets_client",
+    "parse_user_lazy_event": ".websockets_client",
+    "read_frames": ".websockets_recording",
+    "replay_frames": ".websockets_recording",
 }
 
 
@@ -1,9 +1,21 @@
+import asyncio
 import json
 import logging
 import random
+import sqlite3
 import time
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from time import monotonic
+from functools import partial
 from typing import Any, Literal, Optional, Self, cast
 from urllib.parse import urljoin
 
@@ -46,6 +58,7 @@ from ..types.clob_types import (
 )
 from ..types.common import EthAddress, Keccak256
 from ..utilities._internal_log import (
+    current_or_new_trace_id,
     emit,
     ensure_trace_id,
     get_logger,
@@ -92,6 +105,8 @@ from ..utilities.endpoints import (
     TRADES,
 )
 from ..utilities.exceptions import (
+    RETRYABLE_CODES,
+    BulkRequestError,
     InvalidFeeRateError,
     InvalidPriceError,
     InvalidTickSizeError,
@@ -113,6 +128,16 @@ from ..utilities.signing.signer import Signer
 from ..utilities.web3.helpers import (
     detect_wallet_signature_type as detect_wallet_signature_type_from_runtime,
 )
+from .clob_metadata_cache import (
+    CacheStats,
+    LruTtlCache,
+    MetadataCacheConfig,
+    MetadataKind,
+    SqliteMetadataCache,
+)
+
+DEFAULT_BULK_CHUNK_SIZE = 500
+DEFAULT_BULK_CONCURRENCY = 8
 
 
 def _order_type_value(order_type: OrderType) -> str:
@@ -215,105 +240,367 @@ def _order_action_text(order_fields: dict[str, Any], log_context: dict[str, Any]
     return f"{order_fields['side']} {order_fields['size_display']} @ {order_fields['price_display']}"
 
 
-class PolymarketReadOnlyClobClient:
-    """Read-only order book related operations."""
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _concat[T](parts: list[list[T]]) -> list[T]:
+    return [item for part in parts for item in part]
+
+
+def _union[K, V](parts: list[dict[K, V]]) -> dict[K, V]:
+    merged: dict[K, V] = {}
+    for part in parts:
+        merged.update(part)
+    return merged
+
+
+def _merge_bid_asks(parts: list[dict[str, BidAsk]]) -> dict[str, BidAsk]:
+    # Both sides of a token can land in different chunks; keep each side.
+    merged: dict[str, BidAsk] = {}
+    for part in parts:
+        for token_id, bid_ask in part.items():
+            seen = merged.get(token_id)
+            merged[token_id] = (
+                bid_ask
+                if seen is None
+                else BidAsk(
+                    BUY=seen.BUY if bid_ask.BUY is None else bid_ask.BUY,
+                    SELL=seen.SELL if bid_ask.SELL is None else bid_ask.SELL,
+                )
+            )
+    return merged
+
+
+def _book_params_token_id(param: BookParams) -> str:
+    return param.token_id
+
+
+def _token_id(token_id: str) -> str:
+    return token_id
+
+
+def _stored_tick_size(value: Any) -> TickSize:
+    return cast("TickSize", value)
+
+
+def _stored_condition_id(value: Any) -> Keccak256:
+    return cast("Keccak256", value)
+
+
+def _stored_fee_info(value: Any) -> FeeInfo:
+    return FeeInfo(**value)
+
+
+_METADATA_DECODERS: dict[MetadataKind, Callable[[Any], Any]] = {
+    "tick_size": _stored_tick_size,
+    "neg_risk": bool,
+    "fee_rate": int,
+    "fee_info": _stored_fee_info,
+    "condition_id": _stored_condition_id,
+}
+_METADATA_ENCODERS: dict[MetadataKind, Callable[[Any], Any]] = {
+    "fee_info": FeeInfo.model_dump,
+}
+
+
+def _market_fee_info(info: ClobMarketInfo) -> FeeInfo:
+    if info.fee_data is None:
+        return FeeInfo()
+    return FeeInfo(rate=info.fee_data.rate, exponent=float(info.fee_data.exponent))
+
+
+@dataclass(frozen=True, slots=True)
+class _ClobRequest:
+    method: str
+    url: str
+    params: Mapping[str, Any] | None = None
+    headers: Mapping[str, str] | None = None
+    json: Any = None
+    content: bytes | None = None
+
+
+# A client operation: yields each request it needs and is sent the response,
+# so the sync and async clients drive the same code over their own transport.
+type _ClobCall[T] = Generator[_ClobRequest, httpx.Response, T]
+
+
+class _ClobClientBase:
+    """Request building, caches and response parsing shared by the sync and async clients."""
+
+    # Whether a metadata lookup that misses memory reads ``metadata_cache``.
+    _metadata_read_through = True
 
     def __init__(
         self,
         tick_size_ttl: float = 300.0,
-        proxy: Optional[str] = None,
         *,
         logger: Optional[logging.Logger] = None,
         max_retries: int = 3,
         base_retry_delay: float = 0.25,
         max_retry_delay: float = 30.0,
+        metadata_cache: SqliteMetadataCache | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
     ) -> None:
-        self.client = httpx.Client(http2=True, timeout=30.0, proxy=proxy)
         self.base_url: str = "https://clob.polymarket.com"
-        self.tick_size_ttl = tick_size_ttl
         self._max_retries = max_retries
         self._base_retry_delay = base_retry_delay
         self._max_retry_delay = max_retry_delay
+        self.metadata_cache = metadata_cache
 
         # local cache
-        self.__tick_sizes: dict[str, tuple[TickSize, float]] = {}
-        self.__neg_risk: dict[str, bool] = {}
-        self.__fee_rates: dict[str, int] = {}
-        self.__fee_infos: dict[str, FeeInfo] = {}
-        self.__token_condition_map: dict[str, Keccak256] = {}
+        config = metadata_cache_config or MetadataCacheConfig()
+        ttls = {"tick_size": tick_size_ttl, **config.ttls}
+        self.__tick_sizes = LruTtlCache[str, TickSize](
+            config.max_entries, ttls.get("tick_size")
+        )
+        self.__neg_risk = LruTtlCache[str, bool](
+            config.max_entries, ttls.get("neg_risk")
+        )
+        self.__fee_rates = LruTtlCache[str, int](
+            config.max_entries, ttls.get("fee_rate")
+        )
+        self.__fee_infos = LruTtlCache[str, FeeInfo](
+            config.max_entries, ttls.get("fee_info")
+        )
+        self.__token_condition_map = LruTtlCache[str, Keccak256](
+            config.max_entries, ttls.get("condition_id")
+        )
+        self.__caches: dict[MetadataKind, LruTtlCache[str, Any]] = {
+            "tick_size": self.__tick_sizes,
+            "neg_risk": self.__neg_risk,
+            "fee_rate": self.__fee_rates,
+            "fee_info": self.__fee_infos,
+            "condition_id": self.__token_condition_map,
+        }
 
         self.logger = logger or get_logger(__name__)
 
     def _build_url(self, endpoint: str) -> str:
         return urljoin(self.base_url, endpoint)
 
-    def _retry_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """Execute an HTTP request with retry logic for transient failures."""
-        last_error: Optional[Exception] = None
-        for attempt in range(self._max_retries + 1):
+    def _load(
+        self, kind: MetadataKind, key: str, max_age: float | None = None
+    ) -> tuple[Any, float] | None:
+        if self.metadata_cache is None:
+            return None
+        try:
+            return self.metadata_cache.get(kind, key, max_age=max_age)
+        except sqlite3.Error as exc:
+            self._metadata_cache_failed("read", kind, exc)
+            return None
+
+    def _persist(self, items: Mapping[MetadataKind, Mapping[str, Any]]) -> None:
+        if self.metadata_cache is None or not items:
+            return
+        try:
+            self.metadata_cache.update(items)
+        except sqlite3.Error as exc:
+            self._metadata_cache_failed("write", ",".join(items), exc)
+
+    def _forget(self, kind: MetadataKind, token_id: str | None) -> None:
+        if self.metadata_cache is None:
+            return
+        try:
+            self.metadata_cache.delete(kind, token_id)
+        except sqlite3.Error as exc:
+            self._metadata_cache_failed("delete", kind, exc)
+
+    def _load_metadata_cache(self) -> None:
+        """Fill the in-memory caches from ``metadata_cache``, newest entries first."""
+        if self.metadata_cache is None:
+            return
+        for kind, cache in self.__caches.items():
             try:
-                response = self.client.request(method, url, **kwargs)
-            except (httpx.ConnectError, httpx.TimeoutException) as exc:
-                if attempt == self._max_retries:
-                    raise
-                delay = min(
-                    self._base_retry_delay * (2 ** attempt), self._max_retry_delay
-                )
-                jitter = random.uniform(0, delay * 0.1)
-                self.logger.warning(
-                    "Connection retry %d/%d after %.2fs for %s %s: %s",
-                    attempt + 1,
-                    self._max_retries,
-                    delay + jitter,
-                    method,
-                    url,
-                    str(exc),
-                    extra=log_extra(
-                        attempt=attempt + 1,
-                        max_retries=self._max_retries,
-                        error_type=type(exc).__name__,
-                        url=url,
-                    ),
+                rows = self.metadata_cache.entries(
+                    kind, max_age=cache.ttl, limit=cache.max_size
                 )
-                time.sleep(delay + jitter)
-            else:
-                if response.status_code >= 500 or response.status_code == 429:
-                    if attempt == self._max_retries:
-                        break
-                    delay = min(
-                        self._base_retry_delay * (2 ** attempt), self._max_retry_delay
-                    )
-                    jitter = random.uniform(0, delay * 0.1)
-                    self.logger.warning(
-                        "HTTP retry %d/%d after %.2fs for %s %s → %d",
-                        attempt + 1,
-                        self._max_retries,
-                        delay + jitter,
-                        method,
-                        url,
-                        response.status_code,
-                        extra=log_extra(
-                            attempt=attempt + 1,
-                            max_retries=self._max_retries,
-                            status_code=response.status_code,
-                            url=url,
-                        ),
-                    )
-                    time.sleep(delay + jitter)
-                    continue
-                return response
-
-        # If we get here, we exhausted retries
-        raise last_error or httpx.HTTPStatusError(
-            f"Max retries ({self._max_retries}) exceeded",
-            request=httpx.Request(method, url),
-            response=httpx.Response(503),
+            except sqlite3.Error as exc:
+                self._metadata_cache_failed("read", kind, exc)
+                continue
+            decode = _METADATA_DECODERS[kind]
+            now = time.time()
+            # Oldest first, so that the newest end up most recently used.
+            for key, value, updated_at in reversed(rows):
+                cache.set(key, decode(value), age=max(now - updated_at, 0.0))
+
+    def _metadata_cache_failed(
+        self, operation: str, kind: str, exc: sqlite3.Error
+    ) -> None:
+        # The persistent cache only saves round trips; never fail a request over it.
+        emit(
+            self.logger,
+            logging.WARNING,
+            "clob.metadata_cache.error",
+            "metadata cache %s failed for %s: %s",
+            operation,
+            kind,
+            exc,
+            trace_id=current_or_new_trace_id(),
+            operation=operation,
+            kind=kind,
+            error_type=type(exc).__name__,
         )
 
-    def get_ok(self) -> str:
-        response = self.client.get(self.base_url)
-        response.raise_for_status()
-        return cast("str", response.json())
+    def _cached[V](
+        self,
+        kind: MetadataKind,
+        cache: LruTtlCache[str, V],
+        token_id: str,
+        decode: Callable[[Any], V],
+    ) -> V | None:
+        value = cache.get(token_id)
+        if value is not None or not self._metadata_read_through:
+            return value
+        stored = self._load(kind, token_id, max_age=cache.ttl)
+        if stored is None:
+            return None
+        value = decode(stored[0])
+        # Carry the entry's age over so the TTL runs from when it was fetched.
+        cache.set(token_id, value, age=max(time.time() - stored[1], 0.0))
+        return value
+
+    def _store(self, items: Mapping[MetadataKind, Mapping[str, Any]]) -> None:
+        """Cache values of one response, persisting those that changed in one write."""
+        changed: dict[MetadataKind, dict[str, Any]] = {}
+        for kind, values in items.items():
+            cache = self.__caches[kind]
+            encode = _METADATA_ENCODERS.get(kind)
+            fresh = {
+                key: value if encode is None else encode(value)
+                for key, value in values.items()
+                if cache.peek(key) != value
+            }
+            cache.update(values)
+            if fresh:
+                changed[kind] = fresh
+        self._persist(changed)
+
+    @property
+    def tick_size_ttl(self) -> float | None:
+        return self.__tick_sizes.ttl
+
+    @tick_size_ttl.setter
+    def tick_size_ttl(self, ttl: float | None) -> None:
+        self.__tick_sizes.ttl = ttl
+
+    def metadata_cache_stats(self) -> dict[MetadataKind, CacheStats]:
+        """Hit, miss, eviction and expiration counts of each in-memory metadata cache."""
+        return {kind: cache.stats() for kind, cache in self.__caches.items()}
+
+    def invalidate_metadata(
+        self,
+        token_id: str | None = None,
+        kinds: Iterable[MetadataKind] | None = None,
+    ) -> None:
+        """
+        Forget cached metadata so the next lookup refetches it.
+
+        Drops ``token_id`` (every token when None) from the given ``kinds``
+        (every kind when None), in memory and in ``metadata_cache``. Call it
+        from a ``tick_size_change`` handler, or when a market is resolved.
+        """
+        for kind in self.__caches if kinds is None else kinds:
+            self.__caches[kind].invalidate(token_id)
+            self._forget(kind, token_id)
+
+    def _retry_delay(self, attempt: int) -> float:
+        delay: float = min(self._base_retry_delay * (2**attempt), self._max_retry_delay)
+        return delay + random.uniform(0, delay * 0.1)
+
+    def _retry_warning(self, attempt: int, delay: float, exc: httpx.HTTPError) -> None:
+        method, url = exc.request.method, str(exc.request.url)
+        if isinstance(exc, HTTPStatusError):
+            self.logger.warning(
+                "HTTP retry %d/%d after %.2fs for %s %s → %d",
+                attempt + 1,
+                self._max_retries,
+                delay,
+                method,
+                url,
+                exc.response.status_code,
+                extra=log_extra(
+                    attempt=attempt + 1,
+                    max_retries=self._max_retries,
+                    status_code=exc.response.status_code,
+                    url=url,
+                ),
+            )
+        else:
+            self.logger.warning(
+                "Connection retry %d/%d after %.2fs for %s %s: %s",
+                attempt + 1,
+                self._max_retries,
+                delay,
+                method,
+                url,
+                str(exc),
+                extra=log_extra(
+                    attempt=attempt + 1,
+                    max_retries=self._max_retries,
+                    error_type=type(exc).__name__,
+                    url=url,
+                ),
+            )
+
+    @staticmethod
+    def _bulk_chunks[X](
+        items: Sequence[X], chunk_size: int, max_concurrency: int
+    ) -> list[list[X]]:
+        if chunk_size < 1:
+            msg = f"chunk_size must be at least 1, got {chunk_size}"
+            raise ValueError(msg)
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        return [
+            list(items[start : start + chunk_size])
+            for start in range(0, len(items), chunk_size)
+        ]
+
+    def _bulk_result[X, R, M](
+        self,
+        operation: str,
+        chunks: list[list[X]],
+        outcomes: Sequence[R | BaseException],
+        merge: Callable[[list[R]], M],
+        token_id: Callable[[X], str],
+    ) -> M:
+        merged = merge(
+            [part for part in outcomes if not isinstance(part, BaseException)]
+        )
+        failed = [
+            (chunk, outcome)
+            for chunk, outcome in zip(chunks, outcomes, strict=True)
+            if isinstance(outcome, BaseException)
+        ]
+        if not failed:
+            return merged
+
+        failed_token_ids = [token_id(item) for chunk, _ in failed for item in chunk]
+        errors = [error for _, error in failed]
+        emit(
+            self.logger,
+            logging.WARNING,
+            "clob.bulk.partial",
+            "%s failed for %d/%d chunks (%d tokens)",
+            operation,
+            len(failed),
+            len(chunks),
+            len(failed_token_ids),
+            operation=operation,
+            trace_id=current_or_new_trace_id(),
+            chunk_count=len(chunks),
+            failed_chunk_count=len(failed),
+            failed_token_count=len(failed_token_ids),
+            error_types=sorted({type(error).__name__ for error in errors}),
+        )
+        msg = f"{operation} failed for {len(failed)} of {len(chunks)} chunks"
+        raise BulkRequestError(
+            msg, results=merged, failed_token_ids=failed_token_ids, errors=errors
+        )
 
     def detect_wallet_signature_type(
         self, address: EthAddress
@@ -330,99 +617,113 @@ class PolymarketReadOnlyClobClient:
         """
         return detect_wallet_signature_type_from_runtime(address)
 
-    def get_utc_time(self) -> datetime:
-        response = self.client.get(self._build_url(TIME))
+    def clear_tick_size_cache(self, token_id: str | None = None) -> None:
+        self.invalidate_metadata(token_id, kinds=("tick_size",))
+
+    def _get_ok(self) -> _ClobCall[str]:
+        response = yield _ClobRequest("GET", self.base_url)
+        response.raise_for_status()
+        return cast("str", response.json())
+
+    def _get_utc_time(self) -> _ClobCall[datetime]:
+        response = yield _ClobRequest("GET", self._build_url(TIME))
         response.raise_for_status()
         return datetime.fromtimestamp(response.json(), tz=UTC)
 
-    def get_tick_size(self, token_id: str) -> TickSize:
-        cached = self.__tick_sizes.get(token_id)
+    def _get_tick_size(self, token_id: str) -> _ClobCall[TickSize]:
+        cached = self._cached(
+            "tick_size", self.__tick_sizes, token_id, _stored_tick_size
+        )
         if cached is not None:
-            tick_size, cached_at = cached
-            if monotonic() - cached_at < self.tick_size_ttl:
-                return tick_size
+            return cached
 
         params = {"token_id": token_id}
-        response = self.client.get(self._build_url(GET_TICK_SIZE), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_TICK_SIZE), params=params
+        )
         response.raise_for_status()
         tick_size = cast("TickSize", str(response.json()["minimum_tick_size"]))
-        self.__tick_sizes[token_id] = (tick_size, monotonic())
+        self._store({"tick_size": {token_id: tick_size}})
 
         return tick_size
 
-    def clear_tick_size_cache(self, token_id: str | None = None) -> None:
-        if token_id is None:
-            self.__tick_sizes.clear()
-            return
-        self.__tick_sizes.pop(token_id, None)
-
-    def get_neg_risk(self, token_id: str) -> bool:
-        if token_id in self.__neg_risk:
-            return self.__neg_risk[token_id]
+    def _get_neg_risk(self, token_id: str) -> _ClobCall[bool]:
+        cached = self._cached("neg_risk", self.__neg_risk, token_id, bool)
+        if cached is not None:
+            return cached
 
         params = {"token_id": token_id}
-        response = self.client.get(self._build_url(GET_NEG_RISK), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_NEG_RISK), params=params
+        )
         response.raise_for_status()
-        self.__neg_risk[token_id] = response.json()["neg_risk"]
+        neg_risk: bool = response.json()["neg_risk"]
+        self._store({"neg_risk": {token_id: neg_risk}})
 
-        return self.__neg_risk[token_id]
+        return neg_risk
 
-    def get_fee_rate_bps(self, token_id: str) -> int:
-        if token_id in self.__fee_rates:
-            return self.__fee_rates[token_id]
+    def _get_fee_rate_bps(self, token_id: str) -> _ClobCall[int]:
+        cached = self._cached("fee_rate", self.__fee_rates, token_id, int)
+        if cached is not None:
+            return cached
 
         params = {"token_id": token_id}
-        response = self.client.get(self._build_url(GET_FEE_RATE), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_FEE_RATE), params=params
+        )
         response.raise_for_status()
-        fee_rate = response.json().get("base_fee") or 0
-        self.__fee_rates[token_id] = fee_rate
+        fee_rate: int = response.json().get("base_fee") or 0
+        self._store({"fee_rate": {token_id: fee_rate}})
 
         return fee_rate
 
-    def get_clob_market_info(self, condition_id: Keccak256) -> ClobMarketInfo:
-        response = self.client.get(
-            self._build_url(f"{GET_CLOB_MARKET_INFO}{condition_id}")
+    def _get_clob_market_info(
+        self, condition_id: Keccak256
+    ) -> _ClobCall[ClobMarketInfo]:
+        response = yield _ClobRequest(
+            "GET", self._build_url(f"{GET_CLOB_MARKET_INFO}{condition_id}")
         )
         response.raise_for_status()
         info = ClobMarketInfo(**response.json())
-        for token in info.tokens:
-            self.__token_condition_map[token.token_id] = condition_id
-            self.__tick_sizes[token.token_id] = (
-                cast("TickSize", str(info.minimum_tick_size)),
-                monotonic(),
-            )
-            if info.fee_data is None:
-                self.__fee_infos[token.token_id] = FeeInfo()
-                continue
-
-            self.__fee_infos[token.token_id] = FeeInfo(
-                rate=info.fee_data.rate,
-                exponent=float(info.fee_data.exponent),
-            )
+        tick_size = cast("TickSize", str(info.minimum_tick_size))
+        fee_info = _market_fee_info(info)
+        token_ids = [token.token_id for token in info.tokens]
+        self._store(
+            {
+                "condition_id": dict.fromkeys(token_ids, condition_id),
+                "tick_size": dict.fromkeys(token_ids, tick_size),
+                "fee_info": {token_id: fee_info.model_copy() for token_id in token_ids},
+            }
+        )
         return info
 
-    def _get_market_fee_info(self, token_id: str) -> FeeInfo:
-        if token_id in self.__fee_infos:
-            return self.__fee_infos[token_id]
+    def _get_market_fee_info(self, token_id: str) -> _ClobCall[FeeInfo]:
+        cached = self._cached("fee_info", self.__fee_infos, token_id, _stored_fee_info)
+        if cached is not None:
+            return cached
 
-        condition_id = self.__token_condition_map.get(token_id)
+        condition_id = self._cached(
+            "condition_id", self.__token_condition_map, token_id, _stored_condition_id
+        )
         if condition_id is None:
-            response = self.client.get(
-                self._build_url(f"{GET_MARKET_BY_TOKEN}{token_id}")
+            response = yield _ClobRequest(
+                "GET", self._build_url(f"{GET_MARKET_BY_TOKEN}{token_id}")
             )
             response.raise_for_status()
-            condition_id = response.json()["condition_id"]
-            self.__token_condition_map[token_id] = condition_id
+            condition_id = cast("Keccak256", response.json()["condition_id"])
+            self._store({"condition_id": {token_id: condition_id}})
 
-        self.get_clob_market_info(condition_id)
-        return self.__fee_infos.get(token_id, FeeInfo())
+        info = yield from self._get_clob_market_info(condition_id)
+        if any(token.token_id == token_id for token in info.tokens):
+            return _market_fee_info(info)
+        return FeeInfo()
 
     def _resolve_tick_size(
         self,
         token_id: str,
         tick_size: TickSize | None = None,
-    ) -> TickSize:
-        min_tick_size = self.get_tick_size(token_id)
+    ) -> _ClobCall[TickSize]:
+        min_tick_size = yield from self._get_tick_size(token_id)
         if tick_size is not None:
             if is_tick_size_smaller(tick_size, min_tick_size):
                 msg = (
@@ -438,8 +739,8 @@ class PolymarketReadOnlyClobClient:
         self,
         token_id: str,
         user_fee_rate: int | None = None,
-    ) -> int:
-        market_fee_rate_bps = self.get_fee_rate_bps(token_id)
+    ) -> _ClobCall[int]:
+        market_fee_rate_bps = yield from self._get_fee_rate_bps(token_id)
         if (
             market_fee_rate_bps > 0
             and user_fee_rate is not None
@@ -453,120 +754,118 @@ class PolymarketReadOnlyClobClient:
             raise InvalidFeeRateError(msg)
         return market_fee_rate_bps
 
-    def get_midpoint(self, token_id: str) -> Midpoint:
-        """Get the mid-market price for the given token."""
+    def _get_midpoint(self, token_id: str) -> _ClobCall[Midpoint]:
         params = {"token_id": token_id}
-        response = self.client.get(self._build_url(MID_POINT), params=params)
+        response = yield _ClobRequest("GET", self._build_url(MID_POINT), params=params)
         response.raise_for_status()
         return Midpoint(token_id=token_id, value=float(response.json()["mid"]))
 
-    def get_midpoints(self, token_ids: list[str]) -> dict[str, float]:
-        """Get the mid-market prices for a set of tokens."""
+    def _get_midpoints(self, token_ids: list[str]) -> _ClobCall[dict[str, float]]:
         data = [{"token_id": token_id} for token_id in token_ids]
-        response = self.client.post(self._build_url(MID_POINTS), json=data)
+        response = yield _ClobRequest("POST", self._build_url(MID_POINTS), json=data)
         response.raise_for_status()
         return TokenValueDict(**response.json()).root
 
-    def get_spread(self, token_id: str) -> Spread:
-        """Get the spread for the given token."""
+    def _get_spread(self, token_id: str) -> _ClobCall[Spread]:
         params = {"token_id": token_id}
-        response = self.client.get(self._build_url(GET_SPREAD), params=params)
+        response = yield _ClobRequest("GET", self._build_url(GET_SPREAD), params=params)
         response.raise_for_status()
         return Spread(token_id=token_id, value=float(response.json()["mid"]))
 
-    def get_spreads(self, token_ids: list[str]) -> dict[str, float]:
-        """Get the spreads for a set of tokens."""
+    def _get_spreads(self, token_ids: list[str]) -> _ClobCall[dict[str, float]]:
         data = [{"token_id": token_id} for token_id in token_ids]
-        response = self.client.post(self._build_url(GET_SPREADS), json=data)
+        response = yield _ClobRequest("POST", self._build_url(GET_SPREADS), json=data)
         response.raise_for_status()
         return TokenValueDict(**response.json()).root
 
-    def get_price(self, token_id: str, side: Literal["BUY", "SELL"]) -> Price:
-        """Get the market price for the given token and side."""
+    def _get_price(
+        self, token_id: str, side: Literal["BUY", "SELL"]
+    ) -> _ClobCall[Price]:
         params = {"token_id": token_id, "side": side}
-        response = self.client.get(self._build_url(PRICE), params=params)
+        response = yield _ClobRequest("GET", self._build_url(PRICE), params=params)
         response.raise_for_status()
         return Price(**response.json(), token_id=token_id, side=side)
 
-    def get_prices(self, params: list[BookParams]) -> dict[str, BidAsk]:
-        """Get the market prices for a set of tokens and sides."""
+    def _get_prices(self, params: list[BookParams]) -> _ClobCall[dict[str, BidAsk]]:
         data = [{"token_id": param.token_id, "side": param.side} for param in params]
-        response = self.client.post(self._build_url(GET_PRICES), json=data)
+        response = yield _ClobRequest("POST", self._build_url(GET_PRICES), json=data)
         response.raise_for_status()
         return TokenBidAskDict(**response.json()).root
 
-    def get_last_trade_price(self, token_id: str) -> Price:
-        """Fetches the last trade price for a token_id."""
+    def _get_last_trade_price(self, token_id: str) -> _ClobCall[Price]:
         params = {"token_id": token_id}
-        response = self.client.get(
-            self._build_url(GET_LAST_TRADE_PRICE), params=params
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_LAST_TRADE_PRICE), params=params
         )
         response.raise_for_status()
         return Price(**response.json(), token_id=token_id)
 
-    def get_last_trades_prices(self, token_ids: list[str]) -> list[Price]:
-        """Fetches the last trades prices for a set of token ids."""
+    def _get_last_trades_prices(self, token_ids: list[str]) -> _ClobCall[list[Price]]:
         body = [{"token_id": token_id} for token_id in token_ids]
-        response = self.client.post(self._build_url(GET_LAST_TRADES_PRICES), json=body)
+        response = yield _ClobRequest(
+            "POST", self._build_url(GET_LAST_TRADES_PRICES), json=body
+        )
         response.raise_for_status()
         return [Price(**price) for price in response.json()]
 
-    def get_order_book(self, token_id: str) -> OrderBookSummary:
-        """Get the orderbook for the given token."""
+    def _get_order_book(self, token_id: str) -> _ClobCall[OrderBookSummary]:
         params = {"token_id": token_id}
-        response = self.client.get(self._build_url(GET_ORDER_BOOK), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_ORDER_BOOK), params=params
+        )
         response.raise_for_status()
         order_book = OrderBookSummary(**response.json())
         if order_book.tick_size is not None:
-            self.__tick_sizes[token_id] = (order_book.tick_size, monotonic())
+            self._store({"tick_size": {token_id: order_book.tick_size}})
         return order_book
 
-    def get_order_books(self, token_ids: list[str]) -> list[OrderBookSummary]:
-        """Get the orderbook for a set of tokens."""
+    def _get_order_books(
+        self, token_ids: list[str]
+    ) -> _ClobCall[list[OrderBookSummary]]:
         body = [{"token_id": token_id} for token_id in token_ids]
-        response = self.client.post(self._build_url(GET_ORDER_BOOKS), json=body)
+        response = yield _ClobRequest(
+            "POST", self._build_url(GET_ORDER_BOOKS), json=body
+        )
         response.raise_for_status()
         order_books = [OrderBookSummary(**obs) for obs in response.json()]
-        now = monotonic()
-        for order_book in order_books:
-            if order_book.tick_size is not None:
-                self.__tick_sizes[order_book.token_id] = (order_book.tick_size, now)
+        self._store(
+            {
+                "tick_size": {
+                    order_book.token_id: order_book.tick_size
+                    for order_book in order_books
+                    if order_book.tick_size is not None
+                }
+            }
+        )
         return order_books
 
-    def get_market(self, condition_id: Keccak256) -> ClobMarket:
-        """Get a ClobMarket by condition_id."""
-        response = self.client.get(self._build_url(GET_MARKET + condition_id))
+    def _get_market(self, condition_id: Keccak256) -> _ClobCall[ClobMarket]:
+        response = yield _ClobRequest("GET", self._build_url(GET_MARKET + condition_id))
         response.raise_for_status()
         return ClobMarket(**response.json())
 
-    def get_market_ids_from_token(self, token_id: str) -> MarketIDs:
-        """Resolve the parent condition and complementary token IDs for a token."""
-        response = self.client.get(self._build_url(f"{GET_MARKET_BY_TOKEN}{token_id}"))
+    def _get_market_ids_from_token(self, token_id: str) -> _ClobCall[MarketIDs]:
+        response = yield _ClobRequest(
+            "GET", self._build_url(f"{GET_MARKET_BY_TOKEN}{token_id}")
+        )
         response.raise_for_status()
         return MarketIDs(**response.json())
 
-    def get_markets(self, next_cursor: str = "MA==") -> PaginatedResponse[ClobMarket]:
-        """Get paginated ClobMarkets."""
+    def _get_markets(
+        self, next_cursor: str
+    ) -> _ClobCall[PaginatedResponse[ClobMarket]]:
         params = {"next_cursor": next_cursor}
-        response = self.client.get(self._build_url(GET_MARKETS), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_MARKETS), params=params
+        )
         response.raise_for_status()
         return PaginatedResponse[ClobMarket](**response.json())
 
-    def get_all_markets(self, next_cursor: str = "MA==") -> list[ClobMarket]:
-        """Recursively fetch all ClobMarkets using pagination."""
-        if next_cursor == "LTE=":
-            self.logger.debug("Reached the last page of markets")
-            return []
-
-        paginated_response = self.get_markets(next_cursor=next_cursor)
-        current_markets = paginated_response.data
-        next_page_markets = self.get_all_markets(
-            next_cursor=paginated_response.next_cursor,
-        )
-        return current_markets + next_page_markets
-
-    def get_crypto_outcomes(self, slugs: list[str]) -> dict[str, CryptoOutcome]:
-        response = self.client.post(
+    def _get_crypto_outcomes(
+        self, slugs: list[str]
+    ) -> _ClobCall[dict[str, CryptoOutcome]]:
+        response = yield _ClobRequest(
+            "POST",
             "https://polymarket.com/api/past-results",
             json={
                 "includeOutcomesBySlug": True,
@@ -578,13 +877,12 @@ class PolymarketReadOnlyClobClient:
         parsed = PastResultsResponse(**response.json())
         return parsed.data.outcomes_by_slug
 
-    def get_recent_history(
+    def _get_recent_history(
         self,
         token_id: str,
-        interval: Literal["1h", "6h", "1d", "1w", "1m", "max"] = "1d",
-        fidelity: int = 1,
-    ) -> PriceHistory:
-        """Get the recent price history of a token (up to now)."""
+        interval: Literal["1h", "6h", "1d", "1w", "1m", "max"],
+        fidelity: int,
+    ) -> _ClobCall[PriceHistory]:
         min_fidelities: dict[str, int] = {
             "1h": 1,
             "6h": 1,
@@ -606,18 +904,19 @@ class PolymarketReadOnlyClobClient:
             "interval": interval,
             "fidelity": fidelity,
         }
-        response = self.client.get(self._build_url("/prices-history"), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url("/prices-history"), params=params
+        )
         response.raise_for_status()
         return PriceHistory(**response.json(), token_id=token_id)
 
-    def get_history(
+    def _get_history(
         self,
         token_id: str,
-        start_time: datetime | None = None,
-        end_time: datetime | None = None,
-        fidelity: int = 2,
-    ) -> PriceHistory:
-        """Get the price history of a token between a selected date range."""
+        start_time: datetime | None,
+        end_time: datetime | None,
+        fidelity: int,
+    ) -> _ClobCall[PriceHistory]:
         if start_time is None and end_time is None:
             msg = (
                 "At least 'start_time' or ('start_time' and 'end_time') "
@@ -645,25 +944,22 @@ class PolymarketReadOnlyClobClient:
         if end_time:
             params["endTs"] = int(end_time.timestamp())
 
-        response = self.client.get(self._build_url("/prices-history"), params=params)
+        response = yield _ClobRequest(
+            "GET", self._build_url("/prices-history"), params=params
+        )
         response.raise_for_status()
         return PriceHistory(**response.json(), token_id=token_id)
 
-    def get_all_history(self, token_id: str) -> PriceHistory:
-        """Get the full price history of a token."""
-        return self.get_history(
-            token_id=token_id,
-            start_time=datetime(2020, 1, 1, tzinfo=UTC),
-        )
-
-    def __enter__(self) -> Self:
-        return self
 
-    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
-        self.client.close()
+class _ClobTradingBase(_ClobClientBase):
+    """Authenticated operations shared by the sync and async trading clients."""
 
+    address: EthAddress
+    signer: Signer
+    signature_type: Literal[0, 1, 2, 3] | None
+    builder: OrderBuilder
+    creds: ApiCreds | None
 
-class PolymarketClobClient(PolymarketReadOnlyClobClient):
     @staticmethod
     def _validate_post_only_order_type(
         post_only: bool | None, order_type: OrderType
@@ -672,18 +968,13 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             msg = "post_only is not supported for FOK/FAK orders"
             raise ValueError(msg)
 
-    def __init__(
+    def _init_signing(
         self,
         private_key: str,
         address: EthAddress,
-        creds: ApiCreds | None = None,
-        chain_id: Literal[137, 80002] = POLYGON,
-        signature_type: Literal[0, 1, 2, 3] | None = None,
-        proxy: Optional[str] = None,
-        *,
-        logger: Optional[logging.Logger] = None,
+        chain_id: Literal[137, 80002],
+        signature_type: Literal[0, 1, 2, 3] | None,
     ) -> None:
-        super().__init__(proxy=proxy, logger=logger)
         self.address = address
         self.signer = Signer(private_key=private_key, chain_id=chain_id)
         if signature_type is None:
@@ -694,64 +985,82 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             sig_type=signature_type,
             funder=address,
         )
-        self.creds = creds if creds else self.create_or_derive_api_creds()
 
-    def create_api_creds(self, nonce: int | None = None) -> ApiCreds:
+    def set_api_creds(self, creds: ApiCreds) -> None:
+        self.creds = creds
+
+    def _api_creds(self) -> _ClobCall[ApiCreds]:
+        if self.creds is None:
+            self.creds = yield from self._create_or_derive_api_creds()
+        return self.creds
+
+    def _level_2_headers(self, request_args: RequestArgs) -> _ClobCall[dict[str, str]]:
+        creds = yield from self._api_creds()
+        return create_level_2_headers(self.signer, creds, request_args)
+
+    def _create_api_creds(self, nonce: int | None) -> _ClobCall[ApiCreds]:
         headers = create_level_1_headers(self.signer, nonce)
-        response = self.client.post(self._build_url(CREATE_API_KEY), headers=headers)
+        response = yield _ClobRequest(
+            "POST", self._build_url(CREATE_API_KEY), headers=headers
+        )
         response.raise_for_status()
         return ApiCreds(**response.json())
 
-    def derive_api_key(self, nonce: int | None = None) -> ApiCreds:
+    def _derive_api_key(self, nonce: int | None) -> _ClobCall[ApiCreds]:
         headers = create_level_1_headers(self.signer, nonce)
-        response = self.client.get(self._build_url(DERIVE_API_KEY), headers=headers)
+        response = yield _ClobRequest(
+            "GET", self._build_url(DERIVE_API_KEY), headers=headers
+        )
         response.raise_for_status()
         return ApiCreds(**response.json())
 
-    def create_or_derive_api_creds(self, nonce: int | None = None) -> ApiCreds:
+    def _create_or_derive_api_creds(
+        self, nonce: int | None = None
+    ) -> _ClobCall[ApiCreds]:
         try:
-            return self.create_api_creds(nonce)
+            return (yield from self._create_api_creds(nonce))
         except HTTPStatusError:
-            return self.derive_api_key(nonce)
-
-    def set_api_creds(self, creds: ApiCreds) -> None:
-        self.creds = creds
+            return (yield from self._derive_api_key(nonce))
 
-    def get_api_keys(self) -> list[str]:
+    def _get_api_keys(self) -> _ClobCall[list[str]]:
         request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        response = self.client.get(self._build_url(GET_API_KEYS), headers=headers)
+        headers = yield from self._level_2_headers(request_args)
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_API_KEYS), headers=headers
+        )
         response.raise_for_status()
         return cast("list[str]", response.json()["apiKeys"])
 
-    def delete_api_keys(self) -> Literal["OK"]:
+    def _delete_api_keys(self) -> _ClobCall[Literal["OK"]]:
         request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        response = self.client.delete(self._build_url(DELETE_API_KEY), headers=headers)
+        headers = yield from self._level_2_headers(request_args)
+        response = yield _ClobRequest(
+            "DELETE", self._build_url(DELETE_API_KEY), headers=headers
+        )
         response.raise_for_status()
         return cast("Literal['OK']", response.json())
 
-    def create_readonly_api_key(self) -> str:
+    def _create_readonly_api_key(self) -> _ClobCall[str]:
         request_args = RequestArgs(method="POST", request_path=CREATE_READONLY_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
-        response = self.client.post(
-            self._build_url(CREATE_READONLY_API_KEY), headers=headers
+        response = yield _ClobRequest(
+            "POST", self._build_url(CREATE_READONLY_API_KEY), headers=headers
         )
         response.raise_for_status()
         return cast("str", response.json()["apiKey"])
 
-    def get_readonly_api_keys(self) -> list[str]:
+    def _get_readonly_api_keys(self) -> _ClobCall[list[str]]:
         request_args = RequestArgs(method="GET", request_path=GET_READONLY_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
-        response = self.client.get(
-            self._build_url(GET_READONLY_API_KEYS), headers=headers
+        response = yield _ClobRequest(
+            "GET", self._build_url(GET_READONLY_API_KEYS), headers=headers
         )
         response.raise_for_status()
         return cast("list[str]", response.json()["readonlyApiKeys"])
 
-    def delete_readonly_api_key(self, key: str) -> str:
+    def _delete_readonly_api_key(self, key: str) -> _ClobCall[str]:
         body = {"key": key}
 
         request_args = RequestArgs(
@@ -759,9 +1068,9 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             request_path=DELETE_READONLY_API_KEY,
             body=body,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
-        response = self.client.request(
+        response = yield _ClobRequest(
             "DELETE",
             self._build_url(DELETE_READONLY_API_KEY),
             headers=headers,
@@ -770,37 +1079,39 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         response.raise_for_status()
         return cast("str", response.json())
 
-    def get_pusd_balance(self) -> float:
-        params = {
-            "asset_type": "COLLATERAL",
-            "signature_type": self.signature_type,
-        }
+    def _get_balance(self, params: dict[str, Any]) -> _ClobCall[float]:
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        response = self.client.get(
-            self._build_url(GET_BALANCE_ALLOWANCE), headers=headers, params=params
+        headers = yield from self._level_2_headers(request_args)
+        response = yield _ClobRequest(
+            "GET",
+            self._build_url(GET_BALANCE_ALLOWANCE),
+            headers=headers,
+            params=params,
         )
         response.raise_for_status()
         return int(response.json()["balance"]) / 10**6
 
-    def get_token_balance(self, token_id: str) -> float:
+    def _get_pusd_balance(self) -> _ClobCall[float]:
+        params = {
+            "asset_type": "COLLATERAL",
+            "signature_type": self.signature_type,
+        }
+        return (yield from self._get_balance(params))
+
+    def _get_token_balance(self, token_id: str) -> _ClobCall[float]:
         params = {
             "asset_type": "CONDITIONAL",
             "token_id": token_id,
             "signature_type": self.signature_type,
         }
-        request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        response = self.client.get(
-            self._build_url(GET_BALANCE_ALLOWANCE), headers=headers, params=params
-        )
-        response.raise_for_status()
-        return int(response.json()["balance"]) / 10**6
+        return (yield from self._get_balance(params))
 
-    def send_heartbeat(self) -> Literal["ok"]:
+    def _send_heartbeat(self) -> _ClobCall[Literal["ok"]]:
         request_args = RequestArgs(method="POST", request_path="/heartbeats")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        response = self.client.post(self._build_url("/heartbeats"), headers=headers)
+        headers = yield from self._level_2_headers(request_args)
+        response = yield _ClobRequest(
+            "POST", self._build_url("/heartbeats"), headers=headers
+        )
         response.raise_for_status()
         status = response.json().get("status")
         if status != "ok":
@@ -808,14 +1119,13 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             raise ValueError(msg)
         return "ok"
 
-    def get_orders(
+    def _get_orders(
         self,
-        order_id: str | None = None,
-        condition_id: Keccak256 | None = None,
-        token_id: str | None = None,
-        next_cursor: str = "MA==",
-    ) -> list[OpenOrder]:
-        """Gets your active orders, filtered by order_id, condition_id, token_id."""
+        order_id: str | None,
+        condition_id: Keccak256 | None,
+        token_id: str | None,
+        next_cursor: str,
+    ) -> _ClobCall[list[OpenOrder]]:
         params: dict[str, str] = {}
         if order_id:
             params["id"] = order_id
@@ -825,14 +1135,14 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             params["asset_id"] = token_id
 
         request_args = RequestArgs(method="GET", request_path=ORDERS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
         results: list[OpenOrder] = []
         next_cursor_str: str = next_cursor if next_cursor is not None else "MA=="
         while next_cursor_str != END_CURSOR:
             params["next_cursor"] = next_cursor_str
-            response = self.client.get(
-                self._build_url(ORDERS), headers=headers, params=params
+            response = yield _ClobRequest(
+                "GET", self._build_url(ORDERS), headers=headers, params=dict(params)
             )
             response.raise_for_status()
             data = response.json()
@@ -841,11 +1151,10 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
 
         return results
 
-    def create_order(
-        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
-    ) -> SignedOrder:
-        """Creates and signs an order."""
-        tick_size = self._resolve_tick_size(
+    def _create_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None
+    ) -> _ClobCall[SignedOrder]:
+        tick_size = yield from self._resolve_tick_size(
             order_args.token_id,
             options.tick_size if options else None,
         )
@@ -860,7 +1169,7 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         neg_risk = (
             options.neg_risk
             if options and options.neg_risk is not None
-            else self.get_neg_risk(order_args.token_id)
+            else (yield from self._get_neg_risk(order_args.token_id))
         )
 
         return self.builder.create_order(
@@ -871,36 +1180,20 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             ),
         )
 
-    def post_order(
+    def _post_order(
         self,
         order: SignedOrder,
-        order_type: OrderType = OrderType.GTC,
-        post_only: Optional[bool] = False,
-        defer_exec: Optional[bool] = False,
-        *,
-        idempotency_key: str | None = None,
-        _log_context: dict[str, Any] | None = None,
-    ) -> OrderPostResponse | None:
-        """
-        Posts a SignedOrder.
-
-        Args:
-            order: The signed order to post.
-            order_type: Order type (GTC, FOK, FAK, GTD).
-            post_only: Whether the order is post-only.
-            defer_exec: Whether to defer execution.
-            idempotency_key: Optional idempotency key for safe retries on timeout.
-
-        Returns:
-            OrderPostResponse if successful, None if the order was rejected by
-            the server (HTTP 4xx). Raises on 5xx or network errors.
-
-        """
+        order_type: OrderType,
+        post_only: Optional[bool],
+        defer_exec: Optional[bool],
+        idempotency_key: str | None,
+        log_context: dict[str, Any] | None,
+    ) -> _ClobCall[OrderPostResponse | None]:
         trace_id, trace_token = ensure_trace_id()
         self._validate_post_only_order_type(post_only, order_type)
         start = time.monotonic()
         order_fields = _signed_order_log_fields(order)
-        log_context = _log_context or {"order_source": "limit"}
+        log_context = log_context or {"order_source": "limit"}
         action_text = _order_action_text(order_fields, log_context)
         try:
             emit(
@@ -922,11 +1215,12 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                 **order_fields,
             )
 
-            body = order_to_json(order, self.creds.key, order_type, post_only, defer_exec)
+            creds = yield from self._api_creds()
+            body = order_to_json(order, creds.key, order_type, post_only, defer_exec)
             serialized = json.dumps(body, separators=(",", ":"), ensure_ascii=False)
             headers = create_level_2_headers(
                 self.signer,
-                self.creds,
+                creds,
                 RequestArgs(method="POST", request_path=POST_ORDER, body=serialized),
             )
             if idempotency_key:
@@ -947,7 +1241,8 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                     idempotency_key=idempotency_key,
                     **order_fields,
                 )
-                response = self.client.post(
+                response = yield _ClobRequest(
+                    "POST",
                     self._build_url("/order"),
                     headers=headers,
                     content=serialized.encode("utf-8"),
@@ -1039,30 +1334,27 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         finally:
             reset_trace_id(trace_token)
 
-    def create_and_post_order(
+    def _create_and_post_order(
         self,
         order_args: OrderArgs,
-        options: PartialCreateOrderOptions | None = None,
-        order_type: OrderType = OrderType.GTC,
-        post_only: Optional[bool] = False,
-        defer_exec: Optional[bool] = False,
-    ) -> OrderPostResponse | None:
-        """Utility function to create and publish an order."""
-        order = self.create_order(order_args, options)
-        return self.post_order(
-            order=order,
-            order_type=order_type,
-            post_only=post_only,
-            defer_exec=defer_exec,
+        options: PartialCreateOrderOptions | None,
+        order_type: OrderType,
+        post_only: Optional[bool],
+        defer_exec: Optional[bool],
+    ) -> _ClobCall[OrderPostResponse | None]:
+        order = yield from self._create_order(order_args, options)
+        return (
+            yield from self._post_order(
+                order, order_type, post_only, defer_exec, None, None
+            )
         )
 
-    def post_orders(
+    def _post_orders(
         self,
         args: list[PostOrdersArgs],
-        post_only: Optional[bool] = False,
-        defer_exec: Optional[bool] = False,
-    ) -> list[OrderPostResponse] | None:
-        """Posts multiple SignedOrders at once."""
+        post_only: Optional[bool],
+        defer_exec: Optional[bool],
+    ) -> _ClobCall[list[OrderPostResponse] | None]:
         trace_id, trace_token = ensure_trace_id()
         start = time.monotonic()
         try:
@@ -1090,10 +1382,11 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                 ],
             )
 
+            creds = yield from self._api_creds()
             body = [
                 order_to_json(
                     arg.order,
-                    self.creds.key,
+                    creds.key,
                     arg.order_type,
                     post_only,
                     defer_exec,
@@ -1103,12 +1396,13 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             serialized = json.dumps(body, separators=(",", ":"), ensure_ascii=False)
             headers = create_level_2_headers(
                 self.signer,
-                self.creds,
+                creds,
                 RequestArgs(method="POST", request_path=POST_ORDERS, body=serialized),
             )
 
             try:
-                response = self.client.post(
+                response = yield _ClobRequest(
+                    "POST",
                     self._build_url("/orders"),
                     headers=headers,
                     content=serialized.encode("utf-8"),
@@ -1176,8 +1470,8 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                 success_count = sum(1 for r in order_responses if r.success)
                 emit(
                     self.logger,
-                logging.INFO,
-                "clob.orders.post.accepted_summary",
+                    logging.INFO,
+                    "clob.orders.post.accepted_summary",
                     "POST_BATCH count=%d/%d order_ids=%s in %.2fms",
                     success_count,
                     len(args),
@@ -1196,10 +1490,9 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         finally:
             reset_trace_id(trace_token)
 
-    def create_and_post_orders(
-        self, args: list[OrderArgs], order_types: list[OrderType] | None = None
-    ) -> list[OrderPostResponse] | None:
-        """Utility function to create and publish multiple orders at once."""
+    def _create_and_post_orders(
+        self, args: list[OrderArgs], order_types: list[OrderType] | None
+    ) -> _ClobCall[list[OrderPostResponse] | None]:
         if order_types is None:
             order_types = [OrderType.GTC] * len(args)
 
@@ -1207,20 +1500,16 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             msg = "order_types must have same length as args"
             raise ValueError(msg)
 
-        return self.post_orders(
-            [
-                PostOrdersArgs(
-                    order=self.create_order(order_args), order_type=order_type
-                )
-                for order_args, order_type in zip(args, order_types, strict=True)
-            ]
-        )
+        post_args: list[PostOrdersArgs] = []
+        for order_args, order_type in zip(args, order_types, strict=True):
+            order = yield from self._create_order(order_args, None)
+            post_args.append(PostOrdersArgs(order=order, order_type=order_type))
+        return (yield from self._post_orders(post_args, False, False))
 
-    def calculate_market_price(
+    def _calculate_market_price(
         self, token_id: str, side: str, amount: float, order_type: OrderType
-    ) -> float:
-        """Calculates the matching price considering an amount and the current orderbook."""
-        book = self.get_order_book(token_id)
+    ) -> _ClobCall[float]:
+        book = yield from self._get_order_book(token_id)
         if book is None:
             msg = "Order book is None"
             raise MissingOrderbookError(msg)
@@ -1245,21 +1534,20 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         msg = 'Side must be "BUY" or "SELL"'
         raise ValueError(msg)
 
-    def create_market_order(
+    def _create_market_order(
         self,
         order_args: MarketOrderArgs,
-        options: PartialCreateOrderOptions | None = None,
-    ) -> SignedOrder:
-        """Creates and signs a market order."""
-        self._get_market_fee_info(order_args.token_id)
+        options: PartialCreateOrderOptions | None,
+    ) -> _ClobCall[SignedOrder]:
+        yield from self._get_market_fee_info(order_args.token_id)
 
-        tick_size = self._resolve_tick_size(
+        tick_size = yield from self._resolve_tick_size(
             order_args.token_id,
             options.tick_size if options else None,
         )
 
         if order_args.price is None or order_args.price <= 0:
-            order_args.price = self.calculate_market_price(
+            order_args.price = yield from self._calculate_market_price(
                 order_args.token_id,
                 order_args.side,
                 order_args.amount,
@@ -1274,7 +1562,7 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             raise InvalidPriceError(msg)
 
         if order_args.side == "BUY" and order_args.user_usdc_balance:
-            fee_info = self._get_market_fee_info(order_args.token_id)
+            fee_info = yield from self._get_market_fee_info(order_args.token_id)
             order_args.amount = adjust_market_buy_amount(
                 order_args.amount,
                 order_args.user_usdc_balance,
@@ -1286,7 +1574,7 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         neg_risk = (
             options.neg_risk
             if options and options.neg_risk is not None
-            else self.get_neg_risk(order_args.token_id)
+            else (yield from self._get_neg_risk(order_args.token_id))
         )
 
         return self.builder.create_market_order(
@@ -1297,30 +1585,31 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             ),
         )
 
-    def create_and_post_market_order(
+    def _create_and_post_market_order(
         self,
         order_args: MarketOrderArgs,
-        options: PartialCreateOrderOptions | None = None,
-        order_type: OrderType = OrderType.FOK,
-        defer_exec: Optional[bool] = False,
-    ) -> OrderPostResponse | None:
-        """Utility function to create and publish a market order."""
+        options: PartialCreateOrderOptions | None,
+        order_type: OrderType,
+        defer_exec: Optional[bool],
+    ) -> _ClobCall[OrderPostResponse | None]:
         requested_amount = order_args.amount
-        order = self.create_market_order(order_args, options)
-        return self.post_order(
-            order=order,
-            order_type=order_type,
-            post_only=False,
-            defer_exec=defer_exec,
-            _log_context={
-                "order_source": "market",
-                "requested_amount": requested_amount,
-                "requested_amount_display": _display_decimal(requested_amount),
-            },
+        order = yield from self._create_market_order(order_args, options)
+        return (
+            yield from self._post_order(
+                order,
+                order_type,
+                False,
+                defer_exec,
+                None,
+                {
+                    "order_source": "market",
+                    "requested_amount": requested_amount,
+                    "requested_amount_display": _display_decimal(requested_amount),
+                },
+            )
         )
 
-    def cancel_order(self, order_id: Keccak256) -> OrderCancelResponse:
-        """Cancels an order."""
+    def _cancel_order(self, order_id: Keccak256) -> _ClobCall[OrderCancelResponse]:
         trace_id, trace_token = ensure_trace_id()
         start = time.monotonic()
         body = {"orderID": order_id}
@@ -1340,10 +1629,10 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             )
 
             request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
-            headers = create_level_2_headers(self.signer, self.creds, request_args)
+            headers = yield from self._level_2_headers(request_args)
 
             try:
-                response = self.client.request(
+                response = yield _ClobRequest(
                     "DELETE",
                     self._build_url(CANCEL),
                     headers=headers,
@@ -1409,8 +1698,9 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         finally:
             reset_trace_id(trace_token)
 
-    def cancel_orders(self, order_ids: list[Keccak256]) -> OrderCancelResponse:
-        """Cancels multiple orders."""
+    def _cancel_orders(
+        self, order_ids: list[Keccak256]
+    ) -> _ClobCall[OrderCancelResponse]:
         trace_id, trace_token = ensure_trace_id()
         start = time.monotonic()
         body = order_ids
@@ -1435,10 +1725,10 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                 request_path=CANCEL_ORDERS,
                 body=body,
             )
-            headers = create_level_2_headers(self.signer, self.creds, request_args)
+            headers = yield from self._level_2_headers(request_args)
 
             try:
-                response = self.client.request(
+                response = yield _ClobRequest(
                     "DELETE",
                     self._build_url(CANCEL_ORDERS),
                     headers=headers,
@@ -1506,8 +1796,7 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         finally:
             reset_trace_id(trace_token)
 
-    def cancel_all(self) -> OrderCancelResponse:
-        """Cancels all available orders for the user."""
+    def _cancel_all(self) -> _ClobCall[OrderCancelResponse]:
         trace_id, trace_token = ensure_trace_id()
         start = time.monotonic()
         try:
@@ -1522,10 +1811,12 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                 cancel_scope="all",
             )
             request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
-            headers = create_level_2_headers(self.signer, self.creds, request_args)
+            headers = yield from self._level_2_headers(request_args)
 
             try:
-                response = self.client.delete(self._build_url(CANCEL_ALL), headers=headers)
+                response = yield _ClobRequest(
+                    "DELETE", self._build_url(CANCEL_ALL), headers=headers
+                )
                 response.raise_for_status()
             except HTTPStatusError as exc:
                 latency_ms = round((time.monotonic() - start) * 1000, 3)
@@ -1585,7 +1876,7 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
 
     def _cancel_orders_for_market(
         self, body: dict[str, str]
-    ) -> OrderCancelResponse:
+    ) -> _ClobCall[OrderCancelResponse]:
         trace_id, trace_token = ensure_trace_id()
         start = time.monotonic()
         filter_fields = _cancel_filter_log_fields(body)
@@ -1606,10 +1897,10 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
                 request_path=CANCEL_MARKET_ORDERS,
                 body=body,
             )
-            headers = create_level_2_headers(self.signer, self.creds, request_args)
+            headers = yield from self._level_2_headers(request_args)
 
             try:
-                response = self.client.request(
+                response = yield _ClobRequest(
                     "DELETE",
                     self._build_url(CANCEL_MARKET_ORDERS),
                     headers=headers,
@@ -1675,23 +1966,12 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         finally:
             reset_trace_id(trace_token)
 
-    def cancel_orders_for_condition_id(
-        self,
-        condition_id: Keccak256,
-    ) -> OrderCancelResponse:
-        """Cancels all orders for both token_ids of a specific condition_id."""
-        return self._cancel_orders_for_market({"market": condition_id})
-
-    def cancel_orders_for_token_id(self, token_id: str) -> OrderCancelResponse:
-        """Cancels all orders for a specific token_id."""
-        return self._cancel_orders_for_market({"asset_id": token_id})
-
-    def is_order_scoring(self, order_id: Keccak256) -> bool:
-        """Check if the order is currently scoring."""
+    def _is_order_scoring(self, order_id: Keccak256) -> _ClobCall[bool]:
         request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
-        response = self.client.get(
+        response = yield _ClobRequest(
+            "GET",
             self._build_url(IS_ORDER_SCORING),
             headers=headers,
             params={"order_id": order_id},
@@ -1699,49 +1979,44 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         response.raise_for_status()
         return cast("bool", response.json()["scoring"])
 
-    def are_orders_scoring(self, order_ids: list[Keccak256]) -> dict[Keccak256, bool]:
-        """Check if the orders are currently scoring."""
+    def _are_orders_scoring(
+        self, order_ids: list[Keccak256]
+    ) -> _ClobCall[dict[Keccak256, bool]]:
         body = order_ids
         request_args = RequestArgs(
             method="POST",
             request_path=ARE_ORDERS_SCORING,
             body=body,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
         headers["Content-Type"] = "application/json"
 
-        response = self.client.post(
-            self._build_url(ARE_ORDERS_SCORING), headers=headers, json=body
+        response = yield _ClobRequest(
+            "POST", self._build_url(ARE_ORDERS_SCORING), headers=headers, json=body
         )
         response.raise_for_status()
         return cast("dict[Keccak256, bool]", response.json())
 
-    def get_market_rewards(self, condition_id: Keccak256) -> MarketRewards:
-        """
-        Get the MarketRewards for a given market (condition_id).
-
-        - metadata, tokens, max_spread, min_size, rewards_config, market_competitiveness.
-        """
+    def _get_market_rewards(self, condition_id: Keccak256) -> _ClobCall[MarketRewards]:
         request_args = RequestArgs(method="GET", request_path="/rewards/markets/")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
-        response = self.client.get(
-            self._build_url("/rewards/markets/" + condition_id), headers=headers
+        response = yield _ClobRequest(
+            "GET", self._build_url("/rewards/markets/" + condition_id), headers=headers
         )
         response.raise_for_status()
         return next(MarketRewards(**market) for market in response.json()["data"])
 
-    def get_trades(
+    def _get_trades(
         self,
-        condition_id: Keccak256 | None = None,
-        token_id: str | None = None,
-        trade_id: str | None = None,
-        before: datetime | None = None,
-        after: datetime | None = None,
-        address: EthAddress | None = None,
-        next_cursor: str | None = "MA==",
-    ) -> list[PolygonTrade]:
-        """Fetches the trade history for a user."""
+        condition_id: Keccak256 | None,
+        token_id: str | None,
+        trade_id: str | None,
+        before: datetime | None,
+        after: datetime | None,
+        address: EthAddress | None,
+        next_cursor: str | None,
+    ) -> _ClobCall[list[PolygonTrade]]:
         params: dict[str, str | int] = {}
         if condition_id:
             params["market"] = condition_id
@@ -1757,14 +2032,14 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             params["maker_address"] = address
 
         request_args = RequestArgs(method="GET", request_path=TRADES)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
 
         results: list[PolygonTrade] = []
         next_cursor_str: str = next_cursor if next_cursor is not None else "MA=="
         while next_cursor_str != END_CURSOR:
             params["next_cursor"] = next_cursor_str
-            response = self.client.get(
-                self._build_url(TRADES), headers=headers, params=params
+            response = yield _ClobRequest(
+                "GET", self._build_url(TRADES), headers=headers, params=dict(params)
             )
             response.raise_for_status()
             data = response.json()
@@ -1773,8 +2048,7 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
 
         return results
 
-    def get_total_rewards(self, date: datetime | None = None) -> DailyEarnedReward:
-        """Get the total rewards earned on a given date."""
+    def _get_total_rewards(self, date: datetime | None) -> _ClobCall[DailyEarnedReward]:
         if date is None:
             date = datetime.now(UTC)
         params = {
@@ -1783,11 +2057,11 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
         }
 
         request_args = RequestArgs(method="GET", request_path="/rewards/user/total")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
         params["l2Headers"] = json.dumps(headers)
 
-        response = self.client.get(
-            "https://polymarket.com/api/rewards/totalEarnings", params=params
+        response = yield _ClobRequest(
+            "GET", "https://polymarket.com/api/rewards/totalEarnings", params=params
         )
         response.raise_for_status()
         if response.json():
@@ -1800,24 +2074,13 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             asset_rate=0.0,
         )
 
-    def get_reward_markets(
+    def _get_reward_markets(
         self,
-        query: str | None = None,
-        sort_by: Literal[
-            "market",
-            "max_spread",
-            "min_size",
-            "rate_per_day",
-            "spread",
-            "price",
-            "earnings",
-            "earning_percentage",
-        ]
-        | None = "market",
-        sort_direction: Literal["ASC", "DESC"] | None = None,
-        show_favorites: bool = False,
-    ) -> list[RewardMarket]:
-        """Search through markets that offer rewards by query, sorted by different metrics."""
+        query: str | None,
+        sort_by: str | None,
+        sort_direction: Literal["ASC", "DESC"] | None,
+        show_favorites: bool,
+    ) -> _ClobCall[list[RewardMarket]]:
         results: list[RewardMarket] = []
         desc = {"ASC": False, "DESC": True}
         params: dict[str, bool | str] = {
@@ -1833,14 +2096,14 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             params["desc"] = desc[sort_direction]
 
         request_args = RequestArgs(method="GET", request_path="/rewards/user/markets")
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = yield from self._level_2_headers(request_args)
         params["l2Headers"] = json.dumps(headers)
 
         next_cursor = "MA=="
         while next_cursor != END_CURSOR:
             params["nextCursor"] = next_cursor
-            response = self.client.get(
-                "https://polymarket.com/api/rewards/markets", params=params
+            response = yield _ClobRequest(
+                "GET", "https://polymarket.com/api/rewards/markets", params=params
             )
             response.raise_for_status()
             data = response.json()
@@ -1848,3 +2111,1233 @@ class PolymarketClobClient(PolymarketReadOnlyClobClient):
             results += [RewardMarket(**reward) for reward in data["data"]]
 
         return results
+
+
+class PolymarketReadOnlyClobClient(_ClobClientBase):
+    """Read-only order book related operations."""
+
+    def __init__(
+        self,
+        tick_size_ttl: float = 300.0,
+        proxy: Optional[str] = None,
+        *,
+        logger: Optional[logging.Logger] = None,
+        max_retries: int = 3,
+        base_retry_delay: float = 0.25,
+        max_retry_delay: float = 30.0,
+        metadata_cache: SqliteMetadataCache | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
+    ) -> None:
+        super().__init__(
+            tick_size_ttl,
+            logger=logger,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            metadata_cache=metadata_cache,
+            metadata_cache_config=metadata_cache_config,
+        )
+        self.client = httpx.Client(http2=True, timeout=30.0, proxy=proxy)
+
+    def _send[T](self, call: _ClobCall[T]) -> T:
+        try:
+            request = next(call)
+            while True:
+                request = call.send(
+                    self.client.request(
+                        request.method,
+                        request.url,
+                        params=request.params,
+                        headers=request.headers,
+                        json=request.json,
+                        content=request.content,
+                    )
+                )
+        except StopIteration as stop:
+            result: T = stop.value
+            return result
+        finally:
+            call.close()
+
+    def _send_retrying[T](self, make_call: Callable[[], _ClobCall[T]]) -> T:
+        attempt = 0
+        while True:
+            try:
+                return self._send(make_call())
+            except httpx.HTTPError as exc:
+                if attempt >= self._max_retries or not _is_retryable(exc):
+                    raise
+                delay = self._retry_delay(attempt)
+                self._retry_warning(attempt, delay, exc)
+                time.sleep(delay)
+                attempt += 1
+
+    def _bulk[X, R, M](
+        self,
+        operation: str,
+        items: Sequence[X],
+        make_call: Callable[[list[X]], _ClobCall[R]],
+        merge: Callable[[list[R]], M],
+        token_id: Callable[[X], str],
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> M:
+        chunks = self._bulk_chunks(items, chunk_size, max_concurrency)
+        outcomes: list[R | BaseException] = []
+        if chunks:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(chunks))
+            ) as pool:
+                futures = [
+                    pool.submit(self._send_retrying, partial(make_call, chunk))
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    error = future.exception()
+                    outcomes.append(future.result() if error is None else error)
+        return self._bulk_result(operation, chunks, outcomes, merge, token_id)
+
+    def get_ok(self) -> str:
+        return self._send(self._get_ok())
+
+    def get_utc_time(self) -> datetime:
+        return self._send(self._get_utc_time())
+
+    def get_tick_size(self, token_id: str) -> TickSize:
+        return self._send(self._get_tick_size(token_id))
+
+    def get_neg_risk(self, token_id: str) -> bool:
+        return self._send(self._get_neg_risk(token_id))
+
+    def get_fee_rate_bps(self, token_id: str) -> int:
+        return self._send(self._get_fee_rate_bps(token_id))
+
+    def get_clob_market_info(self, condition_id: Keccak256) -> ClobMarketInfo:
+        return self._send(self._get_clob_market_info(condition_id))
+
+    def get_midpoint(self, token_id: str) -> Midpoint:
+        """Get the mid-market price for the given token."""
+        return self._send(self._get_midpoint(token_id))
+
+    def get_midpoints(self, token_ids: list[str]) -> dict[str, float]:
+        """Get the mid-market prices for a set of tokens."""
+        return self._send(self._get_midpoints(token_ids))
+
+    def get_spread(self, token_id: str) -> Spread:
+        """Get the spread for the given token."""
+        return self._send(self._get_spread(token_id))
+
+    def get_spreads(self, token_ids: list[str]) -> dict[str, float]:
+        """Get the spreads for a set of tokens."""
+        return self._send(self._get_spreads(token_ids))
+
+    def get_price(self, token_id: str, side: Literal["BUY", "SELL"]) -> Price:
+        """Get the market price for the given token and side."""
+        return self._send(self._get_price(token_id, side))
+
+    def get_prices(self, params: list[BookParams]) -> dict[str, BidAsk]:
+        """Get the market prices for a set of tokens and sides."""
+        return self._send(self._get_prices(params))
+
+    def get_last_trade_price(self, token_id: str) -> Price:
+        """Fetches the last trade price for a token_id."""
+        return self._send(self._get_last_trade_price(token_id))
+
+    def get_last_trades_prices(self, token_ids: list[str]) -> list[Price]:
+        """Fetches the last trades prices for a set of token ids."""
+        return self._send(self._get_last_trades_prices(token_ids))
+
+    def get_order_book(self, token_id: str) -> OrderBookSummary:
+        """Get the orderbook for the given token."""
+        return self._send(self._get_order_book(token_id))
+
+    def get_order_books(self, token_ids: list[str]) -> list[OrderBookSummary]:
+        """Get the orderbook for a set of tokens."""
+        return self._send(self._get_order_books(token_ids))
+
+    def get_order_books_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[OrderBookSummary]:
+        """
+        Get the orderbooks for any number of tokens.
+
+        Tokens are sent ``chunk_size`` at a time, with up to ``max_concurrency``
+        chunks in flight on the HTTP/2 connection, and results keep the input
+        order. A chunk failing with a transport error, 429 or 5xx is retried
+        ``max_retries`` times; if any chunk still fails, ``BulkRequestError``
+        is raised with the merged results of the others.
+        """
+        return self._bulk(
+            "get_order_books",
+            token_ids,
+            self._get_order_books,
+            _concat,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    def get_midpoints_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, float]:
+        """Get the mid-market prices for any number of tokens; see ``get_order_books_bulk``."""
+        return self._bulk(
+            "get_midpoints",
+            token_ids,
+            self._get_midpoints,
+            _union,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    def get_spreads_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, float]:
+        """Get the spreads for any number of tokens; see ``get_order_books_bulk``."""
+        return self._bulk(
+            "get_spreads",
+            token_ids,
+            self._get_spreads,
+            _union,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    def get_prices_bulk(
+        self,
+        params: Sequence[BookParams],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, BidAsk]:
+        """Get the market prices for any number of tokens and sides; see ``get_order_books_bulk``."""
+        return self._bulk(
+            "get_prices",
+            params,
+            self._get_prices,
+            _merge_bid_asks,
+            _book_params_token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    def get_last_trades_prices_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[Price]:
+        """Fetches the last trades prices for any number of tokens; see ``get_order_books_bulk``."""
+        return self._bulk(
+            "get_last_trades_prices",
+            token_ids,
+            self._get_last_trades_prices,
+            _concat,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    def get_market(self, condition_id: Keccak256) -> ClobMarket:
+        """Get a ClobMarket by condition_id."""
+        return self._send(self._get_market(condition_id))
+
+    def get_market_ids_from_token(self, token_id: str) -> MarketIDs:
+        """Resolve the parent condition and complementary token IDs for a token."""
+        return self._send(self._get_market_ids_from_token(token_id))
+
+    def get_markets(self, next_cursor: str = "MA==") -> PaginatedResponse[ClobMarket]:
+        """Get paginated ClobMarkets."""
+        return self._send(self._get_markets(next_cursor))
+
+    def iter_market_pages(
+        self, next_cursor: str = "MA=="
+    ) -> Generator[PaginatedResponse[ClobMarket]]:
+        """
+        Yield pages of ClobMarkets, fetching each next page in the background.
+
+        Pass a page's ``next_cursor`` back in to resume after it. At most the
+        current and the prefetched page are held at a time.
+        """
+        if next_cursor == END_CURSOR:
+            return
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(
+                self._send_retrying, partial(self._get_markets, next_cursor)
+            )
+            while True:
+                page = pending.result()
+                if page.next_cursor == END_CURSOR:
+                    self.logger.debug("Reached the last page of markets")
+                    yield page
+                    return
+                pending = pool.submit(
+                    self._send_retrying, partial(self._get_markets, page.next_cursor)
+                )
+                yield page
+
+    def iter_markets(self, next_cursor: str = "MA==") -> Generator[ClobMarket]:
+        """Yield ClobMarkets page by page; see ``iter_market_pages``."""
+        for page in self.iter_market_pages(next_cursor):
+            yield from page.data
+
+    def get_all_markets(self, next_cursor: str = "MA==") -> list[ClobMarket]:
+        """Fetch all ClobMarkets using pagination."""
+        return list(self.iter_markets(next_cursor))
+
+    def get_crypto_outcomes(self, slugs: list[str]) -> dict[str, CryptoOutcome]:
+        return self._send(self._get_crypto_outcomes(slugs))
+
+    def get_recent_history(
+        self,
+        token_id: str,
+        interval: Literal["1h", "6h", "1d", "1w", "1m", "max"] = "1d",
+        fidelity: int = 1,
+    ) -> PriceHistory:
+        """Get the recent price history of a token (up to now)."""
+        return self._send(self._get_recent_history(token_id, interval, fidelity))
+
+    def get_history(
+        self,
+        token_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        fidelity: int = 2,
+    ) -> PriceHistory:
+        """Get the price history of a token between a selected date range."""
+        return self._send(self._get_history(token_id, start_time, end_time, fidelity))
+
+    def get_all_history(self, token_id: str) -> PriceHistory:
+        """Get the full price history of a token."""
+        return self.get_history(
+            token_id=token_id,
+            start_time=datetime(2020, 1, 1, tzinfo=UTC),
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.client.close()
+
+
+class PolymarketClobClient(_ClobTradingBase, PolymarketReadOnlyClobClient):
+    creds: ApiCreds
+
+    def __init__(
+        self,
+        private_key: str,
+        address: EthAddress,
+        creds: ApiCreds | None = None,
+        chain_id: Literal[137, 80002] = POLYGON,
+        signature_type: Literal[0, 1, 2, 3] | None = None,
+        proxy: Optional[str] = None,
+        *,
+        logger: Optional[logging.Logger] = None,
+        tick_size_ttl: float = 300.0,
+        metadata_cache: SqliteMetadataCache | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
+    ) -> None:
+        super().__init__(
+            tick_size_ttl,
+            proxy,
+            logger=logger,
+            metadata_cache=metadata_cache,
+            metadata_cache_config=metadata_cache_config,
+        )
+        self._init_signing(private_key, address, chain_id, signature_type)
+        self.creds = creds if creds else self.create_or_derive_api_creds()
+
+    def create_api_creds(self, nonce: int | None = None) -> ApiCreds:
+        return self._send(self._create_api_creds(nonce))
+
+    def derive_api_key(self, nonce: int | None = None) -> ApiCreds:
+        return self._send(self._derive_api_key(nonce))
+
+    def create_or_derive_api_creds(self, nonce: int | None = None) -> ApiCreds:
+        return self._send(self._create_or_derive_api_creds(nonce))
+
+    def get_api_keys(self) -> list[str]:
+        return self._send(self._get_api_keys())
+
+    def delete_api_keys(self) -> Literal["OK"]:
+        return self._send(self._delete_api_keys())
+
+    def create_readonly_api_key(self) -> str:
+        return self._send(self._create_readonly_api_key())
+
+    def get_readonly_api_keys(self) -> list[str]:
+        return self._send(self._get_readonly_api_keys())
+
+    def delete_readonly_api_key(self, key: str) -> str:
+        return self._send(self._delete_readonly_api_key(key))
+
+    def get_pusd_balance(self) -> float:
+        return self._send(self._get_pusd_balance())
+
+    def get_token_balance(self, token_id: str) -> float:
+        return self._send(self._get_token_balance(token_id))
+
+    def send_heartbeat(self) -> Literal["ok"]:
+        return self._send(self._send_heartbeat())
+
+    def get_orders(
+        self,
+        order_id: str | None = None,
+        condition_id: Keccak256 | None = None,
+        token_id: str | None = None,
+        next_cursor: str = "MA==",
+    ) -> list[OpenOrder]:
+        """Gets your active orders, filtered by order_id, condition_id, token_id."""
+        return self._send(
+            self._get_orders(order_id, condition_id, token_id, next_cursor)
+        )
+
+    def create_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
+    ) -> SignedOrder:
+        """Creates and signs an order."""
+        return self._send(self._create_order(order_args, options))
+
+    def post_order(
+        self,
+        order: SignedOrder,
+        order_type: OrderType = OrderType.GTC,
+        post_only: Optional[bool] = False,
+        defer_exec: Optional[bool] = False,
+        *,
+        idempotency_key: str | None = None,
+        _log_context: dict[str, Any] | None = None,
+    ) -> OrderPostResponse | None:
+        """
+        Posts a SignedOrder.
+
+        Args:
+            order: The signed order to post.
+            order_type: Order type (GTC, FOK, FAK, GTD).
+            post_only: Whether the order is post-only.
+            defer_exec: Whether to defer execution.
+            idempotency_key: Optional idempotency key for safe retries on timeout.
+
+        Returns:
+            OrderPostResponse if successful, None if the order was rejected by
+            the server (HTTP 4xx). Raises on 5xx or network errors.
+
+        """
+        return self._send(
+            self._post_order(
+                order, order_type, post_only, defer_exec, idempotency_key, _log_context
+            )
+        )
+
+    def create_and_post_order(
+        self,
+        order_args: OrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+        order_type: OrderType = OrderType.GTC,
+        post_only: Optional[bool] = False,
+        defer_exec: Optional[bool] = False,
+    ) -> OrderPostResponse | None:
+        """Utility function to create and publish an order."""
+        return self._send(
+            self._create_and_post_order(
+                order_args, options, order_type, post_only, defer_exec
+            )
+        )
+
+    def post_orders(
+        self,
+        args: list[PostOrdersArgs],
+        post_only: Optional[bool] = False,
+        defer_exec: Optional[bool] = False,
+    ) -> list[OrderPostResponse] | None:
+        """Posts multiple SignedOrders at once."""
+        return self._send(self._post_orders(args, post_only, defer_exec))
+
+    def create_and_post_orders(
+        self, args: list[OrderArgs], order_types: list[OrderType] | None = None
+    ) -> list[OrderPostResponse] | None:
+        """Utility function to create and publish multiple orders at once."""
+        return self._send(self._create_and_post_orders(args, order_types))
+
+    def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """Calculates the matching price considering an amount and the current orderbook."""
+        return self._send(
+            self._calculate_market_price(token_id, side, amount, order_type)
+        )
+
+    def create_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+    ) -> SignedOrder:
+        """Creates and signs a market order."""
+        return self._send(self._create_market_order(order_args, options))
+
+    def create_and_post_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+        order_type: OrderType = OrderType.FOK,
+        defer_exec: Optional[bool] = False,
+    ) -> OrderPostResponse | None:
+        """Utility function to create and publish a market order."""
+        return self._send(
+            self._create_and_post_market_order(
+                order_args, options, order_type, defer_exec
+            )
+        )
+
+    def cancel_order(self, order_id: Keccak256) -> OrderCancelResponse:
+        """Cancels an order."""
+        return self._send(self._cancel_order(order_id))
+
+    def cancel_orders(self, order_ids: list[Keccak256]) -> OrderCancelResponse:
+        """Cancels multiple orders."""
+        return self._send(self._cancel_orders(order_ids))
+
+    def cancel_all(self) -> OrderCancelResponse:
+        """Cancels all available orders for the user."""
+        return self._send(self._cancel_all())
+
+    def cancel_orders_for_condition_id(
+        self,
+        condition_id: Keccak256,
+    ) -> OrderCancelResponse:
+        """Cancels all orders for both token_ids of a specific condition_id."""
+        return self._send(self._cancel_orders_for_market({"market": condition_id}))
+
+    def cancel_orders_for_token_id(self, token_id: str) -> OrderCancelResponse:
+        """Cancels all orders for a specific token_id."""
+        return self._send(self._cancel_orders_for_market({"asset_id": token_id}))
+
+    def is_order_scoring(self, order_id: Keccak256) -> bool:
+        """Check if the order is currently scoring."""
+        return self._send(self._is_order_scoring(order_id))
+
+    def are_orders_scoring(self, order_ids: list[Keccak256]) -> dict[Keccak256, bool]:
+        """Check if the orders are currently scoring."""
+        return self._send(self._are_orders_scoring(order_ids))
+
+    def get_market_rewards(self, condition_id: Keccak256) -> MarketRewards:
+        """
+        Get the MarketRewards for a given market (condition_id).
+
+        - metadata, tokens, max_spread, min_size, rewards_config, market_competitiveness.
+        """
+        return self._send(self._get_market_rewards(condition_id))
+
+    def get_trades(
+        self,
+        condition_id: Keccak256 | None = None,
+        token_id: str | None = None,
+        trade_id: str | None = None,
+        before: datetime | None = None,
+        after: datetime | None = None,
+        address: EthAddress | None = None,
+        next_cursor: str | None = "MA==",
+    ) -> list[PolygonTrade]:
+        """Fetches the trade history for a user."""
+        return self._send(
+            self._get_trades(
+                condition_id, token_id, trade_id, before, after, address, next_cursor
+            )
+        )
+
+    def get_total_rewards(self, date: datetime | None = None) -> DailyEarnedReward:
+        """Get the total rewards earned on a given date."""
+        return self._send(self._get_total_rewards(date))
+
+    def get_reward_markets(
+        self,
+        query: str | None = None,
+        sort_by: Literal[
+            "market",
+            "max_spread",
+            "min_size",
+            "rate_per_day",
+            "spread",
+            "price",
+            "earnings",
+            "earning_percentage",
+        ]
+        | None = "market",
+        sort_direction: Literal["ASC", "DESC"] | None = None,
+        show_favorites: bool = False,
+    ) -> list[RewardMarket]:
+        """Search through markets that offer rewards by query, sorted by different metrics."""
+        return self._send(
+            self._get_reward_markets(query, sort_by, sort_direction, show_favorites)
+        )
+
+
+class AsyncPolymarketReadOnlyClobClient(_ClobClientBase):
+    """Read-only order book related operations on ``httpx.AsyncClient``."""
+
+    # Everything on disk is loaded into memory before the first request.
+    _metadata_read_through = False
+
+    def __init__(
+        self,
+        tick_size_ttl: float = 300.0,
+        proxy: Optional[str] = None,
+        *,
+        logger: Optional[logging.Logger] = None,
+        max_retries: int = 3,
+        base_retry_delay: float = 0.25,
+        max_retry_delay: float = 30.0,
+        metadata_cache: SqliteMetadataCache | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
+    ) -> None:
+        super().__init__(
+            tick_size_ttl,
+            logger=logger,
+            max_retries=max_retries,
+            base_retry_delay=base_retry_delay,
+            max_retry_delay=max_retry_delay,
+            metadata_cache=metadata_cache,
+            metadata_cache_config=metadata_cache_config,
+        )
+        self.client = httpx.AsyncClient(http2=True, timeout=30.0, proxy=proxy)
+        # ``metadata_cache`` is only used from this thread, so that SQLite
+        # never blocks the event loop and writes land in order.
+        self._metadata_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="clob-metadata-cache")
+            if metadata_cache is not None
+            else None
+        )
+        self._metadata_loaded = metadata_cache is None
+        self._metadata_load_lock = asyncio.Lock()
+
+    def _persist(self, items: Mapping[MetadataKind, Mapping[str, Any]]) -> None:
+        if self._metadata_executor is not None and items:
+            self._metadata_executor.submit(super()._persist, items)
+
+    def _forget(self, kind: MetadataKind, token_id: str | None) -> None:
+        if self._metadata_executor is not None:
+            self._metadata_executor.submit(super()._forget, kind, token_id)
+
+    async def _ensure_metadata_loaded(self) -> None:
+        async with self._metadata_load_lock:
+            if not self._metadata_loaded:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._metadata_executor, self._load_metadata_cache
+                )
+                self._metadata_loaded = True
+
+    async def _request(self, request: _ClobRequest) -> httpx.Response:
+        return await self.client.request(
+            request.method,
+            request.url,
+            params=request.params,
+            headers=request.headers,
+            json=request.json,
+            content=request.content,
+        )
+
+    async def _send[T](self, call: _ClobCall[T]) -> T:
+        try:
+            if not self._metadata_loaded:
+                await self._ensure_metadata_loaded()
+            request = next(call)
+            while True:
+                request = call.send(await self._request(request))
+        except StopIteration as stop:
+            result: T = stop.value
+            return result
+        finally:
+            call.close()
+
+    async def _send_retrying[T](self, make_call: Callable[[], _ClobCall[T]]) -> T:
+        attempt = 0
+        while True:
+            try:
+                return await self._send(make_call())
+            except httpx.HTTPError as exc:
+                if attempt >= self._max_retries or not _is_retryable(exc):
+                    raise
+                delay = self._retry_delay(attempt)
+                self._retry_warning(attempt, delay, exc)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _bulk[X, R, M](
+        self,
+        operation: str,
+        items: Sequence[X],
+        make_call: Callable[[list[X]], _ClobCall[R]],
+        merge: Callable[[list[R]], M],
+        token_id: Callable[[X], str],
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> M:
+        chunks = self._bulk_chunks(items, chunk_size, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(chunk: list[X]) -> R:
+            async with semaphore:
+                return await self._send_retrying(partial(make_call, chunk))
+
+        outcomes = await asyncio.gather(
+            *(fetch(chunk) for chunk in chunks), return_exceptions=True
+        )
+        return self._bulk_result(operation, chunks, outcomes, merge, token_id)
+
+    async def get_ok(self) -> str:
+        return await self._send(self._get_ok())
+
+    async def get_utc_time(self) -> datetime:
+        return await self._send(self._get_utc_time())
+
+    async def get_tick_size(self, token_id: str) -> TickSize:
+        return await self._send(self._get_tick_size(token_id))
+
+    async def get_neg_risk(self, token_id: str) -> bool:
+        return await self._send(self._get_neg_risk(token_id))
+
+    async def get_fee_rate_bps(self, token_id: str) -> int:
+        return await self._send(self._get_fee_rate_bps(token_id))
+
+    async def get_clob_market_info(self, condition_id: Keccak256) -> ClobMarketInfo:
+        return await self._send(self._get_clob_market_info(condition_id))
+
+    async def get_midpoint(self, token_id: str) -> Midpoint:
+        """Get the mid-market price for the given token."""
+        return await self._send(self._get_midpoint(token_id))
+
+    async def get_midpoints(self, token_ids: list[str]) -> dict[str, float]:
+        """Get the mid-market prices for a set of tokens."""
+        return await self._send(self._get_midpoints(token_ids))
+
+    async def get_spread(self, token_id: str) -> Spread:
+        """Get the spread for the given token."""
+        return await self._send(self._get_spread(token_id))
+
+    async def get_spreads(self, token_ids: list[str]) -> dict[str, float]:
+        """Get the spreads for a set of tokens."""
+        return await self._send(self._get_spreads(token_ids))
+
+    async def get_price(self, token_id: str, side: Literal["BUY", "SELL"]) -> Price:
+        """Get the market price for the given token and side."""
+        return await self._send(self._get_price(token_id, side))
+
+    async def get_prices(self, params: list[BookParams]) -> dict[str, BidAsk]:
+        """Get the market prices for a set of tokens and sides."""
+        return await self._send(self._get_prices(params))
+
+    async def get_last_trade_price(self, token_id: str) -> Price:
+        """Fetches the last trade price for a token_id."""
+        return await self._send(self._get_last_trade_price(token_id))
+
+    async def get_last_trades_prices(self, token_ids: list[str]) -> list[Price]:
+        """Fetches the last trades prices for a set of token ids."""
+        return await self._send(self._get_last_trades_prices(token_ids))
+
+    async def get_order_book(self, token_id: str) -> OrderBookSummary:
+        """Get the orderbook for the given token."""
+        return await self._send(self._get_order_book(token_id))
+
+    async def get_order_books(self, token_ids: list[str]) -> list[OrderBookSummary]:
+        """Get the orderbook for a set of tokens."""
+        return await self._send(self._get_order_books(token_ids))
+
+    async def get_order_books_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[OrderBookSummary]:
+        """
+        Get the orderbooks for any number of tokens.
+
+        Tokens are sent ``chunk_size`` at a time, with up to ``max_concurrency``
+        chunks in flight on the HTTP/2 connection, and results keep the input
+        order. A chunk failing with a transport error, 429 or 5xx is retried
+        ``max_retries`` times; if any chunk still fails, ``BulkRequestError``
+        is raised with the merged results of the others.
+        """
+        return await self._bulk(
+            "get_order_books",
+            token_ids,
+            self._get_order_books,
+            _concat,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    async def get_midpoints_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, float]:
+        """Get the mid-market prices for any number of tokens; see ``get_order_books_bulk``."""
+        return await self._bulk(
+            "get_midpoints",
+            token_ids,
+            self._get_midpoints,
+            _union,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    async def get_spreads_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, float]:
+        """Get the spreads for any number of tokens; see ``get_order_books_bulk``."""
+        return await self._bulk(
+            "get_spreads",
+            token_ids,
+            self._get_spreads,
+            _union,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    async def get_prices_bulk(
+        self,
+        params: Sequence[BookParams],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, BidAsk]:
+        """Get the market prices for any number of tokens and sides; see ``get_order_books_bulk``."""
+        return await self._bulk(
+            "get_prices",
+            params,
+            self._get_prices,
+            _merge_bid_asks,
+            _book_params_token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    async def get_last_trades_prices_bulk(
+        self,
+        token_ids: Sequence[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[Price]:
+        """Fetches the last trades prices for any number of tokens; see ``get_order_books_bulk``."""
+        return await self._bulk(
+            "get_last_trades_prices",
+            token_ids,
+            self._get_last_trades_prices,
+            _concat,
+            _token_id,
+            chunk_size,
+            max_concurrency,
+        )
+
+    async def get_market(self, condition_id: Keccak256) -> ClobMarket:
+        """Get a ClobMarket by condition_id."""
+        return await self._send(self._get_market(condition_id))
+
+    async def get_market_ids_from_token(self, token_id: str) -> MarketIDs:
+        """Resolve the parent condition and complementary token IDs for a token."""
+        return await self._send(self._get_market_ids_from_token(token_id))
+
+    async def get_markets(
+        self, next_cursor: str = "MA=="
+    ) -> PaginatedResponse[ClobMarket]:
+        """Get paginated ClobMarkets."""
+        return await self._send(self._get_markets(next_cursor))
+
+    async def iter_market_pages(
+        self, next_cursor: str = "MA=="
+    ) -> AsyncGenerator[PaginatedResponse[ClobMarket]]:
+        """
+        Yield pages of ClobMarkets, fetching each next page in the background.
+
+        Pass a page's ``next_cursor`` back in to resume after it. At most the
+        current and the prefetched page are held at a time.
+        """
+        if next_cursor == END_CURSOR:
+            return
+        pending = asyncio.ensure_future(
+            self._send_retrying(partial(self._get_markets, next_cursor))
+        )
+        try:
+            while True:
+                page = await pending
+                if page.next_cursor == END_CURSOR:
+                    self.logger.debug("Reached the last page of markets")
+                    yield page
+                    return
+                pending = asyncio.ensure_future(
+                    self._send_retrying(partial(self._get_markets, page.next_cursor))
+                )
+                yield page
+        finally:
+            pending.cancel()
+
+    async def iter_markets(
+        self, next_cursor: str = "MA=="
+    ) -> AsyncGenerator[ClobMarket]:
+        """Yield ClobMarkets page by page; see ``iter_market_pages``."""
+        async for page in self.iter_market_pages(next_cursor):
+            for market in page.data:
+                yield market
+
+    async def get_all_markets(self, next_cursor: str = "MA==") -> list[ClobMarket]:
+        """Fetch all ClobMarkets using pagination."""
+        return [market async for market in self.iter_markets(next_cursor)]
+
+    async def get_crypto_outcomes(self, slugs: list[str]) -> dict[str, CryptoOutcome]:
+        return await self._send(self._get_crypto_outcomes(slugs))
+
+    async def get_recent_history(
+        self,
+        token_id: str,
+        interval: Literal["1h", "6h", "1d", "1w", "1m", "max"] = "1d",
+        fidelity: int = 1,
+    ) -> PriceHistory:
+        """Get the recent price history of a token (up to now)."""
+        return await self._send(self._get_recent_history(token_id, interval, fidelity))
+
+    async def get_history(
+        self,
+        token_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        fidelity: int = 2,
+    ) -> PriceHistory:
+        """Get the price history of a token between a selected date range."""
+        return await self._send(
+            self._get_history(token_id, start_time, end_time, fidelity)
+        )
+
+    async def get_all_history(self, token_id: str) -> PriceHistory:
+        """Get the full price history of a token."""
+        return await self.get_history(
+            token_id=token_id,
+            start_time=datetime(2020, 1, 1, tzinfo=UTC),
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+        executor, self._metadata_executor = self._metadata_executor, None
+        if executor is not None:
+            # Let queued metadata writes finish; later ones are not persisted.
+            await asyncio.to_thread(executor.shutdown)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.aclose()
+
+
+# Yielded by the async client's _api_creds in place of the create-or-derive
+# requests, so that _send derives the API key once under a lock.
+_AWAIT_API_CREDS = _ClobRequest("POST", CREATE_API_KEY)
+
+
+class AsyncPolymarketClobClient(_ClobTradingBase, AsyncPolymarketReadOnlyClobClient):
+    """
+    Trading client on ``httpx.AsyncClient``, for use from the websocket event loop.
+
+    Without ``creds`` the API key is created or derived on the first
+    authenticated request rather than in the constructor; concurrent first
+    requests wait for a single round trip. Without
+    ``signature_type`` the wallet type is looked up over RPC in the
+    constructor, which blocks; pass it explicitly when constructing on a
+    running loop.
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        address: EthAddress,
+        creds: ApiCreds | None = None,
+        chain_id: Literal[137, 80002] = POLYGON,
+        signature_type: Literal[0, 1, 2, 3] | None = None,
+        proxy: Optional[str] = None,
+        *,
+        logger: Optional[logging.Logger] = None,
+        tick_size_ttl: float = 300.0,
+        metadata_cache: SqliteMetadataCache | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
+    ) -> None:
+        super().__init__(
+            tick_size_ttl,
+            proxy,
+            logger=logger,
+            metadata_cache=metadata_cache,
+            metadata_cache_config=metadata_cache_config,
+        )
+        self._init_signing(private_key, address, chain_id, signature_type)
+        self.creds = creds
+        self._api_creds_lock = asyncio.Lock()
+
+    def _api_creds(self) -> _ClobCall[ApiCreds]:
+        while self.creds is None:
+            yield _AWAIT_API_CREDS
+        return self.creds
+
+    async def _ensure_api_creds(self) -> None:
+        async with self._api_creds_lock:
+            if self.creds is None:
+                self.creds = await self.create_or_derive_api_creds()
+
+    async def _send[T](self, call: _ClobCall[T]) -> T:
+        try:
+            if not self._metadata_loaded:
+                await self._ensure_metadata_loaded()
+            request = next(call)
+            while True:
+                if request is _AWAIT_API_CREDS:
+                    await self._ensure_api_creds()
+                    request = next(call)
+                else:
+                    request = call.send(await self._request(request))
+        except StopIteration as stop:
+            result: T = stop.value
+            return result
+        finally:
+            call.close()
+
+    async def create_api_creds(self, nonce: int | None = None) -> ApiCreds:
+        return await self._send(self._create_api_creds(nonce))
+
+    async def derive_api_key(self, nonce: int | None = None) -> ApiCreds:
+        return await self._send(self._derive_api_key(nonce))
+
+    async def create_or_derive_api_creds(self, nonce: int | None = None) -> ApiCreds:
+        return await self._send(self._create_or_derive_api_creds(nonce))
+
+    async def get_api_keys(self) -> list[str]:
+        return await self._send(self._get_api_keys())
+
+    async def delete_api_keys(self) -> Literal["OK"]:
+        return await self._send(self._delete_api_keys())
+
+    async def create_readonly_api_key(self) -> str:
+        return await self._send(self._create_readonly_api_key())
+
+    async def get_readonly_api_keys(self) -> list[str]:
+        return await self._send(self._get_readonly_api_keys())
+
+    async def delete_readonly_api_key(self, key: str) -> str:
+        return await self._send(self._delete_readonly_api_key(key))
+
+    async def get_pusd_balance(self) -> float:
+        return await self._send(self._get_pusd_balance())
+
+    async def get_token_balance(self, token_id: str) -> float:
+        return await self._send(self._get_token_balance(token_id))
+
+    async def send_heartbeat(self) -> Literal["ok"]:
+        return await self._send(self._send_heartbeat())
+
+    async def get_orders(
+        self,
+        order_id: str | None = None,
+        condition_id: Keccak256 | None = None,
+        token_id: str | None = None,
+        next_cursor: str = "MA==",
+    ) -> list[OpenOrder]:
+        """Gets your active orders, filtered by order_id, condition_id, token_id."""
+        return await self._send(
+            self._get_orders(order_id, condition_id, token_id, next_cursor)
+        )
+
+    async def create_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions | None = None
+    ) -> SignedOrder:
+        """Creates and signs an order."""
+        return await self._send(self._create_order(order_args, options))
+
+    async def post_order(
+        self,
+        order: SignedOrder,
+        order_type: OrderType = OrderType.GTC,
+        post_only: Optional[bool] = False,
+        defer_exec: Optional[bool] = False,
+        *,
+        idempotency_key: str | None = None,
+        _log_context: dict[str, Any] | None = None,
+    ) -> OrderPostResponse | None:
+        """Posts a SignedOrder; see ``PolymarketClobClient.post_order``."""
+        return await self._send(
+            self._post_order(
+                order, order_type, post_only, defer_exec, idempotency_key, _log_context
+            )
+        )
+
+    async def create_and_post_order(
+        self,
+        order_args: OrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+        order_type: OrderType = OrderType.GTC,
+        post_only: Optional[bool] = False,
+        defer_exec: Optional[bool] = False,
+    ) -> OrderPostResponse | None:
+        """Utility function to create and publish an order."""
+        return await self._send(
+            self._create_and_post_order(
+                order_args, options, order_type, post_only, defer_exec
+            )
+        )
+
+    async def post_orders(
+        self,
+        args: list[PostOrdersArgs],
+        post_only: Optional[bool] = False,
+        defer_exec: Optional[bool] = False,
+    ) -> list[OrderPostResponse] | None:
+        """Posts multiple SignedOrders at once."""
+        return await self._send(self._post_orders(args, post_only, defer_exec))
+
+    async def create_and_post_orders(
+        self, args: list[OrderArgs], order_types: list[OrderType] | None = None
+    ) -> list[OrderPostResponse] | None:
+        """Utility function to create and publish multiple orders at once."""
+        return await self._send(self._create_and_post_orders(args, order_types))
+
+    async def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """Calculates the matching price considering an amount and the current orderbook."""
+        return await self._send(
+            self._calculate_market_price(token_id, side, amount, order_type)
+        )
+
+    async def create_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+    ) -> SignedOrder:
+        """Creates and signs a market order."""
+        return await self._send(self._create_market_order(order_args, options))
+
+    async def create_and_post_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: PartialCreateOrderOptions | None = None,
+        order_type: OrderType = OrderType.FOK,
+        defer_exec: Optional[bool] = False,
+    ) -> OrderPostResponse | None:
+        """Utility function to create and publish a market order."""
+        return await self._send(
+            self._create_and_post_market_order(
+                order_args, options, order_type, defer_exec
+            )
+        )
+
+    async def cancel_order(self, order_id: Keccak256) -> OrderCancelResponse:
+        """Cancels an order."""
+        return await self._send(self._cancel_order(order_id))
+
+    async def cancel_orders(self, order_ids: list[Keccak256]) -> OrderCancelResponse:
+        """Cancels multiple orders."""
+        return await self._send(self._cancel_orders(order_ids))
+
+    async def cancel_all(self) -> OrderCancelResponse:
+        """Cancels all available orders for the user."""
+        return await self._send(self._cancel_all())
+
+    async def cancel_orders_for_condition_id(
+        self,
+        condition_id: Keccak256,
+    ) -> OrderCancelResponse:
+        """Cancels all orders for both token_ids of a specific condition_id."""
+        return await self._send(
+            self._cancel_orders_for_market({"market": condition_id})
+        )
+
+    async def cancel_orders_for_token_id(self, token_id: str) -> OrderCancelResponse:
+        """Cancels all orders for a specific token_id."""
+        return await self._send(self._cancel_orders_for_market({"asset_id": token_id}))
+
+    async def is_order_scoring(self, order_id: Keccak256) -> bool:
+        """Check if the order is currently scoring."""
+        return await self._send(self._is_order_scoring(order_id))
+
+    async def are_orders_scoring(
+        self, order_ids: list[Keccak256]
+    ) -> dict[Keccak256, bool]:
+        """Check if the orders are currently scoring."""
+        return await self._send(self._are_orders_scoring(order_ids))
+
+    async def get_market_rewards(self, condition_id: Keccak256) -> MarketRewards:
+        """
+        Get the MarketRewards for a given market (condition_id).
+
+        - metadata, tokens, max_spread, min_size, rewards_config, market_competitiveness.
+        """
+        return await self._send(self._get_market_rewards(condition_id))
+
+    async def get_trades(
+        self,
+        condition_id: Keccak256 | None = None,
+        token_id: str | None = None,
+        trade_id: str | None = None,
+        before: datetime | None = None,
+        after: datetime | None = None,
+        address: EthAddress | None = None,
+        next_cursor: str | None = "MA==",
+    ) -> list[PolygonTrade]:
+        """Fetches the trade history for a user."""
+        return await self._send(
+            self._get_trades(
+                condition_id, token_id, trade_id, before, after, address, next_cursor
+            )
+        )
+
+    async def get_total_rewards(
+        self, date: datetime | None = None
+    ) -> DailyEarnedReward:
+        """Get the total rewards earned on a given date."""
+        return await self._send(self._get_total_rewards(date))
+
+    async def get_reward_markets(
+        self,
+        query: str | None = None,
+        sort_by: Literal[
+            "market",
+            "max_spread",
+            "min_size",
+            "rate_per_day",
+            "spread",
+            "price",
+            "earnings",
+            "earning_percentage",
+        ]
+        | None = "market",
+        sort_direction: Literal["ASC", "DESC"] | None = None,
+        show_favorites: bool = False,
+    ) -> list[RewardMarket]:
+        """Search through markets that offer rewards by query, sorted by different metrics."""
+        return await self._send(
+            self._get_reward_markets(query, sort_by, sort_direction, show_favorites)
+        )
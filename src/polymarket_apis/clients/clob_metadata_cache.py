@@ -0,0 +1,317 @@
+"""
+Caches for CLOB market metadata: bounded in memory, optionally on disk.
+
+A CLOB client keeps each kind of metadata in its own ``LruTtlCache``, sized
+and expired per ``MetadataCacheConfig``, and reports hit, miss, eviction and
+expiration counts as ``CacheStats``.
+
+``SqliteMetadataCache`` keeps tick sizes, neg risk flags, fee rates, fee info
+and the token to condition id map in a single SQLite table keyed by kind and
+token id. Pass one to a CLOB client as ``metadata_cache``: lookups that miss
+the in-memory cache read through to it before going to the network, and every
+fetched value is written back. Entries carry the wall-clock time they were
+written, so TTLs still apply across restarts.
+
+``AsyncPolymarketReadOnlyClobClient`` and ``AsyncPolymarketClobClient`` never
+touch the database on the event loop: they load it into memory once, on a
+worker thread, before their first request, and write back from that thread.
+
+The database runs in WAL mode, so any number of processes can read while one
+writes; writers wait up to ``timeout`` seconds for each other. Open a separate
+instance per process rather than sharing one across ``fork``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Literal, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+type MetadataKind = Literal[
+    "tick_size", "neg_risk", "fee_rate", "fee_info", "condition_id"
+]
+
+DEFAULT_METADATA_CACHE_MAX_ENTRIES = 100_000
+DEFAULT_METADATA_CACHE_TIMEOUT = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int | None
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+@dataclass(frozen=True, slots=True)
+class MetadataCacheConfig:
+    """
+    Bounds for a CLOB client's in-memory metadata caches.
+
+    Every kind holds at most ``max_entries`` tokens (None for no bound).
+    ``ttls`` maps a kind to the seconds after which its entries are refetched;
+    tick sizes default to the client's ``tick_size_ttl`` and other kinds
+    never expire unless listed.
+    """
+
+    max_entries: int | None = DEFAULT_METADATA_CACHE_MAX_ENTRIES
+    ttls: Mapping[MetadataKind, float] = field(default_factory=dict)
+
+
+class LruTtlCache[K, V]:
+    """
+    Thread-safe mapping of at most ``max_size`` entries that expire after ``ttl`` seconds.
+
+    Storing past ``max_size`` evicts the least recently used entry. ``get``
+    counts a hit or a miss; an expired entry is dropped and counts as a miss
+    and an expiration. Either bound may be None. ``ttl`` can be changed at
+    any time and applies to entries already stored.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = DEFAULT_METADATA_CACHE_MAX_ENTRIES,
+        ttl: float | None = None,
+    ) -> None:
+        if max_size is not None and max_size < 1:
+            msg = f"max_size must be at least 1, got {max_size}"
+            raise ValueError(msg)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, stored_at = entry
+            if self.ttl is not None and monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: K) -> V | None:
+        """Return the unexpired value for ``key`` without counting a lookup or using it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if self.ttl is not None and monotonic() - stored_at >= self.ttl:
+                return None
+            return value
+
+    def set(self, key: K, value: V, *, age: float = 0.0) -> None:
+        """Store ``value``, treated as fetched ``age`` seconds ago for its TTL."""
+        self.update({key: value}, age=age)
+
+    def update(self, items: Mapping[K, V], *, age: float = 0.0) -> None:
+        stored_at = monotonic() - age
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (value, stored_at)
+                self._entries.move_to_end(key)
+            if self.max_size is None:
+                return
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Drop ``key``, or every entry when ``key`` is None. Counters are kept."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+class SqliteMetadataCache:
+    """
+    Market metadata in the SQLite database at ``path``, created if missing.
+
+    Values are stored as JSON. One connection is shared by all threads of the
+    process and serialised with a lock; each ``set_many`` is one transaction.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        timeout: float = DEFAULT_METADATA_CACHE_TIMEOUT,
+    ) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path,
+            timeout=timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+
+    def get(
+        self,
+        kind: MetadataKind,
+        key: str,
+        *,
+        max_age: float | None = None,
+    ) -> tuple[Any, float] | None:
+        """
+        Return ``(value, updated_at)`` for ``key``, or None when missing.
+
+        With ``max_age``, entries written more than ``max_age`` seconds ago
+        count as missing. ``updated_at`` is a ``time.time()`` timestamp.
+        """
+        oldest = -1.0 if max_age is None else time.time() - max_age
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, updated_at FROM metadata"
+                " WHERE kind = ? AND key = ? AND updated_at > ?",
+                (kind, key, oldest),
+            ).fetchone()
+        if row is None:
+            return None
+        value, updated_at = row
+        return json.loads(value), updated_at
+
+    def entries(
+        self,
+        kind: MetadataKind,
+        *,
+        max_age: float | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, Any, float]]:
+        """
+        Return ``(key, value, updated_at)`` for the ``limit`` newest entries of ``kind``.
+
+        With ``max_age``, entries written more than ``max_age`` seconds ago
+        are left out.
+        """
+        oldest = -1.0 if max_age is None else time.time() - max_age
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value, updated_at FROM metadata"
+                " WHERE kind = ? AND updated_at > ?"
+                " ORDER BY updated_at DESC LIMIT ?",
+                (kind, oldest, -1 if limit is None else limit),
+            ).fetchall()
+        return [(key, json.loads(value), updated_at) for key, value, updated_at in rows]
+
+    def set_many(
+        self,
+        kind: MetadataKind,
+        items: Mapping[str, Any],
+        *,
+        updated_at: float | None = None,
+    ) -> None:
+        """Store every value in ``items``, stamped with ``updated_at`` (default now)."""
+        self.update({kind: items}, updated_at=updated_at)
+
+    def update(
+        self,
+        items: Mapping[MetadataKind, Mapping[str, Any]],
+        *,
+        updated_at: float | None = None,
+    ) -> None:
+        """Store the values of several kinds in one transaction."""
+        stamp = time.time() if updated_at is None else updated_at
+        rows = [
+            (kind, key, json.dumps(value), stamp)
+            for kind, values in items.items()
+            for key, value in values.items()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO metadata (kind, key, value, updated_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def delete(self, kind: MetadataKind | None = None, key: str | None = None) -> None:
+        """Delete ``key`` of ``kind``, every entry of ``kind``, or everything."""
+        with self._lock:
+            if kind is None:
+                self._connection.execute("DELETE FROM metadata")
+            elif key is None:
+                self._connection.execute("DELETE FROM metadata WHERE kind = ?", (kind,))
+            else:
+                self._connection.execute(
+                    "DELETE FROM metadata WHERE kind = ? AND key = ?", (kind, key)
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
@@ -2,33 +2,55 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
 import inspect
 import json
 import logging
 import random
+import re
 import threading
 import time
+from collections import deque
 from collections.abc import Callable, Coroutine, Mapping, Sequence
-from concurrent.futures import Future
+from concurrent.futures import Executor, Future
 from copy import deepcopy
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from heapq import nlargest, nsmallest
+from functools import lru_cache
 from json import JSONDecodeError
-from typing import Any, Literal, cast, get_args, get_origin, get_type_hints
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from pydantic import BaseModel, TypeAdapter, ValidationError
 from websockets.asyncio.client import ClientConnection, connect
 from websockets.exceptions import ConnectionClosed
 
-from ..types.clob_types import ApiCreds
+from ..types.clob_types import ApiCreds, ClobMarket, MarketIDs, OrderBookSummary
+from ..types.websockets_lazy import LazyEvent, lazy_event
+from ..types.websockets_structs import (
+    MarketEventStruct,
+    OrderBookSummaryEventStruct,
+    PriceChangeEventStruct,
+    decode_market_struct,
+)
 from ..types.websockets_types import (
     ActivityOrderMatchEvent,
     ActivityTradeEvent,
     AssetPriceSubscribeEvent,
     AssetPriceUpdateEvent,
+    BestBidAskEvent,
     CommentEvent,
+    LastTradePriceEvent,
     MarketEvents,
+    MarketResolvedEvent,
+    NewMarketEvent,
     OrderBookSummaryEvent,
     OrderEvent,
     PriceChangeEvent,
@@ -36,10 +58,25 @@ from ..types.websockets_types import (
     RealTimeDataEvents,
     RealTimeDataSubscription,
     SportsGameUpdate,
+    TickSizeChangeEvent,
     TradeEvent,
     UserEvents,
 )
 from ..utilities._internal_log import current_or_new_trace_id, emit
+from ..utilities._latency_histogram import LatencyHistogram, RollingLatencyHistogram
+from ..utilities._order_book_ladder import (
+    LadderSide,
+    PriceLadder,
+    SortedPriceLadder,
+    TickPriceLadder,
+)
+
+if TYPE_CHECKING:
+    from .clob_client import (
+        AsyncPolymarketReadOnlyClobClient,
+        PolymarketReadOnlyClobClient,
+    )
+    from .websockets_recording import FrameRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +90,19 @@ DEFAULT_SUBSCRIPTION_ERROR_GRACE_SECONDS = 0.2
 DEFAULT_STALE_CONNECTION_RECOVERY_TIMEOUT_SECONDS = 2.0
 DEFAULT_LOOP_THREAD_JOIN_TIMEOUT_SECONDS = 5.0
 DEFAULT_LOOP_THREAD_SHUTDOWN_TIMEOUT_SECONDS = 2.0
+DEFAULT_RESYNC_MAX_BUFFERED_DELTAS = 10_000
+DEFAULT_RESYNC_BATCH_SIZE = 50
+DEFAULT_RESYNC_MAX_ATTEMPTS = 3
+DEFAULT_RESYNC_RETRY_DELAY = 1.0
+DEFAULT_MAX_PENDING_HASH_CHECKS = 1_000
 DEFAULT_MESSAGE_QUEUE_MAXSIZE = 1000
+DEFAULT_PARSE_PIPELINE_DEPTH = 64
+DEFAULT_MAX_TOKENS_PER_SHARD = 500
 DEFAULT_SYNC_CLOSE_TIMEOUT_SECONDS = 6.0
+DEFAULT_LATENCY_WINDOW_SECONDS = 60.0
 RAW_MESSAGE_PREVIEW_LIMIT = 500
+_WALL_CLOCK_REANCHOR_NS = 1_000_000_000
+_ASSET_ID_PATTERN = re.compile(r'"asset_id"\s*:\s*"([^"]+)"')
 
 
 def _default_user_stale_after_seconds() -> float:
@@ -68,6 +115,19 @@ def _default_real_time_data_stale_after_seconds() -> float:
 
 MARKET_EVENT_ADAPTER: TypeAdapter[MarketEvents] = TypeAdapter(MarketEvents)
 USER_EVENT_ADAPTER: TypeAdapter[UserEvents] = TypeAdapter(UserEvents)
+MARKET_EVENT_CLASSES: Mapping[str, type[BaseModel]] = {
+    "book": OrderBookSummaryEvent,
+    "price_change": PriceChangeEvent,
+    "tick_size_change": TickSizeChangeEvent,
+    "last_trade_price": LastTradePriceEvent,
+    "best_bid_ask": BestBidAskEvent,
+    "new_market": NewMarketEvent,
+    "market_resolved": MarketResolvedEvent,
+}
+USER_EVENT_CLASSES: Mapping[str, type[BaseModel]] = {
+    "order": OrderEvent,
+    "trade": TradeEvent,
+}
 
 REAL_TIME_DATA_EVENT_CLASSES: Mapping[str, type[RealTimeDataEvents]] = {
     "trades": ActivityTradeEvent,
@@ -81,14 +141,34 @@ REAL_TIME_DATA_EVENT_CLASSES: Mapping[str, type[RealTimeDataEvents]] = {
 }
 
 ParsedMarketMessage = MarketEvents | list[OrderBookSummaryEvent]
+StructMarketMessage = MarketEventStruct | list[OrderBookSummaryEventStruct]
 ProcessEventCallback = Callable[[Any], Any]
 ProcessEventErrorPolicy = Literal["disconnect", "log"]
 ParseErrorPolicy = Literal["drop", "raw"]
-MessageMode = Literal["parsed", "raw"]
-MessageQueueOverflowPolicy = Literal["drop_oldest", "disconnect", "reconnect"]
+MessageMode = Literal["parsed", "raw", "struct", "lazy"]
+MessageQueueOverflowPolicy = Literal[
+    "drop_oldest", "disconnect", "reconnect", "conflate"
+]
 LocalOrderBookUpdateKind = Literal["snapshot", "delta", "ignored"]
+LocalOrderBookBackend = Literal["sorted", "tick"]
+# (timestamp_ms, side, price, size, observed_at) for a delta held during a resync.
+type _BufferedLevelChange = tuple[int | None, str, float, float, datetime]
 type RealTimeDataSubscriptionInput = RealTimeDataSubscription | dict[str, Any]
 _MESSAGE_QUEUE_SENTINEL = object()
+_UNDECODED = object()
+_UNPARSED = object()
+# Message modes that need a channel-specific parser; the rest work everywhere.
+_MESSAGE_MODE_CHANNELS: Mapping[str, frozenset[str]] = {
+    "struct": frozenset({"market"}),
+    "lazy": frozenset({"market", "user"}),
+}
+_OPTIMISTIC_READ_ATTEMPTS = 8
+# Mirrored prices (1 - p) are rounded so they compare equal to parsed prices.
+_MIRROR_PRICE_DECIMALS = 6
+_CONFLATED_EVENT_TYPES = frozenset(
+    {"book", "best_bid_ask", "last_trade_price", "tick_size_change"}
+)
+_HASH_LEVEL_CACHE_SIZE = 65_536
 
 
 class ProcessEventError(RuntimeError):
@@ -123,6 +203,24 @@ class SubscriptionAckTimeoutError(TimeoutError):
         )
 
 
+@dataclass(frozen=True, slots=True)
+class ConnectionLatency:
+    """
+    Where a connection's per-message time goes, over the last one to two minutes.
+
+    ``exchange_to_receive`` compares the payload ``timestamp`` with the local
+    receive time (so it includes clock skew, clamped at zero);
+    ``receive_to_dequeue`` is time spent in the message queue; ``parse`` and
+    ``callback`` time the parser and ``process_event``. The first three need
+    the message envelope, so they stay empty with ``message_mode="raw"``.
+    """
+
+    exchange_to_receive: LatencyHistogram
+    receive_to_dequeue: LatencyHistogram
+    parse: LatencyHistogram
+    callback: LatencyHistogram
+
+
 @dataclass(frozen=True, slots=True)
 class ConnectionHealth:
     channel: str
@@ -137,6 +235,8 @@ class ConnectionHealth:
     last_pong_time: datetime | None
     last_process_event_error: str | None
     consecutive_failures: int
+    resyncing_token_count: int = 0
+    queue_high_water_mark: int = 0
 
     @property
     def last_activity_time(self) -> datetime | None:
@@ -151,6 +251,45 @@ class ConnectionHealth:
         return max(available)
 
 
+@dataclass(frozen=True, slots=True)
+class ShardedConnectionHealth:
+    """Health of every shard of a sharded market stream, with aggregate views."""
+
+    shards: tuple[ConnectionHealth, ...]
+
+    @property
+    def connected(self) -> bool:
+        return bool(self.shards) and all(shard.connected for shard in self.shards)
+
+    @property
+    def connected_shard_count(self) -> int:
+        return sum(shard.connected for shard in self.shards)
+
+    @property
+    def closed(self) -> bool:
+        return all(shard.closed for shard in self.shards)
+
+    @property
+    def reconnecting(self) -> bool:
+        return any(shard.reconnecting for shard in self.shards)
+
+    @property
+    def consecutive_failures(self) -> int:
+        return sum(shard.consecutive_failures for shard in self.shards)
+
+    @property
+    def resyncing_token_count(self) -> int:
+        return sum(shard.resyncing_token_count for shard in self.shards)
+
+    @property
+    def last_activity_time(self) -> datetime | None:
+        """Activity time of the quietest shard; ``None`` if any shard has none."""
+        times = [shard.last_activity_time for shard in self.shards]
+        if not times or any(time is None for time in times):
+            return None
+        return min(time for time in times if time is not None)
+
+
 LifecycleCallback = Callable[[ConnectionHealth], Any]
 
 
@@ -158,6 +297,8 @@ LifecycleCallback = Callable[[ConnectionHealth], Any]
 class WebsocketCallbackConfig:
     process_event_error_policy: ProcessEventErrorPolicy = "disconnect"
     parse_error_policy: ParseErrorPolicy = "raw"
+    batch_max_size: int | None = None
+    parse_executor: Executor | None = None
     on_connect: LifecycleCallback | None = None
     on_disconnect: LifecycleCallback | None = None
     on_reconnect: LifecycleCallback | None = None
@@ -184,27 +325,99 @@ class WebsocketReconnectConfig:
     reconnect_on_real_time_data_stale: bool = True
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
+class OrderBookResyncConfig:
+    """
+    Resync invalidated local order books over REST while the stream stays up.
+
+    Tokens are fetched with ``client.get_order_books`` in batches of
+    ``batch_size``; a batch that fails is retried up to ``max_attempts`` times.
+    An async client is awaited on the event loop, a sync one runs in a thread.
+    """
+
+    client: PolymarketReadOnlyClobClient | AsyncPolymarketReadOnlyClobClient
+    batch_size: int = DEFAULT_RESYNC_BATCH_SIZE
+    max_attempts: int = DEFAULT_RESYNC_MAX_ATTEMPTS
+    retry_delay: float = DEFAULT_RESYNC_RETRY_DELAY
+
+
+class _WallClock:
+    """
+    Converts ``time.monotonic_ns()`` stamps to UTC datetimes.
+
+    The offset between the two clocks is re-read at most once a second, so a
+    wall-clock step or a suspend is picked up without reading both clocks for
+    every frame.
+    """
+
+    __slots__ = ("_anchored_ns", "_offset_ns")
+
+    def __init__(self) -> None:
+        self._anchored_ns = time.monotonic_ns()
+        self._offset_ns = time.time_ns() - self._anchored_ns
+
+    def datetime_at(self, monotonic_ns: int) -> datetime:
+        if monotonic_ns - self._anchored_ns >= _WALL_CLOCK_REANCHOR_NS:
+            self._anchored_ns = time.monotonic_ns()
+            self._offset_ns = time.time_ns() - self._anchored_ns
+        return datetime.fromtimestamp((monotonic_ns + self._offset_ns) / 1e9, UTC)
+
+
+_wall_clock = _WallClock()
+
+
 class _WebsocketMessage:
-    channel: str
-    text: str
-    parse_json: bool = True
-    trace_id: str = field(default_factory=current_or_new_trace_id)
-    received_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    message_size: int = field(init=False)
-    json_data: object | None = field(init=False)
-
-    def __post_init__(self) -> None:
-        self.message_size = len(self.text.encode("utf-8"))
-        if not self.parse_json:
-            self.json_data = None
+    """
+    Envelope of one received frame on its way to the parser.
+
+    One is built per frame, so construction only stamps ``time.monotonic_ns()``
+    and decodes the JSON; ``received_at``, ``message_size`` and ``trace_id``
+    are worked out the first time something (usually a log line) reads them.
+    """
+
+    __slots__ = (
+        "_message_size",
+        "_received_at",
+        "_trace_id",
+        "channel",
+        "json_data",
+        "parse_json",
+        "received_monotonic_ns",
+        "text",
+    )
+
+    def __init__(
+        self,
+        channel: str,
+        text: str,
+        *,
+        parse_json: bool = True,
+        trace_id: str | None = None,
+        received_at: datetime | None = None,
+        json_data: object | None = _UNDECODED,
+        received_monotonic_ns: int | None = None,
+    ) -> None:
+        self.channel = channel
+        self.text = text
+        self.parse_json = parse_json
+        self.received_monotonic_ns = (
+            time.monotonic_ns()
+            if received_monotonic_ns is None
+            else received_monotonic_ns
+        )
+        self._received_at = received_at
+        self._trace_id = trace_id
+        self._message_size: int | None = None
+        self.json_data = json_data
+        if json_data is not _UNDECODED:
+            # Payload was already decoded upstream (e.g. by the local order book).
             return
-        if not self.text or self.text.isspace():
+        if not parse_json or not text or text.isspace():
             self.json_data = None
             return
 
         try:
-            self.json_data = cast("object", json.loads(self.text))
+            self.json_data = cast("object", json.loads(text))
         except JSONDecodeError:
             emit(
                 logger,
@@ -220,6 +433,46 @@ class _WebsocketMessage:
             )
             self.json_data = None
 
+    @property
+    def received_at(self) -> datetime:
+        if self._received_at is None:
+            self._received_at = _wall_clock.datetime_at(self.received_monotonic_ns)
+        return self._received_at
+
+    @property
+    def message_size(self) -> int:
+        """Size of the frame in UTF-8 bytes."""
+        if self._message_size is None:
+            text = self.text
+            # ``isascii`` is a flag check, so ASCII frames skip the encode.
+            self._message_size = (
+                len(text) if text.isascii() else len(text.encode("utf-8"))
+            )
+        return self._message_size
+
+    @property
+    def trace_id(self) -> str:
+        if self._trace_id is None:
+            self._trace_id = current_or_new_trace_id()
+        return self._trace_id
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingHashCheck:
+    """A sampled copy of one token's book, waiting to be hashed by ``verify_hashes``."""
+
+    token_id: str
+    generation: int
+    expected_hash: str
+    market: str | None
+    timestamp: str
+    bids: PriceLadder | None
+    asks: PriceLadder | None
+    tick_size: float | None
+    last_trade_price: float | None
+    min_order_size: float | None
+    neg_risk: bool | None
+
 
 @dataclass(frozen=True, slots=True)
 class LocalOrderBookSnapshot:
@@ -302,13 +555,168 @@ class LocalOrderBookSnapshot:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class MergedOrderBook:
+    """
+    Top levels of a token merged with its complement's, mirrored.
+
+    A complement bid at ``p`` is an ask for this token at ``1 - p`` and a
+    complement ask at ``p`` a bid at ``1 - p``. Polymarket already shows each
+    order on both tokens' books, so sizes at the same price are not added: the
+    larger one is kept, and the merged view mostly fills in levels one token's
+    stream has not caught up with. ``valid`` requires both books to be valid.
+    """
+
+    token_id: str
+    complement_token_id: str
+    condition_id: str
+    top_bids: tuple[tuple[float, float], ...]
+    top_asks: tuple[tuple[float, float], ...]
+    valid: bool
+
+    @property
+    def best_bid(self) -> float | None:
+        return self.top_bids[0][0] if self.top_bids else None
+
+    @property
+    def best_ask(self) -> float | None:
+        return self.top_asks[0][0] if self.top_asks else None
+
+
+@dataclass(frozen=True, slots=True)
+class EventBookAggregate:
+    """
+    Merged best prices summed across the outcomes of an event.
+
+    Each market of the event contributes its primary (first) token. In a
+    neg-risk event exactly one outcome resolves to 1, so ``sum_best_asks`` below
+    1 or ``sum_best_bids`` above 1 prices the full set of outcomes away from par.
+    The sums only cover quoted outcomes; check ``complete`` before using them.
+    """
+
+    event_id: str
+    outcome_token_ids: tuple[str, ...]
+    sum_best_bids: float
+    sum_best_asks: float
+    quoted_bid_count: int
+    quoted_ask_count: int
+    valid: bool
+
+    @property
+    def complete(self) -> bool:
+        outcome_count = len(self.outcome_token_ids)
+        return (
+            self.quoted_bid_count == outcome_count
+            and self.quoted_ask_count == outcome_count
+        )
+
+
+def _mirror_levels(
+    levels: tuple[tuple[float, float], ...],
+) -> tuple[tuple[float, float], ...]:
+    return tuple(
+        (round(1.0 - price, _MIRROR_PRICE_DECIMALS), size) for price, size in levels
+    )
+
+
+def _merge_levels(
+    own: tuple[tuple[float, float], ...],
+    mirrored: tuple[tuple[float, float], ...],
+    *,
+    descending: bool,
+    depth: int,
+) -> tuple[tuple[float, float], ...]:
+    """Merge two best-first ladders, keeping the larger size where prices meet."""
+    if not mirrored:
+        return own[:depth]
+    if not own:
+        return mirrored[:depth]
+    merged: list[tuple[float, float]] = []
+    i = j = 0
+    while len(merged) < depth and (i < len(own) or j < len(mirrored)):
+        if j == len(mirrored):
+            merged.append(own[i])
+            i += 1
+        elif i == len(own):
+            merged.append(mirrored[j])
+            j += 1
+        else:
+            own_price, own_size = own[i]
+            mirrored_price, mirrored_size = mirrored[j]
+            if own_price == mirrored_price:
+                merged.append((own_price, max(own_size, mirrored_size)))
+                i += 1
+                j += 1
+            elif (own_price > mirrored_price) == descending:
+                merged.append(own[i])
+                i += 1
+            else:
+                merged.append(mirrored[j])
+                j += 1
+    return tuple(merged)
+
+
 class LocalOrderBookStore:
-    """Low-latency local market book maintained from raw websocket text frames."""
+    """
+    Low-latency local market book maintained from raw websocket text frames.
+
+    ``backend="sorted"`` keeps each side in a bisect-sorted ladder. ``"tick"``
+    keeps each side in a fixed array indexed by tick, sized from the token's tick
+    size, which trades a predictable per-token footprint for O(1) writes.
+
+    ``depth`` is the number of levels per side cached in ``top_bids``/``top_asks``
+    and ``LocalOrderBookSnapshot.top_bids``/``top_asks``. A side's cache is only
+    rebuilt when a change lands inside its current top-``depth`` window.
+
+    Writes are serialized by a lock; reads never take it on the fast path.
+    Single-value accessors are one dict lookup of an immutable value. ``bids``,
+    ``asks`` and ``snapshot`` read optimistically against a per-token sequence
+    number (odd while a write is in progress) and retry if it moved, falling
+    back to the lock only after repeated collisions.
+
+    ``register_market`` links a market's two tokens (and, for neg-risk markets,
+    its event). For linked tokens the store keeps ``merged_book`` views, the
+    token's top levels merged with its complement's mirrored top levels, and
+    per-event ``event_aggregate`` sums of merged best prices. Both are updated
+    inside the write that changes them, and only when a top window, or a
+    token's validity, actually moved; reads are one dict lookup.
+
+    Validity is tracked per token. ``invalidate(reason, token_ids=[...])`` drops
+    only those books; while a token is being resynced (``begin_resync``) its
+    deltas are buffered, and ``complete_resync`` installs the fetched snapshot
+    and replays the buffered deltas that are newer than it.
+
+    ``hash_check_interval=N`` samples one in every ``N`` server-hashed updates
+    per token (``book`` snapshots and ``price_change`` items carrying ``hash``).
+    Sampling only copies the token's ladders under the write lock; the sha1 is
+    computed later by ``verify_hashes``, which a market connection runs in a
+    worker thread. Tokens whose book disagrees with the server are invalidated
+    with reason ``"hash_mismatch"``. ``0`` disables checking.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        backend: LocalOrderBookBackend = "sorted",
+        depth: int = 2,
+        max_buffered_deltas: int = DEFAULT_RESYNC_MAX_BUFFERED_DELTAS,
+        hash_check_interval: int = 0,
+        max_pending_hash_checks: int = DEFAULT_MAX_PENDING_HASH_CHECKS,
+    ) -> None:
+        if backend not in {"sorted", "tick"}:
+            msg = f"Unsupported order book backend: {backend!r}"
+            raise ValueError(msg)
+        if depth < 1:
+            msg = "depth must be at least 1"
+            raise ValueError(msg)
+        if hash_check_interval < 0:
+            msg = "hash_check_interval must not be negative"
+            raise ValueError(msg)
+        self.backend = backend
+        self.depth = depth
         self._lock = threading.RLock()
-        self._bids_by_token: dict[str, dict[float, float]] = {}
-        self._asks_by_token: dict[str, dict[float, float]] = {}
+        self._bids_by_token: dict[str, PriceLadder] = {}
+        self._asks_by_token: dict[str, PriceLadder] = {}
         self._best_bid_by_token: dict[str, float | None] = {}
         self._best_ask_by_token: dict[str, float | None] = {}
         self._top_bids_by_token: dict[str, tuple[tuple[float, float], ...]] = {}
@@ -321,28 +729,47 @@ class LocalOrderBookStore:
         self._valid_tokens: set[str] = set()
         self._last_snapshot_time_by_token: dict[str, datetime] = {}
         self._last_update_time_by_token: dict[str, datetime] = {}
+        self._sequence_by_token: dict[str, int] = {}
+        self._invalid_reason_by_token: dict[str, str] = {}
+        self._max_buffered_deltas = max_buffered_deltas
+        self._resync_buffers: dict[str, deque[_BufferedLevelChange]] = {}
+        self._hash_check_interval = hash_check_interval
+        self._hash_countdown_by_token: dict[str, int] = {}
+        self._book_fields_by_token: dict[
+            str, tuple[str | None, float | None, bool | None]
+        ] = {}
+        self._book_generation_by_token: dict[str, int] = {}
+        self._pending_hash_checks: deque[_PendingHashCheck] = deque(
+            maxlen=max_pending_hash_checks
+        )
+        self._hash_check_count = 0
+        self._hash_mismatch_count = 0
         self._update_count = 0
+        self._write_listeners: tuple[Callable[[str], None], ...] = ()
+        self._complement_by_token: dict[str, tuple[str, str]] = {}
+        self._tokens_by_condition: dict[str, tuple[str, str]] = {}
+        self._merged_inputs_by_condition: dict[str, tuple[object, ...]] = {}
+        self._merged_by_token: dict[str, MergedOrderBook] = {}
+        self._event_by_condition: dict[str, str] = {}
+        self._conditions_by_event: dict[str, tuple[str, ...]] = {}
+        self._aggregate_by_event: dict[str, EventBookAggregate] = {}
         self._invalid_reason: str | None = "awaiting_initial_snapshot"
 
     @property
     def valid(self) -> bool:
-        with self._lock:
-            return self._invalid_reason is None and bool(self._valid_tokens)
+        return self._invalid_reason is None and bool(self._valid_tokens)
 
     @property
     def invalid_reason(self) -> str | None:
-        with self._lock:
-            return self._invalid_reason
+        return self._invalid_reason
 
     @property
     def update_count(self) -> int:
-        with self._lock:
-            return self._update_count
+        return self._update_count
 
     @property
     def token_ids(self) -> tuple[str, ...]:
-        with self._lock:
-            return tuple(self._valid_tokens)
+        return tuple(self._valid_tokens)
 
     @property
     def last_snapshot_time(self) -> datetime | None:
@@ -358,8 +785,88 @@ class LocalOrderBookStore:
                 return None
             return max(self._last_update_time_by_token.values())
 
-    def invalidate(self, reason: str) -> None:
+    @property
+    def invalid_token_ids(self) -> tuple[str, ...]:
+        """Tokens invalidated individually and not yet restored by a snapshot."""
+        return tuple(self._invalid_reason_by_token)
+
+    @property
+    def resyncing_token_ids(self) -> tuple[str, ...]:
+        return tuple(self._resync_buffers)
+
+    def is_valid(self, token_id: str) -> bool:
+        return token_id in self._valid_tokens and self._invalid_reason is None
+
+    def token_invalid_reason(self, token_id: str) -> str | None:
+        return self._invalid_reason_by_token.get(token_id)
+
+    @property
+    def pending_hash_check_count(self) -> int:
+        return len(self._pending_hash_checks)
+
+    @property
+    def hash_check_count(self) -> int:
+        return self._hash_check_count
+
+    @property
+    def hash_mismatch_count(self) -> int:
+        return self._hash_mismatch_count
+
+    def verify_hashes(self) -> tuple[str, ...]:
+        """
+        Hash every pending sampled book and compare it with the server ``hash``.
+
+        Tokens that disagree, and have not received a newer snapshot since they
+        were sampled, are invalidated with reason ``"hash_mismatch"`` and
+        returned. Safe to call from any thread.
+        """
+        checked = mismatches = 0
+        mismatched: dict[str, int] = {}
+        while True:
+            try:
+                check = self._pending_hash_checks.popleft()
+            except IndexError:
+                break
+            checked += 1
+            if _order_book_hash(check) != check.expected_hash:
+                mismatches += 1
+                mismatched[check.token_id] = check.generation
+        if not checked:
+            return ()
         with self._lock:
+            # Tallied here so that concurrent callers do not lose counts.
+            self._hash_check_count += checked
+            self._hash_mismatch_count += mismatches
+            if not mismatched:
+                return ()
+            token_ids = [
+                token_id
+                for token_id, generation in mismatched.items()
+                if self._book_generation_by_token.get(token_id) == generation
+                and token_id in self._valid_tokens
+            ]
+            self.invalidate("hash_mismatch", token_ids)
+        return tuple(token_ids)
+
+    def invalidate(self, reason: str, token_ids: Sequence[str] | None = None) -> None:
+        """Drop books for ``token_ids``, or for every token when it is ``None``."""
+        if token_ids is not None:
+            with self._lock:
+                for token_id in token_ids:
+                    self._begin_write(token_id)
+                    try:
+                        self._drop_book(token_id)
+                        self._invalid_reason_by_token[token_id] = reason
+                    finally:
+                        self._end_write(token_id)
+                if not self._valid_tokens:
+                    self._invalid_reason = reason
+            return
+
+        with self._lock:
+            tokens = tuple(self._sequence_by_token)
+            for token_id in tokens:
+                self._begin_write(token_id)
             self._bids_by_token.clear()
             self._asks_by_token.clear()
             self._best_bid_by_token.clear()
@@ -374,48 +881,376 @@ class LocalOrderBookStore:
             self._valid_tokens.clear()
             self._last_snapshot_time_by_token.clear()
             self._last_update_time_by_token.clear()
+            self._invalid_reason_by_token.clear()
+            self._resync_buffers.clear()
+            self._hash_countdown_by_token.clear()
+            self._book_fields_by_token.clear()
+            self._pending_hash_checks.clear()
             self._invalid_reason = reason
+            for token_id in tokens:
+                self._end_write(token_id)
 
-    def bids(self, token_id: str) -> dict[float, float]:
+    def begin_resync(self, token_ids: Sequence[str]) -> tuple[str, ...]:
+        """
+        Start buffering deltas for ``token_ids`` until ``complete_resync``.
+
+        Tokens that still hold a valid book are invalidated first. Returns the
+        tokens that are now resyncing.
+        """
         with self._lock:
-            return dict(self._bids_by_token.get(token_id, {}))
+            for token_id in token_ids:
+                if token_id in self._resync_buffers:
+                    continue
+                if token_id in self._valid_tokens:
+                    self.invalidate("resync_requested", [token_id])
+                self._resync_buffers[token_id] = deque(maxlen=self._max_buffered_deltas)
+            return tuple(
+                token_id for token_id in token_ids if token_id in self._resync_buffers
+            )
 
-    def asks(self, token_id: str) -> dict[float, float]:
+    def complete_resync(
+        self,
+        payload: dict[str, Any],
+        *,
+        observed_at: datetime | None = None,
+    ) -> int | None:
+        """
+        Install a fetched ``book`` payload and replay deltas buffered after it.
+
+        Returns the number of replayed deltas, or ``None`` if the token was not
+        resyncing (for example because a websocket snapshot arrived first).
+        """
+        token_id = payload.get("asset_id")
+        observed_at = observed_at or datetime.now(UTC)
         with self._lock:
-            return dict(self._asks_by_token.get(token_id, {}))
+            if not isinstance(token_id, str) or token_id not in self._resync_buffers:
+                return None
+            buffered = self._resync_buffers[token_id]
+            if not self._apply_snapshot(payload, observed_at):
+                return None
+            snapshot_ms = self._timestamp_ms(payload.get("timestamp"))
+            replayed = 0
+            self._begin_write(token_id)
+            try:
+                for timestamp_ms, side, price, size, changed_at in buffered:
+                    if (
+                        snapshot_ms is not None
+                        and timestamp_ms is not None
+                        and timestamp_ms <= snapshot_ms
+                    ):
+                        continue
+                    self._apply_level_change(token_id, side, price, size)
+                    self._last_update_time_by_token[token_id] = changed_at
+                    replayed += 1
+            finally:
+                self._end_write(token_id)
+            return replayed
 
-    def best_bid(self, token_id: str) -> float | None:
+    def evict(self, token_ids: Sequence[str]) -> None:
+        """
+        Forget the books and market state held for ``token_ids``, e.g. after unsubscribing.
+
+        Only each token's seqlock counter is kept: a reader that started before
+        the eviction must still see the counter move, and one integer per token
+        ever seen is cheap. Sampled hash checks still pending for the tokens are
+        discarded with their books.
+        """
+        evicted = set(token_ids)
         with self._lock:
-            return self._best_bid_by_token.get(token_id)
+            for token_id in token_ids:
+                self._begin_write(token_id)
+                try:
+                    self._drop_book(token_id)
+                    per_token: tuple[dict[str, Any], ...] = (
+                        self._tick_size_by_token,
+                        self._last_trade_price_by_token,
+                        self._last_trade_size_by_token,
+                        self._last_trade_side_by_token,
+                        self._last_trade_time_by_token,
+                        self._last_update_time_by_token,
+                        self._invalid_reason_by_token,
+                        self._resync_buffers,
+                        self._book_fields_by_token,
+                        self._book_generation_by_token,
+                    )
+                    for state in per_token:
+                        state.pop(token_id, None)
+                finally:
+                    self._end_write(token_id)
+            # Generations restart at zero, so a stale check could otherwise
+            # match a book built after resubscribing.
+            pending = [
+                check
+                for check in self._pending_hash_checks
+                if check.token_id not in evicted
+            ]
+            self._pending_hash_checks.clear()
+            self._pending_hash_checks.extend(pending)
 
-    def best_ask(self, token_id: str) -> float | None:
+    def cancel_resync(self, token_ids: Sequence[str] | None = None) -> None:
+        """Stop buffering for ``token_ids`` (all when ``None``); their books stay invalid."""
         with self._lock:
-            return self._best_ask_by_token.get(token_id)
+            if token_ids is None:
+                self._resync_buffers.clear()
+                return
+            for token_id in token_ids:
+                self._resync_buffers.pop(token_id, None)
+
+    def _drop_book(self, token_id: str) -> None:
+        self._bids_by_token.pop(token_id, None)
+        self._asks_by_token.pop(token_id, None)
+        self._best_bid_by_token.pop(token_id, None)
+        self._best_ask_by_token.pop(token_id, None)
+        self._top_bids_by_token.pop(token_id, None)
+        self._top_asks_by_token.pop(token_id, None)
+        self._last_snapshot_time_by_token.pop(token_id, None)
+        self._hash_countdown_by_token.pop(token_id, None)
+        self._valid_tokens.discard(token_id)
+
+    def bids(self, token_id: str) -> dict[float, float]:
+        return self._read_consistent(
+            token_id, lambda: self._levels_dict(self._bids_by_token, token_id)
+        )
+
+    def asks(self, token_id: str) -> dict[float, float]:
+        return self._read_consistent(
+            token_id, lambda: self._levels_dict(self._asks_by_token, token_id)
+        )
+
+    def best_bid(self, token_id: str) -> float | None:
+        return self._best_bid_by_token.get(token_id)
+
+    def best_ask(self, token_id: str) -> float | None:
+        return self._best_ask_by_token.get(token_id)
+
+    def top_bids(self, token_id: str) -> tuple[tuple[float, float], ...]:
+        """Return the cached top ``depth`` bid levels, best first, without copying the book."""
+        return self._top_bids_by_token.get(token_id, ())
+
+    def top_asks(self, token_id: str) -> tuple[tuple[float, float], ...]:
+        """Return the cached top ``depth`` ask levels, best first, without copying the book."""
+        return self._top_asks_by_token.get(token_id, ())
 
     def tick_size(self, token_id: str) -> float | None:
-        with self._lock:
-            return self._tick_size_by_token.get(token_id)
+        return self._tick_size_by_token.get(token_id)
 
     def last_trade_price(self, token_id: str) -> float | None:
-        with self._lock:
-            return self._last_trade_price_by_token.get(token_id)
+        return self._last_trade_price_by_token.get(token_id)
 
     def snapshot(self, token_id: str) -> LocalOrderBookSnapshot:
+        return self._read_consistent(token_id, lambda: self._build_snapshot(token_id))
+
+    def register_market(
+        self, market: ClobMarket | MarketIDs, *, event_id: str | None = None
+    ) -> None:
+        """
+        Link the two tokens of ``market`` as complements.
+
+        Accepts ``PolymarketClobClient.get_market`` results (whose first token
+        becomes the primary token) or ``get_market_ids_from_token`` results.
+        Neg-risk ``ClobMarket``s join the event named by ``neg_risk_market_id``
+        unless ``event_id`` is given.
+        """
+        if isinstance(market, MarketIDs):
+            primary, secondary = market.primary_token_id, market.secondary_token_id
+        else:
+            if len(market.token_ids) != 2:
+                msg = f"Market {market.condition_id} has {len(market.token_ids)} tokens, expected 2"
+                raise ValueError(msg)
+            primary, secondary = (token.token_id for token in market.token_ids)
+            if event_id is None and market.neg_risk and market.neg_risk_market_id:
+                event_id = market.neg_risk_market_id
+        self.link_complements(
+            market.condition_id, primary, secondary, event_id=event_id
+        )
+
+    def link_complements(
+        self,
+        condition_id: str,
+        primary_token_id: str,
+        secondary_token_id: str,
+        *,
+        event_id: str | None = None,
+    ) -> None:
         with self._lock:
-            return LocalOrderBookSnapshot(
-                token_id=token_id,
-                bids=dict(self._bids_by_token.get(token_id, {})),
-                asks=dict(self._asks_by_token.get(token_id, {})),
-                top_bids=self._top_bids_by_token.get(token_id, ()),
-                top_asks=self._top_asks_by_token.get(token_id, ()),
-                tick_size=self._tick_size_by_token.get(token_id),
-                last_trade_price=self._last_trade_price_by_token.get(token_id),
-                last_trade_size=self._last_trade_size_by_token.get(token_id),
-                last_trade_side=self._last_trade_side_by_token.get(token_id),
-                last_trade_time=self._last_trade_time_by_token.get(token_id),
-                valid=token_id in self._valid_tokens and self._invalid_reason is None,
-                last_snapshot_time=self._last_snapshot_time_by_token.get(token_id),
-                last_update_time=self._last_update_time_by_token.get(token_id),
+            self._complement_by_token[primary_token_id] = (
+                secondary_token_id,
+                condition_id,
+            )
+            self._complement_by_token[secondary_token_id] = (
+                primary_token_id,
+                condition_id,
+            )
+            self._tokens_by_condition[condition_id] = (
+                primary_token_id,
+                secondary_token_id,
+            )
+            self._merged_inputs_by_condition.pop(condition_id, None)
+            if event_id is not None:
+                self._event_by_condition[condition_id] = event_id
+                conditions = self._conditions_by_event.get(event_id, ())
+                if condition_id not in conditions:
+                    self._conditions_by_event[event_id] = (*conditions, condition_id)
+            self._refresh_merged(condition_id)
+            if event_id is not None:
+                self._refresh_event(event_id)
+
+    def complement_token_id(self, token_id: str) -> str | None:
+        link = self._complement_by_token.get(token_id)
+        return link[0] if link is not None else None
+
+    def merged_book(self, token_id: str) -> MergedOrderBook | None:
+        """The token's merged view, or ``None`` if it has no registered complement."""
+        return self._merged_by_token.get(token_id)
+
+    def event_aggregate(self, event_id: str) -> EventBookAggregate | None:
+        return self._aggregate_by_event.get(event_id)
+
+    def _refresh_merged(self, condition_id: str) -> None:
+        primary, secondary = self._tokens_by_condition[condition_id]
+        top_bids, top_asks = self._top_bids_by_token, self._top_asks_by_token
+        inputs = (
+            top_bids.get(primary, ()),
+            top_asks.get(primary, ()),
+            top_bids.get(secondary, ()),
+            top_asks.get(secondary, ()),
+            self.is_valid(primary) and self.is_valid(secondary),
+        )
+        # The top caches are only rebuilt when their window changes, so this
+        # is usually an identity comparison.
+        if inputs == self._merged_inputs_by_condition.get(condition_id):
+            return
+        self._merged_inputs_by_condition[condition_id] = inputs
+        primary_bids, primary_asks, secondary_bids, secondary_asks, valid = inputs
+        bids = _merge_levels(
+            primary_bids,
+            _mirror_levels(secondary_asks),
+            descending=True,
+            depth=self.depth,
+        )
+        asks = _merge_levels(
+            primary_asks,
+            _mirror_levels(secondary_bids),
+            descending=False,
+            depth=self.depth,
+        )
+        previous = self._merged_by_token.get(primary)
+        merged = MergedOrderBook(primary, secondary, condition_id, bids, asks, valid)
+        self._merged_by_token[primary] = merged
+        self._merged_by_token[secondary] = MergedOrderBook(
+            secondary,
+            primary,
+            condition_id,
+            _mirror_levels(asks),
+            _mirror_levels(bids),
+            valid,
+        )
+        event_id = self._event_by_condition.get(condition_id)
+        if event_id is not None and (
+            previous is None
+            or (previous.best_bid, previous.best_ask, previous.valid)
+            != (merged.best_bid, merged.best_ask, merged.valid)
+        ):
+            self._refresh_event(event_id)
+
+    def _refresh_event(self, event_id: str) -> None:
+        outcomes = tuple(
+            self._tokens_by_condition[condition_id][0]
+            for condition_id in self._conditions_by_event[event_id]
+        )
+        merged = [self._merged_by_token.get(token_id) for token_id in outcomes]
+        best_bids = [
+            book.best_bid
+            for book in merged
+            if book is not None and book.best_bid is not None
+        ]
+        best_asks = [
+            book.best_ask
+            for book in merged
+            if book is not None and book.best_ask is not None
+        ]
+        self._aggregate_by_event[event_id] = EventBookAggregate(
+            event_id=event_id,
+            outcome_token_ids=outcomes,
+            sum_best_bids=round(sum(best_bids), _MIRROR_PRICE_DECIMALS),
+            sum_best_asks=round(sum(best_asks), _MIRROR_PRICE_DECIMALS),
+            quoted_bid_count=len(best_bids),
+            quoted_ask_count=len(best_asks),
+            valid=all(book is not None and book.valid for book in merged),
+        )
+
+    def _build_snapshot(self, token_id: str) -> LocalOrderBookSnapshot:
+        return LocalOrderBookSnapshot(
+            token_id=token_id,
+            bids=self._levels_dict(self._bids_by_token, token_id),
+            asks=self._levels_dict(self._asks_by_token, token_id),
+            top_bids=self._top_bids_by_token.get(token_id, ()),
+            top_asks=self._top_asks_by_token.get(token_id, ()),
+            tick_size=self._tick_size_by_token.get(token_id),
+            last_trade_price=self._last_trade_price_by_token.get(token_id),
+            last_trade_size=self._last_trade_size_by_token.get(token_id),
+            last_trade_side=self._last_trade_side_by_token.get(token_id),
+            last_trade_time=self._last_trade_time_by_token.get(token_id),
+            valid=token_id in self._valid_tokens and self._invalid_reason is None,
+            last_snapshot_time=self._last_snapshot_time_by_token.get(token_id),
+            last_update_time=self._last_update_time_by_token.get(token_id),
+        )
+
+    @staticmethod
+    def _levels_dict(
+        ladders: dict[str, PriceLadder], token_id: str
+    ) -> dict[float, float]:
+        ladder = ladders.get(token_id)
+        return ladder.to_dict() if ladder is not None else {}
+
+    def _read_consistent[T](self, token_id: str, read: Callable[[], T]) -> T:
+        sequences = self._sequence_by_token
+        for _ in range(_OPTIMISTIC_READ_ATTEMPTS):
+            before = sequences.get(token_id, 0)
+            if before & 1:
+                # Writer is mid-update; yield the GIL so it can finish.
+                time.sleep(0)
+                continue
+            try:
+                result = read()
+            except (RuntimeError, IndexError, KeyError):
+                # The ladder was resized under us; the sequence check would
+                # reject this read anyway.
+                continue
+            if sequences.get(token_id, 0) == before:
+                return result
+        with self._lock:
+            return read()
+
+    def _begin_write(self, token_id: str) -> None:
+        self._sequence_by_token[token_id] = self._sequence_by_token.get(token_id, 0) | 1
+
+    def _end_write(self, token_id: str) -> None:
+        self._sequence_by_token[token_id] += 1
+        link = self._complement_by_token.get(token_id)
+        if link is not None:
+            self._refresh_merged(link[1])
+        for listener in self._write_listeners:
+            listener(token_id)
+
+    def add_write_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Call ``listener(token_id)`` for every token held now and after every later write.
+
+        Listeners run under the write lock, so they see each write completed and
+        in order, and must be quick and must not raise.
+        """
+        with self._lock:
+            for token_id in tuple(self._sequence_by_token):
+                listener(token_id)
+            self._write_listeners = (*self._write_listeners, listener)
+
+    def remove_write_listener(self, listener: Callable[[str], None]) -> None:
+        with self._lock:
+            self._write_listeners = tuple(
+                registered
+                for registered in self._write_listeners
+                if registered != listener
             )
 
     def apply_message_text(
@@ -465,19 +1300,40 @@ class LocalOrderBookStore:
         asks = self._levels_from_payload(payload.get("asks"))
         tick_size = self._float_from_payload(payload.get("tick_size"))
         last_trade_price = self._float_from_payload(payload.get("last_trade_price"))
+        market = payload.get("market")
+        neg_risk = payload.get("neg_risk")
+        book_fields = (
+            market if isinstance(market, str) else None,
+            self._float_from_payload(payload.get("min_order_size")),
+            neg_risk if isinstance(neg_risk, bool) else None,
+        )
         with self._lock:
-            self._bids_by_token[token_id] = bids
-            self._asks_by_token[token_id] = asks
-            self._refresh_top_levels(token_id)
-            if tick_size is not None:
-                self._tick_size_by_token[token_id] = tick_size
-            if last_trade_price is not None:
-                self._last_trade_price_by_token[token_id] = last_trade_price
-            self._valid_tokens.add(token_id)
-            self._last_snapshot_time_by_token[token_id] = observed_at
-            self._last_update_time_by_token[token_id] = observed_at
-            self._update_count += 1
-            self._invalid_reason = None
+            self._begin_write(token_id)
+            try:
+                self._book_fields_by_token[token_id] = book_fields
+                self._book_generation_by_token[token_id] = (
+                    self._book_generation_by_token.get(token_id, 0) + 1
+                )
+                if tick_size is not None:
+                    self._tick_size_by_token[token_id] = tick_size
+                self._bids_by_token[token_id] = self._new_ladder(token_id, "BUY", bids)
+                self._asks_by_token[token_id] = self._new_ladder(token_id, "SELL", asks)
+                self._refresh_top_levels(token_id)
+                if last_trade_price is not None:
+                    self._last_trade_price_by_token[token_id] = last_trade_price
+                self._valid_tokens.add(token_id)
+                self._last_snapshot_time_by_token[token_id] = observed_at
+                self._last_update_time_by_token[token_id] = observed_at
+                self._update_count += 1
+                self._invalid_reason = None
+                self._invalid_reason_by_token.pop(token_id, None)
+                self._resync_buffers.pop(token_id, None)
+                if self._hash_check_interval:
+                    self._sample_hash_check(
+                        token_id, payload.get("hash"), payload.get("timestamp")
+                    )
+            finally:
+                self._end_write(token_id)
         return True
 
     def _apply_delta(self, payload: dict[str, Any], observed_at: datetime) -> bool:
@@ -486,14 +1342,20 @@ class LocalOrderBookStore:
             return False
 
         applied = False
+        timestamp_ms: int | None = None
         with self._lock:
             for item in price_changes:
                 if not isinstance(item, dict):
                     continue
                 token_id_obj = item.get("asset_id")
                 token_id = token_id_obj if isinstance(token_id_obj, str) else None
-                if token_id is None or token_id not in self._valid_tokens:
+                if token_id is None:
                     continue
+                buffer = None
+                if token_id not in self._valid_tokens:
+                    buffer = self._resync_buffers.get(token_id)
+                    if buffer is None:
+                        continue
 
                 price = self._float_from_payload(item.get("price"))
                 size = self._float_from_payload(item.get("size"))
@@ -502,40 +1364,99 @@ class LocalOrderBookStore:
                 if price is None or size is None or side not in {"BUY", "SELL"}:
                     continue
 
-                if size > 0:
-                    if side == "BUY":
-                        best_ask = self._best_ask_by_token.get(token_id)
-                        if best_ask is not None and price > best_ask:
-                            asks = self._asks_by_token.setdefault(token_id, {})
-                            for ask_price in list(asks):
-                                if best_ask <= ask_price < price:
-                                    asks.pop(ask_price, None)
-                    else:
-                        best_bid = self._best_bid_by_token.get(token_id)
-                        if best_bid is not None and price < best_bid:
-                            bids = self._bids_by_token.setdefault(token_id, {})
-                            for bid_price in list(bids):
-                                if price < bid_price <= best_bid:
-                                    bids.pop(bid_price, None)
-
-                levels = (
-                    self._bids_by_token.setdefault(token_id, {})
-                    if side == "BUY"
-                    else self._asks_by_token.setdefault(token_id, {})
-                )
-                if size == 0:
-                    levels.pop(price, None)
-                else:
-                    levels[price] = size
+                if buffer is not None:
+                    if timestamp_ms is None:
+                        timestamp_ms = self._timestamp_ms(payload.get("timestamp"))
+                    buffer.append((timestamp_ms, side, price, size, observed_at))
+                    applied = True
+                    continue
 
-                self._refresh_top_levels(token_id)
-                self._last_update_time_by_token[token_id] = observed_at
+                self._begin_write(token_id)
+                try:
+                    self._apply_level_change(token_id, side, price, size)
+                    self._last_update_time_by_token[token_id] = observed_at
+                    if self._hash_check_interval:
+                        self._sample_hash_check(
+                            token_id, item.get("hash"), payload.get("timestamp")
+                        )
+                finally:
+                    self._end_write(token_id)
                 applied = True
 
             if applied:
                 self._update_count += 1
         return applied
 
+    def _apply_level_change(
+        self, token_id: str, side: str, price: float, size: float
+    ) -> None:
+        book_side: LadderSide
+        opposite_side: LadderSide
+        if side == "BUY":
+            book_side, opposite_side = "BUY", "SELL"
+            levels = self._bids_by_token.get(token_id)
+            if levels is None:
+                levels = self._bids_by_token[token_id] = self._new_ladder(
+                    token_id, "BUY"
+                )
+            opposite = self._asks_by_token.get(token_id)
+        else:
+            book_side, opposite_side = "SELL", "BUY"
+            levels = self._asks_by_token.get(token_id)
+            if levels is None:
+                levels = self._asks_by_token[token_id] = self._new_ladder(
+                    token_id, "SELL"
+                )
+            opposite = self._bids_by_token.get(token_id)
+
+        if (
+            size > 0
+            and opposite is not None
+            # A resting quote through the opposite touch means those
+            # levels were consumed; drop everything it crosses.
+            and opposite.remove_better_than(price)
+        ):
+            self._refresh_side_top(token_id, opposite_side)
+        levels.set(price, size)
+
+        if self._touches_top(token_id, book_side, price):
+            self._refresh_side_top(token_id, book_side)
+
+    def _sample_hash_check(
+        self, token_id: str, expected_hash: object, timestamp: object
+    ) -> None:
+        """Queue a copy of ``token_id``'s book for ``verify_hashes`` on every Nth call."""
+        if not isinstance(expected_hash, str) or not expected_hash:
+            return
+        countdown = self._hash_countdown_by_token.get(token_id, 1) - 1
+        if countdown > 0:
+            self._hash_countdown_by_token[token_id] = countdown
+            return
+        timestamp_ms = self._timestamp_ms(timestamp)
+        if timestamp_ms is None:
+            return
+        self._hash_countdown_by_token[token_id] = self._hash_check_interval
+        bids = self._bids_by_token.get(token_id)
+        asks = self._asks_by_token.get(token_id)
+        market, min_order_size, neg_risk = self._book_fields_by_token.get(
+            token_id, (None, None, None)
+        )
+        self._pending_hash_checks.append(
+            _PendingHashCheck(
+                token_id=token_id,
+                generation=self._book_generation_by_token.get(token_id, 0),
+                expected_hash=expected_hash,
+                market=market,
+                timestamp=str(timestamp_ms),
+                bids=bids.copy() if bids is not None else None,
+                asks=asks.copy() if asks is not None else None,
+                tick_size=self._tick_size_by_token.get(token_id),
+                last_trade_price=self._last_trade_price_by_token.get(token_id),
+                min_order_size=min_order_size,
+                neg_risk=neg_risk,
+            )
+        )
+
     def _apply_last_trade_price(
         self,
         payload: dict[str, Any],
@@ -551,12 +1472,16 @@ class LocalOrderBookStore:
         side_obj = payload.get("side")
         side = side_obj if isinstance(side_obj, str) and side_obj in {"BUY", "SELL"} else None
         with self._lock:
-            self._last_trade_price_by_token[token_id] = price
-            self._last_trade_size_by_token[token_id] = size
-            self._last_trade_side_by_token[token_id] = side
-            self._last_trade_time_by_token[token_id] = observed_at
-            self._last_update_time_by_token[token_id] = observed_at
-            self._update_count += 1
+            self._begin_write(token_id)
+            try:
+                self._last_trade_price_by_token[token_id] = price
+                self._last_trade_size_by_token[token_id] = size
+                self._last_trade_side_by_token[token_id] = side
+                self._last_trade_time_by_token[token_id] = observed_at
+                self._last_update_time_by_token[token_id] = observed_at
+                self._update_count += 1
+            finally:
+                self._end_write(token_id)
         return True
 
     def _apply_tick_size_change(
@@ -571,9 +1496,19 @@ class LocalOrderBookStore:
             return False
 
         with self._lock:
-            self._tick_size_by_token[token_id] = tick_size
-            self._last_update_time_by_token[token_id] = observed_at
-            self._update_count += 1
+            self._begin_write(token_id)
+            try:
+                self._tick_size_by_token[token_id] = tick_size
+                for ladder in (
+                    self._bids_by_token.get(token_id),
+                    self._asks_by_token.get(token_id),
+                ):
+                    if isinstance(ladder, TickPriceLadder):
+                        ladder.retick(tick_size)
+                self._last_update_time_by_token[token_id] = observed_at
+                self._update_count += 1
+            finally:
+                self._end_write(token_id)
         return True
 
     @classmethod
@@ -594,15 +1529,55 @@ class LocalOrderBookStore:
             levels[price] = size
         return levels
 
+    def _new_ladder(
+        self,
+        token_id: str,
+        side: LadderSide,
+        levels: dict[float, float] | None = None,
+    ) -> PriceLadder:
+        if self.backend == "tick":
+            return TickPriceLadder(
+                side, levels, tick_size=self._tick_size_by_token.get(token_id)
+            )
+        return SortedPriceLadder(side, levels)
+
     def _refresh_top_levels(self, token_id: str) -> None:
-        bids = self._bids_by_token.get(token_id, {})
-        asks = self._asks_by_token.get(token_id, {})
-        top_bids = tuple(nlargest(2, bids.items()))
-        top_asks = tuple(nsmallest(2, asks.items()))
-        self._top_bids_by_token[token_id] = top_bids
-        self._top_asks_by_token[token_id] = top_asks
-        self._best_bid_by_token[token_id] = top_bids[0][0] if top_bids else None
-        self._best_ask_by_token[token_id] = top_asks[0][0] if top_asks else None
+        self._refresh_side_top(token_id, "BUY")
+        self._refresh_side_top(token_id, "SELL")
+
+    def _refresh_side_top(self, token_id: str, side: LadderSide) -> None:
+        if side == "BUY":
+            bids = self._bids_by_token.get(token_id)
+            top_bids = bids.top(self.depth) if bids is not None else ()
+            self._top_bids_by_token[token_id] = top_bids
+            self._best_bid_by_token[token_id] = top_bids[0][0] if top_bids else None
+        else:
+            asks = self._asks_by_token.get(token_id)
+            top_asks = asks.top(self.depth) if asks is not None else ()
+            self._top_asks_by_token[token_id] = top_asks
+            self._best_ask_by_token[token_id] = top_asks[0][0] if top_asks else None
+
+    def _touches_top(self, token_id: str, side: LadderSide, price: float) -> bool:
+        """Whether a change at ``price`` can alter the cached top window for ``side``."""
+        if side == "BUY":
+            top = self._top_bids_by_token.get(token_id, ())
+            if len(top) < self.depth:
+                return True
+            return price >= top[-1][0]
+        top = self._top_asks_by_token.get(token_id, ())
+        if len(top) < self.depth:
+            return True
+        return price <= top[-1][0]
+
+    @staticmethod
+    def _timestamp_ms(value: object) -> int | None:
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        return None
 
     @staticmethod
     def _float_from_payload(value: object) -> float | None:
@@ -616,6 +1591,49 @@ class LocalOrderBookStore:
         return None
 
 
+@lru_cache(maxsize=_HASH_LEVEL_CACHE_SIZE)
+def _hash_level(price: float, size: float) -> str:
+    price_text = f"{price:.3f}".rstrip("0").rstrip(".")
+    size_text = f"{size:.2f}".rstrip("0").rstrip(".")
+    return f'{{"price":"{price_text}","size":"{size_text}"}}'
+
+
+def _order_book_hash(check: _PendingHashCheck) -> str:
+    """
+    Hash a sampled book the way ``generate_orderbook_summary_hash`` does.
+
+    That is sha1 over the compact ``OrderBookSummary`` JSON with ``hash`` blanked.
+
+    sha1 cannot be updated in place as levels change, so the saving comes from
+    memoizing each level's JSON fragment; most levels survive between samples.
+    """
+    tick_size = f"{check.tick_size:g}" if check.tick_size is not None else None
+    bids = check.bids.items() if check.bids is not None else []
+    asks = check.asks.items() if check.asks is not None else []
+    parts = (
+        '{"market":',
+        json.dumps(check.market),
+        ',"asset_id":',
+        json.dumps(check.token_id),
+        ',"timestamp":"',
+        check.timestamp,
+        '","hash":"","bids":[',
+        ",".join([_hash_level(price, size) for price, size in bids]),
+        '],"asks":[',
+        ",".join([_hash_level(price, size) for price, size in asks]),
+        '],"tick_size":',
+        json.dumps(tick_size),
+        ',"last_trade_price":',
+        json.dumps(check.last_trade_price),
+        ',"min_order_size":',
+        json.dumps(check.min_order_size),
+        ',"neg_risk":',
+        json.dumps(check.neg_risk),
+        "}",
+    )
+    return hashlib.sha1("".join(parts).encode()).hexdigest()
+
+
 def parse_json(message: _WebsocketMessage) -> object | None:
     return message.json_data
 
@@ -664,6 +1682,25 @@ def parse_event[T: BaseModel](
     channel: str,
     raw_message: _WebsocketMessage | None = None,
 ) -> T | None:
+    cls = _event_class(
+        message, classes, event_type_field, channel=channel, raw_message=raw_message
+    )
+    if cls is None:
+        return None
+    return substitute_cls(
+        cls, cast("dict[str, Any]", message), channel=channel, raw_message=raw_message
+    )
+
+
+def _event_class[T: BaseModel](
+    message: object,
+    classes: Mapping[str, type[T]],
+    event_type_field: str,
+    *,
+    channel: str,
+    raw_message: _WebsocketMessage | None = None,
+) -> type[T] | None:
+    """Pick the model for a decoded payload from its event type, logging why not."""
     if message is None:
         return None
     if not isinstance(message, dict):
@@ -724,8 +1761,7 @@ def parse_event[T: BaseModel](
             ),
         )
         return None
-
-    return substitute_cls(cls, message, channel=channel, raw_message=raw_message)
+    return cls
 
 
 def parse_market_event(
@@ -734,23 +1770,53 @@ def parse_market_event(
     payload = parse_json(message)
     if payload is None:
         return None
-    if isinstance(payload, list):
-        result: list[OrderBookSummaryEvent] = []
-        for item in payload:
-            if isinstance(item, dict):
-                obj = substitute_cls(
-                    OrderBookSummaryEvent,
-                    item,
-                    channel=message.channel,
-                    raw_message=message,
-                )
-                if obj is not None:
-                    result.append(obj)
-        return result
-
+    if isinstance(payload, list):
+        result: list[OrderBookSummaryEvent] = []
+        for item in payload:
+            if isinstance(item, dict):
+                obj = substitute_cls(
+                    OrderBookSummaryEvent,
+                    item,
+                    channel=message.channel,
+                    raw_message=message,
+                )
+                if obj is not None:
+                    result.append(obj)
+        return result
+
+    try:
+        return MARKET_EVENT_ADAPTER.validate_python(payload)
+    except ValidationError as exc:
+        emit(
+            logger,
+            logging.WARNING,
+            "ws.message.parse.validation_failed",
+            "Websocket payload failed model validation",
+            channel=message.channel,
+            trace_id=message.trace_id,
+            model="MarketEvents",
+            error_type="ValidationError",
+            error_detail=str(exc),
+            payload_preview=str(payload)[:RAW_MESSAGE_PREVIEW_LIMIT],
+            raw_preview=message.text[:RAW_MESSAGE_PREVIEW_LIMIT],
+        )
+        return None
+
+
+def parse_market_struct_event(
+    message: _WebsocketMessage,
+) -> StructMarketMessage | ParsedMarketMessage | None:
+    """
+    Decode a market frame into ``websockets_structs`` without model validation.
+
+    Event types that have no struct fall back to ``parse_market_event``.
+    """
+    payload = parse_json(message)
+    if payload is None:
+        return None
     try:
-        return MARKET_EVENT_ADAPTER.validate_python(payload)
-    except ValidationError as exc:
+        event = decode_market_struct(payload)
+    except (KeyError, TypeError, ValueError) as exc:
         emit(
             logger,
             logging.WARNING,
@@ -758,13 +1824,43 @@ def parse_market_event(
             "Websocket payload failed model validation",
             channel=message.channel,
             trace_id=message.trace_id,
-            model="MarketEvents",
-            error_type="ValidationError",
+            model="MarketEventStruct",
+            error_type=type(exc).__name__,
             error_detail=str(exc),
             payload_preview=str(payload)[:RAW_MESSAGE_PREVIEW_LIMIT],
             raw_preview=message.text[:RAW_MESSAGE_PREVIEW_LIMIT],
         )
         return None
+    if event is None:
+        return parse_market_event(message)
+    return event
+
+
+def parse_market_lazy_event(
+    message: _WebsocketMessage,
+) -> LazyEvent[Any] | list[LazyEvent[OrderBookSummaryEvent]] | None:
+    """Wrap a market frame in ``LazyEvent`` views; validation waits for field access."""
+    payload = parse_json(message)
+    if isinstance(payload, list):
+        return [
+            lazy_event(OrderBookSummaryEvent, item)
+            for item in payload
+            if isinstance(item, dict)
+        ]
+    cls = _event_class(
+        payload,
+        MARKET_EVENT_CLASSES,
+        "event_type",
+        channel=message.channel,
+        raw_message=message,
+    )
+    return None if cls is None else lazy_event(cls, cast("dict[str, Any]", payload))
+
+
+_MARKET_PARSERS: Mapping[str, Callable[[_WebsocketMessage], Any]] = {
+    "struct": parse_market_struct_event,
+    "lazy": parse_market_lazy_event,
+}
 
 
 def parse_user_event(message: _WebsocketMessage) -> UserEvents | None:
@@ -790,6 +1886,19 @@ def parse_user_event(message: _WebsocketMessage) -> UserEvents | None:
         return None
 
 
+def parse_user_lazy_event(message: _WebsocketMessage) -> LazyEvent[Any] | None:
+    """Wrap a user frame in a ``LazyEvent`` view; validation waits for field access."""
+    payload = parse_json(message)
+    cls = _event_class(
+        payload,
+        USER_EVENT_CLASSES,
+        "event_type",
+        channel=message.channel,
+        raw_message=message,
+    )
+    return None if cls is None else lazy_event(cls, cast("dict[str, Any]", payload))
+
+
 def parse_real_time_data_event(message: _WebsocketMessage) -> RealTimeDataEvents | None:
     return parse_event(
         parse_json(message),
@@ -1089,7 +2198,411 @@ def _message_mode_from_parse_messages(
     return "parsed" if parse_messages else "raw"
 
 
+def _asset_ids_from_payload(payload: object) -> list[str]:
+    """Collect the token ids a decoded market frame refers to."""
+    items = payload if isinstance(payload, list) else [payload]
+    token_ids: list[str] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        asset_id = item.get("asset_id")
+        if isinstance(asset_id, str):
+            token_ids.append(asset_id)
+        changes = item.get("price_changes")
+        if isinstance(changes, list):
+            token_ids.extend(
+                change["asset_id"]
+                for change in changes
+                if isinstance(change, dict) and isinstance(change.get("asset_id"), str)
+            )
+    return list(dict.fromkeys(token_ids))
+
+
+def _without_token_ids(payload: object, token_ids: frozenset[str]) -> object:
+    """Drop the parts of a decoded market frame that refer to ``token_ids``."""
+    if isinstance(payload, list):
+        kept = [item for item in payload if _without_token_ids(item, token_ids) is item]
+        return payload if len(kept) == len(payload) else kept
+    if not isinstance(payload, dict):
+        return payload
+    if payload.get("asset_id") in token_ids:
+        return None
+    changes = payload.get("price_changes")
+    if not isinstance(changes, list):
+        return payload
+    kept_changes = [
+        change
+        for change in changes
+        if not (isinstance(change, dict) and change.get("asset_id") in token_ids)
+    ]
+    if len(kept_changes) == len(changes):
+        return payload
+    if not kept_changes:
+        return None
+    return {**payload, "price_changes": kept_changes}
+
+
+def _asset_ids_from_text(text: str) -> list[str]:
+    """Best-effort token ids from a frame that failed to decode."""
+    return list(dict.fromkeys(_ASSET_ID_PATTERN.findall(text)))
+
+
+def _resync_payload(book: OrderBookSummary) -> dict[str, Any]:
+    # ``hash`` is left out: the REST snapshot is the source of truth being
+    # installed, so there is nothing to verify it against.
+    return {
+        "event_type": "book",
+        "market": book.condition_id,
+        "asset_id": book.token_id,
+        "timestamp": str(int(book.timestamp.timestamp() * 1000)),
+        "bids": [{"price": level.price, "size": level.size} for level in book.bids],
+        "asks": [{"price": level.price, "size": level.size} for level in book.asks],
+        "tick_size": book.tick_size,
+        "last_trade_price": book.last_trade_price,
+        "min_order_size": book.min_order_size,
+        "neg_risk": book.neg_risk,
+    }
+
+
+class _OrderBookResyncer:
+    """Fetches REST snapshots for invalidated tokens in batches, off the event loop."""
+
+    def __init__(
+        self,
+        config: OrderBookResyncConfig,
+        store: LocalOrderBookStore,
+        *,
+        channel: str,
+        on_resynced: Callable[[], None],
+    ) -> None:
+        self.config = config
+        self.store = store
+        self.channel = channel
+        self._on_resynced = on_resynced
+        self._attempts: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending_token_ids(self) -> tuple[str, ...]:
+        return tuple(self._attempts)
+
+    def request(self, token_ids: Sequence[str]) -> None:
+        for token_id in self.store.begin_resync(token_ids):
+            self._attempts.setdefault(token_id, 0)
+        if self._attempts and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.store.cancel_resync(list(self._attempts))
+        self._attempts.clear()
+
+    def discard(self, token_ids: Sequence[str]) -> None:
+        """Stop resyncing ``token_ids``; the running batch loop skips them."""
+        for token_id in token_ids:
+            self._attempts.pop(token_id, None)
+        self.store.cancel_resync(token_ids)
+
+    async def _run(self) -> None:
+        while self._attempts:
+            batch = list(self._attempts)[: self.config.batch_size]
+            trace_id = current_or_new_trace_id()
+            try:
+                books = await self._fetch(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                emit(
+                    logger,
+                    logging.WARNING,
+                    "ws.market.book.resync_failed",
+                    "Failed to fetch order books for resync",
+                    channel=self.channel,
+                    trace_id=trace_id,
+                    token_count=len(batch),
+                    error_type=type(exc).__name__,
+                    error_detail=str(exc),
+                )
+                self._record_failures(batch)
+                await asyncio.sleep(self.config.retry_delay)
+                continue
+
+            replayed = 0
+            received: set[str] = set()
+            for book in books:
+                if book.token_id not in self._attempts:
+                    continue
+                received.add(book.token_id)
+                replayed += self.store.complete_resync(_resync_payload(book)) or 0
+                del self._attempts[book.token_id]
+            self._record_failures(
+                [token_id for token_id in batch if token_id not in received]
+            )
+            emit(
+                logger,
+                logging.INFO,
+                "ws.market.book.resynced",
+                "Resynchronized local order books from REST snapshots",
+                channel=self.channel,
+                trace_id=trace_id,
+                token_count=len(received),
+                replayed_deltas=replayed,
+                pending_token_count=len(self._attempts),
+            )
+            if received:
+                self._on_resynced()
+
+    async def _fetch(self, token_ids: list[str]) -> list[OrderBookSummary]:
+        from .clob_client import AsyncPolymarketReadOnlyClobClient
+
+        client = self.config.client
+        if isinstance(client, AsyncPolymarketReadOnlyClobClient):
+            return await client.get_order_books(token_ids)
+        return await asyncio.to_thread(client.get_order_books, token_ids)
+
+    def _record_failures(self, token_ids: Sequence[str]) -> None:
+        exhausted: list[str] = []
+        for token_id in token_ids:
+            if token_id not in self._attempts:
+                continue
+            self._attempts[token_id] += 1
+            if self._attempts[token_id] >= self.config.max_attempts:
+                exhausted.append(token_id)
+                del self._attempts[token_id]
+        if not exhausted:
+            return
+        self.store.cancel_resync(exhausted)
+        emit(
+            logger,
+            logging.ERROR,
+            "ws.market.book.resync_abandoned",
+            "Giving up on order book resync; tokens stay invalid until the next snapshot",
+            channel=self.channel,
+            trace_id=current_or_new_trace_id(),
+            token_count=len(exhausted),
+            max_attempts=self.config.max_attempts,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _ConflatedEntry:
+    market: object
+    timestamp: object
+    # The ``price_changes`` item for level entries, else the whole message.
+    body: Any
+    received_monotonic_ns: int
+
+
+class _MarketConflator:
+    """
+    Latest pending market state per key, for the ``conflate`` overflow policy.
+
+    ``price_change`` items are keyed by token, side and price, so a level that
+    changes several times while the consumer is behind is delivered once with
+    its latest size and the token's latest best bid/ask. ``book``,
+    ``best_bid_ask``, ``last_trade_price`` and ``tick_size_change`` keep the
+    latest event per token, and a ``book`` also discards the token's pending
+    levels. Anything else is kept as is. Entries drain in order of their last
+    update; consecutive levels of one market are merged into one frame.
+    """
+
+    def __init__(self, *, channel: str, raw: bool) -> None:
+        self.channel = channel
+        self.raw = raw
+        self._pending: dict[tuple[object, ...], _ConflatedEntry] = {}
+        self._best_by_token: dict[str, tuple[object, object]] = {}
+        self._unkeyed_count = 0
+        self.merged_message_count = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._best_by_token.clear()
+
+    def add(self, message: _WebsocketMessage | str) -> None:
+        if isinstance(message, str):
+            received_ns = time.monotonic_ns()
+            payload: object = None
+            with contextlib.suppress(JSONDecodeError):
+                payload = json.loads(message)
+        else:
+            received_ns = message.received_monotonic_ns
+            payload = message.json_data
+        if not isinstance(payload, dict):
+            self._keep_unkeyed(message, received_ns)
+            return
+
+        event_type = payload.get("event_type")
+        market = payload.get("market")
+        timestamp = payload.get("timestamp")
+        if event_type == "price_change":
+            changes = payload.get("price_changes")
+            try:
+                keys: list[tuple[object, ...]] = [
+                    (
+                        "level",
+                        change["asset_id"],
+                        change["side"],
+                        float(change["price"]),
+                    )
+                    for change in cast("list[dict[str, Any]]", changes)
+                ]
+            except (KeyError, TypeError, ValueError):
+                self._keep_unkeyed(message, received_ns)
+                return
+            for key, change in zip(
+                keys, cast("list[dict[str, Any]]", changes), strict=True
+            ):
+                self._put(key, _ConflatedEntry(market, timestamp, change, received_ns))
+                if "best_bid" in change or "best_ask" in change:
+                    self._best_by_token[change["asset_id"]] = (
+                        change.get("best_bid"),
+                        change.get("best_ask"),
+                    )
+            return
+
+        token_id = payload.get("asset_id")
+        if event_type in _CONFLATED_EVENT_TYPES and isinstance(token_id, str):
+            if event_type == "book":
+                for key in [
+                    key for key in self._pending if key[:2] == ("level", token_id)
+                ]:
+                    del self._pending[key]
+            self._put(
+                (event_type, token_id),
+                _ConflatedEntry(market, timestamp, message, received_ns),
+            )
+            return
+        self._keep_unkeyed(message, received_ns)
+
+    def drain(self, limit: int | None = None) -> list[_WebsocketMessage | str]:
+        """Remove and return up to ``limit`` frames, oldest update first."""
+        messages: list[_WebsocketMessage | str] = []
+        levels: list[_ConflatedEntry] = []
+        for key in list(self._pending):
+            entry = self._pending[key]
+            is_level = key[0] == "level"
+            if levels and (not is_level or entry.market != levels[0].market):
+                messages.append(self._price_change_message(levels))
+                levels = []
+            if limit is not None and len(messages) >= limit:
+                break
+            del self._pending[key]
+            if is_level:
+                levels.append(entry)
+            else:
+                messages.append(entry.body)
+        if levels:
+            messages.append(self._price_change_message(levels))
+        if not self._pending:
+            self._best_by_token.clear()
+        return messages
+
+    def _put(self, key: tuple[object, ...], entry: _ConflatedEntry) -> None:
+        # Re-inserting moves the key to the end, so drain order follows the
+        # latest update.
+        if self._pending.pop(key, None) is not None:
+            self.merged_message_count += 1
+        self._pending[key] = entry
+
+    def _keep_unkeyed(self, message: _WebsocketMessage | str, received_ns: int) -> None:
+        self._unkeyed_count += 1
+        self._pending[("unkeyed", self._unkeyed_count)] = _ConflatedEntry(
+            None, None, message, received_ns
+        )
+
+    def _price_change_message(
+        self, levels: list[_ConflatedEntry]
+    ) -> _WebsocketMessage | str:
+        changes: list[dict[str, Any]] = []
+        for entry in levels:
+            change = cast("dict[str, Any]", entry.body)
+            best = self._best_by_token.get(change["asset_id"])
+            if best is not None:
+                change = {**change, "best_bid": best[0], "best_ask": best[1]}
+            changes.append(change)
+        payload = {
+            "event_type": "price_change",
+            "market": levels[-1].market,
+            "timestamp": levels[-1].timestamp,
+            "price_changes": changes,
+        }
+        text = json.dumps(payload, separators=(",", ":"))
+        if self.raw:
+            return text
+        return _WebsocketMessage(
+            channel=self.channel,
+            text=text,
+            json_data=payload,
+            received_monotonic_ns=levels[-1].received_monotonic_ns,
+        )
+
+
+def _timed_parse(
+    parser: Callable[[_WebsocketMessage], Any], message: _WebsocketMessage
+) -> tuple[Any, int]:
+    """Run ``parser`` in a parse executor and report how long it took there."""
+    started_ns = time.monotonic_ns()
+    parsed = parser(message)
+    return parsed, time.monotonic_ns() - started_ns
+
+
+def _exchange_timestamp_ms(value: object) -> int | None:
+    if isinstance(value, str):
+        if not value.isdigit():
+            return None
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool):
+        return None
+    # Smaller values are Unix seconds, as in ``websockets_structs``.
+    return value if value > 20_000_000_000 else value * 1000
+
+
+class _LatencyRecorder:
+    """The rolling histograms behind ``latency_snapshot()``."""
+
+    __slots__ = ("callback", "exchange_to_receive", "parse", "receive_to_dequeue")
+
+    def __init__(self, window_seconds: float) -> None:
+        now_ns = time.monotonic_ns()
+        window_ns = round(window_seconds * 1e9)
+        self.exchange_to_receive = RollingLatencyHistogram(window_ns, now_ns)
+        self.receive_to_dequeue = RollingLatencyHistogram(window_ns, now_ns)
+        self.parse = RollingLatencyHistogram(window_ns, now_ns)
+        self.callback = RollingLatencyHistogram(window_ns, now_ns)
+
+    def record_dequeued(self, message: _WebsocketMessage, now_ns: int) -> None:
+        self.receive_to_dequeue.record(now_ns - message.received_monotonic_ns, now_ns)
+
+    def record_exchange_delay(self, message: _WebsocketMessage) -> None:
+        payload = message.json_data
+        if not isinstance(payload, dict):
+            return
+        exchange_ms = _exchange_timestamp_ms(payload.get("timestamp", payload.get("t")))
+        if exchange_ms is None:
+            return
+        delay_ms = message.received_at.timestamp() * 1000 - exchange_ms
+        self.exchange_to_receive.record(round(delay_ms * 1e6), time.monotonic_ns())
+
+    def snapshot(self) -> ConnectionLatency:
+        now_ns = time.monotonic_ns()
+        return ConnectionLatency(
+            exchange_to_receive=self.exchange_to_receive.snapshot(now_ns),
+            receive_to_dequeue=self.receive_to_dequeue.snapshot(now_ns),
+            parse=self.parse.snapshot(now_ns),
+            callback=self.callback.snapshot(now_ns),
+        )
+
+
 class _ManagedConnection:
+    # Tokens unsubscribed on the live socket; frames already in flight for
+    # them are kept out of the local order books.
+    _dropped_token_ids: frozenset[str] = frozenset()
+
     def __init__(
         self,
         *,
@@ -1101,6 +2614,8 @@ class _ManagedConnection:
         process_event_error_policy: ProcessEventErrorPolicy,
         message_mode: MessageMode | None = None,
         parse_error_policy: ParseErrorPolicy = "raw",
+        batch_max_size: int | None = None,
+        parse_executor: Executor | None = None,
         on_connect: LifecycleCallback | None,
         on_disconnect: LifecycleCallback | None,
         on_reconnect: LifecycleCallback | None,
@@ -1113,6 +2628,7 @@ class _ManagedConnection:
         local_order_books: LocalOrderBookStore | None = None,
         stale_after_seconds: float | None = None,
         reconnect_on_stale: bool = False,
+        order_book_resync: OrderBookResyncConfig | None = None,
     ) -> None:
         self.channel = channel
         self.url = url
@@ -1122,9 +2638,22 @@ class _ManagedConnection:
             parse_messages,
             message_mode,
         )
-        self.parse_messages = self.message_mode == "parsed"
+        supported_channels = _MESSAGE_MODE_CHANNELS.get(self.message_mode)
+        if supported_channels is not None and channel not in supported_channels:
+            msg = (
+                f"message_mode={self.message_mode!r} is only supported on the "
+                f"{' and '.join(sorted(supported_channels))} channel"
+            )
+            raise ValueError(msg)
+        self.parse_messages = self.message_mode != "raw"
         self.process_event_error_policy = process_event_error_policy
         self.parse_error_policy = parse_error_policy
+        if batch_max_size is not None and batch_max_size < 1:
+            msg = "batch_max_size must be at least 1"
+            raise ValueError(msg)
+        self.batch_max_size = batch_max_size
+        self.parse_executor = parse_executor
+        self._event_batch: list[Any] | None = None
         self.on_connect = on_connect
         self.on_disconnect = on_disconnect
         self.on_reconnect = on_reconnect
@@ -1133,7 +2662,24 @@ class _ManagedConnection:
         self.close_timeout_seconds = close_timeout_seconds
         self._client_closed_event = client_closed_event
         self.message_queue_overflow_policy = message_queue_overflow_policy
+        self._conflator = (
+            _MarketConflator(channel=channel, raw=self.message_mode == "raw")
+            if channel == "market" and message_queue_overflow_policy == "conflate"
+            else None
+        )
         self.local_order_books = local_order_books
+        self._order_book_resyncer = (
+            _OrderBookResyncer(
+                order_book_resync,
+                local_order_books,
+                channel=channel,
+                on_resynced=self._on_order_books_resynced,
+            )
+            if order_book_resync is not None and local_order_books is not None
+            else None
+        )
+        self._hash_verification_task: asyncio.Task[None] | None = None
+        self.frame_recorder: FrameRecorder | None = None
         self._stop_event = asyncio.Event()
         self._started_event = asyncio.Event()
         self._closed_event = asyncio.Event()
@@ -1155,6 +2701,8 @@ class _ManagedConnection:
         self.stale_after_seconds = stale_after_seconds
         self.reconnect_on_stale = reconnect_on_stale
         self._dropped_message_count = 0
+        self._latency = _LatencyRecorder(DEFAULT_LATENCY_WINDOW_SECONDS)
+        self._queue_high_water_mark = 0
         self._last_market_data_time: datetime | None = None
         self._last_price_update_time: datetime | None = None
         self._stale_warning_active = False
@@ -1205,10 +2753,9 @@ class _ManagedConnection:
                             self._market_book_invalid_reason = (
                                 "awaiting_initial_snapshot"
                             )
-                            if self.local_order_books is not None:
-                                self.local_order_books.invalidate(
-                                    "awaiting_initial_snapshot"
-                                )
+                            self._invalidate_local_order_books(
+                                "awaiting_initial_snapshot"
+                            )
                         self._consecutive_failures = 0
                         self._last_process_event_error = None
                         emit(
@@ -1312,8 +2859,12 @@ class _ManagedConnection:
                             "connection_closed",
                             log_event=False,
                         )
-                        if self.local_order_books is not None:
-                            self.local_order_books.invalidate("connection_closed")
+                        if self._order_book_resyncer is not None:
+                            self._order_book_resyncer.cancel()
+                        if self._hash_verification_task is not None:
+                            self._hash_verification_task.cancel()
+                            self._hash_verification_task = None
+                        self._invalidate_local_order_books("connection_closed")
                     self._websocket = None
 
                 if self._should_stop():
@@ -1445,11 +2996,26 @@ class _ManagedConnection:
             last_pong_time=self._last_pong_time,
             last_process_event_error=self._last_process_event_error,
             consecutive_failures=self._consecutive_failures,
+            resyncing_token_count=len(self.resyncing_token_ids),
+            queue_high_water_mark=self._queue_high_water_mark,
         )
 
+    def latency_snapshot(self) -> ConnectionLatency:
+        """Snapshot the latency histograms; kept out of ``health()``, which is polled."""
+        return self._latency.snapshot()
+
+    @property
+    def resyncing_token_ids(self) -> tuple[str, ...]:
+        if self._order_book_resyncer is None:
+            return ()
+        return self._order_book_resyncer.pending_token_ids
+
     async def get_health(self) -> ConnectionHealth:
         return self.health()
 
+    async def get_latency_snapshot(self) -> ConnectionLatency:
+        return self.latency_snapshot()
+
     async def get_market_book_synchronized(self) -> bool:
         return self.market_book_synchronized
 
@@ -1459,13 +3025,25 @@ class _ManagedConnection:
     async def get_market_book_invalid_reason(self) -> str | None:
         return self.market_book_invalid_reason
 
+    async def get_resyncing_token_ids(self) -> tuple[str, ...]:
+        return self.resyncing_token_ids
+
     def is_healthy(self, max_silence_seconds: float | None = None) -> bool:
         if not self._connected or self._should_stop():
             return False
 
-        last_activity_time = self.health().last_activity_time
-        if last_activity_time is None:
+        activity_times = [
+            activity_time
+            for activity_time in (
+                self._last_message_time,
+                self._last_pong_time,
+                self._last_connect_time,
+            )
+            if activity_time is not None
+        ]
+        if not activity_times:
             return False
+        last_activity_time = max(activity_times)
 
         timeout_seconds = (
             max_silence_seconds
@@ -1537,24 +3115,37 @@ class _ManagedConnection:
                 continue
             if await self._handle_control_message(websocket, incoming):
                 continue
+            if self.frame_recorder is not None:
+                self.frame_recorder.record(self.channel, incoming)
 
-            self._observe_raw_market_message(incoming)
+            payload = self._observe_raw_market_message(incoming)
             if self.message_mode == "raw":
                 await self._enqueue_message(incoming)
             else:
                 raw_message = _WebsocketMessage(
                     channel=self.channel,
                     text=incoming,
+                    json_data=payload,
+                    received_at=self._last_message_time,
+                    # Captured here so receive- and process-side logs share it.
+                    trace_id=current_or_new_trace_id(),
                 )
                 await self._enqueue_message(raw_message)
             if self._should_stop():
                 break
 
     async def _process_message_queue(self) -> None:
+        if self.batch_max_size is not None or self.parse_executor is not None:
+            await self._process_message_queue_drained(self.batch_max_size)
+            return
         while True:
+            self._refill_from_conflator()
             item = await self._message_queue.get()
+            if isinstance(item, _WebsocketMessage):
+                self._latency.record_dequeued(item, time.monotonic_ns())
             try:
                 if item is _MESSAGE_QUEUE_SENTINEL:
+                    await self._dispatch_conflated_remainder()
                     return
                 await self._dispatch_message(cast("_WebsocketMessage | str", item))
                 if self._should_stop():
@@ -1562,7 +3153,136 @@ class _ManagedConnection:
             finally:
                 self._message_queue.task_done()
 
+    async def _process_message_queue_drained(self, batch_max_size: int | None) -> None:
+        """
+        Drain several queued messages per wake-up.
+
+        With ``parse_executor``, the drained messages are validated concurrently
+        in the executor while the loop keeps reading and heartbeating; results
+        are still dispatched strictly in arrival order. With ``batch_max_size``,
+        the events they produce are handed to ``process_event`` as one list.
+        """
+        limit = batch_max_size or DEFAULT_PARSE_PIPELINE_DEPTH
+        while True:
+            self._refill_from_conflator()
+            items = [await self._message_queue.get()]
+            while len(items) < limit:
+                try:
+                    items.append(self._message_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    if not self._refill_from_conflator():
+                        break
+            dequeued_ns = time.monotonic_ns()
+            for item in items:
+                if isinstance(item, _WebsocketMessage):
+                    self._latency.record_dequeued(item, dequeued_ns)
+            batch: list[Any] | None = [] if batch_max_size is not None else None
+            self._event_batch = batch
+            parses = self._submit_parses(items)
+            stop = False
+            try:
+                for item, parse in zip(items, parses, strict=True):
+                    if item is _MESSAGE_QUEUE_SENTINEL:
+                        await self._dispatch_conflated_remainder()
+                        stop = True
+                        break
+                    parsed = _UNPARSED
+                    if parse is not None:
+                        parsed, parse_ns = await parse
+                        self._latency.parse.record(parse_ns, time.monotonic_ns())
+                    await self._dispatch_message(
+                        cast("_WebsocketMessage | str", item), parsed
+                    )
+                    if self._should_stop():
+                        stop = True
+                        break
+            finally:
+                self._event_batch = None
+                for parse in parses:
+                    if parse is not None:
+                        parse.cancel()
+                for _ in items:
+                    self._message_queue.task_done()
+            if batch:
+                await self._invoke_timed(batch, trace_id=current_or_new_trace_id())
+            if stop:
+                return
+
+    def _submit_parses(
+        self, items: list[object]
+    ) -> list[asyncio.Future[tuple[Any, int]] | None]:
+        executor = self.parse_executor
+        if executor is None or not self.parse_messages:
+            return [None] * len(items)
+        loop = asyncio.get_running_loop()
+        return [
+            loop.run_in_executor(executor, _timed_parse, self.parser, item)
+            if isinstance(item, _WebsocketMessage)
+            else None
+            for item in items
+        ]
+
+    def _refill_from_conflator(self) -> bool:
+        """Move conflated frames into the queue once it has fully drained."""
+        conflator = self._conflator
+        if conflator is None or not conflator or not self._message_queue.empty():
+            return False
+        for message in conflator.drain(self._message_queue.maxsize):
+            self._message_queue.put_nowait(message)
+        self._queue_high_water_mark = max(
+            self._queue_high_water_mark, self._message_queue.qsize()
+        )
+        return True
+
+    async def _dispatch_conflated_remainder(self) -> None:
+        # Conflated frames arrived before the sentinel, so they are still owed.
+        if self._conflator is None:
+            return
+        for message in self._conflator.drain():
+            await self._dispatch_message(message)
+
+    async def _deliver_event(self, event: Any, *, trace_id: str) -> None:
+        if self._event_batch is not None:
+            self._event_batch.append(event)
+            return
+        await self._invoke_timed(event, trace_id=trace_id)
+
+    async def _invoke_timed(self, event: Any, *, trace_id: str) -> None:
+        started_ns = time.monotonic_ns()
+        try:
+            await _invoke_process_event(
+                self.process_event,
+                event,
+                error_policy=self.process_event_error_policy,
+                channel=self.channel,
+                trace_id=trace_id,
+            )
+        finally:
+            finished_ns = time.monotonic_ns()
+            self._latency.callback.record(finished_ns - started_ns, finished_ns)
+
     async def _enqueue_message(self, message: _WebsocketMessage | str) -> None:
+        conflator = self._conflator
+        if conflator is not None and (conflator or self._message_queue.full()):
+            # Once conflating, later frames must queue behind the conflated
+            # state until the consumer catches up.
+            if not conflator:
+                emit(
+                    logger,
+                    logging.WARNING,
+                    "ws.queue.conflating",
+                    "Websocket queue full, conflating pending market updates",
+                    channel=self.channel,
+                    trace_id=(
+                        message.trace_id
+                        if isinstance(message, _WebsocketMessage)
+                        else current_or_new_trace_id()
+                    ),
+                    queue_maxsize=self._message_queue.maxsize,
+                    merged_message_count=conflator.merged_message_count,
+                )
+            conflator.add(message)
+            return
         if self._message_queue.full():
             overflow_policy = self._effective_message_queue_overflow_policy()
             if self.channel == "market":
@@ -1612,8 +3332,7 @@ class _ManagedConnection:
                     dropped_age_ms = None
                     if isinstance(dropped, _WebsocketMessage):
                         dropped_age_ms = round(
-                            (datetime.now(UTC) - dropped.received_at).total_seconds()
-                            * 1000,
+                            (time.monotonic_ns() - dropped.received_monotonic_ns) / 1e6,
                             3,
                         )
                     emit(
@@ -1629,20 +3348,41 @@ class _ManagedConnection:
                         dropped_message_age_ms=dropped_age_ms,
                     )
         await self._message_queue.put(message)
+        self._queue_high_water_mark = max(
+            self._queue_high_water_mark, self._message_queue.qsize()
+        )
+
+    def _observe_raw_market_message(self, message: str) -> object:
+        """
+        Apply a raw market frame to the local order books.
 
-    def _observe_raw_market_message(self, message: str) -> None:
+        Returns the decoded payload so the parsed-event path can reuse it instead
+        of decoding the same text twice, or ``_UNDECODED`` when no decode happened.
+        """
         if self.channel != "market" or self.local_order_books is None:
-            return
+            return _UNDECODED
 
         observed_at = self._last_message_time or datetime.now(UTC)
+        payload: object = _UNDECODED
         try:
-            update_kind = self.local_order_books.apply_message_text(
-                message,
+            payload = json.loads(message)
+            update_kind = self.local_order_books.apply_payload(
+                (
+                    _without_token_ids(payload, self._dropped_token_ids)
+                    if self._dropped_token_ids
+                    else payload
+                ),
                 observed_at=observed_at,
             )
         except (JSONDecodeError, TypeError, ValueError) as exc:
-            self.local_order_books.invalidate("parse_failure")
+            affected = (
+                _asset_ids_from_text(message)
+                if payload is _UNDECODED
+                else _asset_ids_from_payload(payload)
+            )
+            self._invalidate_local_order_books("parse_failure", affected or None)
             self._invalidate_market_book("parse_failure")
+            self._request_order_book_resync(affected or None)
             emit(
                 logger,
                 logging.WARNING,
@@ -1654,14 +3394,41 @@ class _ManagedConnection:
                 error_detail=str(exc),
                 raw_preview=message[:RAW_MESSAGE_PREVIEW_LIMIT],
             )
-            return
+            return payload
 
         if update_kind == "snapshot":
             self._mark_market_book_resynchronized(observed_at)
             self._mark_feed_fresh(observed_at)
-            return
-        if update_kind == "delta":
+        elif update_kind == "delta":
             self._mark_feed_fresh(observed_at)
+        if self.local_order_books.pending_hash_check_count and (
+            self._hash_verification_task is None or self._hash_verification_task.done()
+        ):
+            self._hash_verification_task = asyncio.create_task(
+                self._verify_order_book_hashes()
+            )
+        return payload
+
+    async def _verify_order_book_hashes(self) -> None:
+        """Hash sampled books in a worker thread and resync tokens that disagree."""
+        store = self.local_order_books
+        if store is None:
+            return
+        mismatched = await asyncio.to_thread(store.verify_hashes)
+        if not mismatched:
+            return
+        emit(
+            logger,
+            logging.WARNING,
+            "ws.market.book.hash_mismatch",
+            "Local order book disagrees with the server book hash",
+            channel=self.channel,
+            trace_id=current_or_new_trace_id(),
+            token_count=len(mismatched),
+            hash_mismatch_count=store.hash_mismatch_count,
+        )
+        self._invalidate_market_book("hash_mismatch", log_event=False)
+        self._request_order_book_resync(mismatched)
 
     async def _enqueue_queue_sentinel(self) -> None:
         while True:
@@ -1692,32 +3459,28 @@ class _ManagedConnection:
             else:
                 return
 
-    async def _dispatch_message(self, message: _WebsocketMessage | str) -> None:
+    async def _dispatch_message(
+        self, message: _WebsocketMessage | str, parsed: Any = _UNPARSED
+    ) -> None:
         if isinstance(message, str):
-            await _invoke_process_event(
-                self.process_event,
-                message,
-                error_policy=self.process_event_error_policy,
-                channel=self.channel,
-                trace_id=current_or_new_trace_id(),
-            )
+            await self._deliver_event(message, trace_id=current_or_new_trace_id())
             return
 
         raw_message = message
         if self.parse_messages:
-            parsed = self.parser(raw_message)
+            if parsed is _UNPARSED:
+                started_ns = time.monotonic_ns()
+                parsed = self.parser(raw_message)
+                finished_ns = time.monotonic_ns()
+                self._latency.parse.record(finished_ns - started_ns, finished_ns)
             if parsed is None:
                 if self.channel == "market":
                     self._invalidate_market_book("parse_failure")
                 if self.parse_error_policy == "drop":
                     return
                 if _process_event_accepts_raw_message(self.process_event):
-                    await _invoke_process_event(
-                        self.process_event,
-                        raw_message,
-                        error_policy=self.process_event_error_policy,
-                        channel=self.channel,
-                        trace_id=raw_message.trace_id,
+                    await self._deliver_event(
+                        raw_message, trace_id=raw_message.trace_id
                     )
                 else:
                     emit(
@@ -1732,22 +3495,48 @@ class _ManagedConnection:
                     )
                 return
             self._observe_parsed_event(parsed, raw_message)
-            await _invoke_process_event(
-                self.process_event,
-                parsed,
-                error_policy=self.process_event_error_policy,
-                channel=self.channel,
-                trace_id=raw_message.trace_id,
-            )
+            self._latency.record_exchange_delay(raw_message)
+            await self._deliver_event(parsed, trace_id=raw_message.trace_id)
             return
 
-        await _invoke_process_event(
-            self.process_event,
-            raw_message,
-            error_policy=self.process_event_error_policy,
-            channel=self.channel,
-            trace_id=raw_message.trace_id,
-        )
+        await self._deliver_event(raw_message, trace_id=raw_message.trace_id)
+
+    def _order_book_token_ids(self) -> list[str] | None:
+        """Tokens this connection feeds into ``local_order_books``; ``None`` means all."""
+        return None
+
+    def _invalidate_local_order_books(
+        self,
+        reason: str,
+        token_ids: Sequence[str] | None = None,
+    ) -> None:
+        if self.local_order_books is None:
+            return
+        if token_ids is None:
+            token_ids = self._order_book_token_ids()
+        self.local_order_books.invalidate(reason, token_ids)
+
+    def _request_order_book_resync(
+        self, token_ids: Sequence[str] | None = None
+    ) -> None:
+        if self._order_book_resyncer is None:
+            return
+        if token_ids is None:
+            token_ids = self._order_book_token_ids()
+        if token_ids is None:
+            return
+        self._order_book_resyncer.request(token_ids)
+
+    def _on_order_books_resynced(self) -> None:
+        store = self.local_order_books
+        token_ids = self._order_book_token_ids()
+        if store is None or token_ids is None:
+            return
+        invalid = set(store.invalid_token_ids) | set(store.resyncing_token_ids)
+        if invalid.isdisjoint(token_ids) and all(
+            store.is_valid(token_id) for token_id in token_ids
+        ):
+            self._mark_market_book_resynchronized(datetime.now(UTC))
 
     def _invalidate_market_book(self, reason: str, *, log_event: bool = True) -> None:
         if self.channel != "market":
@@ -1839,8 +3628,9 @@ class _ManagedConnection:
             self._stale_warning_active = True
             if self.channel == "market":
                 self._invalidate_market_book("snapshot_stale")
-                if self.local_order_books is not None:
-                    self.local_order_books.invalidate("snapshot_stale")
+                self._invalidate_local_order_books("snapshot_stale")
+                if not self.reconnect_on_stale:
+                    self._request_order_book_resync()
             emit(
                 logger,
                 logging.WARNING,
@@ -1903,9 +3693,13 @@ class _ManagedConnection:
     def _reset_message_queue(self) -> None:
         self._message_queue = asyncio.Queue(maxsize=self._message_queue_maxsize)
         self._dropped_message_count = 0
+        if self._conflator is not None:
+            self._conflator.clear()
 
     def _observe_parsed_event(self, parsed: Any, raw_message: _WebsocketMessage) -> None:
         if self.channel == "user":
+            if isinstance(parsed, LazyEvent):
+                parsed = self._validated_for_user_event_log(parsed)
             self._emit_user_event_log(parsed, raw_message)
             self._mark_feed_fresh(raw_message.received_at)
             return
@@ -1915,17 +3709,32 @@ class _ManagedConnection:
                     self._mark_market_book_resynchronized(raw_message.received_at)
                     self._mark_feed_fresh(raw_message.received_at)
                 return
-            if isinstance(parsed, OrderBookSummaryEvent):
+            event_class = (
+                parsed.model_class if isinstance(parsed, LazyEvent) else type(parsed)
+            )
+            if issubclass(
+                event_class, (OrderBookSummaryEvent, OrderBookSummaryEventStruct)
+            ):
                 self._mark_market_book_resynchronized(raw_message.received_at)
                 self._mark_feed_fresh(raw_message.received_at)
                 return
-            if isinstance(parsed, PriceChangeEvent):
+            if issubclass(event_class, (PriceChangeEvent, PriceChangeEventStruct)):
                 self._mark_feed_fresh(raw_message.received_at)
                 return
             return
         if self.channel == "real_time_data" and isinstance(parsed, AssetPriceUpdateEvent):
             self._mark_feed_fresh(raw_message.received_at, price_update=True)
 
+    @staticmethod
+    def _validated_for_user_event_log(event: LazyEvent[Any]) -> Any:
+        """The user event log reads every field, so only validate when it is enabled."""
+        if not logger.isEnabledFor(logging.INFO):
+            return None
+        try:
+            return event.model()
+        except ValidationError:
+            return None
+
     def _emit_user_event_log(self, parsed: Any, raw_message: _WebsocketMessage) -> None:
         if isinstance(parsed, OrderEvent):
             emit(
@@ -2086,6 +3895,8 @@ class _FixedSubscriptionConnection(_ManagedConnection):
         process_event_error_policy: ProcessEventErrorPolicy,
         message_mode: MessageMode | None = None,
         parse_error_policy: ParseErrorPolicy = "raw",
+        batch_max_size: int | None = None,
+        parse_executor: Executor | None = None,
         on_connect: LifecycleCallback | None,
         on_disconnect: LifecycleCallback | None,
         on_reconnect: LifecycleCallback | None,
@@ -2098,6 +3909,7 @@ class _FixedSubscriptionConnection(_ManagedConnection):
         local_order_books: LocalOrderBookStore | None = None,
         stale_after_seconds: float | None = None,
         reconnect_on_stale: bool = False,
+        order_book_resync: OrderBookResyncConfig | None = None,
         initial_payload: dict[str, Any] | None = None,
         heartbeat_interval: float | None = None,
         heartbeat_message: str | None = None,
@@ -2112,6 +3924,8 @@ class _FixedSubscriptionConnection(_ManagedConnection):
             process_event_error_policy=process_event_error_policy,
             message_mode=message_mode,
             parse_error_policy=parse_error_policy,
+            batch_max_size=batch_max_size,
+            parse_executor=parse_executor,
             on_connect=on_connect,
             on_disconnect=on_disconnect,
             on_reconnect=on_reconnect,
@@ -2124,6 +3938,7 @@ class _FixedSubscriptionConnection(_ManagedConnection):
             local_order_books=local_order_books,
             stale_after_seconds=stale_after_seconds,
             reconnect_on_stale=reconnect_on_stale,
+            order_book_resync=order_book_resync,
         )
         self.initial_payload = deepcopy(initial_payload)
         self.heartbeat_interval = heartbeat_interval
@@ -2134,6 +3949,14 @@ class _FixedSubscriptionConnection(_ManagedConnection):
         if self.initial_payload is not None:
             await websocket.send(json.dumps(self.initial_payload))
 
+    def _order_book_token_ids(self) -> list[str] | None:
+        if self.channel != "market" or self.initial_payload is None:
+            return None
+        token_ids = self.initial_payload.get("assets_ids")
+        if not isinstance(token_ids, list):
+            return None
+        return [str(token_id) for token_id in token_ids]
+
     def _heartbeat_interval_seconds(self) -> float | None:
         return self.heartbeat_interval
 
@@ -2161,6 +3984,246 @@ class AsyncChannelConnection(_FixedSubscriptionConnection):
     pass
 
 
+class AsyncMarketConnection(AsyncChannelConnection):
+    """
+    Market connection whose token set can change without reconnecting.
+
+    ``subscribe_tokens`` asks the server for the new tokens only, so existing
+    books are untouched and only the added tokens wait for a snapshot.
+    ``unsubscribe_tokens`` stops their updates and evicts them from
+    ``local_order_books``; frames for them that were already in flight are
+    not applied to the books. The subscription payload is kept current, so a
+    reconnect resubscribes to the live token set.
+    """
+
+    async def _on_connect(self, websocket: ClientConnection) -> None:
+        # A new socket only carries the tokens in the subscription payload.
+        self._dropped_token_ids = frozenset()
+        await super()._on_connect(websocket)
+
+    @property
+    def token_ids(self) -> tuple[str, ...]:
+        return tuple(self._order_book_token_ids() or ())
+
+    async def get_token_ids(self) -> tuple[str, ...]:
+        return self.token_ids
+
+    async def subscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        """Add ``token_ids`` to the subscription; returns the ones not already subscribed."""
+        current = list(self.token_ids)
+        known = set(current)
+        added = [
+            token_id for token_id in dict.fromkeys(token_ids) if token_id not in known
+        ]
+        if not added:
+            return []
+        self._set_token_ids(current + added)
+        if self._dropped_token_ids:
+            self._dropped_token_ids = self._dropped_token_ids.difference(added)
+        store = self.local_order_books
+        if store is not None:
+            pending = [token_id for token_id in added if not store.is_valid(token_id)]
+            store.invalidate("awaiting_initial_snapshot", pending)
+        await self._send_token_operation("subscribe", added)
+        return added
+
+    async def unsubscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        """Drop ``token_ids`` from the subscription and the local books; returns the removed ones."""
+        dropping = set(token_ids)
+        current = list(self.token_ids)
+        removed = [token_id for token_id in current if token_id in dropping]
+        if not removed:
+            return []
+        self._set_token_ids(
+            [token_id for token_id in current if token_id not in dropping]
+        )
+        # Unsubscribe before evicting, and keep frames the server sent before
+        # it saw the unsubscribe from rebuilding the evicted books.
+        self._dropped_token_ids = self._dropped_token_ids.union(removed)
+        await self._send_token_operation("unsubscribe", removed)
+        if self._order_book_resyncer is not None:
+            self._order_book_resyncer.discard(removed)
+        if self.local_order_books is not None:
+            self.local_order_books.evict(removed)
+        return removed
+
+    def _set_token_ids(self, token_ids: list[str]) -> None:
+        if self.initial_payload is None:
+            self.initial_payload = {"assets_ids": token_ids, "type": "market"}
+        else:
+            self.initial_payload["assets_ids"] = token_ids
+
+    async def _send_token_operation(
+        self,
+        operation: Literal["subscribe", "unsubscribe"],
+        token_ids: list[str],
+    ) -> None:
+        websocket = self._websocket
+        if websocket is None or not self._connected:
+            # The next connect sends the updated initial payload.
+            return
+        payload: dict[str, Any] = {"assets_ids": token_ids, "operation": operation}
+        if (
+            self.initial_payload is not None
+            and "custom_feature_enabled" in self.initial_payload
+        ):
+            payload["custom_feature_enabled"] = self.initial_payload[
+                "custom_feature_enabled"
+            ]
+        with contextlib.suppress(ConnectionClosed):
+            await websocket.send(json.dumps(payload))
+        emit(
+            logger,
+            logging.INFO,
+            "ws.market.subscription.updated",
+            "Updated market token subscription",
+            channel=self.channel,
+            trace_id=current_or_new_trace_id(),
+            operation=operation,
+            token_count=len(token_ids),
+            subscribed_token_count=len(self.token_ids),
+        )
+
+
+def _balanced_shards(
+    token_ids: Sequence[str],
+    shard_count: int | None,
+    max_tokens_per_shard: int,
+) -> list[list[str]]:
+    """
+    Split ``token_ids`` into contiguous groups whose sizes differ by at most one.
+
+    Contiguous groups keep tokens listed together (e.g. both outcomes of a
+    market) on the same socket. Duplicate token ids are dropped.
+    """
+    if shard_count is not None and shard_count < 1:
+        msg = "shard_count must be at least 1"
+        raise ValueError(msg)
+    if max_tokens_per_shard < 1:
+        msg = "max_tokens_per_shard must be at least 1"
+        raise ValueError(msg)
+    unique = list(dict.fromkeys(token_ids))
+    if shard_count is None:
+        shard_count = -(-len(unique) // max_tokens_per_shard)
+    shard_count = max(1, min(shard_count, len(unique)))
+    size, extra = divmod(len(unique), shard_count)
+    shards: list[list[str]] = []
+    start = 0
+    for index in range(shard_count):
+        end = start + size + (index < extra)
+        shards.append(unique[start:end])
+        start = end
+    return shards
+
+
+class AsyncShardedMarketConnection:
+    """
+    A market stream spread over several ``AsyncMarketConnection`` shards.
+
+    Each shard has its own socket, queue and reconnect loop, so a disconnect or
+    queue overflow on one shard only invalidates that shard's tokens in the
+    shared ``local_order_books``. ``subscribe_tokens`` places new tokens on the
+    least loaded shards.
+    """
+
+    def __init__(self, shards: Sequence[AsyncMarketConnection]) -> None:
+        self.shards = tuple(shards)
+
+    @property
+    def token_ids_by_shard(self) -> tuple[tuple[str, ...], ...]:
+        return tuple(shard.token_ids for shard in self.shards)
+
+    async def get_token_ids_by_shard(self) -> tuple[tuple[str, ...], ...]:
+        return self.token_ids_by_shard
+
+    async def subscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        """Add ``token_ids``, filling the least loaded shards first; returns the new ones."""
+        subscribed = {token_id for shard in self.shards for token_id in shard.token_ids}
+        added = [
+            token_id
+            for token_id in dict.fromkeys(token_ids)
+            if token_id not in subscribed
+        ]
+        if not added or not self.shards:
+            return []
+        loads = [len(shard.token_ids) for shard in self.shards]
+        groups: list[list[str]] = [[] for _ in self.shards]
+        for token_id in added:
+            index = loads.index(min(loads))
+            groups[index].append(token_id)
+            loads[index] += 1
+        await asyncio.gather(
+            *(
+                shard.subscribe_tokens(group)
+                for shard, group in zip(self.shards, groups, strict=True)
+                if group
+            )
+        )
+        return added
+
+    async def unsubscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        removed = await asyncio.gather(
+            *(shard.unsubscribe_tokens(token_ids) for shard in self.shards)
+        )
+        return [token_id for shard_removed in removed for token_id in shard_removed]
+
+    @property
+    def local_order_books(self) -> LocalOrderBookStore | None:
+        return self.shards[0].local_order_books if self.shards else None
+
+    @property
+    def market_book_synchronized(self) -> bool:
+        return all(shard.market_book_synchronized for shard in self.shards)
+
+    @property
+    def resyncing_token_ids(self) -> tuple[str, ...]:
+        return tuple(
+            token_id for shard in self.shards for token_id in shard.resyncing_token_ids
+        )
+
+    def health(self) -> ShardedConnectionHealth:
+        return ShardedConnectionHealth(
+            shards=tuple(shard.health() for shard in self.shards)
+        )
+
+    def is_healthy(self, max_silence_seconds: float | None = None) -> bool:
+        return all(
+            shard.is_healthy(max_silence_seconds=max_silence_seconds)
+            for shard in self.shards
+        )
+
+    def latency_snapshot(self) -> tuple[ConnectionLatency, ...]:
+        """Latency histograms of each shard, in shard order."""
+        return tuple(shard.latency_snapshot() for shard in self.shards)
+
+    async def get_health(self) -> ShardedConnectionHealth:
+        return self.health()
+
+    async def get_latency_snapshot(self) -> tuple[ConnectionLatency, ...]:
+        return self.latency_snapshot()
+
+    async def get_is_healthy(self, max_silence_seconds: float | None = None) -> bool:
+        return self.is_healthy(max_silence_seconds=max_silence_seconds)
+
+    async def get_market_book_synchronized(self) -> bool:
+        return self.market_book_synchronized
+
+    async def get_resyncing_token_ids(self) -> tuple[str, ...]:
+        return self.resyncing_token_ids
+
+    async def close(self) -> None:
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+
+    async def graceful_close(self) -> None:
+        await asyncio.gather(*(shard.graceful_close() for shard in self.shards))
+
+    async def abort(self) -> None:
+        await asyncio.gather(*(shard.abort() for shard in self.shards))
+
+    async def wait_closed(self) -> None:
+        await asyncio.gather(*(shard.wait_closed() for shard in self.shards))
+
+
 class _DynamicSubscriptionConnection(_ManagedConnection):
     def __init__(
         self,
@@ -2172,6 +4235,8 @@ class _DynamicSubscriptionConnection(_ManagedConnection):
         process_event_error_policy: ProcessEventErrorPolicy,
         message_mode: MessageMode | None = None,
         parse_error_policy: ParseErrorPolicy = "raw",
+        batch_max_size: int | None = None,
+        parse_executor: Executor | None = None,
         on_connect: LifecycleCallback | None,
         on_disconnect: LifecycleCallback | None,
         on_reconnect: LifecycleCallback | None,
@@ -2193,6 +4258,8 @@ class _DynamicSubscriptionConnection(_ManagedConnection):
             process_event_error_policy=process_event_error_policy,
             message_mode=message_mode,
             parse_error_policy=parse_error_policy,
+            batch_max_size=batch_max_size,
+            parse_executor=parse_executor,
             on_connect=on_connect,
             on_disconnect=on_disconnect,
             on_reconnect=on_reconnect,
@@ -2386,7 +4453,9 @@ class AsyncRealTimeDataConnection(_DynamicSubscriptionConnection):
 
         return False
 
-    async def _dispatch_message(self, message: _WebsocketMessage | str) -> None:
+    async def _dispatch_message(
+        self, message: _WebsocketMessage | str, parsed: Any = _UNPARSED
+    ) -> None:
         payload: object | None = None
         if isinstance(message, str):
             trace_id = current_or_new_trace_id()
@@ -2434,7 +4503,7 @@ class AsyncRealTimeDataConnection(_DynamicSubscriptionConnection):
                     if not self._pending_subscription_ack_keys:
                         pending_ack.set_result(None)
 
-        await super()._dispatch_message(message)
+        await super()._dispatch_message(message, parsed)
 
     async def _send_subscription_request(
         self,
@@ -2681,6 +4750,7 @@ class AsyncPolymarketWebsocketsClient:
         callbacks: WebsocketCallbackConfig | None = None,
         queue: WebsocketQueueConfig | None = None,
         reconnect: WebsocketReconnectConfig | None = None,
+        recorder: FrameRecorder | None = None,
     ) -> None:
         callbacks = callbacks or WebsocketCallbackConfig()
         queue = queue or WebsocketQueueConfig()
@@ -2691,18 +4761,33 @@ class AsyncPolymarketWebsocketsClient:
         self.url_sports = "wss://sports-api.polymarket.com/ws"
         self.process_event_error_policy = callbacks.process_event_error_policy
         self.parse_error_policy = callbacks.parse_error_policy
+        self.batch_max_size = callbacks.batch_max_size
+        self.parse_executor = callbacks.parse_executor
         self.message_queue_maxsize = queue.maxsize
+        if "conflate" in (
+            queue.user_overflow_policy,
+            queue.real_time_data_overflow_policy,
+            queue.sports_overflow_policy,
+        ):
+            msg = "the conflate overflow policy is only supported on the market channel"
+            raise ValueError(msg)
+        # Channels without conflation fall back to dropping the oldest message.
+        inherited_overflow_policy: MessageQueueOverflowPolicy = (
+            "drop_oldest"
+            if queue.overflow_policy == "conflate"
+            else queue.overflow_policy
+        )
         self.message_queue_overflow_policy = queue.overflow_policy
         self.user_message_queue_overflow_policy = queue.user_overflow_policy
         self.real_time_data_message_queue_overflow_policy = (
             queue.real_time_data_overflow_policy
             if queue.real_time_data_overflow_policy is not None
-            else queue.overflow_policy
+            else inherited_overflow_policy
         )
         self.sports_message_queue_overflow_policy = (
             queue.sports_overflow_policy
             if queue.sports_overflow_policy is not None
-            else queue.overflow_policy
+            else inherited_overflow_policy
         )
         self.on_connect = callbacks.on_connect
         self.on_disconnect = callbacks.on_disconnect
@@ -2715,6 +4800,7 @@ class AsyncPolymarketWebsocketsClient:
         self.real_time_data_stale_after_seconds = reconnect.real_time_data_stale_after_seconds
         self.reconnect_on_market_stale = reconnect.reconnect_on_market_stale
         self.reconnect_on_real_time_data_stale = reconnect.reconnect_on_real_time_data_stale
+        self.recorder = recorder
         self._closed = asyncio.Event()
         self._connections: set[_ManagedConnection] = set()
         self._connections_lock = asyncio.Lock()
@@ -2750,6 +4836,7 @@ class AsyncPolymarketWebsocketsClient:
         parse_messages: bool = True,
         message_mode: MessageMode | None = None,
         local_order_books: LocalOrderBookStore | None = None,
+        order_book_resync: OrderBookResyncConfig | None = None,
     ) -> None:
         """
         Convenience API: run the market stream until it closes.
@@ -2764,6 +4851,7 @@ class AsyncPolymarketWebsocketsClient:
             parse_messages=parse_messages,
             message_mode=message_mode,
             local_order_books=local_order_books,
+            order_book_resync=order_book_resync,
         )
         await connection.wait_closed()
 
@@ -2775,18 +4863,31 @@ class AsyncPolymarketWebsocketsClient:
         parse_messages: bool = True,
         message_mode: MessageMode | None = None,
         local_order_books: LocalOrderBookStore | None = None,
-    ) -> AsyncChannelConnection:
-        """Primary API: open a market stream and return a connection handle."""
+        order_book_resync: OrderBookResyncConfig | None = None,
+    ) -> AsyncMarketConnection:
+        """
+        Primary API: open a market stream and return a connection handle.
+
+        With ``order_book_resync``, tokens whose local book is invalidated by a
+        bad frame (or a stale feed without reconnect) are refetched over REST in
+        batches while the stream stays up. Use ``subscribe_tokens`` and
+        ``unsubscribe_tokens`` on the handle to change the token set in place.
+        """
+        if order_book_resync is not None and local_order_books is None:
+            msg = "order_book_resync requires local_order_books"
+            raise ValueError(msg)
         await self._ensure_open()
-        connection = AsyncChannelConnection(
+        connection = AsyncMarketConnection(
             channel="market",
             url=self.url_market,
-            parser=parse_market_event,
+            parser=_MARKET_PARSERS.get(message_mode or "parsed", parse_market_event),
             process_event=process_event,
             parse_messages=parse_messages,
             process_event_error_policy=self.process_event_error_policy,
             message_mode=message_mode,
             parse_error_policy=self.parse_error_policy,
+            batch_max_size=self.batch_max_size,
+            parse_executor=self.parse_executor,
             on_connect=self.on_connect,
             on_disconnect=self.on_disconnect,
             on_reconnect=self.on_reconnect,
@@ -2797,6 +4898,7 @@ class AsyncPolymarketWebsocketsClient:
             message_queue_maxsize=self.message_queue_maxsize,
             message_queue_overflow_policy=self.message_queue_overflow_policy,
             local_order_books=local_order_books,
+            order_book_resync=order_book_resync,
             stale_after_seconds=(
                 self.market_stale_after_seconds
             ),
@@ -2811,6 +4913,77 @@ class AsyncPolymarketWebsocketsClient:
         )
         return await self._start_background_connection(connection)
 
+    async def run_sharded_market_stream(
+        self,
+        token_ids: list[str],
+        shard_count: int | None = None,
+        max_tokens_per_shard: int = DEFAULT_MAX_TOKENS_PER_SHARD,
+        custom_feature_enabled: bool = True,
+        process_event: ProcessEventCallback = _default_process_market_event,
+        parse_messages: bool = True,
+        message_mode: MessageMode | None = None,
+        local_order_books: LocalOrderBookStore | None = None,
+        order_book_resync: OrderBookResyncConfig | None = None,
+    ) -> None:
+        """Convenience API: run a sharded market stream until every shard closes."""
+        connection = await self.open_sharded_market_connection(
+            token_ids=token_ids,
+            shard_count=shard_count,
+            max_tokens_per_shard=max_tokens_per_shard,
+            custom_feature_enabled=custom_feature_enabled,
+            process_event=process_event,
+            parse_messages=parse_messages,
+            message_mode=message_mode,
+            local_order_books=local_order_books,
+            order_book_resync=order_book_resync,
+        )
+        await connection.wait_closed()
+
+    async def open_sharded_market_connection(
+        self,
+        token_ids: list[str],
+        shard_count: int | None = None,
+        max_tokens_per_shard: int = DEFAULT_MAX_TOKENS_PER_SHARD,
+        custom_feature_enabled: bool = True,
+        process_event: ProcessEventCallback = _default_process_market_event,
+        parse_messages: bool = True,
+        message_mode: MessageMode | None = None,
+        local_order_books: LocalOrderBookStore | None = None,
+        order_book_resync: OrderBookResyncConfig | None = None,
+    ) -> AsyncShardedMarketConnection:
+        """
+        Primary API: open a market stream split across several sockets.
+
+        Tokens are divided into ``shard_count`` balanced groups (by default as
+        few as keep each under ``max_tokens_per_shard``), each opened with
+        ``open_market_connection``. All shards share ``process_event`` and
+        ``local_order_books``. If any shard fails to start, the others are closed.
+        """
+        groups = _balanced_shards(token_ids, shard_count, max_tokens_per_shard)
+        opened = await asyncio.gather(
+            *(
+                self.open_market_connection(
+                    token_ids=group,
+                    custom_feature_enabled=custom_feature_enabled,
+                    process_event=process_event,
+                    parse_messages=parse_messages,
+                    message_mode=message_mode,
+                    local_order_books=local_order_books,
+                    order_book_resync=order_book_resync,
+                )
+                for group in groups
+            ),
+            return_exceptions=True,
+        )
+        shards = [shard for shard in opened if isinstance(shard, AsyncMarketConnection)]
+        for result in opened:
+            if isinstance(result, BaseException):
+                await asyncio.gather(
+                    *(shard.close() for shard in shards), return_exceptions=True
+                )
+                raise result
+        return AsyncShardedMarketConnection(shards)
+
     async def run_user_stream(
         self,
         creds: ApiCreds,
@@ -2861,12 +5034,16 @@ class AsyncPolymarketWebsocketsClient:
         connection = AsyncChannelConnection(
             channel="user",
             url=self.url_user,
-            parser=parse_user_event,
+            parser=parse_user_lazy_event
+            if message_mode == "lazy"
+            else parse_user_event,
             process_event=process_event,
             parse_messages=parse_messages,
             process_event_error_policy=self.process_event_error_policy,
             message_mode=message_mode,
             parse_error_policy=self.parse_error_policy,
+            batch_max_size=self.batch_max_size,
+            parse_executor=self.parse_executor,
             on_connect=self.on_connect,
             on_disconnect=self.on_disconnect,
             on_reconnect=self.on_reconnect,
@@ -2909,6 +5086,8 @@ class AsyncPolymarketWebsocketsClient:
             process_event_error_policy=self.process_event_error_policy,
             message_mode=message_mode,
             parse_error_policy=self.parse_error_policy,
+            batch_max_size=self.batch_max_size,
+            parse_executor=self.parse_executor,
             on_connect=self.on_connect,
             on_disconnect=self.on_disconnect,
             on_reconnect=self.on_reconnect,
@@ -2984,6 +5163,8 @@ class AsyncPolymarketWebsocketsClient:
             process_event_error_policy=self.process_event_error_policy,
             message_mode=message_mode,
             parse_error_policy=self.parse_error_policy,
+            batch_max_size=self.batch_max_size,
+            parse_executor=self.parse_executor,
             on_connect=self.on_connect,
             on_disconnect=self.on_disconnect,
             on_reconnect=self.on_reconnect,
@@ -3013,6 +5194,7 @@ class AsyncPolymarketWebsocketsClient:
     ](
         self, connection: TConnection
     ) -> TConnection:
+        connection.frame_recorder = self.recorder
         task = asyncio.create_task(self._run_connection(connection))
         connection.bind_run_task(task)
         try:
@@ -3133,6 +5315,10 @@ class SyncRealTimeDataConnection:
         future = self._loop_thread.submit(self._handle.get_health())
         return future.result()
 
+    def latency_snapshot(self) -> ConnectionLatency:
+        future = self._loop_thread.submit(self._handle.get_latency_snapshot())
+        return future.result()
+
     def is_healthy(self, max_silence_seconds: float | None = None) -> bool:
         future = self._loop_thread.submit(
             self._handle.get_is_healthy(max_silence_seconds=max_silence_seconds)
@@ -3182,6 +5368,10 @@ class SyncChannelConnection:
         future = self._loop_thread.submit(self._handle.get_health())
         return future.result()
 
+    def latency_snapshot(self) -> ConnectionLatency:
+        future = self._loop_thread.submit(self._handle.get_latency_snapshot())
+        return future.result()
+
     def is_healthy(self, max_silence_seconds: float | None = None) -> bool:
         future = self._loop_thread.submit(
             self._handle.get_is_healthy(max_silence_seconds=max_silence_seconds)
@@ -3203,6 +5393,107 @@ class SyncChannelConnection:
         future = self._loop_thread.submit(self._handle.get_market_book_invalid_reason())
         return future.result()
 
+    @property
+    def resyncing_token_ids(self) -> tuple[str, ...]:
+        future = self._loop_thread.submit(self._handle.get_resyncing_token_ids())
+        return future.result()
+
+    @property
+    def local_order_books(self) -> LocalOrderBookStore | None:
+        return self._handle.local_order_books
+
+    def close(self) -> None:
+        future = self._loop_thread.submit(self._handle.close())
+        future.result(timeout=self._close_timeout_seconds)
+
+    def graceful_close(self) -> None:
+        future = self._loop_thread.submit(self._handle.graceful_close())
+        future.result(timeout=self._close_timeout_seconds)
+
+    def abort(self) -> None:
+        future = self._loop_thread.submit(self._handle.abort())
+        future.result(timeout=self._close_timeout_seconds)
+
+    def wait_closed(self) -> None:
+        future = self._loop_thread.submit(self._handle.wait_closed())
+        future.result(timeout=self._close_timeout_seconds)
+
+
+class SyncMarketConnection(SyncChannelConnection):
+    _handle: AsyncMarketConnection
+
+    @property
+    def token_ids(self) -> tuple[str, ...]:
+        future = self._loop_thread.submit(self._handle.get_token_ids())
+        return future.result()
+
+    def subscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        future = self._loop_thread.submit(self._handle.subscribe_tokens(token_ids))
+        return future.result()
+
+    def unsubscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        future = self._loop_thread.submit(self._handle.unsubscribe_tokens(token_ids))
+        return future.result()
+
+
+class SyncShardedMarketConnection:
+    def __init__(
+        self,
+        *,
+        loop_thread: _EventLoopThread,
+        handle: AsyncShardedMarketConnection,
+        close_timeout_seconds: float,
+    ) -> None:
+        self._loop_thread = loop_thread
+        self._handle = handle
+        self._close_timeout_seconds = close_timeout_seconds
+        self.shards = tuple(
+            SyncMarketConnection(
+                loop_thread=loop_thread,
+                handle=shard,
+                close_timeout_seconds=close_timeout_seconds,
+            )
+            for shard in handle.shards
+        )
+
+    @property
+    def token_ids_by_shard(self) -> tuple[tuple[str, ...], ...]:
+        future = self._loop_thread.submit(self._handle.get_token_ids_by_shard())
+        return future.result()
+
+    def subscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        future = self._loop_thread.submit(self._handle.subscribe_tokens(token_ids))
+        return future.result()
+
+    def unsubscribe_tokens(self, token_ids: Sequence[str]) -> list[str]:
+        future = self._loop_thread.submit(self._handle.unsubscribe_tokens(token_ids))
+        return future.result()
+
+    @property
+    def health(self) -> ShardedConnectionHealth:
+        future = self._loop_thread.submit(self._handle.get_health())
+        return future.result()
+
+    def latency_snapshot(self) -> tuple[ConnectionLatency, ...]:
+        future = self._loop_thread.submit(self._handle.get_latency_snapshot())
+        return future.result()
+
+    def is_healthy(self, max_silence_seconds: float | None = None) -> bool:
+        future = self._loop_thread.submit(
+            self._handle.get_is_healthy(max_silence_seconds=max_silence_seconds)
+        )
+        return future.result()
+
+    @property
+    def market_book_synchronized(self) -> bool:
+        future = self._loop_thread.submit(self._handle.get_market_book_synchronized())
+        return future.result()
+
+    @property
+    def resyncing_token_ids(self) -> tuple[str, ...]:
+        future = self._loop_thread.submit(self._handle.get_resyncing_token_ids())
+        return future.result()
+
     @property
     def local_order_books(self) -> LocalOrderBookStore | None:
         return self._handle.local_order_books
@@ -3242,6 +5533,7 @@ class PolymarketWebsocketsClient:
         queue: WebsocketQueueConfig | None = None,
         reconnect: WebsocketReconnectConfig | None = None,
         sync_close_timeout_seconds: float = DEFAULT_SYNC_CLOSE_TIMEOUT_SECONDS,
+        recorder: FrameRecorder | None = None,
     ) -> None:
         self._loop_thread = _EventLoopThread()
         self._sync_close_timeout_seconds = sync_close_timeout_seconds
@@ -3249,6 +5541,7 @@ class PolymarketWebsocketsClient:
             callbacks=callbacks,
             queue=queue,
             reconnect=reconnect,
+            recorder=recorder,
         )
 
     @property
@@ -3291,6 +5584,7 @@ class PolymarketWebsocketsClient:
         parse_messages: bool = True,
         message_mode: MessageMode | None = None,
         local_order_books: LocalOrderBookStore | None = None,
+        order_book_resync: OrderBookResyncConfig | None = None,
     ) -> None:
         future = self._loop_thread.submit(
             self._async_client.run_market_stream(
@@ -3300,6 +5594,7 @@ class PolymarketWebsocketsClient:
                 parse_messages=parse_messages,
                 message_mode=message_mode,
                 local_order_books=local_order_books,
+                order_book_resync=order_book_resync,
             )
         )
         future.result()
@@ -3312,7 +5607,8 @@ class PolymarketWebsocketsClient:
         parse_messages: bool = True,
         message_mode: MessageMode | None = None,
         local_order_books: LocalOrderBookStore | None = None,
-    ) -> SyncChannelConnection:
+        order_book_resync: OrderBookResyncConfig | None = None,
+    ) -> SyncMarketConnection:
         future = self._loop_thread.submit(
             self._async_client.open_market_connection(
                 token_ids=token_ids,
@@ -3321,10 +5617,70 @@ class PolymarketWebsocketsClient:
                 parse_messages=parse_messages,
                 message_mode=message_mode,
                 local_order_books=local_order_books,
+                order_book_resync=order_book_resync,
             )
         )
         handle = future.result()
-        return SyncChannelConnection(
+        return SyncMarketConnection(
+            loop_thread=self._loop_thread,
+            handle=handle,
+            close_timeout_seconds=self._sync_close_timeout_seconds,
+        )
+
+    def run_sharded_market_stream(
+        self,
+        token_ids: list[str],
+        shard_count: int | None = None,
+        max_tokens_per_shard: int = DEFAULT_MAX_TOKENS_PER_SHARD,
+        custom_feature_enabled: bool = True,
+        process_event: ProcessEventCallback = _default_process_market_event,
+        parse_messages: bool = True,
+        message_mode: MessageMode | None = None,
+        local_order_books: LocalOrderBookStore | None = None,
+        order_book_resync: OrderBookResyncConfig | None = None,
+    ) -> None:
+        future = self._loop_thread.submit(
+            self._async_client.run_sharded_market_stream(
+                token_ids=token_ids,
+                shard_count=shard_count,
+                max_tokens_per_shard=max_tokens_per_shard,
+                custom_feature_enabled=custom_feature_enabled,
+                process_event=process_event,
+                parse_messages=parse_messages,
+                message_mode=message_mode,
+                local_order_books=local_order_books,
+                order_book_resync=order_book_resync,
+            )
+        )
+        future.result()
+
+    def open_sharded_market_connection(
+        self,
+        token_ids: list[str],
+        shard_count: int | None = None,
+        max_tokens_per_shard: int = DEFAULT_MAX_TOKENS_PER_SHARD,
+        custom_feature_enabled: bool = True,
+        process_event: ProcessEventCallback = _default_process_market_event,
+        parse_messages: bool = True,
+        message_mode: MessageMode | None = None,
+        local_order_books: LocalOrderBookStore | None = None,
+        order_book_resync: OrderBookResyncConfig | None = None,
+    ) -> SyncShardedMarketConnection:
+        future = self._loop_thread.submit(
+            self._async_client.open_sharded_market_connection(
+                token_ids=token_ids,
+                shard_count=shard_count,
+                max_tokens_per_shard=max_tokens_per_shard,
+                custom_feature_enabled=custom_feature_enabled,
+                process_event=process_event,
+                parse_messages=parse_messages,
+                message_mode=message_mode,
+                local_order_books=local_order_books,
+                order_book_resync=order_book_resync,
+            )
+        )
+        handle = future.result()
+        return SyncShardedMarketConnection(
             loop_thread=self._loop_thread,
             handle=handle,
             close_timeout_seconds=self._sync_close_timeout_seconds,
@@ -0,0 +1,393 @@
+"""
+Record raw websocket frames to disk and replay them through the ingest path.
+
+``FrameRecorder`` appends every data frame a managed connection receives to a
+gzip-compressed JSON Lines file. ``replay_frames`` feeds a recording back
+through ``LocalOrderBookStore.apply_payload``, the channel's ``parse_*_event``
+parser and ``process_event``, either as fast as possible or paced to the
+recorded receive times.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import inspect
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator
+from dataclasses import dataclass
+from json import JSONDecodeError
+from typing import Any, Self, cast
+
+from ..utilities._internal_log import current_or_new_trace_id, emit
+from .websockets_client import (
+    _UNDECODED,
+    RAW_MESSAGE_PREVIEW_LIMIT,
+    LocalOrderBookStore,
+    ProcessEventCallback,
+    _asset_ids_from_payload,
+    _asset_ids_from_text,
+    _WebsocketMessage,
+    parse_market_event,
+    parse_real_time_data_event,
+    parse_sports_event,
+    parse_user_event,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECORDER_COMPRESSLEVEL = 5
+DEFAULT_RECORDER_BATCH_SIZE = 512
+DEFAULT_RECORDER_MAX_QUEUED_FRAMES = 100_000
+DEFAULT_REPLAY_MAX_GAP = 60.0
+_FLUSH = object()
+_CLOSE = object()
+
+_PARSERS: dict[str, Callable[[_WebsocketMessage], Any]] = {
+    "market": parse_market_event,
+    "user": parse_user_event,
+    "real_time_data": parse_real_time_data_event,
+    "sports": parse_sports_event,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FrameRecord:
+    channel: str
+    received_monotonic_ns: int
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayStats:
+    frames: int
+    events: int
+    unparsed: int
+    seconds: float
+    rejected: int = 0
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.seconds if self.seconds else float("inf")
+
+
+class FrameRecorder:
+    """
+    Append raw websocket frames to a gzip-compressed JSON Lines file.
+
+    ``record`` only timestamps the frame and hands it to a writer thread, so the
+    socket reader never waits on compression or disk. Each line holds
+    ``channel``, ``received_monotonic_ns`` and ``text``. Opening an existing
+    file appends a new gzip member, which ``read_frames`` reads as one stream.
+    Pass the recorder to ``AsyncPolymarketWebsocketsClient(recorder=...)`` to
+    capture every connection the client opens.
+
+    At most ``max_queued_frames`` frames wait for the writer; frames offered
+    beyond that are dropped. A write error is logged once and marks the
+    recorder ``failed``: from then on frames are dropped instead of queued,
+    and ``flush`` and ``close`` still return.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        compresslevel: int = DEFAULT_RECORDER_COMPRESSLEVEL,
+        batch_size: int = DEFAULT_RECORDER_BATCH_SIZE,
+        max_queued_frames: int = DEFAULT_RECORDER_MAX_QUEUED_FRAMES,
+    ) -> None:
+        self.path = os.fspath(path)
+        # Owned by the writer thread, which closes it on ``close``.
+        self._file = gzip.open(  # noqa: SIM115
+            self.path, "at", encoding="utf-8", compresslevel=compresslevel
+        )
+        self._batch_size = batch_size
+        self._queue: queue.Queue[tuple[str, int, str] | object] = queue.Queue(
+            max_queued_frames
+        )
+        self._closed = False
+        self._failed = False
+        self._recorded_frame_count = 0
+        # Counted by the recording thread and the writer thread respectively.
+        self._dropped_frame_count = 0
+        self._lost_frame_count = 0
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def failed(self) -> bool:
+        """True once a write to the file has failed."""
+        return self._failed
+
+    @property
+    def recorded_frame_count(self) -> int:
+        return self._recorded_frame_count
+
+    @property
+    def dropped_frame_count(self) -> int:
+        """Frames discarded: offered after ``close``, with the queue full, or lost to a write error."""
+        return self._dropped_frame_count + self._lost_frame_count
+
+    def record(
+        self,
+        channel: str,
+        text: str,
+        *,
+        received_monotonic_ns: int | None = None,
+    ) -> None:
+        if self._closed or self._failed:
+            self._dropped_frame_count += 1
+            return
+        if received_monotonic_ns is None:
+            received_monotonic_ns = time.monotonic_ns()
+        try:
+            self._queue.put_nowait((channel, received_monotonic_ns, text))
+        except queue.Full:
+            self._dropped_frame_count += 1
+
+    def flush(self) -> None:
+        """Block until every frame recorded so far is written to the file."""
+        if self._closed:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _write_loop(self) -> None:
+        try:
+            while True:
+                items = [self._queue.get()]
+                while len(items) < self._batch_size:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    stop = self._write_items(items)
+                finally:
+                    # Always, so that ``flush`` and ``close`` return after a failure.
+                    for _ in items:
+                        self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            try:
+                self._file.close()
+            except OSError as exc:
+                self._write_failed(exc)
+
+    def _write_items(self, items: list[tuple[str, int, str] | object]) -> bool:
+        lines: list[str] = []
+        stop = False
+        for item in items:
+            if item is _FLUSH or item is _CLOSE:
+                self._write(lines)
+                lines = []
+                if not self._failed:
+                    try:
+                        self._file.flush()
+                    except OSError as exc:
+                        self._write_failed(exc)
+                stop = stop or item is _CLOSE
+                continue
+            channel, received_monotonic_ns, text = cast("tuple[str, int, str]", item)
+            lines.append(
+                json.dumps(
+                    {
+                        "channel": channel,
+                        "received_monotonic_ns": received_monotonic_ns,
+                        "text": text,
+                    },
+                    separators=(",", ":"),
+                )
+            )
+        self._write(lines)
+        return stop
+
+    def _write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        if not self._failed:
+            try:
+                self._file.write("\n".join(lines) + "\n")
+            except OSError as exc:
+                self._write_failed(exc)
+            else:
+                self._recorded_frame_count += len(lines)
+                return
+        self._lost_frame_count += len(lines)
+
+    def _write_failed(self, exc: OSError) -> None:
+        if self._failed:
+            return
+        self._failed = True
+        emit(
+            logger,
+            logging.ERROR,
+            "ws.recorder.write_failed",
+            "Frame recorder failed to write %s; dropping further frames",
+            self.path,
+            trace_id=current_or_new_trace_id(),
+            path=self.path,
+            error_type=type(exc).__name__,
+            error_detail=str(exc),
+        )
+
+
+def read_frames(path: str | os.PathLike[str]) -> Iterator[FrameRecord]:
+    """
+    Yield the frames of a recording in file order.
+
+    A recording cut short by a crash ends at the last complete line instead of
+    raising.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        try:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    return
+                yield FrameRecord(
+                    channel=record["channel"],
+                    received_monotonic_ns=record["received_monotonic_ns"],
+                    text=record["text"],
+                )
+        except EOFError:
+            return
+
+
+async def replay_frames(
+    source: str | os.PathLike[str] | Iterable[FrameRecord],
+    *,
+    process_event: ProcessEventCallback | None = None,
+    local_order_books: LocalOrderBookStore | None = None,
+    channels: Collection[str] | None = None,
+    parse_messages: bool = True,
+    speed: float | None = None,
+    max_gap: float = DEFAULT_REPLAY_MAX_GAP,
+) -> ReplayStats:
+    """
+    Feed recorded frames through the same path a live connection uses.
+
+    Market frames are applied to ``local_order_books`` first, then parsed with
+    the channel's parser (unless ``parse_messages=False``, which passes raw
+    text) and handed to ``process_event``, awaiting it if it is a coroutine.
+    As on a live connection, a frame the store cannot apply is logged, its
+    books are invalidated and replay continues; ``ReplayStats.rejected``
+    counts them.
+
+    ``speed=None`` replays as fast as possible; ``speed=1.0`` reproduces the
+    recorded gaps between frames and ``2.0`` halves them. A recording appended
+    over several sessions has unrelated stamps, so a gap longer than
+    ``max_gap`` recorded seconds, or one that runs backwards, is not waited
+    out: pacing restarts from that frame.
+    """
+    if speed is not None and speed <= 0:
+        msg = "speed must be positive"
+        raise ValueError(msg)
+    records = read_frames(source) if isinstance(source, (str, os.PathLike)) else source
+    frames = events = unparsed = rejected = 0
+    first_ns: int | None = None
+    previous_ns = 0
+    started = paced_from = time.perf_counter()
+    for record in records:
+        if channels is not None and record.channel not in channels:
+            continue
+        if speed is not None:
+            gap_ns = record.received_monotonic_ns - previous_ns
+            if first_ns is None or gap_ns < 0 or gap_ns > max_gap * 1e9:
+                first_ns = record.received_monotonic_ns
+                paced_from = time.perf_counter()
+            previous_ns = record.received_monotonic_ns
+            due = (record.received_monotonic_ns - first_ns) / 1e9 / speed
+            delay = due - (time.perf_counter() - paced_from)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        frames += 1
+
+        payload: object = _UNDECODED
+        if record.channel == "market" and local_order_books is not None:
+            try:
+                payload = json.loads(record.text)
+                local_order_books.apply_payload(payload)
+            except (JSONDecodeError, TypeError, ValueError) as exc:
+                rejected += 1
+                _reject_frame(local_order_books, record, payload, exc)
+        if process_event is None:
+            continue
+
+        event: Any = record.text
+        if parse_messages:
+            parser = _PARSERS.get(record.channel)
+            if parser is None:
+                unparsed += 1
+                continue
+            event = parser(
+                _WebsocketMessage(
+                    channel=record.channel, text=record.text, json_data=payload
+                )
+            )
+            if event is None:
+                unparsed += 1
+                continue
+        result = process_event(event)
+        if inspect.isawaitable(result):
+            await result
+        events += 1
+    return ReplayStats(
+        frames=frames,
+        events=events,
+        unparsed=unparsed,
+        seconds=time.perf_counter() - started,
+        rejected=rejected,
+    )
+
+
+def _reject_frame(
+    store: LocalOrderBookStore,
+    record: FrameRecord,
+    payload: object,
+    exc: Exception,
+) -> None:
+    affected = (
+        _asset_ids_from_text(record.text)
+        if payload is _UNDECODED
+        else _asset_ids_from_payload(payload)
+    )
+    if affected:
+        store.invalidate("parse_failure", affected)
+    emit(
+        logger,
+        logging.WARNING,
+        "ws.replay.local_order_books.parse_failed",
+        "Failed to apply recorded frame to local order book",
+        channel=record.channel,
+        trace_id=current_or_new_trace_id(),
+        error_type=type(exc).__name__,
+        error_detail=str(exc),
+        raw_preview=record.text[:RAW_MESSAGE_PREVIEW_LIMIT],
+    )
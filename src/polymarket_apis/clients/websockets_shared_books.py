@@ -0,0 +1,485 @@
+"""
+Publish local order books to other processes through a memory-mapped file.
+
+One process keeps a ``LocalOrderBookStore`` fed by a market connection and
+attaches a ``SharedOrderBookPublisher``; every write to a token's book is
+copied, top ``depth`` levels per side, into a fixed slot of the mapped file.
+Any number of ``SharedOrderBookReader`` instances in other processes map the
+same file read-only and serve ``best_bid``/``best_ask``/``top_bids``/
+``snapshot`` straight from it, without a socket of their own. Put the file on
+a RAM-backed filesystem such as ``/dev/shm``.
+
+Layout: a header (magic, layout version, depth, capacity, slot size, the
+publisher's generation and the number of allocated slots) followed by
+``capacity`` slots. Each slot starts
+with a sequence number that is odd while the publisher writes it (a seqlock):
+readers copy the fields they need and retry if the sequence was odd or moved.
+Slots are assigned in order of first publication and never reused; an evicted
+token keeps its slot as an empty, invalid book.
+
+A publisher builds its file under a temporary name and renames it over the
+path, so a restart never truncates a file that readers have mapped. It then
+retires the file it replaced, and its own file on close, by zeroing the
+generation. Readers check the generation on every read and map the path again
+when it changes; while no publisher is live every token reads as unknown.
+
+CPython has no memory fences, so the seqlock relies on the CPU keeping stores
+in order as seen from other cores, as x86-64 does.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from ..utilities._internal_log import current_or_new_trace_id, emit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .websockets_client import LocalOrderBookStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARED_BOOK_CAPACITY = 4096
+DEFAULT_SHARED_BOOK_READ_ATTEMPTS = 10_000
+
+_MAGIC = b"PMBOOKS\0"
+_LAYOUT_VERSION = 2
+_TOKEN_ID_BYTES = 96
+# magic, layout version, depth, capacity, slot size, generation, allocated slots
+_HEADER = struct.Struct("<8sIIIIQQ")
+_GENERATION_OFFSET = _HEADER.size - 16
+_ALLOCATED_OFFSET = _HEADER.size - 8
+_GENERATION = struct.Struct("<Q")
+_RETIRED = 0
+_SEQUENCE = struct.Struct("<Q")
+_TOKEN_ID = struct.Struct(f"<{_TOKEN_ID_BYTES}s")
+# valid, bid count, ask count, tick size, last trade price, published at (ns)
+_BOOK = struct.Struct("<IIIddq")
+_BOOK_OFFSET = _SEQUENCE.size + _TOKEN_ID.size
+_LEVELS_OFFSET = _BOOK_OFFSET + _BOOK.size
+_PRICE = struct.Struct("<d")
+_COUNT = struct.Struct("<I")
+_ALLOCATED = struct.Struct("<Q")
+
+
+@dataclass(frozen=True, slots=True)
+class SharedOrderBookSnapshot:
+    token_id: str
+    top_bids: tuple[tuple[float, float], ...]
+    top_asks: tuple[tuple[float, float], ...]
+    tick_size: float | None
+    last_trade_price: float | None
+    valid: bool
+    published_at: datetime | None
+    sequence: int
+
+    @property
+    def best_bid(self) -> float | None:
+        return self.top_bids[0][0] if self.top_bids else None
+
+    @property
+    def best_ask(self) -> float | None:
+        return self.top_asks[0][0] if self.top_asks else None
+
+
+def _slot_size(depth: int) -> int:
+    size = _LEVELS_OFFSET + 2 * 2 * depth * 8
+    # Keep every slot 64-byte aligned so one slot never shares a cache line
+    # with the next.
+    return -(-size // 64) * 64
+
+
+def _optional(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _from_optional(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _retire(fd: int) -> None:
+    """Zero the generation of the shared book file open as ``fd``, if it is one."""
+    if os.fstat(fd).st_size < _HEADER.size:
+        return
+    with mmap.mmap(fd, _HEADER.size) as header:
+        magic, version = _HEADER.unpack_from(header, 0)[:2]
+        if magic == _MAGIC and version == _LAYOUT_VERSION:
+            _GENERATION.pack_into(header, _GENERATION_OFFSET, _RETIRED)
+
+
+def _pairs(values: tuple[float, ...], count: int) -> tuple[tuple[float, float], ...]:
+    return tuple(zip(values[0 : 2 * count : 2], values[1 : 2 * count : 2], strict=True))
+
+
+class SharedOrderBookPublisher:
+    """
+    Mirror a ``LocalOrderBookStore`` into a memory-mapped file at ``path``.
+
+    The file is sized for ``capacity`` tokens at the store's ``depth`` and
+    replaces any file already at ``path``, which is retired. Publishing runs inside the store's write lock, right
+    after each write, so readers see books in the same order the store applied
+    them; writes that leave the top levels, validity, tick size and last trade
+    price unchanged are skipped. Tokens beyond ``capacity`` are not published;
+    a warning is logged the first time that happens.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        store: LocalOrderBookStore,
+        *,
+        capacity: int = DEFAULT_SHARED_BOOK_CAPACITY,
+    ) -> None:
+        if capacity < 1:
+            msg = "capacity must be at least 1"
+            raise ValueError(msg)
+        self.path = os.fspath(path)
+        self.store = store
+        self.depth = store.depth
+        self.capacity = capacity
+        self._slot_size = _slot_size(self.depth)
+        self._body = struct.Struct(f"{_BOOK.format}{4 * self.depth}d")
+        self._zeros = (0.0,) * (2 * self.depth)
+        self.generation = int.from_bytes(os.urandom(8), "little") | 1
+        size = _HEADER.size + capacity * self._slot_size
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temporary, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        _HEADER.pack_into(
+            self._map,
+            0,
+            _MAGIC,
+            _LAYOUT_VERSION,
+            self.depth,
+            capacity,
+            self._slot_size,
+            self.generation,
+            0,
+        )
+        # Open the file being replaced first: once renamed over, the path
+        # names the new one.
+        try:
+            replaced: int | None = os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            replaced = None
+        try:
+            Path(temporary).replace(self.path)
+            if replaced is not None:
+                _retire(replaced)
+        finally:
+            if replaced is not None:
+                os.close(replaced)
+        self._slot_by_token: dict[str, int] = {}
+        self._sequences: list[int] = []
+        self._published: list[tuple[object, ...] | None] = []
+        self._full_warned = False
+        self._closed = False
+        self._publish_count = 0
+        store.add_write_listener(self.publish)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def token_count(self) -> int:
+        return len(self._slot_by_token)
+
+    @property
+    def publish_count(self) -> int:
+        return self._publish_count
+
+    def publish(self, token_id: str) -> None:
+        """Copy the store's current top levels for ``token_id`` into its slot."""
+        if self._closed:
+            return
+        slot = self._slot_by_token.get(token_id)
+        if slot is None:
+            slot = self._allocate(token_id)
+            if slot is None:
+                return
+        store = self.store
+        top_bids = store.top_bids(token_id)
+        top_asks = store.top_asks(token_id)
+        state = (
+            top_bids,
+            top_asks,
+            store.is_valid(token_id),
+            store.tick_size(token_id),
+            store.last_trade_price(token_id),
+        )
+        if state == self._published[slot]:
+            # Most deltas land outside the top levels and change nothing here.
+            return
+        values = [value for level in top_bids for value in level]
+        values.extend(self._zeros[len(values) :])
+        values.extend(value for level in top_asks for value in level)
+        values.extend(self._zeros[len(values) - 2 * self.depth :])
+        offset = _HEADER.size + slot * self._slot_size
+        buffer = self._map
+        sequence = self._sequences[slot] + 1
+        _SEQUENCE.pack_into(buffer, offset, sequence)
+        self._body.pack_into(
+            buffer,
+            offset + _BOOK_OFFSET,
+            state[2],
+            len(top_bids),
+            len(top_asks),
+            _optional(state[3]),
+            _optional(state[4]),
+            time.time_ns(),
+            *values,
+        )
+        sequence += 1
+        _SEQUENCE.pack_into(buffer, offset, sequence)
+        self._sequences[slot] = sequence
+        self._published[slot] = state
+        self._publish_count += 1
+
+    def _allocate(self, token_id: str) -> int | None:
+        encoded = token_id.encode("utf-8")
+        if len(self._slot_by_token) >= self.capacity or len(encoded) > _TOKEN_ID_BYTES:
+            if not self._full_warned:
+                self._full_warned = True
+                emit(
+                    logger,
+                    logging.WARNING,
+                    "ws.shared_books.not_published",
+                    "Order book not published to shared memory",
+                    trace_id=current_or_new_trace_id(),
+                    path=self.path,
+                    capacity=self.capacity,
+                    token_id=token_id,
+                )
+            return None
+        slot = len(self._slot_by_token)
+        offset = _HEADER.size + slot * self._slot_size
+        _TOKEN_ID.pack_into(self._map, offset + _SEQUENCE.size, encoded)
+        self._slot_by_token[token_id] = slot
+        self._sequences.append(0)
+        self._published.append(None)
+        # Readers discover the slot once the count covers it.
+        _ALLOCATED.pack_into(self._map, _ALLOCATED_OFFSET, slot + 1)
+        return slot
+
+    def close(self, *, unlink: bool = True) -> None:
+        """Stop publishing, unmap the file and, by default, delete it."""
+        if self._closed:
+            return
+        self._closed = True
+        self.store.remove_write_listener(self.publish)
+        _GENERATION.pack_into(self._map, _GENERATION_OFFSET, _RETIRED)
+        self._map.close()
+        if unlink:
+            Path(self.path).unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class SharedOrderBookReader:
+    """
+    Read books published by a ``SharedOrderBookPublisher`` at ``path``.
+
+    The file is mapped read-only and every accessor reads the token's slot in
+    place; only the values returned are copied out. When a publisher restarts
+    on the same path the reader maps the new file on its next read. A read
+    that keeps colliding with the publisher (or finds a slot left mid-write by
+    a crashed publisher) raises ``TimeoutError`` after ``read_attempts`` tries.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        read_attempts: int = DEFAULT_SHARED_BOOK_READ_ATTEMPTS,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.read_attempts = read_attempts
+        self._map: mmap.mmap | None = None
+        self._attach()
+
+    @property
+    def token_ids(self) -> tuple[str, ...]:
+        if self._live_map() is None:
+            return ()
+        self._refresh_directory()
+        return tuple(self._slot_by_token)
+
+    def sequence(self, token_id: str) -> int:
+        """Even number that changes whenever the token's book is republished; 0 if unknown."""
+        read = self._read(token_id, lambda _buffer, _offset: None)
+        return 0 if read is None else read[0]
+
+    def is_valid(self, token_id: str) -> bool:
+        read = self._read(
+            token_id,
+            lambda buffer, offset: _COUNT.unpack_from(buffer, offset + _BOOK_OFFSET),
+        )
+        return read is not None and bool(read[1][0])
+
+    def best_bid(self, token_id: str) -> float | None:
+        return self._best(token_id, 0)
+
+    def best_ask(self, token_id: str) -> float | None:
+        return self._best(token_id, 1)
+
+    def top_bids(self, token_id: str) -> tuple[tuple[float, float], ...]:
+        return self.snapshot(token_id).top_bids
+
+    def top_asks(self, token_id: str) -> tuple[tuple[float, float], ...]:
+        return self.snapshot(token_id).top_asks
+
+    def snapshot(self, token_id: str) -> SharedOrderBookSnapshot:
+        def read(
+            buffer: mmap.mmap, offset: int
+        ) -> tuple[tuple[Any, ...], tuple[float, ...], tuple[float, ...]]:
+            levels = self._levels
+            levels_offset = offset + _LEVELS_OFFSET
+            return (
+                _BOOK.unpack_from(buffer, offset + _BOOK_OFFSET),
+                levels.unpack_from(buffer, levels_offset),
+                levels.unpack_from(buffer, levels_offset + levels.size),
+            )
+
+        result = self._read(token_id, read)
+        if result is None:
+            return SharedOrderBookSnapshot(token_id, (), (), None, None, False, None, 0)
+        sequence, (book, bid_values, ask_values) = result
+        valid, bid_count, ask_count, tick_size, last_trade_price, published_ns = book
+        return SharedOrderBookSnapshot(
+            token_id=token_id,
+            top_bids=_pairs(bid_values, bid_count),
+            top_asks=_pairs(ask_values, ask_count),
+            tick_size=_from_optional(tick_size),
+            last_trade_price=_from_optional(last_trade_price),
+            valid=bool(valid),
+            published_at=(
+                datetime.fromtimestamp(published_ns / 1e9, UTC)
+                if published_ns
+                else None
+            ),
+            sequence=sequence,
+        )
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _best(self, token_id: str, side: int) -> float | None:
+        count_offset = _BOOK_OFFSET + _COUNT.size * (1 + side)
+
+        def read(buffer: mmap.mmap, offset: int) -> float | None:
+            if not _COUNT.unpack_from(buffer, offset + count_offset)[0]:
+                return None
+            price: float = _PRICE.unpack_from(
+                buffer, offset + _LEVELS_OFFSET + side * self._levels.size
+            )[0]
+            return price
+
+        result = self._read(token_id, read)
+        return None if result is None else result[1]
+
+    def _read[T](
+        self, token_id: str, read: Callable[[mmap.mmap, int], T]
+    ) -> tuple[int, T] | None:
+        """Return the slot's sequence and ``read``'s result, or None if the token is unknown."""
+        for _ in range(self.read_attempts):
+            buffer = self._live_map()
+            if buffer is None:
+                return None
+            slot = self._slot(token_id)
+            if slot is None:
+                return None
+            offset, encoded = slot
+            (before,) = _SEQUENCE.unpack_from(buffer, offset)
+            if before & 1:
+                # The publisher is mid-write; give it the CPU.
+                time.sleep(0)
+                continue
+            value = read(buffer, offset)
+            if buffer[offset + _SEQUENCE.size : offset + _BOOK_OFFSET] != encoded:
+                # The slot belongs to another token; rebuild the directory.
+                self._slot_by_token.clear()
+                continue
+            (after,) = _SEQUENCE.unpack_from(buffer, offset)
+            if after == before:
+                return before, value
+        msg = f"Could not read a consistent order book from {self.path}"
+        raise TimeoutError(msg)
+
+    def _attach(self) -> None:
+        with Path(self.path).open("rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(buffer, 0) if len(buffer) >= _HEADER.size else None
+        if header is None or header[0] != _MAGIC or header[1] != _LAYOUT_VERSION:
+            buffer.close()
+            msg = f"{self.path} is not a shared order book file (layout {_LAYOUT_VERSION})"
+            raise ValueError(msg)
+        _, _, depth, capacity, slot_size, generation, _ = header
+        self.close()
+        self._map = buffer
+        self._generation: int = generation
+        self.depth: int = depth
+        self.capacity: int = capacity
+        self._slot_size: int = slot_size
+        self._levels = struct.Struct(f"<{2 * depth}d")
+        self._slot_by_token: dict[str, tuple[int, bytes]] = {}
+
+    def _live_map(self) -> mmap.mmap | None:
+        """The mapped file if its publisher is live, after following a restart."""
+        buffer = self._map
+        if (
+            buffer is not None
+            and self._generation != _RETIRED
+            and _GENERATION.unpack_from(buffer, _GENERATION_OFFSET)[0]
+            == self._generation
+        ):
+            return buffer
+        try:
+            self._attach()
+        except (OSError, ValueError):
+            return None
+        return self._map if self._generation != _RETIRED else None
+
+    def _slot(self, token_id: str) -> tuple[int, bytes] | None:
+        slot = self._slot_by_token.get(token_id)
+        if slot is None:
+            self._refresh_directory()
+            slot = self._slot_by_token.get(token_id)
+        return slot
+
+    def _refresh_directory(self) -> None:
+        buffer = self._map
+        if buffer is None:
+            return
+        slots = self._slot_by_token
+        (allocated,) = _ALLOCATED.unpack_from(buffer, _ALLOCATED_OFFSET)
+        for slot in range(len(slots), min(allocated, self.capacity)):
+            offset = _HEADER.size + slot * self._slot_size
+            (raw,) = _TOKEN_ID.unpack_from(buffer, offset + _SEQUENCE.size)
+            slots[raw.rstrip(b"\0").decode("utf-8")] = (offset, raw)
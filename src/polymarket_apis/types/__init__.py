@@ -77,6 +77,17 @@ if TYPE_CHECKING:
         Tag,
     )
     from .web3_types import DepositWalletCall
+    from .websockets_lazy import LazyEvent
+    from .websockets_structs import (
+        BestBidAskEventStruct,
+        LastTradePriceEventStruct,
+        MarketEventStruct,
+        OrderBookSummaryEventStruct,
+        OrderSummaryStruct,
+        PriceChangeEventStruct,
+        PriceChangeStruct,
+        TickSizeChangeEventStruct,
+    )
     from .websockets_types import (
         ActivityOrderMatchEvent,
         ActivityTradeEvent,
@@ -114,6 +125,7 @@ __all__ = [
     "AssetPriceUpdateEvent",
     "AssetType",
     "BestBidAskEvent",
+    "BestBidAskEventStruct",
     "BidAsk",
     "BookParams",
     "ClobMarket",
@@ -135,6 +147,9 @@ __all__ = [
     "HolderResponse",
     "Keccak256",
     "LastTradePriceEvent",
+    "LastTradePriceEventStruct",
+    "LazyEvent",
+    "MarketEventStruct",
     "MarketEvents",
     "MarketIDs",
     "MarketOrderArgs",
@@ -146,9 +161,11 @@ __all__ = [
     "OrderArgs",
     "OrderBookSummary",
     "OrderBookSummaryEvent",
+    "OrderBookSummaryEventStruct",
     "OrderCancelResponse",
     "OrderEvent",
     "OrderPostResponse",
+    "OrderSummaryStruct",
     "OrderType",
     "PaginatedResponse",
     "Pagination",
@@ -159,6 +176,8 @@ __all__ = [
     "Price",
     "PriceChange",
     "PriceChangeEvent",
+    "PriceChangeEventStruct",
+    "PriceChangeStruct",
     "PriceChanges",
     "PriceHistory",
     "ReactionEvent",
@@ -174,6 +193,7 @@ __all__ = [
     "Tag",
     "TickSize",
     "TickSizeChangeEvent",
+    "TickSizeChangeEventStruct",
     "TimeseriesPoint",
     "Token",
     "TokenBidAsk",
@@ -272,6 +292,15 @@ _EXPORT_MAP = {
     "UserMetric": ".data_types",
     "UserRank": ".data_types",
     "ValueResponse": ".data_types",
+    "LazyEvent": ".websockets_lazy",
+    "BestBidAskEventStruct": ".websockets_structs",
+    "LastTradePriceEventStruct": ".websockets_structs",
+    "MarketEventStruct": ".websockets_structs",
+    "OrderBookSummaryEventStruct": ".websockets_structs",
+    "OrderSummaryStruct": ".websockets_structs",
+    "PriceChangeEventStruct": ".websockets_structs",
+    "PriceChangeStruct": ".websockets_structs",
+    "TickSizeChangeEventStruct": ".websockets_structs",
 }
 
 
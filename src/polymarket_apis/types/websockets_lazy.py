@@ -0,0 +1,230 @@
+"""
+Lazily validated websocket events for ``message_mode="lazy"``.
+
+A ``LazyEvent`` wraps the decoded payload of one event together with the
+pydantic model it would have been parsed into. Fields that need nothing but a
+type conversion (plain strings, floats, ints, literals and lists of them, with
+no validators) are read straight from the payload, and lists of nested models
+come back as lazy views of their own. Any other field, such as a timestamp or a
+hash-checked condition id, validates the whole event on first access, as does
+``model()``; from then on every attribute is read from the validated model.
+"""
+
+from __future__ import annotations
+
+import types
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel
+
+if TYPE_CHECKING:
+    from pydantic.fields import FieldInfo
+
+_FALLBACK = object()
+
+type _Reader = Callable[[dict[str, Any]], Any]
+
+
+class LazyEvent[T: BaseModel]:
+    """
+    Attribute view over a decoded payload that validates into ``model_class`` on demand.
+
+    Build views with ``lazy_event``, which picks a subclass with one property
+    per model field.
+    """
+
+    __slots__ = ("_model", "_nested", "model_class", "raw")
+
+    def __init__(self, model_class: type[T], raw: dict[str, Any]) -> None:
+        self.model_class = model_class
+        self.raw = raw
+        self._model: T | None = None
+        # Views built for nested model lists, so repeated reads keep their state.
+        self._nested: dict[str, Any] | None = None
+
+    @property
+    def validated(self) -> bool:
+        return self._model is not None
+
+    def model(self) -> T:
+        """Validate the payload once; raises ``pydantic.ValidationError`` if it is invalid."""
+        if self._model is None:
+            self._model = self.model_class.model_validate(self.raw)
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not fields, e.g. ``model_dump``.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.model(), name)
+
+    def __repr__(self) -> str:
+        state = "validated" if self._model is not None else "unvalidated"
+        return f"LazyEvent[{self.model_class.__name__}]({state}, {self.raw!r})"
+
+
+_VIEW_CLASSES: dict[type[BaseModel], type[LazyEvent[Any]]] = {}
+
+
+def lazy_event[T: BaseModel](model_class: type[T], raw: dict[str, Any]) -> LazyEvent[T]:
+    view_class = _VIEW_CLASSES.get(model_class)
+    if view_class is None:
+        view_class = _VIEW_CLASSES[model_class] = _view_class(model_class)
+    return view_class(model_class, raw)
+
+
+def _view_class(model_class: type[BaseModel]) -> type[LazyEvent[Any]]:
+    decorators = model_class.__pydantic_decorators__
+    validated_fields = {
+        name
+        for decorator in decorators.field_validators.values()
+        for name in decorator.info.fields
+    }
+    namespace: dict[str, Any] = {"__slots__": ()}
+    for name, field in model_class.model_fields.items():
+        convert = (
+            _converter(field.annotation)
+            if not decorators.model_validators
+            and name not in validated_fields
+            and not field.metadata
+            else None
+        )
+        if convert is None:
+            namespace[name] = _validated_property(name)
+            continue
+        reader = _reader(_payload_keys(name, field), field, convert)
+        nested = get_origin(field.annotation) is list and (
+            _nested_model(field.annotation) is not None
+        )
+        namespace[name] = _read_property(name, reader, keep=nested)
+    return type(f"Lazy{model_class.__name__}", (LazyEvent,), namespace)
+
+
+def _validated_property(name: str) -> property:
+    def get(self: LazyEvent[Any]) -> Any:
+        return getattr(self.model(), name)
+
+    return property(get)
+
+
+def _read_property(name: str, reader: _Reader, *, keep: bool) -> property:
+    def get(self: LazyEvent[Any]) -> Any:
+        if self._model is None:
+            value = reader(self.raw)
+            if value is not _FALLBACK:
+                return value
+        return getattr(self.model(), name)
+
+    def get_kept(self: LazyEvent[Any]) -> Any:
+        if self._model is None:
+            nested = self._nested
+            if nested is not None and name in nested:
+                return nested[name]
+            value = reader(self.raw)
+            if value is not _FALLBACK:
+                if nested is None:
+                    nested = self._nested = {}
+                nested[name] = value
+                return value
+        return getattr(self.model(), name)
+
+    return property(get_kept if keep else get)
+
+
+def _payload_keys(name: str, field: FieldInfo) -> tuple[str, ...]:
+    alias = field.validation_alias
+    if isinstance(alias, AliasChoices):
+        return tuple(choice for choice in alias.choices if isinstance(choice, str))
+    if isinstance(alias, str):
+        return (alias,)
+    return (field.alias or name,)
+
+
+def _reader(
+    keys: tuple[str, ...], field: FieldInfo, convert: Callable[[Any], Any]
+) -> _Reader:
+    required = field.is_required()
+
+    def read(raw: dict[str, Any]) -> Any:
+        for key in keys:
+            if key in raw:
+                return convert(raw[key])
+        return _FALLBACK if required else field.get_default(call_default_factory=True)
+
+    return read
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    (item,) = get_args(annotation)
+    return item if isinstance(item, type) and issubclass(item, BaseModel) else None
+
+
+def _convert_str(value: Any) -> Any:
+    return value if isinstance(value, str) else _FALLBACK
+
+
+def _convert_float(value: Any) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return _FALLBACK
+    try:
+        return float(value)
+    except ValueError:
+        return _FALLBACK
+
+
+def _convert_int(value: Any) -> Any:
+    return (
+        value if isinstance(value, int) and not isinstance(value, bool) else _FALLBACK
+    )
+
+
+def _lazy_list(value: Any, model_class: type[BaseModel]) -> Any:
+    if not isinstance(value, list):
+        return _FALLBACK
+    views: list[LazyEvent[Any]] = []
+    for entry in value:
+        if not isinstance(entry, dict):
+            return _FALLBACK
+        views.append(lazy_event(model_class, entry))
+    return views
+
+
+def _convert_list(value: Any, convert_item: Callable[[Any], Any]) -> Any:
+    if not isinstance(value, list):
+        return _FALLBACK
+    items = [convert_item(item) for item in value]
+    return _FALLBACK if any(item is _FALLBACK for item in items) else items
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Return a cheap conversion for ``annotation``, or ``None`` if it needs the model."""
+    if annotation is str:
+        return _convert_str
+    if annotation is float:
+        return _convert_float
+    if annotation is int:
+        return _convert_int
+    origin = get_origin(annotation)
+    if origin is Literal:
+        allowed = frozenset(get_args(annotation))
+        return lambda value: (
+            value if isinstance(value, (str, int)) and value in allowed else _FALLBACK
+        )
+    if origin is list:
+        nested_model = _nested_model(annotation)
+        if nested_model is not None:
+            return lambda value: _lazy_list(value, nested_model)
+        convert_item = _converter(get_args(annotation)[0])
+        if convert_item is None:
+            return None
+        return lambda value: _convert_list(value, convert_item)
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1 or len(members) == len(get_args(annotation)):
+            return None
+        inner = _converter(members[0])
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    return None
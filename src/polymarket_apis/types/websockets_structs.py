@@ -0,0 +1,237 @@
+"""
+Lightweight market-channel events for ``message_mode="struct"``.
+
+Each struct is a ``NamedTuple`` with the field names of its pydantic
+counterpart in ``websockets_types`` (``PriceChangeEventStruct`` mirrors
+``PriceChangeEvent`` and so on), built by ``decode_market_struct`` straight
+from the decoded JSON. Prices and sizes become floats and timestamps UTC
+datetimes, but nothing else is checked: hashes, condition ids and sides are
+passed through as received.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, Literal, NamedTuple
+
+# Same cut-off pydantic uses to tell Unix seconds from milliseconds.
+_MAX_UNIX_SECONDS = 20_000_000_000
+
+
+class OrderSummaryStruct(NamedTuple):
+    price: float
+    size: float
+
+
+class PriceChangeStruct(NamedTuple):
+    best_ask: float
+    best_bid: float
+    price: float
+    size: float
+    side: Literal["BUY", "SELL"]
+    token_id: str
+    hash: str
+
+
+class PriceChangeEventStruct(NamedTuple):
+    condition_id: str
+    price_changes: list[PriceChangeStruct]
+    timestamp: datetime
+    event_type: Literal["price_change"]
+
+
+class OrderBookSummaryEventStruct(NamedTuple):
+    condition_id: str
+    token_id: str
+    timestamp: datetime
+    hash: str
+    bids: list[OrderSummaryStruct]
+    asks: list[OrderSummaryStruct]
+    tick_size: str | None
+    last_trade_price: float | None
+    min_order_size: float | None
+    neg_risk: bool | None
+    event_type: Literal["book"]
+
+
+class TickSizeChangeEventStruct(NamedTuple):
+    token_id: str
+    condition_id: str
+    old_tick_size: str
+    new_tick_size: str
+    timestamp: datetime
+    event_type: Literal["tick_size_change"]
+
+
+class LastTradePriceEventStruct(NamedTuple):
+    price: float
+    size: float
+    side: Literal["BUY", "SELL"]
+    token_id: str
+    condition_id: str
+    fee_rate_bps: float
+    transaction_hash: str | None
+    timestamp: datetime
+    event_type: Literal["last_trade_price"]
+
+
+class BestBidAskEventStruct(NamedTuple):
+    condition_id: str
+    token_id: str
+    best_bid: float
+    best_ask: float
+    spread: float
+    timestamp: datetime
+    event_type: Literal["best_bid_ask"]
+
+
+type MarketEventStruct = (
+    OrderBookSummaryEventStruct
+    | PriceChangeEventStruct
+    | TickSizeChangeEventStruct
+    | LastTradePriceEventStruct
+    | BestBidAskEventStruct
+)
+
+
+def _timestamp(value: Any) -> datetime:
+    number = int(value)
+    if abs(number) > _MAX_UNIX_SECONDS:
+        return datetime.fromtimestamp(number / 1000, UTC)
+    return datetime.fromtimestamp(number, UTC)
+
+
+def _optional_float(value: Any) -> float | None:
+    return None if value is None or value == "" else float(value)
+
+
+def _levels(levels: list[dict[str, Any]]) -> list[OrderSummaryStruct]:
+    return [
+        OrderSummaryStruct(float(level["price"]), float(level["size"]))
+        for level in levels
+    ]
+
+
+def _book(payload: dict[str, Any]) -> OrderBookSummaryEventStruct:
+    return OrderBookSummaryEventStruct(
+        payload["market"],
+        payload["asset_id"],
+        _timestamp(payload["timestamp"]),
+        payload["hash"],
+        _levels(payload["bids"]),
+        _levels(payload["asks"]),
+        payload.get("tick_size"),
+        _optional_float(payload.get("last_trade_price")),
+        _optional_float(payload.get("min_order_size")),
+        payload.get("neg_risk"),
+        "book",
+    )
+
+
+def _price_change(change: dict[str, Any]) -> PriceChangeStruct:
+    if "asset_id" in change:
+        return PriceChangeStruct(
+            float(change["best_ask"]),
+            float(change["best_bid"]),
+            float(change["price"]),
+            float(change["size"]),
+            change["side"],
+            change["asset_id"],
+            change["hash"],
+        )
+    return PriceChangeStruct(
+        float(change["ba"]),
+        float(change["bb"]),
+        float(change["p"]),
+        float(change["s"]),
+        change["si"],
+        change["a"],
+        change["h"],
+    )
+
+
+def _price_changes(payload: dict[str, Any]) -> PriceChangeEventStruct:
+    if "price_changes" in payload:
+        market, changes, timestamp = (
+            payload["market"],
+            payload["price_changes"],
+            payload["timestamp"],
+        )
+    else:
+        market, changes, timestamp = payload["m"], payload["pc"], payload["t"]
+    return PriceChangeEventStruct(
+        market,
+        [_price_change(change) for change in changes],
+        _timestamp(timestamp),
+        "price_change",
+    )
+
+
+def _tick_size_change(payload: dict[str, Any]) -> TickSizeChangeEventStruct:
+    return TickSizeChangeEventStruct(
+        payload["asset_id"],
+        payload["market"],
+        payload["old_tick_size"],
+        payload["new_tick_size"],
+        _timestamp(payload["timestamp"]),
+        "tick_size_change",
+    )
+
+
+def _last_trade_price(payload: dict[str, Any]) -> LastTradePriceEventStruct:
+    return LastTradePriceEventStruct(
+        float(payload["price"]),
+        float(payload["size"]),
+        payload["side"],
+        payload["asset_id"],
+        payload["market"],
+        float(payload["fee_rate_bps"]),
+        payload.get("transaction_hash"),
+        _timestamp(payload["timestamp"]),
+        "last_trade_price",
+    )
+
+
+def _best_bid_ask(payload: dict[str, Any]) -> BestBidAskEventStruct:
+    return BestBidAskEventStruct(
+        payload["market"],
+        payload["asset_id"],
+        float(payload["best_bid"]),
+        float(payload["best_ask"]),
+        float(payload["spread"]),
+        _timestamp(payload["timestamp"]),
+        "best_bid_ask",
+    )
+
+
+_DECODERS: dict[str, Callable[[dict[str, Any]], MarketEventStruct]] = {
+    "book": _book,
+    "price_change": _price_changes,
+    "tick_size_change": _tick_size_change,
+    "last_trade_price": _last_trade_price,
+    "best_bid_ask": _best_bid_ask,
+}
+
+
+def decode_market_struct(
+    payload: object,
+) -> MarketEventStruct | list[OrderBookSummaryEventStruct] | None:
+    """
+    Build a struct from a decoded market frame without validating it.
+
+    A list is treated as the initial batch of ``book`` snapshots. Returns
+    ``None`` for event types without a struct (``new_market``,
+    ``market_resolved``); malformed frames raise ``KeyError``, ``TypeError``
+    or ``ValueError``.
+    """
+    if isinstance(payload, list):
+        return [_book(item) for item in payload]
+    if not isinstance(payload, dict):
+        msg = (
+            f"market payload must be an object or a list, got {type(payload).__name__}"
+        )
+        raise TypeError(msg)
+    event_type = payload.get("event_type")
+    decoder = _DECODERS.get(event_type) if isinstance(event_type, str) else None
+    return None if decoder is None else decoder(payload)
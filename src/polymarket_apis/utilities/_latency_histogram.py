@@ -0,0 +1,121 @@
+"""
+Rolling latency histograms for websocket connection health.
+
+Durations are counted in fixed log-spaced buckets (four per doubling, from 1 us
+to about two minutes), so recording is a bisect and three additions and a
+snapshot costs the same however many samples it covers. Quantiles are read
+from bucket upper bounds and are therefore accurate to within about 19%.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+
+# Upper bound of each bucket in nanoseconds; one more bucket catches the rest.
+BUCKET_BOUNDS_NS: tuple[int, ...] = tuple(
+    round(1_000 * 2 ** (step / 4)) for step in range(108)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyHistogram:
+    """Snapshot of one rolling latency histogram; durations are reported in seconds."""
+
+    count: int
+    total_ns: int
+    max_ns: int
+    bucket_counts: tuple[int, ...]
+
+    @property
+    def mean_seconds(self) -> float | None:
+        return self.total_ns / self.count / 1e9 if self.count else None
+
+    @property
+    def max_seconds(self) -> float | None:
+        return self.max_ns / 1e9 if self.count else None
+
+    @property
+    def p50_seconds(self) -> float | None:
+        return self.quantile_seconds(0.5)
+
+    @property
+    def p90_seconds(self) -> float | None:
+        return self.quantile_seconds(0.9)
+
+    @property
+    def p99_seconds(self) -> float | None:
+        return self.quantile_seconds(0.99)
+
+    def quantile_seconds(self, quantile: float) -> float | None:
+        """Upper bound of the bucket holding ``quantile``, capped at the largest sample."""
+        if not self.count:
+            return None
+        rank = max(1, round(quantile * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = (
+                    BUCKET_BOUNDS_NS[index]
+                    if index < len(BUCKET_BOUNDS_NS)
+                    else self.max_ns
+                )
+                return min(bound, self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+
+class _Window:
+    __slots__ = ("count", "counts", "max_ns", "total_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+class RollingLatencyHistogram:
+    """
+    Latency histogram over the last one to two windows of ``window_ns``.
+
+    Samples go into the current window; when it is ``window_ns`` old it becomes
+    the previous window and the one before is discarded. Snapshots merge both.
+    """
+
+    __slots__ = ("_current", "_previous", "_started_ns", "window_ns")
+
+    def __init__(self, window_ns: int, now_ns: int) -> None:
+        self.window_ns = window_ns
+        self._current = _Window()
+        self._previous = _Window()
+        self._started_ns = now_ns
+
+    def record(self, duration_ns: int, now_ns: int) -> None:
+        if now_ns - self._started_ns >= self.window_ns:
+            self._rotate(now_ns)
+        duration_ns = max(duration_ns, 0)
+        window = self._current
+        window.counts[bisect_left(BUCKET_BOUNDS_NS, duration_ns)] += 1
+        window.count += 1
+        window.total_ns += duration_ns
+        window.max_ns = max(window.max_ns, duration_ns)
+
+    def snapshot(self, now_ns: int) -> LatencyHistogram:
+        if now_ns - self._started_ns >= self.window_ns:
+            self._rotate(now_ns)
+        current, previous = self._current, self._previous
+        return LatencyHistogram(
+            count=current.count + previous.count,
+            total_ns=current.total_ns + previous.total_ns,
+            max_ns=max(current.max_ns, previous.max_ns),
+            bucket_counts=tuple(
+                a + b for a, b in zip(current.counts, previous.counts, strict=True)
+            ),
+        )
+
+    def _rotate(self, now_ns: int) -> None:
+        stale = now_ns - self._started_ns >= 2 * self.window_ns
+        self._previous = _Window() if stale else self._current
+        self._current = _Window()
+        self._started_ns = now_ns
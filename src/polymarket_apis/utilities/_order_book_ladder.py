@@ -0,0 +1,373 @@
+"""
+Price-ladder storage engines for the local websocket order book.
+
+Each ladder holds one side of one token's book. ``SortedPriceLadder`` keeps
+levels so that the best price is always at the *end* of a sorted key array,
+which keeps the hot operations (touching the top of book, removing crossed
+levels) at the cheap end of a Python list. ``TickPriceLadder`` instead stores
+sizes in a preallocated array indexed by tick, sized from the token's tick size.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator, Mapping
+from functools import cache
+from typing import Literal
+
+LadderSide = Literal["BUY", "SELL"]
+
+# Valid CLOB tick sizes, coarsest first (see ``TickSize`` in ``clob_types``).
+TICK_SIZES: tuple[float, ...] = (0.1, 0.01, 0.001, 0.0001)
+# Allowed distance from a grid point, in ticks, to absorb float noise.
+_GRID_TOLERANCE = 1e-6
+
+
+class SortedPriceLadder:
+    """
+    One side of a book as a sorted key array plus a ``price -> size`` map.
+
+    Bids are keyed by price and asks by negated price, so for both sides the
+    best level is ``keys[-1]`` and "better than" means "greater key". Lookups
+    are O(1), inserts and deletes are O(log n) searches plus a short tail
+    shift, and crossed-level removal truncates the tail in O(log n + k).
+    """
+
+    __slots__ = ("_keys", "_sign", "_sizes", "side")
+
+    def __init__(
+        self,
+        side: LadderSide,
+        levels: Mapping[float, float] | None = None,
+    ) -> None:
+        self.side: LadderSide = side
+        self._sign = 1.0 if side == "BUY" else -1.0
+        self._sizes: dict[float, float] = {}
+        self._keys: list[float] = []
+        if levels:
+            self._sizes = {price: size for price, size in levels.items() if size != 0}
+            self._keys = sorted(self._sign * price for price in self._sizes)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, price: float) -> bool:
+        return price in self._sizes
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate prices from best to worst."""
+        sign = self._sign
+        return (sign * key for key in reversed(self._keys))
+
+    def get(self, price: float) -> float | None:
+        return self._sizes.get(price)
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at ``price``; a zero size removes the level."""
+        if size == 0:
+            self.remove(price)
+            return
+        if price not in self._sizes:
+            insort(self._keys, self._sign * price)
+        self._sizes[price] = size
+
+    def remove(self, price: float) -> bool:
+        if self._sizes.pop(price, None) is None:
+            return False
+        key = self._sign * price
+        del self._keys[bisect_left(self._keys, key)]
+        return True
+
+    def remove_better_than(self, price: float) -> int:
+        """
+        Drop every level strictly better than ``price``.
+
+        For bids that is every price above ``price``, for asks every price below.
+        Returns the number of removed levels.
+        """
+        keys = self._keys
+        start = bisect_right(keys, self._sign * price)
+        removed = len(keys) - start
+        if not removed:
+            return 0
+        sign = self._sign
+        sizes = self._sizes
+        for key in keys[start:]:
+            del sizes[sign * key]
+        del keys[start:]
+        return removed
+
+    def best(self) -> tuple[float, float] | None:
+        if not self._keys:
+            return None
+        price = self._sign * self._keys[-1]
+        return (price, self._sizes[price])
+
+    def best_price(self) -> float | None:
+        if not self._keys:
+            return None
+        return self._sign * self._keys[-1]
+
+    def top(self, depth: int) -> tuple[tuple[float, float], ...]:
+        """Return up to ``depth`` levels ordered from best to worst."""
+        keys = self._keys
+        sign = self._sign
+        sizes = self._sizes
+        count = min(depth, len(keys))
+        return tuple(
+            (sign * keys[index], sizes[sign * keys[index]])
+            for index in range(len(keys) - 1, len(keys) - 1 - count, -1)
+        )
+
+    def to_dict(self) -> dict[float, float]:
+        return dict(self._sizes)
+
+    def copy(self) -> SortedPriceLadder:
+        """Return an independent ladder; both containers are copied at C speed."""
+        clone = SortedPriceLadder(self.side)
+        clone._sizes = self._sizes.copy()
+        clone._keys = self._keys.copy()
+        return clone
+
+    def items(self) -> list[tuple[float, float]]:
+        """Return every level ordered from worst to best."""
+        sign = self._sign
+        sizes = self._sizes
+        return [(sign * key, sizes[sign * key]) for key in self._keys]
+
+
+@cache
+def _grid_prices(tick_size: float) -> tuple[float, ...]:
+    """Price of every index on the ``[0, 1]`` grid, shared by all ladders."""
+    decimals = TICK_SIZES.index(tick_size) + 1
+    return tuple(
+        round(index * tick_size, decimals) for index in range(round(1 / tick_size) + 1)
+    )
+
+
+def _on_grid(price: float, tick_size: float) -> bool:
+    scaled = price / tick_size
+    return abs(scaled - round(scaled)) <= _GRID_TOLERANCE
+
+
+def _grid_for(tick_size: float | None, prices: list[float]) -> float:
+    """Return the coarsest valid tick, no coarser than ``tick_size``, that fits ``prices``."""
+    ceiling = TICK_SIZES[1] if tick_size is None else tick_size
+    for tick in TICK_SIZES:
+        if tick <= ceiling * (1 + _GRID_TOLERANCE) and all(
+            _on_grid(price, tick) for price in prices
+        ):
+            return tick
+    return TICK_SIZES[-1]
+
+
+class TickPriceLadder:
+    """
+    One side of a book as a preallocated ``array('d')`` of sizes keyed by tick.
+
+    Index ``i`` holds the size resting at ``i * tick_size``, so a token on a
+    0.01 grid costs 101 slots per side regardless of how many levels are live.
+    Writes are O(1); the best index is tracked and only rescanned towards the
+    back of the book when the best level is emptied. A price that is off the
+    current grid re-indexes the ladder onto the next finer valid tick; prices
+    finer than 0.0001 are snapped to the nearest 0.0001.
+    """
+
+    __slots__ = ("_best", "_count", "_prices", "_sizes", "_steps", "side", "tick_size")
+
+    def __init__(
+        self,
+        side: LadderSide,
+        levels: Mapping[float, float] | None = None,
+        *,
+        tick_size: float | None = None,
+    ) -> None:
+        self.side: LadderSide = side
+        live = {price: size for price, size in (levels or {}).items() if size != 0}
+        self._allocate(_grid_for(tick_size, list(live)))
+        self._load(live)
+
+    def _allocate(self, tick_size: float) -> None:
+        self.tick_size = tick_size
+        self._steps = round(1 / tick_size)
+        self._prices = _grid_prices(tick_size)
+        self._sizes = array("d", bytes(8 * len(self._prices)))
+        self._count = 0
+        self._best = -1
+
+    def _load(self, levels: Mapping[float, float]) -> None:
+        """Write levels already known to sit on the current grid."""
+        steps = self._steps
+        for price, size in levels.items():
+            index = round(price * steps)
+            if 0 <= index <= steps:
+                self._write(index, size)
+
+    def _index(self, price: float) -> int:
+        scaled = price * self._steps
+        index = round(scaled)
+        if abs(scaled - index) > _GRID_TOLERANCE:
+            self.retick(_grid_for(self.tick_size, [price]))
+            index = round(price * self._steps)
+        if 0 <= index <= self._steps:
+            return index
+        return 0 if index < 0 else self._steps
+
+    def _write(self, index: int, size: float) -> None:
+        sizes = self._sizes
+        previous = sizes[index]
+        sizes[index] = size
+        if size and not previous:
+            self._count += 1
+            if self._best < 0 or self._is_better(index, self._best):
+                self._best = index
+        elif previous and not size:
+            self._count -= 1
+            if index == self._best:
+                self._best = self._next_live(index)
+
+    def _is_better(self, index: int, other: int) -> bool:
+        return index > other if self.side == "BUY" else index < other
+
+    def _next_live(self, index: int) -> int:
+        """Scan from ``index`` towards the back of the book for a live level."""
+        if not self._count:
+            return -1
+        sizes = self._sizes
+        if self.side == "BUY":
+            for candidate in range(index - 1, -1, -1):
+                if sizes[candidate]:
+                    return candidate
+        else:
+            for candidate in range(index + 1, len(sizes)):
+                if sizes[candidate]:
+                    return candidate
+        return -1
+
+    def _live_indices(self) -> Iterator[int]:
+        """Yield live indices from best to worst."""
+        if self._best < 0:
+            return
+        sizes = self._sizes
+        remaining = self._count
+        step = -1 if self.side == "BUY" else 1
+        index = self._best
+        while remaining:
+            if sizes[index]:
+                remaining -= 1
+                yield index
+            index += step
+
+    def retick(self, tick_size: float) -> None:
+        """Re-index onto ``tick_size``, or a finer grid if live levels need one."""
+        levels = self.to_dict()
+        target = _grid_for(tick_size, list(levels))
+        if target == self.tick_size:
+            return
+        self._allocate(target)
+        self._load(levels)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, price: float) -> bool:
+        return self.get(price) is not None
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate prices from best to worst."""
+        prices = self._prices
+        return (prices[index] for index in self._live_indices())
+
+    def get(self, price: float) -> float | None:
+        scaled = price * self._steps
+        index = round(scaled)
+        if abs(scaled - index) > _GRID_TOLERANCE or not 0 <= index <= self._steps:
+            return None
+        return self._sizes[index] or None
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at ``price``; a zero size removes the level."""
+        self._write(self._index(price), size)
+
+    def remove(self, price: float) -> bool:
+        if self.get(price) is None:
+            return False
+        self._write(round(price * self._steps), 0.0)
+        return True
+
+    def remove_better_than(self, price: float) -> int:
+        """
+        Drop every level strictly better than ``price``.
+
+        For bids that is every price above ``price``, for asks every price below.
+        Returns the number of removed levels.
+        """
+        if self._best < 0:
+            return 0
+        limit = self._index(price)
+        sizes = self._sizes
+        removed = 0
+        if self.side == "BUY":
+            span = range(self._best, limit, -1)
+        else:
+            span = range(self._best, limit)
+        for index in span:
+            if sizes[index]:
+                sizes[index] = 0.0
+                removed += 1
+        if removed:
+            self._count -= removed
+            self._best = limit if sizes[limit] else self._next_live(limit)
+        return removed
+
+    def best(self) -> tuple[float, float] | None:
+        if self._best < 0:
+            return None
+        return (self._prices[self._best], self._sizes[self._best])
+
+    def best_price(self) -> float | None:
+        if self._best < 0:
+            return None
+        return self._prices[self._best]
+
+    def top(self, depth: int) -> tuple[tuple[float, float], ...]:
+        """Return up to ``depth`` levels ordered from best to worst."""
+        index = self._best
+        if index < 0 or depth <= 0:
+            return ()
+        prices = self._prices
+        sizes = self._sizes
+        levels = [(prices[index], sizes[index])]
+        wanted = min(depth, self._count)
+        step = -1 if self.side == "BUY" else 1
+        while len(levels) < wanted:
+            index += step
+            if sizes[index]:
+                levels.append((prices[index], sizes[index]))
+        return tuple(levels)
+
+    def copy(self) -> TickPriceLadder:
+        """Return an independent ladder sharing the immutable price grid."""
+        clone = TickPriceLadder(self.side, tick_size=self.tick_size)
+        clone._sizes = self._sizes[:]
+        clone._count = self._count
+        clone._best = self._best
+        return clone
+
+    def to_dict(self) -> dict[float, float]:
+        prices = self._prices
+        sizes = self._sizes
+        return {prices[index]: sizes[index] for index in self._live_indices()}
+
+    def items(self) -> list[tuple[float, float]]:
+        """Return every level ordered from worst to best."""
+        prices = self._prices
+        sizes = self._sizes
+        return [
+            (prices[index], sizes[index])
+            for index in reversed(list(self._live_indices()))
+        ]
+
+
+type PriceLadder = SortedPriceLadder | TickPriceLadder
@@ -61,6 +61,28 @@ class ServerError(PolymarketHTTPError):
     """5xx — server-side error, safe to retry with backoff."""
 
 
+class BulkRequestError(PolymarketError):
+    """
+    Some chunks of a bulk request still failed after retries.
+
+    ``results`` holds what the other chunks returned, merged as the bulk call
+    would have; ``errors`` holds the last error of each failed chunk.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        results: Any,
+        failed_token_ids: list[str],
+        errors: list[BaseException],
+    ) -> None:
+        super().__init__(message)
+        self.results = results
+        self.failed_token_ids = failed_token_ids
+        self.errors = errors
+
+
 # --- Domain / Trading Errors ---
 class PolymarketDomainError(PolymarketError):
     """Business-logic error raised before an HTTP call is made."""
@@ -0,0 +1,523 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+import pytest
+import respx
+
+from polymarket_apis.clients.clob_client import (
+    AsyncPolymarketClobClient,
+    AsyncPolymarketReadOnlyClobClient,
+    PolymarketClobClient,
+    PolymarketReadOnlyClobClient,
+)
+from polymarket_apis.clients.clob_metadata_cache import (
+    MetadataCacheConfig,
+    SqliteMetadataCache,
+)
+from polymarket_apis.types.clob_types import (
+    ApiCreds,
+    BidAsk,
+    BookParams,
+    OrderArgs,
+    OrderType,
+)
+from polymarket_apis.types.common import EthAddress
+from polymarket_apis.utilities.exceptions import BulkRequestError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from polymarket_apis.clients.clob_metadata_cache import MetadataKind
+
+pytestmark = pytest.mark.contract
+
+PRIVATE_KEY = "0x" + "11" * 32
+ADDRESS = cast("EthAddress", "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A")
+TOKEN_ID = "1234"
+ORDER_ID = "0x" + "ef" * 32
+CREDS = ApiCreds(key="key", secret="c2VjcmV0", passphrase="passphrase")
+BASE_URL = "https://clob.polymarket.com"
+
+POSTED = {
+    "errorMsg": "",
+    "orderID": ORDER_ID,
+    "takingAmount": "",
+    "makingAmount": "",
+    "status": "live",
+    "success": True,
+}
+
+
+def mock_market(router: respx.MockRouter) -> None:
+    router.get(f"{BASE_URL}/tick-size").respond(json={"minimum_tick_size": 0.01})
+    router.get(f"{BASE_URL}/neg-risk").respond(json={"neg_risk": False})
+
+
+@pytest.mark.asyncio
+async def test_async_client_sends_the_same_signed_requests_as_the_sync_client() -> None:
+    order_args = OrderArgs(token_id=TOKEN_ID, price=0.5, size=10, side="BUY")
+    with respx.mock(assert_all_called=True) as router:
+        mock_market(router)
+        post = router.post(f"{BASE_URL}/order").respond(json=POSTED)
+        with PolymarketClobClient(
+            PRIVATE_KEY, ADDRESS, CREDS, signature_type=0
+        ) as client:
+            order = client.create_order(order_args)
+            assert client.post_order(order) is not None
+        async with AsyncPolymarketClobClient(
+            PRIVATE_KEY, ADDRESS, CREDS, signature_type=0
+        ) as async_client:
+            assert await async_client.get_tick_size(TOKEN_ID) == "0.01"
+            response = await async_client.post_order(order)
+
+    assert response is not None
+    assert response.order_id == ORDER_ID
+    assert post.call_count == 2
+    sync_request, async_request = (call.request for call in post.calls)
+    assert sync_request.content == async_request.content
+    assert json.loads(async_request.content)["owner"] == CREDS.key
+    assert {name for name in async_request.headers if name.startswith("poly_")} == {
+        name for name in sync_request.headers if name.startswith("poly_")
+    }
+
+
+@pytest.mark.asyncio
+async def test_post_and_cancel_run_concurrently_on_one_loop() -> None:
+    order_args = OrderArgs(token_id=TOKEN_ID, price=0.5, size=10, side="SELL")
+    cancel_seen = asyncio.Event()
+
+    async def post_order(_request: httpx.Request) -> httpx.Response:
+        # Only completes once the cancel is in flight too.
+        await asyncio.wait_for(cancel_seen.wait(), timeout=5)
+        return httpx.Response(200, json=POSTED)
+
+    def cancel_order(_request: httpx.Request) -> httpx.Response:
+        cancel_seen.set()
+        return httpx.Response(200, json={"canceled": [ORDER_ID], "not_canceled": {}})
+
+    with respx.mock(assert_all_called=True) as router:
+        mock_market(router)
+        create = router.post(f"{BASE_URL}/auth/api-key").respond(
+            json={"apiKey": "key", "secret": "c2VjcmV0", "passphrase": "passphrase"}
+        )
+        router.post(f"{BASE_URL}/heartbeats").respond(json={"status": "ok"})
+        router.post(f"{BASE_URL}/order").mock(side_effect=post_order)
+        router.delete(f"{BASE_URL}/order").mock(side_effect=cancel_order)
+        async with AsyncPolymarketClobClient(
+            PRIVATE_KEY, ADDRESS, signature_type=0
+        ) as client:
+            assert client.creds is None
+            order = await client.create_order(order_args)
+            # The first authenticated request creates the API key.
+            assert await client.send_heartbeat() == "ok"
+            assert client.creds is not None
+            posted, cancelled = await asyncio.gather(
+                client.post_order(order, OrderType.GTC),
+                client.cancel_order(ORDER_ID),
+            )
+
+    assert posted is not None
+    assert posted.success
+    assert cancelled.canceled == [ORDER_ID]
+    assert create.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_authenticated_requests_create_one_api_key() -> None:
+    async def create_api_key(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(
+            200,
+            json={"apiKey": "key", "secret": "c2VjcmV0", "passphrase": "passphrase"},
+        )
+
+    with respx.mock(assert_all_called=True) as router:
+        create = router.post(f"{BASE_URL}/auth/api-key").mock(
+            side_effect=create_api_key
+        )
+        heartbeat = router.post(f"{BASE_URL}/heartbeats").respond(json={"status": "ok"})
+        async with AsyncPolymarketClobClient(
+            PRIVATE_KEY, ADDRESS, signature_type=0
+        ) as client:
+            results = await asyncio.gather(*(client.send_heartbeat() for _ in range(5)))
+            creds = client.creds
+
+    assert results == ["ok"] * 5
+    assert create.call_count == 1
+    assert heartbeat.call_count == 5
+    assert creds is not None
+    assert {call.request.headers["poly_api_key"] for call in heartbeat.calls} == {
+        creds.key
+    }
+
+
+def book(token_id: str) -> dict[str, object]:
+    return {
+        "market": "0x" + "ab" * 32,
+        "asset_id": token_id,
+        "timestamp": "1700000000000",
+        "hash": "0x" + "cd" * 20,
+        "bids": [{"price": "0.48", "size": "10"}],
+        "asks": [{"price": "0.52", "size": "15"}],
+        "tick_size": "0.01",
+        "min_order_size": "5",
+        "neg_risk": False,
+    }
+
+
+def requested_tokens(request: httpx.Request) -> list[str]:
+    return [item["token_id"] for item in json.loads(request.content)]
+
+
+def test_bulk_books_retry_failed_chunks_and_report_the_rest(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    token_ids = [f"t{index}" for index in range(5)]
+    attempts: dict[str, int] = {}
+
+    def books(request: httpx.Request) -> httpx.Response:
+        tokens = requested_tokens(request)
+        attempts[tokens[0]] = attempts.get(tokens[0], 0) + 1
+        if tokens[0] == "t2" and attempts["t2"] == 1:
+            return httpx.Response(503)
+        if "t4" in tokens:
+            return httpx.Response(400, json={"error": "bad token"})
+        return httpx.Response(
+            200, json=[book(token_id) for token_id in reversed(tokens)]
+        )
+
+    client = PolymarketReadOnlyClobClient(max_retries=1, base_retry_delay=0)
+    with respx.mock(assert_all_called=True) as router:
+        router.post(f"{BASE_URL}/books").mock(side_effect=books)
+        with pytest.raises(BulkRequestError) as raised:
+            client.get_order_books_bulk(token_ids, chunk_size=2)
+
+    assert attempts == {"t0": 1, "t2": 2, "t4": 1}
+    error = raised.value
+    assert error.failed_token_ids == ["t4"]
+    assert [type(exc) for exc in error.errors] == [httpx.HTTPStatusError]
+    assert [summary.token_id for summary in error.results] == ["t1", "t0", "t3", "t2"]
+    # Books from the chunks that succeeded still refresh the tick size cache.
+    assert client.get_tick_size("t3") == "0.01"
+    assert [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("HTTP retry")
+    ] == [f"HTTP retry 1/1 after 0.00s for POST {BASE_URL}/books → 503"]
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_midpoints_bound_concurrency_and_keep_input_order() -> None:
+    token_ids = [f"t{index}" for index in range(12)]
+    in_flight = 0
+    peak = 0
+
+    async def midpoints(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=dict.fromkeys(requested_tokens(request), "0.5"))
+
+    with respx.mock(assert_all_called=True) as router:
+        route = router.post(f"{BASE_URL}/midpoints").mock(side_effect=midpoints)
+        async with AsyncPolymarketReadOnlyClobClient() as client:
+            result = await client.get_midpoints_bulk(
+                token_ids, chunk_size=2, max_concurrency=3
+            )
+            assert await client.get_midpoints_bulk([]) == {}
+
+    assert list(result) == token_ids
+    assert set(result.values()) == {0.5}
+    assert route.call_count == 6
+    assert peak == 3
+
+
+PRICE_BY_SIDE = {"BUY": "0.5", "SELL": "0.6"}
+BOTH_SIDES = [
+    BookParams(token_id="t1", side="BUY"),
+    BookParams(token_id="t1", side="SELL"),
+]
+
+
+def prices(request: httpx.Request) -> httpx.Response:
+    body: dict[str, dict[str, str]] = {}
+    for item in json.loads(request.content):
+        body.setdefault(item["token_id"], {})[item["side"]] = PRICE_BY_SIDE[
+            item["side"]
+        ]
+    return httpx.Response(200, json=body)
+
+
+def test_bulk_prices_keep_both_sides_of_a_token_split_across_chunks() -> None:
+    client = PolymarketReadOnlyClobClient()
+    with respx.mock(assert_all_called=True) as router:
+        route = router.post(f"{BASE_URL}/prices").mock(side_effect=prices)
+        result = client.get_prices_bulk(BOTH_SIDES, chunk_size=1)
+
+    assert route.call_count == 2
+    assert result == {"t1": BidAsk(BUY=0.5, SELL=0.6)}
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_prices_keep_both_sides_of_a_token_split_across_chunks() -> (
+    None
+):
+    with respx.mock(assert_all_called=True) as router:
+        route = router.post(f"{BASE_URL}/prices").mock(side_effect=prices)
+        async with AsyncPolymarketReadOnlyClobClient() as client:
+            result = await client.get_prices_bulk(BOTH_SIDES, chunk_size=1)
+
+    assert route.call_count == 2
+    assert result == {"t1": BidAsk(BUY=0.5, SELL=0.6)}
+
+
+def market(index: int) -> dict[str, object]:
+    return {
+        "tokens": [
+            {"token_id": f"{index}1", "outcome": "Yes", "price": 0.5, "winner": False}
+        ],
+        "condition_id": "0x" + f"{index:02x}" * 32,
+        "question_id": "0x" + "aa" * 32,
+        "question": f"Market {index}?",
+        "description": "",
+        "market_slug": f"market-{index}",
+        "end_date_iso": None,
+        "seconds_delay": 0,
+        "enable_order_book": True,
+        "accepting_orders": True,
+        "accepting_order_timestamp": None,
+        "minimum_order_size": 5,
+        "minimum_tick_size": 0.01,
+        "active": True,
+        "closed": False,
+        "archived": False,
+        "neg_risk": False,
+        "neg_risk_market_id": "",
+        "neg_risk_request_id": "",
+        "fpmm": "",
+        "notifications_enabled": False,
+        "is_50_50_outcome": False,
+        "icon": "",
+        "image": "",
+        "rewards": None,
+        "tags": None,
+    }
+
+
+# Three pages of two markets: MA== -> c1 -> c2 -> LTE=
+MARKET_PAGES = {
+    "MA==": ([0, 1], "c1"),
+    "c1": ([2, 3], "c2"),
+    "c2": ([4, 5], "LTE="),
+}
+
+
+def markets_page(request: httpx.Request) -> httpx.Response:
+    indexes, next_cursor = MARKET_PAGES[request.url.params["next_cursor"]]
+    return httpx.Response(
+        200,
+        json={
+            "data": [market(index) for index in indexes],
+            "next_cursor": next_cursor,
+            "limit": 2,
+            "count": 2,
+        },
+    )
+
+
+def test_market_pages_prefetch_and_resume_from_a_cursor() -> None:
+    client = PolymarketReadOnlyClobClient()
+    with respx.mock(assert_all_called=True) as router:
+        route = router.get(f"{BASE_URL}/markets").mock(side_effect=markets_page)
+        pages = client.iter_market_pages()
+        first = next(pages)
+        assert [item.market_slug for item in first.data] == ["market-0", "market-1"]
+        # The second page is requested before the caller asks for it.
+        for _ in range(100):
+            if route.call_count == 2:
+                break
+            time.sleep(0.01)
+        assert route.call_count == 2
+        pages.close()
+
+        resumed = [item.market_slug for item in client.iter_markets(first.next_cursor)]
+        assert resumed == ["market-2", "market-3", "market-4", "market-5"]
+        assert len(client.get_all_markets()) == 6
+        assert list(client.iter_markets("LTE=")) == []
+
+
+@pytest.mark.asyncio
+async def test_async_iter_markets_yields_every_page_and_stops_early() -> None:
+    with respx.mock(assert_all_called=True) as router:
+        route = router.get(f"{BASE_URL}/markets").mock(side_effect=markets_page)
+        async with AsyncPolymarketReadOnlyClobClient() as client:
+            slugs = [item.market_slug async for item in client.iter_markets()]
+            assert slugs == [f"market-{index}" for index in range(6)]
+            assert route.call_count == 3
+
+            pages = client.iter_market_pages("c1")
+            page = await anext(pages)
+            assert page.next_cursor == "c2"
+            await pages.aclose()
+
+
+def test_metadata_cache_warm_starts_a_new_client_without_requests(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "metadata.sqlite"
+    order_args = OrderArgs(token_id=TOKEN_ID, price=0.5, size=10, side="BUY")
+    with respx.mock(assert_all_called=True) as router:
+        mock_market(router)
+        router.get(f"{BASE_URL}/fee-rate").respond(json={"base_fee": 1000})
+        with (
+            SqliteMetadataCache(path) as cache,
+            PolymarketClobClient(
+                PRIVATE_KEY, ADDRESS, CREDS, signature_type=0, metadata_cache=cache
+            ) as client,
+        ):
+            cold = client.create_order(order_args)
+            assert client.get_fee_rate_bps(TOKEN_ID) == 1000
+
+    # A restarted process: no routes are mocked, so any request would fail.
+    with (
+        respx.mock(),
+        SqliteMetadataCache(path) as cache,
+        PolymarketClobClient(
+            PRIVATE_KEY, ADDRESS, CREDS, signature_type=0, metadata_cache=cache
+        ) as client,
+    ):
+        warm = client.create_order(order_args)
+        assert client.get_fee_rate_bps(TOKEN_ID) == 1000
+        assert client.get_neg_risk(TOKEN_ID) is False
+
+    assert warm.maker_amount == cold.maker_amount
+    assert warm.taker_amount == cold.taker_amount
+
+
+def test_metadata_cache_expires_tick_sizes_by_when_they_were_written(
+    tmp_path: Path,
+) -> None:
+    with SqliteMetadataCache(tmp_path / "metadata.sqlite") as cache:
+        cache.set_many("tick_size", {"fresh": "0.001"}, updated_at=time.time() - 60)
+        cache.set_many("tick_size", {TOKEN_ID: "0.1"}, updated_at=time.time() - 600)
+        client = PolymarketReadOnlyClobClient(tick_size_ttl=300, metadata_cache=cache)
+        with respx.mock(assert_all_called=True) as router:
+            route = router.get(f"{BASE_URL}/tick-size").respond(
+                json={"minimum_tick_size": 0.01}
+            )
+            assert client.get_tick_size("fresh") == "0.001"
+            assert client.get_tick_size(TOKEN_ID) == "0.01"
+            assert route.call_count == 1
+
+        stored = cache.get("tick_size", TOKEN_ID, max_age=300)
+        assert stored is not None
+        assert stored[0] == "0.01"
+
+        client.clear_tick_size_cache()
+        assert cache.get("tick_size", "fresh") is None
+
+
+def test_metadata_caches_evict_least_recently_used_and_count_lookups() -> None:
+    config = MetadataCacheConfig(max_entries=2, ttls={"neg_risk": 60})
+    client = PolymarketReadOnlyClobClient(metadata_cache_config=config)
+    with respx.mock(assert_all_called=True) as router:
+        route = router.get(f"{BASE_URL}/neg-risk").respond(json={"neg_risk": True})
+        for token_id in ["a", "b", "a", "c", "a", "b"]:
+            assert client.get_neg_risk(token_id) is True
+
+    # "b" was the least recently used when "c" came in, so it was refetched.
+    assert route.call_count == 4
+    stats = client.metadata_cache_stats()["neg_risk"]
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+    assert stats.hit_rate == pytest.approx(2 / 6)
+    assert client.metadata_cache_stats()["fee_rate"].hit_rate is None
+
+
+def test_invalidate_metadata_forgets_tokens_in_memory_and_on_disk(
+    tmp_path: Path,
+) -> None:
+    with (
+        SqliteMetadataCache(tmp_path / "metadata.sqlite") as cache,
+        respx.mock(assert_all_called=True) as router,
+    ):
+        mock_market(router)
+        router.get(f"{BASE_URL}/fee-rate").respond(json={"base_fee": 0})
+        client = PolymarketReadOnlyClobClient(metadata_cache=cache)
+        client.get_tick_size(TOKEN_ID)
+        client.get_neg_risk(TOKEN_ID)
+        client.get_fee_rate_bps(TOKEN_ID)
+
+        client.invalidate_metadata(TOKEN_ID, kinds=["neg_risk", "fee_rate"])
+        assert cache.get("neg_risk", TOKEN_ID) is None
+        assert cache.get("tick_size", TOKEN_ID) is not None
+        client.invalidate_metadata()
+        assert cache.get("tick_size", TOKEN_ID) is None
+
+    assert client.metadata_cache_stats()["tick_size"].size == 0
+
+
+class ThreadRecordingCache(SqliteMetadataCache):
+    """Records which threads read and write the database."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.threads: set[str] = set()
+        self.writes = 0
+
+    def entries(
+        self,
+        kind: MetadataKind,
+        *,
+        max_age: float | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, Any, float]]:
+        self.threads.add(threading.current_thread().name)
+        return super().entries(kind, max_age=max_age, limit=limit)
+
+    def update(
+        self,
+        items: Mapping[MetadataKind, Mapping[str, Any]],
+        *,
+        updated_at: float | None = None,
+    ) -> None:
+        self.threads.add(threading.current_thread().name)
+        self.writes += 1
+        super().update(items, updated_at=updated_at)
+
+
+@pytest.mark.asyncio
+async def test_async_client_keeps_metadata_cache_io_off_the_event_loop(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "metadata.sqlite"
+    with SqliteMetadataCache(path) as cache:
+        cache.set_many("neg_risk", {TOKEN_ID: True})
+
+    with (
+        ThreadRecordingCache(path) as cache,
+        respx.mock(assert_all_called=True) as router,
+    ):
+        route = router.get(f"{BASE_URL}/book").respond(json=book(TOKEN_ID))
+        async with AsyncPolymarketReadOnlyClobClient(metadata_cache=cache) as client:
+            # Loaded from disk before the first request; neg-risk is not mocked.
+            assert await client.get_neg_risk(TOKEN_ID) is True
+            await client.get_order_book(TOKEN_ID)
+            await client.get_order_book(TOKEN_ID)
+        stored = cache.get("tick_size", TOKEN_ID)
+
+    assert route.call_count == 2
+    assert stored is not None
+    assert stored[0] == "0.01"
+    # The unchanged tick size of the second book is not written again.
+    assert cache.writes == 1
+    assert cache.threads
+    assert threading.current_thread().name not in cache.threads
@@ -0,0 +1,1148 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import httpx
+import pytest
+import respx
+from pydantic import BaseModel, ValidationError
+from websockets.asyncio.server import ServerConnection, serve
+
+from polymarket_apis.clients.clob_client import (
+    AsyncPolymarketReadOnlyClobClient,
+    PolymarketReadOnlyClobClient,
+)
+from polymarket_apis.clients.websockets_client import (
+    AsyncPolymarketWebsocketsClient,
+    LocalOrderBookBackend,
+    LocalOrderBookSnapshot,
+    LocalOrderBookStore,
+    OrderBookResyncConfig,
+    WebsocketCallbackConfig,
+    WebsocketQueueConfig,
+    _balanced_shards,
+    _MarketConflator,
+    _OrderBookResyncer,
+    _WebsocketMessage,
+    parse_market_event,
+    parse_market_lazy_event,
+    parse_market_struct_event,
+    parse_user_lazy_event,
+)
+from polymarket_apis.types.clob_types import ApiCreds, MarketIDs, OrderBookSummary
+from polymarket_apis.types.websockets_lazy import LazyEvent
+from polymarket_apis.types.websockets_structs import (
+    OrderBookSummaryEventStruct,
+    PriceChangeEventStruct,
+)
+from polymarket_apis.types.websockets_types import (
+    OrderBookSummaryEvent,
+    OrderEvent,
+    PriceChange,
+    PriceChangeEvent,
+)
+from polymarket_apis.utilities._internal_log import set_trace_id
+from polymarket_apis.utilities._latency_histogram import RollingLatencyHistogram
+from polymarket_apis.utilities.order_builder.helpers import (
+    generate_orderbook_summary_hash,
+)
+
+pytestmark = pytest.mark.contract
+
+TOKEN_ID = "1234"
+OTHER_TOKEN_ID = "5678"
+CONDITION_ID = "0x" + "ab" * 32
+
+
+def book_frame(
+    token_id: str = TOKEN_ID,
+    *,
+    bids: list[tuple[str, str]] | None = None,
+    asks: list[tuple[str, str]] | None = None,
+) -> dict[str, object]:
+    return {
+        "event_type": "book",
+        "market": CONDITION_ID,
+        "asset_id": token_id,
+        "timestamp": "1700000000000",
+        "hash": "0x" + "cd" * 20,
+        "bids": [
+            {"price": price, "size": size}
+            for price, size in (bids or [("0.48", "10"), ("0.49", "20")])
+        ],
+        "asks": [
+            {"price": price, "size": size}
+            for price, size in (asks or [("0.52", "15"), ("0.51", "25")])
+        ],
+        "tick_size": "0.01",
+    }
+
+
+def test_pre_decoded_payload_is_reused_by_market_parser() -> None:
+    payload = book_frame()
+    text = json.dumps(payload)
+    store = LocalOrderBookStore()
+
+    assert store.apply_payload(payload) == "snapshot"
+    message = _WebsocketMessage(channel="market", text=text, json_data=payload)
+
+    assert message.json_data is payload
+    parsed = parse_market_event(message)
+    assert isinstance(parsed, OrderBookSummaryEvent)
+    assert parsed.token_id == TOKEN_ID
+    assert store.best_bid(TOKEN_ID) == 0.49
+    assert store.best_ask(TOKEN_ID) == 0.51
+
+
+def test_message_without_pre_decoded_payload_still_decodes() -> None:
+    text = json.dumps(book_frame())
+
+    message = _WebsocketMessage(channel="market", text=text)
+
+    assert message.json_data == json.loads(text)
+
+
+def test_envelope_fills_size_time_and_trace_id_on_first_read() -> None:
+    text = json.dumps({**book_frame(), "note": "prix élevé"}, ensure_ascii=False)
+    before = datetime.now(UTC)
+    message = _WebsocketMessage(channel="market", text=text)
+
+    def read_trace_id() -> str:
+        set_trace_id("trace-at-first-read")
+        return message.trace_id
+
+    # The trace id is looked up on first read, not when the frame arrives.
+    assert contextvars.copy_context().run(read_trace_id) == "trace-at-first-read"
+    assert message.message_size == len(text.encode("utf-8")) > len(text)
+    assert (
+        before - timedelta(seconds=1)
+        <= message.received_at
+        <= datetime.now(UTC) + timedelta(seconds=1)
+    )
+    ascii_message = _WebsocketMessage(
+        channel="market", text='{"a": 1}', trace_id="trace-1"
+    )
+    assert (ascii_message.message_size, ascii_message.trace_id) == (8, "trace-1")
+
+
+def price_change_frame(
+    price: str, size: str, side: str, token_id: str = TOKEN_ID
+) -> dict[str, object]:
+    return {
+        "event_type": "price_change",
+        "market": CONDITION_ID,
+        "timestamp": "1700000000001",
+        "price_changes": [
+            {"asset_id": token_id, "price": price, "size": size, "side": side}
+        ],
+    }
+
+
+@pytest.mark.parametrize("backend", ["sorted", "tick"])
+def test_crossing_buy_removes_consumed_asks(backend: LocalOrderBookBackend) -> None:
+    store = LocalOrderBookStore(backend=backend)
+    store.apply_payload(
+        book_frame(asks=[("0.55", "5"), ("0.53", "5"), ("0.52", "15"), ("0.51", "25")])
+    )
+
+    assert store.apply_payload(price_change_frame("0.53", "7", "BUY")) == "delta"
+
+    assert store.asks(TOKEN_ID) == {0.53: 5.0, 0.55: 5.0}
+    assert store.best_bid(TOKEN_ID) == 0.53
+    assert store.best_ask(TOKEN_ID) == 0.53
+
+
+@pytest.mark.parametrize("backend", ["sorted", "tick"])
+def test_crossing_sell_removes_consumed_bids_and_zero_size_deletes(
+    backend: LocalOrderBookBackend,
+) -> None:
+    store = LocalOrderBookStore(backend=backend)
+    store.apply_payload(
+        book_frame(bids=[("0.45", "1"), ("0.48", "10"), ("0.49", "20")])
+    )
+
+    store.apply_payload(price_change_frame("0.47", "3", "SELL"))
+    store.apply_payload(price_change_frame("0.45", "0", "BUY"))
+
+    assert store.bids(TOKEN_ID) == {}
+    assert store.best_bid(TOKEN_ID) is None
+    assert store.best_ask(TOKEN_ID) == 0.47
+
+
+def test_tick_backend_reindexes_on_tick_size_change_and_off_grid_prices() -> None:
+    store = LocalOrderBookStore(backend="tick")
+    store.apply_payload(book_frame())
+
+    store.apply_payload(
+        {
+            "event_type": "tick_size_change",
+            "market": CONDITION_ID,
+            "asset_id": TOKEN_ID,
+            "old_tick_size": "0.01",
+            "new_tick_size": "0.001",
+            "timestamp": "1700000000002",
+        }
+    )
+    store.apply_payload(price_change_frame("0.495", "4", "BUY"))
+    store.apply_payload(price_change_frame("0.5075", "6", "SELL"))
+
+    snapshot = store.snapshot(TOKEN_ID)
+    assert snapshot.bids == {0.48: 10.0, 0.49: 20.0, 0.495: 4.0}
+    assert snapshot.asks == {0.5075: 6.0, 0.51: 25.0, 0.52: 15.0}
+    assert store.best_bid(TOKEN_ID) == 0.495
+    assert store.best_ask(TOKEN_ID) == 0.5075
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="backend"):
+        LocalOrderBookStore(backend="btree")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("backend", ["sorted", "tick"])
+def test_top_levels_follow_configured_depth(backend: LocalOrderBookBackend) -> None:
+    store = LocalOrderBookStore(backend=backend, depth=3)
+    store.apply_payload(
+        book_frame(bids=[("0.45", "1"), ("0.46", "2"), ("0.47", "3"), ("0.48", "4")])
+    )
+    assert store.top_bids(TOKEN_ID) == ((0.48, 4.0), (0.47, 3.0), (0.46, 2.0))
+
+    store.apply_payload(price_change_frame("0.40", "9", "BUY"))
+    store.apply_payload(price_change_frame("0.47", "0", "BUY"))
+
+    assert store.top_bids(TOKEN_ID) == ((0.48, 4.0), (0.46, 2.0), (0.45, 1.0))
+    assert store.snapshot(TOKEN_ID).top_bids == store.top_bids(TOKEN_ID)
+    assert store.top_asks(TOKEN_ID) == ((0.51, 25.0), (0.52, 15.0))
+
+
+@pytest.mark.parametrize("backend", ["sorted", "tick"])
+def test_concurrent_snapshots_are_internally_consistent(
+    backend: LocalOrderBookBackend,
+) -> None:
+    store = LocalOrderBookStore(backend=backend, depth=3)
+    store.apply_payload(book_frame())
+    frames = [
+        price_change_frame(f"0.{40 + step % 9}", str(step % 4), "BUY")
+        for step in range(3000)
+    ]
+    done = threading.Event()
+    mismatches: list[LocalOrderBookSnapshot] = []
+
+    def write() -> None:
+        for frame in frames:
+            store.apply_payload(frame)
+        done.set()
+
+    # Force frequent thread switches so reads interleave with writes.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writer = threading.Thread(target=write)
+        writer.start()
+        while not done.is_set():
+            snapshot = store.snapshot(TOKEN_ID)
+            if snapshot.top_bids != tuple(snapshot.sorted_bids()[:3]):
+                mismatches.append(snapshot)
+        writer.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert mismatches == []
+
+
+def test_invalidating_one_token_keeps_other_books() -> None:
+    store = LocalOrderBookStore()
+    store.apply_payload(book_frame())
+    store.apply_payload(book_frame(OTHER_TOKEN_ID))
+
+    store.invalidate("parse_failure", [TOKEN_ID])
+
+    assert store.valid
+    assert not store.is_valid(TOKEN_ID)
+    assert store.token_invalid_reason(TOKEN_ID) == "parse_failure"
+    assert store.bids(TOKEN_ID) == {}
+    assert store.is_valid(OTHER_TOKEN_ID)
+    assert store.best_bid(OTHER_TOKEN_ID) == 0.49
+
+
+def test_resync_replays_only_deltas_newer_than_fetched_snapshot() -> None:
+    store = LocalOrderBookStore()
+    store.apply_payload(book_frame())
+
+    assert store.begin_resync([TOKEN_ID]) == (TOKEN_ID,)
+    older = price_change_frame("0.47", "1", "BUY")
+    older["timestamp"] = "1700000000100"
+    newer = price_change_frame("0.50", "3", "BUY")
+    newer["timestamp"] = "1700000000900"
+    assert store.apply_payload(older) == "delta"
+    assert store.apply_payload(newer) == "delta"
+    assert store.bids(TOKEN_ID) == {}
+
+    fetched = book_frame(bids=[("0.47", "8")])
+    fetched["timestamp"] = "1700000000500"
+    assert store.complete_resync(fetched) == 1
+
+    assert store.resyncing_token_ids == ()
+    assert store.is_valid(TOKEN_ID)
+    assert store.bids(TOKEN_ID) == {0.47: 8.0, 0.50: 3.0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls", [PolymarketReadOnlyClobClient, AsyncPolymarketReadOnlyClobClient]
+)
+async def test_resyncer_fetches_invalidated_tokens_in_batches(
+    client_cls: type[PolymarketReadOnlyClobClient | AsyncPolymarketReadOnlyClobClient],
+) -> None:
+    store = LocalOrderBookStore()
+    store.apply_payload(book_frame())
+    store.apply_payload(book_frame(OTHER_TOKEN_ID))
+    resynced: list[None] = []
+    finished = asyncio.Event()
+
+    def on_resynced() -> None:
+        resynced.append(None)
+        if len(resynced) == 2:
+            finished.set()
+
+    def books(request: httpx.Request) -> httpx.Response:
+        body = [
+            {
+                **book_frame(item["token_id"], bids=[("0.30", "2")]),
+                "timestamp": "1700000000500",
+            }
+            for item in json.loads(request.content)
+        ]
+        return httpx.Response(200, json=body)
+
+    with respx.mock(assert_all_called=True) as router:
+        route = router.post("https://clob.polymarket.com/books").mock(side_effect=books)
+        resyncer = _OrderBookResyncer(
+            OrderBookResyncConfig(client=client_cls(), batch_size=1),
+            store,
+            channel="market",
+            on_resynced=on_resynced,
+        )
+        resyncer.request([TOKEN_ID, OTHER_TOKEN_ID])
+        assert set(store.resyncing_token_ids) == {TOKEN_ID, OTHER_TOKEN_ID}
+
+        await asyncio.wait_for(finished.wait(), timeout=5)
+
+    assert route.call_count == 2
+    assert resyncer.pending_token_ids == ()
+    assert store.resyncing_token_ids == ()
+    assert store.bids(TOKEN_ID) == {0.30: 2.0}
+    assert store.bids(OTHER_TOKEN_ID) == {0.30: 2.0}
+
+
+def server_hash(frame: dict[str, object]) -> str:
+    return generate_orderbook_summary_hash(OrderBookSummary.model_validate(frame))
+
+
+@pytest.mark.parametrize("backend", ["sorted", "tick"])
+def test_sampled_hash_checks_invalidate_only_mismatched_tokens(
+    backend: LocalOrderBookBackend,
+) -> None:
+    store = LocalOrderBookStore(backend=backend, hash_check_interval=1)
+    snapshot = book_frame()
+    snapshot["hash"] = server_hash(snapshot)
+    other = book_frame(OTHER_TOKEN_ID)
+    other["hash"] = server_hash(other)
+    store.apply_payload(snapshot)
+    store.apply_payload(other)
+
+    delta = price_change_frame("0.50", "5", "BUY")
+    after = book_frame(bids=[("0.48", "10"), ("0.49", "20"), ("0.5", "5")])
+    after["timestamp"] = delta["timestamp"]
+    delta["price_changes"][0]["hash"] = server_hash(after)  # type: ignore[index]
+    store.apply_payload(delta)
+    assert store.pending_hash_check_count == 3
+    assert store.verify_hashes() == ()
+
+    corrupt = price_change_frame("0.47", "1", "BUY", OTHER_TOKEN_ID)
+    corrupt["price_changes"][0]["hash"] = "0" * 40  # type: ignore[index]
+    store.apply_payload(corrupt)
+
+    assert store.verify_hashes() == (OTHER_TOKEN_ID,)
+    assert store.hash_check_count == 4
+    assert store.hash_mismatch_count == 1
+    assert store.token_invalid_reason(OTHER_TOKEN_ID) == "hash_mismatch"
+    assert store.is_valid(TOKEN_ID)
+
+
+def test_hash_checks_are_sampled_per_token() -> None:
+    store = LocalOrderBookStore(hash_check_interval=3)
+    store.apply_payload(book_frame())
+    for step in range(6):
+        frame = price_change_frame(f"0.4{step}", "1", "BUY")
+        frame["price_changes"][0]["hash"] = "0" * 40  # type: ignore[index]
+        store.apply_payload(frame)
+
+    # The snapshot and every third hashed delta after it.
+    assert store.pending_hash_check_count == 3
+
+
+def test_merged_books_mirror_complements_and_aggregate_events() -> None:
+    store = LocalOrderBookStore(depth=2)
+    store.register_market(
+        MarketIDs(
+            condition_id=CONDITION_ID,
+            primary_token_id=TOKEN_ID,
+            secondary_token_id=OTHER_TOKEN_ID,
+        ),
+        event_id="event",
+    )
+    other_condition = "0x" + "cd" * 32
+    store.link_complements(other_condition, "yes-2", "no-2", event_id="event")
+    store.apply_payload(
+        book_frame(
+            bids=[("0.48", "10"), ("0.47", "5")], asks=[("0.52", "15"), ("0.55", "1")]
+        )
+    )
+    # The complement quotes a tighter market: NO asks 0.51 => YES bid 0.49.
+    store.apply_payload(
+        book_frame(
+            OTHER_TOKEN_ID,
+            bids=[("0.48", "7"), ("0.40", "2")],
+            asks=[("0.51", "3"), ("0.52", "9")],
+        )
+    )
+
+    merged = store.merged_book(TOKEN_ID)
+    assert merged is not None
+    assert merged.valid
+    assert merged.top_bids == ((0.49, 3.0), (0.48, 10.0))
+    assert merged.top_asks == ((0.52, 15.0), (0.55, 1.0))
+    complement = store.merged_book(OTHER_TOKEN_ID)
+    assert complement is not None
+    assert complement.top_bids == ((0.48, 15.0), (0.45, 1.0))
+    assert complement.top_asks == ((0.51, 3.0), (0.52, 10.0))
+    assert store.complement_token_id(OTHER_TOKEN_ID) == TOKEN_ID
+
+    # A delta below both top windows leaves the merged view untouched.
+    store.apply_payload(price_change_frame("0.30", "4", "BUY"))
+    assert store.merged_book(TOKEN_ID) is merged
+
+    aggregate = store.event_aggregate("event")
+    assert aggregate is not None
+    assert (aggregate.sum_best_bids, aggregate.sum_best_asks) == (0.49, 0.52)
+    assert not aggregate.complete
+    assert not aggregate.valid
+    store.apply_payload(book_frame("yes-2", bids=[("0.40", "1")], asks=[("0.45", "1")]))
+    store.apply_payload(book_frame("no-2", bids=[("0.50", "1")], asks=[("0.60", "1")]))
+    aggregate = store.event_aggregate("event")
+    assert aggregate is not None
+    assert aggregate.complete
+    assert aggregate.valid
+    assert (aggregate.sum_best_bids, aggregate.sum_best_asks) == (0.89, 0.97)
+
+    store.invalidate("hash_mismatch", [OTHER_TOKEN_ID])
+    merged = store.merged_book(TOKEN_ID)
+    assert merged is not None
+    assert not merged.valid
+    assert merged.top_bids == ((0.48, 10.0), (0.47, 5.0))
+
+
+def test_shards_are_balanced_contiguous_and_deduplicated() -> None:
+    tokens = [str(index) for index in range(7)]
+
+    assert _balanced_shards(tokens, 3, 500) == [["0", "1", "2"], ["3", "4"], ["5", "6"]]
+    assert _balanced_shards(tokens, None, 3) == [
+        ["0", "1", "2"],
+        ["3", "4"],
+        ["5", "6"],
+    ]
+    assert _balanced_shards(["1", "2", "1"], 5, 500) == [["1"], ["2"]]
+    with pytest.raises(ValueError, match="shard_count"):
+        _balanced_shards(tokens, 0, 500)
+
+
+@pytest.mark.asyncio
+async def test_sharded_market_connection_feeds_one_store() -> None:
+    tokens = [str(1000 + index) for index in range(5)]
+    subscriptions: list[list[str]] = []
+
+    async def handler(websocket: ServerConnection) -> None:
+        request = json.loads(await websocket.recv())
+        subscriptions.append(request["assets_ids"])
+        await websocket.send(
+            json.dumps([book_frame(token) for token in request["assets_ids"]])
+        )
+        await websocket.wait_closed()
+
+    store = LocalOrderBookStore()
+    loaded = asyncio.Event()
+
+    def on_event(_event: object) -> None:
+        if set(store.token_ids) == set(tokens):
+            loaded.set()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncPolymarketWebsocketsClient()
+        client.url_market = f"ws://127.0.0.1:{port}"
+        connection = await client.open_sharded_market_connection(
+            tokens, shard_count=2, process_event=on_event, local_order_books=store
+        )
+        try:
+            await asyncio.wait_for(loaded.wait(), timeout=5)
+            health = connection.health()
+            assert connection.token_ids_by_shard == (
+                tuple(tokens[:3]),
+                tuple(tokens[3:]),
+            )
+            assert sorted(subscriptions) == sorted([tokens[:3], tokens[3:]])
+            assert health.connected
+            assert health.connected_shard_count == 2
+            assert len(health.shards) == 2
+            assert connection.market_book_synchronized
+        finally:
+            await client.close()
+
+    assert connection.health().closed
+
+
+@pytest.mark.asyncio
+async def test_market_subscription_changes_without_reconnecting() -> None:
+    requests: list[dict[str, object]] = []
+    connects: list[None] = []
+
+    async def handler(websocket: ServerConnection) -> None:
+        connects.append(None)
+        async for raw in websocket:
+            request = json.loads(raw)
+            requests.append(request)
+            if request.get("operation", "subscribe") == "subscribe":
+                await websocket.send(
+                    json.dumps([book_frame(token) for token in request["assets_ids"]])
+                )
+
+    store = LocalOrderBookStore()
+    books = asyncio.Queue[None]()
+
+    def on_event(_event: object) -> None:
+        books.put_nowait(None)
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        client = AsyncPolymarketWebsocketsClient()
+        client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        connection = await client.open_market_connection(
+            [TOKEN_ID], process_event=on_event, local_order_books=store
+        )
+        try:
+            await asyncio.wait_for(books.get(), timeout=5)
+
+            assert await connection.subscribe_tokens([TOKEN_ID, OTHER_TOKEN_ID]) == [
+                OTHER_TOKEN_ID
+            ]
+            await asyncio.wait_for(books.get(), timeout=5)
+            assert set(store.token_ids) == {TOKEN_ID, OTHER_TOKEN_ID}
+
+            assert await connection.unsubscribe_tokens([TOKEN_ID]) == [TOKEN_ID]
+            assert connection.token_ids == (OTHER_TOKEN_ID,)
+            assert store.token_ids == (OTHER_TOKEN_ID,)
+            assert store.tick_size(TOKEN_ID) is None
+        finally:
+            await client.close()
+
+    assert len(connects) == 1
+    assert requests[1] == {
+        "assets_ids": [OTHER_TOKEN_ID],
+        "operation": "subscribe",
+        "custom_feature_enabled": True,
+    }
+    assert requests[2] == {
+        "assets_ids": [TOKEN_ID],
+        "operation": "unsubscribe",
+        "custom_feature_enabled": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_frames_in_flight_after_unsubscribe_do_not_rebuild_evicted_books() -> (
+    None
+):
+    async def handler(websocket: ServerConnection) -> None:
+        async for raw in websocket:
+            bids = [("0.3", "1")] if json.loads(raw).get("operation") else None
+            # After an unsubscribe this stands in for frames already in flight.
+            await websocket.send(
+                json.dumps(
+                    [book_frame(bids=bids), book_frame(OTHER_TOKEN_ID, bids=bids)]
+                )
+            )
+
+    store = LocalOrderBookStore()
+    written = asyncio.Event()
+    store.add_write_listener(lambda _token_id: written.set())
+
+    async def book_has(token_id: str, price: float) -> None:
+        while price not in store.bids(token_id):
+            written.clear()
+            await written.wait()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        client = AsyncPolymarketWebsocketsClient()
+        client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        connection = await client.open_market_connection(
+            [TOKEN_ID, OTHER_TOKEN_ID], local_order_books=store
+        )
+        try:
+            await asyncio.wait_for(book_has(OTHER_TOKEN_ID, 0.48), timeout=5)
+            assert await connection.unsubscribe_tokens([TOKEN_ID]) == [TOKEN_ID]
+            await asyncio.wait_for(book_has(OTHER_TOKEN_ID, 0.3), timeout=5)
+            assert store.token_ids == (OTHER_TOKEN_ID,)
+
+            # Subscribing again lets its frames through.
+            assert await connection.subscribe_tokens([TOKEN_ID]) == [TOKEN_ID]
+            await asyncio.wait_for(book_has(TOKEN_ID, 0.3), timeout=5)
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_frames_keep_the_reader_trace_id_in_parse_workers_and_callbacks(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        await websocket.send(json.dumps({"event_type": "book", "asset_id": TOKEN_ID}))
+        await websocket.send(json.dumps(book_frame()))
+        await websocket.wait_closed()
+
+    failed = asyncio.Event()
+
+    def on_event(_event: object) -> None:
+        failed.set()
+        msg = "callback failed"
+        raise ValueError(msg)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async with serve(handler, "127.0.0.1", 0) as server:
+            client = AsyncPolymarketWebsocketsClient(
+                callbacks=WebsocketCallbackConfig(
+                    process_event_error_policy="log", parse_executor=executor
+                )
+            )
+            client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            await client.open_market_connection([TOKEN_ID], process_event=on_event)
+            try:
+                await asyncio.wait_for(failed.wait(), timeout=5)
+            finally:
+                await client.close()
+
+    # The invalid frame is parsed on a worker thread, the valid one's callback
+    # fails on the processor task; both log the id captured by the reader.
+    trace_ids = {
+        getattr(record, "event", ""): getattr(record, "trace_id", None)
+        for record in caplog.records
+    }
+    trace_ids = {
+        event: trace_ids[event]
+        for event in ("ws.message.parse.validation_failed", "ws.callback.failed")
+        if event in trace_ids
+    }
+    assert len(trace_ids) == 2
+    assert len(set(trace_ids.values())) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_delivers_queued_events_as_lists() -> None:
+    prices = [round(0.30 + index / 100, 2) for index in range(20)]
+    deltas = [
+        {
+            "event_type": "price_change",
+            "market": CONDITION_ID,
+            "timestamp": "1700000000001",
+            "price_changes": [
+                {
+                    "asset_id": TOKEN_ID,
+                    "price": str(price),
+                    "size": "1",
+                    "side": "BUY",
+                    "hash": "0x" + "ef" * 20,
+                    "best_bid": "0.49",
+                    "best_ask": "0.51",
+                }
+            ],
+        }
+        for price in prices
+    ]
+
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        await websocket.send(json.dumps(book_frame()))
+        for frame in deltas:
+            await websocket.send(json.dumps(frame))
+        await websocket.wait_closed()
+
+    batches: list[list[object]] = []
+    done = asyncio.Event()
+
+    async def on_batch(events: list[object]) -> None:
+        batches.append(events)
+        # Let the rest of the stream pile up behind the first batch.
+        await asyncio.sleep(0.05 if len(batches) == 1 else 0)
+        if sum(len(batch) for batch in batches) == len(deltas) + 1:
+            done.set()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        client = AsyncPolymarketWebsocketsClient(
+            callbacks=WebsocketCallbackConfig(batch_max_size=8)
+        )
+        client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        await client.open_market_connection([TOKEN_ID], process_event=on_batch)
+        try:
+            await asyncio.wait_for(done.wait(), timeout=5)
+        finally:
+            await client.close()
+
+    events = [event for batch in batches for event in batch]
+    assert isinstance(events[0], OrderBookSummaryEvent)
+    assert [
+        event.price_changes[0].price
+        for event in events[1:]
+        if isinstance(event, PriceChangeEvent)
+    ] == prices
+    assert max(len(batch) for batch in batches) == 8
+
+
+def level_change(
+    price: str,
+    size: str,
+    *,
+    side: str = "BUY",
+    token_id: str = TOKEN_ID,
+    best_bid: str = "0.49",
+) -> dict[str, object]:
+    return {
+        "event_type": "price_change",
+        "market": CONDITION_ID,
+        "timestamp": "1700000000001",
+        "price_changes": [
+            {
+                "asset_id": token_id,
+                "price": price,
+                "size": size,
+                "side": side,
+                "hash": "0x" + "ef" * 20,
+                "best_bid": best_bid,
+                "best_ask": "0.52",
+            }
+        ],
+    }
+
+
+def test_conflator_keeps_latest_level_and_lets_books_supersede_levels() -> None:
+    conflator = _MarketConflator(channel="market", raw=True)
+    conflator.add(json.dumps(level_change("0.48", "1")))
+    conflator.add(json.dumps(level_change("0.47", "2", token_id=OTHER_TOKEN_ID)))
+    conflator.add(json.dumps(level_change("0.48", "3", best_bid="0.48")))
+    conflator.add("not json")
+
+    assert conflator.merged_message_count == 1
+    frames = conflator.drain()
+    assert frames[-1] == "not json"
+    merged = json.loads(str(frames[0]))
+    assert [
+        (change["asset_id"], change["size"]) for change in merged["price_changes"]
+    ] == [
+        (OTHER_TOKEN_ID, "2"),
+        (TOKEN_ID, "3"),
+    ]
+    assert merged["price_changes"][1]["best_bid"] == "0.48"
+    assert len(conflator) == 0
+
+    conflator.add(json.dumps(level_change("0.48", "1")))
+    conflator.add(json.dumps(book_frame()))
+    conflator.add(json.dumps(level_change("0.47", "4")))
+    first, second = conflator.drain(limit=1), conflator.drain()
+    assert json.loads(str(first[0]))["event_type"] == "book"
+    assert json.loads(str(second[0]))["price_changes"][0]["size"] == "4"
+
+    with pytest.raises(ValueError, match="market channel"):
+        AsyncPolymarketWebsocketsClient(
+            queue=WebsocketQueueConfig(user_overflow_policy="conflate")
+        )
+
+
+@pytest.mark.asyncio
+async def test_conflate_policy_delivers_latest_levels_without_invalidating() -> None:
+    sizes = [
+        (price, str(step))
+        for step in range(1, 31)
+        for price in ("0.45", "0.46", "0.47")
+    ]
+
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        await websocket.send(json.dumps(book_frame()))
+        for price, size in sizes:
+            await websocket.send(json.dumps(level_change(price, size)))
+        await websocket.wait_closed()
+
+    latest: dict[float, float] = {}
+    received: list[object] = []
+    done = asyncio.Event()
+
+    async def on_event(event: object) -> None:
+        received.append(event)
+        if len(received) == 1:
+            await asyncio.sleep(0.1)
+        if isinstance(event, PriceChangeEvent):
+            latest.update({change.price: change.size for change in event.price_changes})
+        if latest == {0.45: 30.0, 0.46: 30.0, 0.47: 30.0}:
+            done.set()
+
+    store = LocalOrderBookStore()
+    async with serve(handler, "127.0.0.1", 0) as server:
+        client = AsyncPolymarketWebsocketsClient(
+            queue=WebsocketQueueConfig(maxsize=4, overflow_policy="conflate")
+        )
+        client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        connection = await client.open_market_connection(
+            [TOKEN_ID], process_event=on_event, local_order_books=store
+        )
+        try:
+            await asyncio.wait_for(done.wait(), timeout=5)
+            assert connection.market_book_synchronized
+            assert store.bids(TOKEN_ID)[0.47] == 30.0
+        finally:
+            await client.close()
+
+    assert len(received) < len(sizes)
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_validates_off_loop_in_arrival_order() -> None:
+    deep_book = book_frame(
+        bids=[(f"0.{10 + index}", "5") for index in range(30)],
+        asks=[(f"0.{60 + index}", "5") for index in range(30)],
+    )
+    frames = [
+        deep_book if index % 3 == 0 else level_change(f"0.{40 + index}", str(index))
+        for index in range(30)
+    ]
+    loop_thread = threading.get_ident()
+    parse_threads: set[int] = set()
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit[T](
+            self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+        ) -> Future[T]:
+            def run() -> T:
+                parse_threads.add(threading.get_ident())
+                return fn(*args, **kwargs)
+
+            return super().submit(run)
+
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        for frame in frames:
+            await websocket.send(json.dumps(frame))
+        await websocket.wait_closed()
+
+    received: list[object] = []
+    done = asyncio.Event()
+
+    def on_event(event: object) -> None:
+        received.append(event)
+        if len(received) == len(frames):
+            done.set()
+
+    with RecordingExecutor(max_workers=4) as executor:
+        async with serve(handler, "127.0.0.1", 0) as server:
+            client = AsyncPolymarketWebsocketsClient(
+                callbacks=WebsocketCallbackConfig(parse_executor=executor)
+            )
+            client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            await client.open_market_connection([TOKEN_ID], process_event=on_event)
+            try:
+                await asyncio.wait_for(done.wait(), timeout=5)
+            finally:
+                await client.close()
+
+    assert parse_threads
+    assert loop_thread not in parse_threads
+    assert [type(event).__name__ for event in received] == [
+        "OrderBookSummaryEvent" if index % 3 == 0 else "PriceChangeEvent"
+        for index in range(len(frames))
+    ]
+    assert [
+        event.price_changes[0].size
+        for event in received
+        if isinstance(event, PriceChangeEvent)
+    ] == [float(index) for index in range(len(frames)) if index % 3]
+
+
+def as_plain(value: object) -> object:
+    if isinstance(value, BaseModel):
+        return as_plain(dict(value))
+    if isinstance(value, tuple) and hasattr(value, "_asdict"):
+        return as_plain(value._asdict())
+    if isinstance(value, dict):
+        return {key: as_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [as_plain(item) for item in value]
+    return value
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        {**book_frame(), "last_trade_price": "", "neg_risk": True},
+        [book_frame(), book_frame(OTHER_TOKEN_ID)],
+        level_change("0.47", "3"),
+        {
+            "event_type": "price_change",
+            "m": CONDITION_ID,
+            "t": "1700000000002",
+            "pc": [
+                {
+                    "a": TOKEN_ID,
+                    "p": "0.5",
+                    "s": "2",
+                    "si": "SELL",
+                    "h": "0x01",
+                    "bb": "0.49",
+                    "ba": "0.5",
+                }
+            ],
+        },
+        {
+            "event_type": "last_trade_price",
+            "market": CONDITION_ID,
+            "asset_id": TOKEN_ID,
+            "price": "0.5",
+            "size": "7",
+            "side": "BUY",
+            "fee_rate_bps": "0",
+            "timestamp": "1700000000003",
+        },
+        {
+            "event_type": "best_bid_ask",
+            "market": CONDITION_ID,
+            "asset_id": TOKEN_ID,
+            "best_bid": "0.49",
+            "best_ask": "0.51",
+            "spread": "0.02",
+            "timestamp": "1700000000004",
+        },
+        {
+            "event_type": "tick_size_change",
+            "market": CONDITION_ID,
+            "asset_id": TOKEN_ID,
+            "old_tick_size": "0.01",
+            "new_tick_size": "0.001",
+            "timestamp": "1700000000005",
+        },
+    ],
+)
+def test_struct_decoder_matches_pydantic_fields(frame: object) -> None:
+    message = _WebsocketMessage(channel="market", text=json.dumps(frame))
+
+    struct = parse_market_struct_event(message)
+
+    assert isinstance(struct, (tuple, list))
+    assert as_plain(struct) == as_plain(parse_market_event(message))
+
+
+def test_struct_decoder_rejects_malformed_frames() -> None:
+    frame = level_change("0.47", "3")
+    del cast("list[dict[str, str]]", frame["price_changes"])[0]["size"]
+
+    assert (
+        parse_market_struct_event(
+            _WebsocketMessage(channel="market", text=json.dumps(frame))
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_struct_mode_delivers_structs_and_feeds_the_store() -> None:
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        await websocket.send(json.dumps([book_frame()]))
+        await websocket.send(json.dumps(level_change("0.50", "4")))
+        await websocket.wait_closed()
+
+    received: list[object] = []
+    done = asyncio.Event()
+    store = LocalOrderBookStore()
+
+    def on_event(event: object) -> None:
+        received.append(event)
+        if len(received) == 2:
+            done.set()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        client = AsyncPolymarketWebsocketsClient()
+        client.url_market = client.url_user = (
+            f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        )
+        await client.open_market_connection(
+            [TOKEN_ID],
+            process_event=on_event,
+            message_mode="struct",
+            local_order_books=store,
+        )
+        try:
+            await asyncio.wait_for(done.wait(), timeout=5)
+            assert store.best_bid(TOKEN_ID) == 0.50
+            with pytest.raises(
+                ValueError, match="only supported on the market channel"
+            ):
+                await client.open_user_connection(
+                    ApiCreds(key="k", secret="s", passphrase="p"), message_mode="struct"
+                )
+        finally:
+            await client.close()
+
+    books, delta = received
+    assert isinstance(books, list)
+    assert isinstance(books[0], OrderBookSummaryEventStruct)
+    assert isinstance(delta, PriceChangeEventStruct)
+    assert delta.price_changes[0].size == 4.0
+
+
+def test_lazy_market_event_validates_only_on_demand() -> None:
+    frame = {**level_change("0.47", "3"), "market": "not-a-condition-id"}
+
+    event = parse_market_lazy_event(
+        _WebsocketMessage(channel="market", text=json.dumps(frame))
+    )
+
+    assert isinstance(event, LazyEvent)
+    assert event.event_type == "price_change"
+    change = event.price_changes[0]
+    assert (change.token_id, change.price, change.side) == (TOKEN_ID, 0.47, "BUY")
+    assert not event.validated
+    assert not change.validated
+    with pytest.raises(ValidationError):
+        _ = event.condition_id
+
+    valid = parse_market_lazy_event(
+        _WebsocketMessage(channel="market", text=json.dumps(level_change("0.47", "3")))
+    )
+    assert isinstance(valid, LazyEvent)
+    assert valid.timestamp == valid.model().timestamp
+    assert valid.validated
+    assert isinstance(valid.price_changes[0], PriceChange)
+
+
+def test_lazy_user_event_reads_plain_fields_and_validates_into_model() -> None:
+    order = {
+        "event_type": "order",
+        "type": "UPDATE",
+        "id": "0x" + "12" * 32,
+        "asset_id": TOKEN_ID,
+        "market": CONDITION_ID,
+        "owner": "owner-key",
+        "maker_address": "0x" + "34" * 20,
+        "price": "0.5",
+        "side": "BUY",
+        "size_matched": "5",
+        "original_size": "10",
+        "outcome": "Yes",
+        "order_type": "GTC",
+        "created_at": "1699999999",
+        "expiration": "0",
+        "status": "LIVE",
+    }
+
+    event = parse_user_lazy_event(
+        _WebsocketMessage(channel="user", text=json.dumps(order))
+    )
+
+    assert isinstance(event, LazyEvent)
+    assert (event.token_id, event.price, event.status, event.event_owner) == (
+        TOKEN_ID,
+        0.5,
+        "LIVE",
+        "owner-key",
+    )
+    assert event.associated_trades is None
+    assert not event.validated
+    assert event.expiration is None
+    assert isinstance(event.model(), OrderEvent)
+    assert (
+        parse_user_lazy_event(
+            _WebsocketMessage(channel="user", text='{"event_type": "x"}')
+        )
+        is None
+    )
+
+
+def test_rolling_latency_histogram_quantiles_and_window_rotation() -> None:
+    histogram = RollingLatencyHistogram(window_ns=1_000, now_ns=0)
+    for duration_ns in [10_000] * 98 + [1_000_000, 5_000_000]:
+        histogram.record(duration_ns, now_ns=100)
+    histogram.record(-5, now_ns=100)
+
+    snapshot = histogram.snapshot(now_ns=100)
+    assert snapshot.count == 101
+    assert snapshot.max_seconds == 0.005
+    p50 = snapshot.p50_seconds
+    assert p50 is not None
+    assert 10e-6 <= p50 < 12e-6
+    assert snapshot.quantile_seconds(1.0) == 0.005
+
+    # One window later the samples are still visible, two windows later they are gone.
+    assert histogram.snapshot(now_ns=1_100).count == 101
+    histogram.record(20_000, now_ns=1_200)
+    assert histogram.snapshot(now_ns=2_200).count == 1
+    assert histogram.snapshot(now_ns=5_000).count == 0
+    assert histogram.snapshot(now_ns=5_000).p99_seconds is None
+
+
+@pytest.mark.asyncio
+async def test_connection_reports_latency_and_queue_high_water_mark() -> None:
+    frames = [book_frame()] + [
+        level_change(str(round(0.40 + index / 100, 2)), "1") for index in range(9)
+    ]
+
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        for frame in frames:
+            await websocket.send(json.dumps(frame))
+        await websocket.wait_closed()
+
+    received: list[object] = []
+    done = asyncio.Event()
+
+    async def on_event(event: object) -> None:
+        received.append(event)
+        # Hold the first event so the rest of the stream queues up behind it.
+        await asyncio.sleep(0.05 if len(received) == 1 else 0)
+        if len(received) == len(frames):
+            done.set()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        client = AsyncPolymarketWebsocketsClient()
+        client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        connection = await client.open_market_connection(
+            [TOKEN_ID], process_event=on_event
+        )
+        try:
+            await asyncio.wait_for(done.wait(), timeout=5)
+            health = await connection.get_health()
+            latency = await connection.get_latency_snapshot()
+        finally:
+            await client.close()
+
+    assert latency.receive_to_dequeue.count == len(frames)
+    assert latency.parse.count == len(frames)
+    assert latency.exchange_to_receive.count == len(frames)
+    assert latency.callback.count == len(frames)
+    callback_max = latency.callback.max_seconds
+    assert callback_max is not None
+    assert callback_max >= 0.05
+    assert health.queue_high_water_mark >= 2
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from websockets.asyncio.server import ServerConnection, serve
+
+from polymarket_apis.clients.websockets_client import (
+    AsyncPolymarketWebsocketsClient,
+    LocalOrderBookStore,
+)
+from polymarket_apis.clients.websockets_recording import (
+    FrameRecord,
+    FrameRecorder,
+    read_frames,
+    replay_frames,
+)
+from polymarket_apis.types.websockets_types import (
+    OrderBookSummaryEvent,
+    PriceChangeEvent,
+)
+
+pytestmark = pytest.mark.contract
+
+TOKEN_ID = "1234"
+CONDITION_ID = "0x" + "ab" * 32
+
+BOOK = {
+    "event_type": "book",
+    "market": CONDITION_ID,
+    "asset_id": TOKEN_ID,
+    "timestamp": "1700000000000",
+    "hash": "0x" + "cd" * 20,
+    "bids": [{"price": "0.48", "size": "10"}],
+    "asks": [{"price": "0.52", "size": "15"}],
+}
+PRICE_CHANGE = {
+    "event_type": "price_change",
+    "market": CONDITION_ID,
+    "timestamp": "1700000000001",
+    "price_changes": [
+        {
+            "asset_id": TOKEN_ID,
+            "price": "0.49",
+            "size": "5",
+            "side": "BUY",
+            "hash": "0x" + "ef" * 20,
+            "best_bid": "0.49",
+            "best_ask": "0.52",
+        }
+    ],
+}
+
+
+def test_recordings_append_and_survive_truncation(tmp_path: Path) -> None:
+    path = tmp_path / "frames.jsonl.gz"
+    with FrameRecorder(path) as recorder:
+        recorder.record("market", json.dumps(BOOK), received_monotonic_ns=10)
+    with FrameRecorder(path) as recorder:
+        recorder.record("user", "{}", received_monotonic_ns=20)
+        recorder.flush()
+        assert recorder.recorded_frame_count == 1
+    recorder.record("user", "{}")
+
+    assert recorder.dropped_frame_count == 1
+    assert list(read_frames(path)) == [
+        FrameRecord("market", 10, json.dumps(BOOK)),
+        FrameRecord("user", 20, "{}"),
+    ]
+
+    truncated = tmp_path / "truncated.jsonl.gz"
+    truncated.write_bytes(path.read_bytes()[:-12])
+    assert len(list(read_frames(truncated))) <= 2
+
+
+@pytest.mark.asyncio
+async def test_replay_feeds_store_parser_and_async_callback() -> None:
+    records = [
+        FrameRecord("market", 0, json.dumps(BOOK)),
+        FrameRecord("market", 20_000_000, json.dumps(PRICE_CHANGE)),
+        FrameRecord("user", 30_000_000, "{}"),
+    ]
+    store = LocalOrderBookStore()
+    events: list[object] = []
+
+    async def on_event(event: object) -> None:
+        events.append(event)
+
+    stats = await replay_frames(
+        records,
+        process_event=on_event,
+        local_order_books=store,
+        channels={"market"},
+        speed=1.0,
+    )
+
+    assert stats.frames == 2
+    assert stats.events == 2
+    assert stats.seconds >= 0.02
+    assert isinstance(events[0], OrderBookSummaryEvent)
+    assert isinstance(events[1], PriceChangeEvent)
+    assert store.bids(TOKEN_ID) == {0.48: 10.0, 0.49: 5.0}
+
+    raw: list[object] = []
+    fast = await replay_frames(records, process_event=raw.append, parse_messages=False)
+    assert fast.frames == 3
+    assert raw == [record.text for record in records]
+
+
+@pytest.mark.skipif(not Path("/dev/full").exists(), reason="needs /dev/full")
+def test_recorder_drops_frames_after_a_write_error(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Every write to /dev/full fails with ENOSPC once gzip flushes.
+    recorder = FrameRecorder("/dev/full")
+    for _ in range(10):
+        recorder.record("market", json.dumps(BOOK))
+    recorder.flush()
+    assert recorder.failed
+    for _ in range(1000):
+        recorder.record("market", json.dumps(BOOK))
+    recorder.flush()
+    recorder.close()
+
+    assert recorder.dropped_frame_count == 1000
+    assert [
+        record
+        for record in caplog.records
+        if getattr(record, "event", "") == "ws.recorder.write_failed"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_recorder_captures_data_frames(tmp_path: Path) -> None:
+    async def handler(websocket: ServerConnection) -> None:
+        await websocket.recv()
+        await websocket.send(json.dumps([BOOK]))
+        await websocket.send(json.dumps(PRICE_CHANGE))
+        await websocket.wait_closed()
+
+    path = tmp_path / "session.jsonl.gz"
+    received = asyncio.Event()
+
+    def on_event(event: object) -> None:
+        if isinstance(event, PriceChangeEvent):
+            received.set()
+
+    with FrameRecorder(path) as recorder:
+        async with serve(handler, "127.0.0.1", 0) as server:
+            client = AsyncPolymarketWebsocketsClient(recorder=recorder)
+            client.url_market = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            await client.open_market_connection([TOKEN_ID], process_event=on_event)
+            try:
+                await asyncio.wait_for(received.wait(), timeout=5)
+            finally:
+                await client.close()
+
+    frames = list(read_frames(path))
+    assert [frame.channel for frame in frames] == ["market", "market"]
+    assert json.loads(frames[1].text) == PRICE_CHANGE
+    assert frames[0].received_monotonic_ns <= frames[1].received_monotonic_ns
+    with gzip.open(path, "rt") as file:
+        assert set(json.loads(file.readline())) == {
+            "channel",
+            "received_monotonic_ns",
+            "text",
+        }
+
+
+@pytest.mark.asyncio
+async def test_replay_skips_malformed_frames_and_restarts_pacing_across_sessions() -> (
+    None
+):
+    records = [
+        FrameRecord("market", 5_000_000_000, json.dumps(BOOK)),
+        FrameRecord("market", 5_010_000_000, "INVALID OPERATION"),
+        # A later session appended to the same file: its clock restarted.
+        FrameRecord("market", 1_000, json.dumps(PRICE_CHANGE)),
+    ]
+    store = LocalOrderBookStore()
+    events: list[object] = []
+
+    stats = await replay_frames(
+        records, process_event=events.append, local_order_books=store, speed=1.0
+    )
+
+    assert (stats.frames, stats.events, stats.unparsed, stats.rejected) == (3, 2, 1, 1)
+    assert stats.seconds < 1
+    assert isinstance(events[1], PriceChangeEvent)
+    assert store.bids(TOKEN_ID) == {0.48: 10.0, 0.49: 5.0}
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from polymarket_apis.clients.websockets_client import LocalOrderBookStore
+from polymarket_apis.clients.websockets_shared_books import (
+    SharedOrderBookPublisher,
+    SharedOrderBookReader,
+)
+
+pytestmark = pytest.mark.contract
+
+TOKEN_ID = "1234"
+OTHER_TOKEN_ID = "5678"
+CONDITION_ID = "0x" + "ab" * 32
+
+
+def book(token_id: str = TOKEN_ID) -> dict[str, object]:
+    return {
+        "event_type": "book",
+        "market": CONDITION_ID,
+        "asset_id": token_id,
+        "timestamp": "1700000000000",
+        "hash": "0x" + "cd" * 20,
+        "bids": [{"price": "0.47", "size": "5"}, {"price": "0.48", "size": "10"}],
+        "asks": [{"price": "0.52", "size": "15"}, {"price": "0.53", "size": "1"}],
+        "tick_size": "0.01",
+    }
+
+
+def level_change(price: str, size: str, side: str) -> dict[str, object]:
+    return {
+        "event_type": "price_change",
+        "market": CONDITION_ID,
+        "timestamp": "1700000000001",
+        "price_changes": [
+            {"asset_id": TOKEN_ID, "price": price, "size": size, "side": side}
+        ],
+    }
+
+
+def test_reader_follows_publisher_writes(tmp_path: Path) -> None:
+    store = LocalOrderBookStore(depth=2)
+    # Tokens already in the store are published on attach.
+    store.apply_payload(book())
+    path = tmp_path / "books"
+    with (
+        SharedOrderBookPublisher(path, store) as publisher,
+        SharedOrderBookReader(path) as reader,
+    ):
+        snapshot = reader.snapshot(TOKEN_ID)
+        assert snapshot.top_bids == ((0.48, 10.0), (0.47, 5.0))
+        assert snapshot.top_asks == ((0.52, 15.0), (0.53, 1.0))
+        assert (snapshot.tick_size, snapshot.last_trade_price, snapshot.valid) == (
+            0.01,
+            None,
+            True,
+        )
+        assert snapshot.published_at is not None
+
+        store.apply_payload(level_change("0.50", "3", "BUY"))
+        assert reader.best_bid(TOKEN_ID) == 0.5
+        assert reader.top_bids(TOKEN_ID) == ((0.5, 3.0), (0.48, 10.0))
+        assert reader.sequence(TOKEN_ID) > snapshot.sequence
+
+        store.apply_payload(book(OTHER_TOKEN_ID))
+        assert set(reader.token_ids) == {TOKEN_ID, OTHER_TOKEN_ID}
+        assert reader.best_ask(OTHER_TOKEN_ID) == 0.52
+
+        store.invalidate("hash_mismatch", [TOKEN_ID])
+        assert not reader.is_valid(TOKEN_ID)
+        assert reader.best_bid(TOKEN_ID) is None
+        assert reader.is_valid(OTHER_TOKEN_ID)
+
+        assert reader.snapshot("unknown").sequence == 0
+        assert publisher.token_count == 2
+
+    assert not path.exists()
+    store.apply_payload(book())  # no longer published after close
+
+
+def test_reader_follows_a_restarted_publisher(tmp_path: Path) -> None:
+    path = tmp_path / "books"
+    store = LocalOrderBookStore(depth=2)
+    publisher = SharedOrderBookPublisher(path, store)
+    store.apply_payload(book())
+    store.apply_payload(book(OTHER_TOKEN_ID))
+    store.apply_payload(level_change("0.50", "3", "BUY"))
+    with SharedOrderBookReader(path) as reader:
+        assert (reader.best_bid(TOKEN_ID), reader.best_bid(OTHER_TOKEN_ID)) == (
+            0.5,
+            0.48,
+        )
+        publisher.close(unlink=False)
+        assert reader.best_bid(TOKEN_ID) is None
+
+        # The new publisher allocates the tokens' slots in the opposite order.
+        restarted = LocalOrderBookStore(depth=2)
+        publisher = SharedOrderBookPublisher(path, restarted)
+        restarted.apply_payload(book(OTHER_TOKEN_ID))
+        restarted.apply_payload(book())
+        restarted.apply_payload(level_change("0.49", "3", "BUY"))
+        assert (reader.best_bid(TOKEN_ID), reader.best_bid(OTHER_TOKEN_ID)) == (
+            0.49,
+            0.48,
+        )
+
+        publisher.close()
+        assert reader.token_ids == ()
+        assert not reader.snapshot(TOKEN_ID).valid
+
+        publisher = SharedOrderBookPublisher(path, store)
+        assert reader.best_bid(TOKEN_ID) == 0.5
+        publisher.close()
+
+
+def test_capacity_overflow_is_logged_once(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    store = LocalOrderBookStore()
+    with (
+        SharedOrderBookPublisher(tmp_path / "books", store, capacity=1) as publisher,
+        caplog.at_level(logging.WARNING),
+    ):
+        store.apply_payload(book())
+        store.apply_payload(book(OTHER_TOKEN_ID))
+        store.apply_payload(book("9999"))
+        assert publisher.token_count == 1
+
+    assert [record.getMessage() for record in caplog.records].count(
+        "Order book not published to shared memory"
+    ) == 1
+
+
+def _read_best_bid(path: str, token_id: str) -> float | None:
+    with SharedOrderBookReader(path) as reader:
+        return reader.best_bid(token_id)
+
+
+def test_reader_in_another_process(tmp_path: Path) -> None:
+    store = LocalOrderBookStore()
+    path = tmp_path / "books"
+    with SharedOrderBookPublisher(path, store):
+        store.apply_payload(book())
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(1) as pool:
+            assert pool.apply(_read_best_bid, (str(path), TOKEN_ID)) == 0.48